@@ -5,6 +5,10 @@ Local OpenAI-compatible Embeddings server for jinaai/jina-embeddings-v2-base-de.
 - Serves POST /v1/embeddings with the OpenAI embeddings API schema
 - Loads the model via sentence-transformers
 - Default model: jinaai/jina-embeddings-v2-base-de (768 dims)
+- Merges concurrent requests into micro-batches encoded on a worker thread
+- Serves throughput and queue metrics on GET /stats
+- Caches the vectors of texts it has embedded before, see EMBED_CACHE_SIZE
+- Reports the tokens of the input texts in `usage`, counted with the model tokenizer
 
 Run (without adding deps to the project):
   uv run --with fastapi --with uvicorn --with "sentence-transformers>=2.6" \
@@ -12,14 +16,37 @@ Run (without adding deps to the project):
     uvicorn apps.local_embedding_server.server:app --host 127.0.0.1 --port 8000
 
 Or add dependencies once to your project and then run uvicorn directly.
+
+Batching is tuned with MAX_BATCH_SIZE (texts per forward pass, default 64) and
+MAX_WAIT_MS (how long the first request of a batch waits for others, default 5).
+
+Vectors are cached by model id and normalized text. EMBED_CACHE_SIZE bounds the
+in-memory cache (entries, default 20000, 0 keeps no vectors in memory) and
+EMBED_CACHE_DIR adds a memory-mapped float32 store on disk that survives restarts.
+With EMBED_CACHE_SIZE=0 and EMBED_CACHE_DIR set, only the disk store is used;
+without EMBED_CACHE_DIR it disables caching.
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import json
+import logging
 import os
-from typing import Any, List
+import queue
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Literal
 
+import numpy as np
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 import traceback
 
@@ -29,51 +56,448 @@ from sentence_transformers import SentenceTransformer
 DEFAULT_MODEL_ID = os.environ.get("MODEL_ID", "jinaai/jina-embeddings-v2-base-de")
 EMBED_DIM = int(os.environ.get("EMBED_DIM", "768"))
 EMBED_DEVICE = os.environ.get("EMBED_DEVICE", "cpu")
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "64"))
+MAX_WAIT_MS = float(os.environ.get("MAX_WAIT_MS", "5"))
+EMBED_CACHE_SIZE = int(os.environ.get("EMBED_CACHE_SIZE", "20000"))
+EMBED_CACHE_DIR = os.environ.get("EMBED_CACHE_DIR")
 
-app = FastAPI(title="Local Embeddings Server", version="1.0.0")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Local Embeddings Server", version="1.1.0")
 
 
 class EmbeddingRequest(BaseModel):
     input: str | List[str]
     model: str | None = Field(default=None)
+    encoding_format: Literal["float", "base64"] = "float"
 
 
-class EmbeddingItem(BaseModel):
-    object: str = "embedding"
-    embedding: List[float]
-    index: int
+# Global model instance (loaded on first request)
+_model: SentenceTransformer | None = None
+# the encoding worker and the token counting threads may both load it first
+_model_lock = threading.Lock()
 
 
-class EmbeddingUsage(BaseModel):
-    prompt_tokens: int = 0
-    total_tokens: int = 0
+def get_model(model_id: str = DEFAULT_MODEL_ID) -> SentenceTransformer:
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = SentenceTransformer(model_id, device=EMBED_DEVICE)
+        return _model
 
 
-class EmbeddingResponse(BaseModel):
-    object: str = "list"
-    data: List[EmbeddingItem]
-    model: str
-    usage: EmbeddingUsage = Field(default_factory=EmbeddingUsage)
+def count_tokens(texts: list[str], model_id: str = DEFAULT_MODEL_ID) -> int:
+    """Return the number of tokens the model reads for the texts, special tokens included."""
+    if not texts:
+        return 0
+    model = get_model(model_id)
+    encoded = model.tokenizer(
+        texts, truncation=True, max_length=model.max_seq_length
+    )
+    return sum(len(ids) for ids in encoded["input_ids"])
 
 
-# Global model instance (loaded on first request)
-_model: SentenceTransformer | None = None
+class _DiskStore:
+    """
+    An append-only store of float32 vectors, memory-mapped for reading.
 
+    `vectors.f32` holds one row per vector and `keys.bin` the 16 byte key of each
+    row. Rows are written before their keys, so a torn write only loses the last
+    vectors. `append` writes new rows without touching `rows`, which `get` reads;
+    they become visible once the caller passes them to `publish`.
+    """
+
+    def __init__(self, directory: Path, dim: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self._vectors_path = directory / "vectors.f32"
+        self._keys_path = directory / "keys.bin"
+        self._vectors_path.touch()
+        self._keys_path.touch()
+        num_vectors = self._vectors_path.stat().st_size // (4 * dim)
+        keys = self._keys_path.read_bytes()
+        num_rows = min(num_vectors, len(keys) // 16)
+        self.rows = {keys[16 * i : 16 * (i + 1)]: i for i in range(num_rows)}
+        self._num_rows = num_rows
+        # drop what a torn write left behind
+        os.truncate(self._vectors_path, num_rows * 4 * dim)
+        os.truncate(self._keys_path, num_rows * 16)
+        self._mapped: np.ndarray | None = None
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        """Return the stored vector of the key, if any."""
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        if self._mapped is None or row >= len(self._mapped):
+            # remap once the file has grown past the mapped rows
+            self._mapped = np.memmap(
+                self._vectors_path, dtype="<f4", mode="r"
+            ).reshape(-1, self.dim)
+        return np.array(self._mapped[row], dtype=np.float32)
+
+    def append(self, keys: list[bytes], vectors: np.ndarray) -> dict[bytes, int]:
+        """Write the vectors whose keys are not stored yet and return their rows.
+
+        Only one thread may append at a time.
+        """
+        new = {key: i for i, key in enumerate(keys) if key not in self.rows}
+        if not new:
+            return {}
+        with self._vectors_path.open("ab") as file:
+            file.write(vectors[list(new.values())].astype("<f4").tobytes())
+        with self._keys_path.open("ab") as file:
+            file.write(b"".join(new))
+        rows = {key: self._num_rows + i for i, key in enumerate(new)}
+        self._num_rows += len(rows)
+        return rows
+
+    def publish(self, rows: dict[bytes, int]) -> None:
+        """Make appended rows visible to `get`."""
+        self.rows.update(rows)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed vectors, keyed by model id and normalized text.
+
+    Recently used vectors are kept in memory, up to `max_entries`; with a directory
+    all vectors are also kept on disk, where memory misses are looked up. Lookups
+    may read the disk, so call them off the event loop. Disk writes happen outside
+    the lock the lookups take.
+    """
+
+    def __init__(
+        self, model_id: str, max_entries: int, directory: str | None, dim: int
+    ):
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._disk = (
+            _DiskStore(Path(directory) / re.sub(r"[^\w.-]", "_", model_id), dim)
+            if directory
+            else None
+        )
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+
+    def key(self, text: str) -> bytes:
+        """Return the cache key of the text, ignoring surrounding whitespace and Unicode normal forms."""
+        normalized = unicodedata.normalize("NFC", text).strip()
+        return hashlib.blake2b(
+            f"{self.model_id}\0{normalized}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        """Return the cached vector of the key, counting the hit or miss."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+            elif self._disk is not None:
+                vector = self._disk.get(key)
+                if vector is not None:
+                    self._remember(key, vector)
+            if vector is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return vector
+
+    def lookup(
+        self, texts: list[str]
+    ) -> tuple[list[bytes], dict[bytes, np.ndarray], dict[bytes, str]]:
+        """Return the keys of the texts, the cached vectors and the texts to encode by key."""
+        keys = [self.key(text) for text in texts]
+        found: dict[bytes, np.ndarray] = {}
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in found or key in missing:
+                continue
+            vector = self.get(key)
+            if vector is None:
+                missing[key] = text
+            else:
+                found[key] = vector
+        return keys, found, missing
+
+    def put_many(self, keys: list[bytes], vectors: np.ndarray) -> None:
+        """Cache a vector for each key."""
+        with self._lock:
+            for key, vector in zip(keys, vectors, strict=True):
+                # a copy, the row would keep the whole batch alive
+                self._remember(key, vector.copy())
+        if self._disk is not None and vectors.shape[1] == self._disk.dim:
+            # lookups carry on while the rows are written, they see them once published
+            with self._disk_lock:
+                rows = self._disk.append(keys, vectors)
+                with self._lock:
+                    self._disk.publish(rows)
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the hit rate and size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_entries,
+                "disk_entries": len(self._disk.rows) if self._disk else None,
+            }
+
+
+@dataclass
+class _Job:
+    """The texts of one request and the future its vectors are delivered to."""
+
+    texts: list[str]
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    keys: list[bytes] | None = None
+    enqueued: float = field(default_factory=time.perf_counter)
 
-def get_model(model_id: str = DEFAULT_MODEL_ID) -> SentenceTransformer:
-    global _model
-    if _model is None:
-        _model = SentenceTransformer(model_id, device=EMBED_DEVICE)
-    return _model
+
+@dataclass
+class _Stats:
+    started: float = field(default_factory=time.perf_counter)
+    requests: int = 0
+    texts: int = 0
+    batches: int = 0
+    encode_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+    queued_texts: int = 0
+
+
+class MicroBatcher:
+    """
+    Merges the texts of concurrent requests into batches for a single worker thread.
+
+    Texts found in the cache skip the queue, only the misses of a request are
+    encoded. The worker takes the first waiting request and keeps adding requests until the
+    batch holds `max_batch_size` texts or `max_wait` seconds have passed, so a lone
+    request is only delayed by `max_wait` while a burst fills whole batches. A request
+    larger than `max_batch_size` forms a batch of its own.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        max_batch_size: int,
+        max_wait: float,
+        cache: EmbeddingCache | None = None,
+    ):
+        self.model_id = model_id
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.cache = cache
+        self.stats = _Stats()
+        self._queue: queue.Queue[_Job] = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """Return the normalized float32 vectors of the texts, one row per text."""
+        if not texts:
+            return np.empty((0, EMBED_DIM), dtype=np.float32)
+        if self.cache is None:
+            return await self._enqueue(texts)
+
+        # lookups may wait for the cache lock or read the disk store
+        keys, found, missing = await asyncio.to_thread(self.cache.lookup, texts)
+        if missing:
+            encoded = await self._enqueue(list(missing.values()), list(missing))
+            found.update(zip(missing, encoded, strict=True))
+        return np.stack([found[key] for key in keys])
+
+    async def _enqueue(
+        self, texts: list[str], keys: list[bytes] | None = None
+    ) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        job = _Job(texts=texts, loop=loop, future=loop.create_future(), keys=keys)
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-worker", daemon=True
+                )
+                self._worker.start()
+            self.stats.requests += 1
+            self.stats.queued_texts += len(texts)
+        self._queue.put(job)
+        return await job.future
+
+    def _run(self) -> None:
+        pending: _Job | None = None
+        while True:
+            jobs = [pending or self._queue.get()]
+            pending = None
+            size = len(jobs[0].texts)
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    job = (
+                        self._queue.get(timeout=timeout)
+                        if timeout > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if size + len(job.texts) > self.max_batch_size:
+                    # starts the next batch instead of overfilling this one
+                    pending = job
+                    break
+                jobs.append(job)
+                size += len(job.texts)
+            self._encode_batch(jobs)
+
+    def _encode_batch(self, jobs: list[_Job]) -> None:
+        texts = [text for job in jobs for text in job.texts]
+        start = time.perf_counter()
+        try:
+            # similar lengths share a forward pass and need less padding
+            order = np.argsort([len(text) for text in texts], kind="stable")
+            sorted_vectors = np.asarray(
+                get_model(self.model_id).encode(
+                    [texts[i] for i in order],
+                    batch_size=self.max_batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                ),
+                dtype=np.float32,
+            ).reshape(len(texts), -1)
+            vectors = np.empty_like(sorted_vectors)
+            vectors[order] = sorted_vectors
+        except Exception as e:  # noqa: BLE001
+            for job in jobs:
+                job.loop.call_soon_threadsafe(_set_exception, job.future, e)
+        else:
+            if self.cache is not None:
+                # with a cache every job carries the keys of its texts
+                try:
+                    self.cache.put_many(
+                        [key for job in jobs for key in job.keys or []], vectors
+                    )
+                except Exception:
+                    logger.exception("Could not cache %d vectors", len(texts))
+            offset = 0
+            for job in jobs:
+                rows = vectors[offset : offset + len(job.texts)]
+                offset += len(job.texts)
+                job.loop.call_soon_threadsafe(_set_result, job.future, rows)
+        finally:
+            with self._lock:
+                self.stats.batches += 1
+                self.stats.texts += len(texts)
+                self.stats.queued_texts -= len(texts)
+                self.stats.encode_seconds += time.perf_counter() - start
+                self.stats.queue_wait_seconds += sum(
+                    start - job.enqueued for job in jobs
+                )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the throughput and queue metrics."""
+        with self._lock:
+            stats = self.stats
+            uptime = time.perf_counter() - stats.started
+            return {
+                "requests": stats.requests,
+                "texts": stats.texts,
+                "batches": stats.batches,
+                "queue_depth": self._queue.qsize(),
+                "queued_texts": stats.queued_texts,
+                "mean_batch_size": stats.texts / stats.batches if stats.batches else 0.0,
+                "texts_per_second": stats.texts / uptime if uptime else 0.0,
+                "encode_texts_per_second": (
+                    stats.texts / stats.encode_seconds if stats.encode_seconds else 0.0
+                ),
+                "mean_queue_wait_ms": (
+                    1000 * stats.queue_wait_seconds / stats.requests
+                    if stats.requests
+                    else 0.0
+                ),
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": 1000 * self.max_wait,
+                "uptime_seconds": uptime,
+            }
+
+
+def _set_result(future: asyncio.Future, result: np.ndarray) -> None:
+    if not future.cancelled():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, error: Exception) -> None:
+    if not future.cancelled():
+        future.set_exception(error)
+
+
+def _embeddings_body(
+    vectors: np.ndarray, model_id: str, encoding_format: str, prompt_tokens: int
+) -> bytes:
+    """Serialize the OpenAI embeddings response straight from the float32 vectors."""
+    if encoding_format == "base64":
+        # little-endian float32, as the OpenAI clients decode it
+        little_endian = vectors.astype("<f4", copy=False)
+        embeddings = [
+            '"' + base64.b64encode(row.tobytes()).decode("ascii") + '"'
+            for row in little_endian
+        ]
+    else:
+        # 9 significant digits round-trip float32 exactly
+        formatted = np.char.mod("%.9g", vectors)
+        embeddings = ["[" + ",".join(row) + "]" for row in formatted]
+    data = ",".join(
+        f'{{"object":"embedding","index":{i},"embedding":{embedding}}}'
+        for i, embedding in enumerate(embeddings)
+    )
+    return (
+        f'{{"object":"list","data":[{data}],"model":{json.dumps(model_id)},'
+        f'"usage":{{"prompt_tokens":{prompt_tokens},"total_tokens":{prompt_tokens}}}}}'
+    ).encode()
+
+
+batcher = MicroBatcher(
+    DEFAULT_MODEL_ID,
+    MAX_BATCH_SIZE,
+    MAX_WAIT_MS / 1000,
+    cache=(
+        EmbeddingCache(DEFAULT_MODEL_ID, EMBED_CACHE_SIZE, EMBED_CACHE_DIR, EMBED_DIM)
+        if EMBED_CACHE_SIZE > 0 or EMBED_CACHE_DIR
+        else None
+    ),
+)
 
 
 @app.get("/")
 def health() -> dict[str, Any]:
-    return {"status": "ok", "model": DEFAULT_MODEL_ID, "dim": EMBED_DIM, "device": EMBED_DEVICE}
+    return {
+        "status": "ok",
+        "model": DEFAULT_MODEL_ID,
+        "dim": EMBED_DIM,
+        "device": EMBED_DEVICE,
+        "cache": batcher.cache.snapshot() if batcher.cache else None,
+    }
+
 
+@app.get("/stats")
+def stats() -> dict[str, Any]:
+    return batcher.snapshot()
 
-@app.post("/v1/embeddings", response_model=EmbeddingResponse)
-def create_embeddings(req: EmbeddingRequest):
+
+@app.post("/v1/embeddings")
+async def create_embeddings(req: EmbeddingRequest):
     try:
         # Always use the server's configured model; ignore client-provided model to avoid HF name mismatches
         model_id = DEFAULT_MODEL_ID
@@ -83,29 +507,16 @@ def create_embeddings(req: EmbeddingRequest):
         else:
             texts = req.input
 
-        model = get_model(model_id)
-        vectors = model.encode(texts, normalize_embeddings=True)
-
-        model = get_model(model_id)
-        vectors = model.encode(texts, normalize_embeddings=True)
-
-        # Ensure lists of floats
-        if hasattr(vectors, "tolist"):
-            vectors = vectors.tolist()
-
-        # Safety: model might return a single vector shape
-        if isinstance(vectors[0], float):
-            vectors = [vectors]
-
-        data = [EmbeddingItem(embedding=vec, index=i) for i, vec in enumerate(vectors)]
-
-        # (Optional) Validate dimension
-        for item in data:
-            if len(item.embedding) != EMBED_DIM:
-                # Do not fail, but include info in usage
-                pass
-
-        return EmbeddingResponse(data=data, model=model_id)
+        # cached texts are not encoded again, but clients still meter their tokens
+        vectors, prompt_tokens = await asyncio.gather(
+            batcher.encode(texts), asyncio.to_thread(count_tokens, texts, model_id)
+        )
+        return Response(
+            content=_embeddings_body(
+                vectors, model_id, req.encoding_format, prompt_tokens
+            ),
+            media_type="application/json",
+        )
     except Exception as e:
         return JSONResponse(
             status_code=500,
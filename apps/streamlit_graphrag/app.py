@@ -3,7 +3,7 @@ import os
 import io
 import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
 # Ensure local package import when running from subdir
 import sys
@@ -27,10 +27,10 @@ from graphrag.config.load_config import load_config
 from graphrag.config.enums import IndexingMethod, SearchMethod
 from graphrag.config.models.chunking_config import ChunkStrategyType
 from graphrag.api.index import build_index
-import graphrag.api.query as query_api
+from graphrag.api.query_engine import QueryEngine
 import graphrag.api.prompt_tune as prompt_api
-from graphrag.utils.api import create_storage_from_config, reformat_context_data
-from graphrag.utils.storage import load_table_from_storage, storage_has_table
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+from graphrag.utils.api import create_cache_from_config, reformat_context_data
 # Prompt templates (for seeding without overwriting settings)
 from graphrag.prompts.index.community_report import COMMUNITY_REPORT_PROMPT
 from graphrag.prompts.index.community_report_text_units import COMMUNITY_REPORT_TEXT_PROMPT
@@ -510,31 +510,38 @@ def save_uploaded_files(files: List[Any], dest_dir: Path) -> List[Path]:
     return saved
 
 
-async def _load_outputs_single_index(config) -> Dict[str, pd.DataFrame]:
-    storage = create_storage_from_config(config.output)
-    required = [
-        "entities",
-        "communities",
-        "community_reports",
-        "text_units",
-        "relationships",
-    ]
-    optional = ["covariates"]
-
-    dfs: Dict[str, pd.DataFrame] = {}
-    for name in required:
-        dfs[name] = await load_table_from_storage(name=name, storage=storage)
-    for name in optional:
-        if await storage_has_table(name, storage):
-            dfs[name] = await load_table_from_storage(name=name, storage=storage)
-        else:
-            dfs[name] = None  # type: ignore
-    return dfs
+# Standardgröße der Speicherstufe des Query-Caches, falls settings.yaml keine vorgibt
+QUERY_CACHE_MAX_ENTRIES = 2000
+
+
+def get_query_engine(root: str, cfg_file: str | None) -> QueryEngine:
+    """Ein QueryEngine pro Projekt: Parquet-Outputs und VectorStore bleiben zwischen Abfragen geladen.
+
+    Die Engine lädt selbstständig neu, sobald sich die Output-Dateien ändern (z. B. nach "Index bauen").
+    Ändern sich settings.yaml oder .env, wird die Engine mit der neuen Konfiguration neu aufgebaut.
+    LLM- und Embedding-Aufrufe laufen über den konfigurierten Cache mit einer LRU-Speicherstufe davor,
+    damit wiederholte Fragen und Query-Embeddings nicht jedes Mal die Platte oder das Netz treffen.
+    """
+    return _cached_query_engine(root, cfg_file, _config_stamp(root, cfg_file))
 
 
-async def _load_outputs_basic_single(config) -> Dict[str, pd.DataFrame]:
-    storage = create_storage_from_config(config.output)
-    return {"text_units": await load_table_from_storage("text_units", storage)}
+def _config_stamp(root: str, cfg_file: str | None) -> tuple[int, ...]:
+    """Änderungszeiten der Konfigurationsdateien, die load_config liest (settings.* und .env)."""
+    if cfg_file:
+        cfg_files = [Path(cfg_file)]
+    else:
+        cfg_files = [Path(root) / name for name in ("settings.yaml", "settings.yml", "settings.json")]
+    env_files = {f.parent / ".env" for f in cfg_files}
+    return tuple(f.stat().st_mtime_ns if f.exists() else 0 for f in [*cfg_files, *sorted(env_files)])
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_query_engine(root: str, cfg_file: str | None, stamp: tuple[int, ...]) -> QueryEngine:  # noqa: ARG001
+    # stamp gehört nur zum Cache-Schlüssel: neue Änderungszeiten bauen die Engine neu
+    cfg = load_config(Path(root), Path(cfg_file)) if cfg_file else load_config(Path(root))
+    if cfg.cache.memory_max_entries is None and cfg.cache.memory_max_bytes is None:
+        cfg.cache.memory_max_entries = QUERY_CACHE_MAX_ENTRIES
+    return QueryEngine(cfg, cache=create_cache_from_config(cfg.cache, root))
 
 
 def run_async(coro):
@@ -811,68 +818,36 @@ with tab_chat:
 
     if st.button("Absenden") and query_text:
         try:
-            cfg = load_config(root_dir, cfg_path) if cfg_path else load_config(root_dir)
+            engine = get_query_engine(str(root_dir), str(cfg_path) if cfg_path else None)
             if st.session_state.get("german_default"):
                 # Nur deutsche Ausgaberichtlinie an bestehende Prompts anhängen (keine _de‑Dateien verwenden)
                 apply_german_defaults(root_dir)
 
             if method == SearchMethod.BASIC.value:
-                dfs = run_async(_load_outputs_basic_single(cfg))
-                text_units = dfs["text_units"]
-                answer, context = run_async(
-                    query_api.basic_search(
-                        config=cfg,
-                        text_units=text_units,
-                        query=query_text,
-                        verbose=False,
-                    )
-                )
+                answer, context = run_async(engine.basic_search(query=query_text))
             elif method == SearchMethod.LOCAL.value:
-                dfs = run_async(_load_outputs_single_index(cfg))
                 answer, context = run_async(
-                    query_api.local_search(
-                        config=cfg,
-                        entities=dfs["entities"],
-                        communities=dfs["communities"],
-                        community_reports=dfs["community_reports"],
-                        text_units=dfs["text_units"],
-                        relationships=dfs["relationships"],
-                        covariates=dfs.get("covariates"),
+                    engine.local_search(
+                        query=query_text,
                         community_level=int(community_level),
                         response_type=str(response_type),
-                        query=query_text,
-                        verbose=False,
                     )
                 )
             elif method == SearchMethod.DRIFT.value:
-                dfs = run_async(_load_outputs_single_index(cfg))
                 answer, context = run_async(
-                    query_api.drift_search(
-                        config=cfg,
-                        entities=dfs["entities"],
-                        communities=dfs["communities"],
-                        community_reports=dfs["community_reports"],
-                        text_units=dfs["text_units"],
-                        relationships=dfs["relationships"],
+                    engine.drift_search(
+                        query=query_text,
                         community_level=int(community_level),
                         response_type=str(response_type),
-                        query=query_text,
-                        verbose=False,
                     )
                 )
             else:  # GLOBAL
-                dfs = run_async(_load_outputs_single_index(cfg))
                 answer, context = run_async(
-                    query_api.global_search(
-                        config=cfg,
-                        entities=dfs["entities"],
-                        communities=dfs["communities"],
-                        community_reports=dfs["community_reports"],
+                    engine.global_search(
+                        query=query_text,
                         community_level=int(community_level),
                         dynamic_community_selection=bool(dyn_comm),
                         response_type=str(response_type),
-                        query=query_text,
-                        verbose=False,
                     )
                 )
 
@@ -1054,6 +1029,21 @@ with tab_debug:
         st.error(f"Konfiguration konnte nicht geladen werden: {e}")
         cfg = None
 
+    # Trefferquote der Speicherstufe des Query-Caches
+    try:
+        query_cache = get_query_engine(str(root_dir), str(cfg_path) if cfg_path else None).cache
+        if isinstance(query_cache, TieredPipelineCache):
+            stats = query_cache.stats()
+            lookups = stats.hits + stats.misses
+            st.markdown("**Query-Cache (Speicher)**")
+            st.code(
+                f"Treffer: {stats.hits}  Fehlgriffe: {stats.misses}  "
+                f"Trefferquote: {stats.hits / lookups if lookups else 0:.1%}\n"
+                f"Einträge: {stats.entries}  Verdrängt: {stats.evictions}"
+            )
+    except (OSError, KeyError, ValueError) as e:
+        st.caption(f"Query-Cache-Statistik nicht verfügbar: {e}")
+
     st.markdown("---")
     st.markdown("### Eingaben im Input-Ordner")
     if cfg:
@@ -1100,21 +1090,28 @@ with tab_debug:
 
     st.markdown("---")
     st.markdown("### Keyword-Test in Dokumenten/Text-Units")
-    kw = st.text_input("Suchbegriff (Regex)", value=r"bcbs\s*239|bcbs|239")
+    kw = st.text_input("Suchbegriffe", value="BCBS 239")
+    st.caption("Text-Units werden über den BM25-Index gesucht (Wortstämme, Groß-/Kleinschreibung und Umlaute egal). Ohne Index wird der Text wörtlich in den Parquet-Dateien gesucht.")
     if st.button("Suchen") and cfg:
         try:
             import re, pandas as pd
             out_dir = (root_dir / Path(cfg.output.base_dir)).resolve()
-            docs = pd.read_parquet(out_dir/"documents.parquet") if (out_dir/"documents.parquet").exists() else pd.DataFrame()
-            tus  = pd.read_parquet(out_dir/"text_units.parquet") if (out_dir/"text_units.parquet").exists() else pd.DataFrame()
-            rx = re.compile(kw, flags=re.I)
+            docs = pd.read_parquet(out_dir/"documents.parquet", columns=["id","title"]) if (out_dir/"documents.parquet").exists() else pd.DataFrame()
             st.write("Dokumente mit Treffer im Titel:")
             if not docs.empty:
-                hit_docs = docs[docs["title"].astype(str).str.contains(rx)]
+                hit_docs = docs[docs["title"].astype(str).str.contains(re.escape(kw), flags=re.I)]
                 st.dataframe(hit_docs.head(50))
-            st.write("Text-Units mit Treffer im Text:")
-            if not tus.empty:
-                hit_tu = tus[tus["text"].astype(str).str.contains(rx)]
-                st.dataframe(hit_tu[["id","human_readable_id","text"]].head(50))
+            engine = get_query_engine(str(root_dir), str(cfg_path) if cfg_path else None)
+            hit_tu = run_async(engine.keyword_search(kw, k=50))
+            if hit_tu is not None:
+                st.write("Text-Units mit Treffer im Text (BM25, beste zuerst):")
+                st.dataframe(hit_tu)
+            else:
+                st.info("Kein BM25-Index gefunden: `bm25_index.enabled` setzen und neu indexieren. Suche wörtlich im Text.")
+                tus = pd.read_parquet(out_dir/"text_units.parquet", columns=["id","human_readable_id","text"]) if (out_dir/"text_units.parquet").exists() else pd.DataFrame()
+                st.write("Text-Units mit Treffer im Text:")
+                if not tus.empty:
+                    hit_tu = tus[tus["text"].astype(str).str.contains(re.escape(kw), flags=re.I)]
+                    st.dataframe(hit_tu.head(50))
         except Exception as ex:
             st.error(f"Fehler beim Keyword-Test: {ex}")
@@ -23,6 +23,7 @@ from graphrag.api.query import (
     multi_index_global_search,
     multi_index_local_search,
 )
+from graphrag.api.query_engine import QueryEngine
 from graphrag.prompt_tune.types import DocSelectionType
 
 __all__ = [  # noqa: RUF022
@@ -41,6 +42,7 @@ __all__ = [  # noqa: RUF022
     "multi_index_drift_search",
     "multi_index_global_search",
     "multi_index_local_search",
+    "QueryEngine",
     # prompt tuning API
     "DocSelectionType",
     "generate_indexing_prompts",
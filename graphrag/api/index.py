@@ -35,6 +35,7 @@ async def build_index(
     additional_context: dict[str, Any] | None = None,
     verbose: bool = False,
     input_documents: pd.DataFrame | None = None,
+    resume: bool = False,
 ) -> list[PipelineRunResult]:
     """Run the pipeline with the given configuration.
 
@@ -52,6 +53,8 @@ async def build_index(
         Additional context to pass to the pipeline run. This can be accessed in the pipeline state under the 'additional_context' key.
     input_documents : pd.DataFrame | None default=None.
         Override document loading and parsing and supply your own dataframe of documents to index.
+    resume : bool default=False
+        Skip the leading workflows whose config and input tables did not change since they completed in a previous run, and restart at the first changed workflow.
 
     Returns
     -------
@@ -84,6 +87,7 @@ async def build_index(
         is_update_run=is_update_run,
         additional_context=additional_context,
         input_documents=input_documents,
+        resume=resume,
     ):
         outputs.append(output)
         if output.errors and len(output.errors) > 0:
@@ -0,0 +1,578 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Persistent Query Engine API.
+
+The function-based query API (`graphrag.api.query`) re-reads the indexer outputs, rebuilds the
+data-model objects and re-opens the vector stores on every call. This module provides a
+long-lived `QueryEngine` that loads the single-index outputs once, keeps the adapted
+data-model objects and vector store connections warm, and serves all four search methods
+from that state. The outputs are reloaded when the underlying parquet files change.
+
+WARNING: This API is under development and may undergo changes in future releases.
+Backwards compatibility is not guaranteed at this time.
+"""
+
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, cast
+
+import pandas as pd
+
+from graphrag.bm25.index import (
+    DOCUMENTS_TABLE,
+    ENTITIES_CORPUS,
+    POSTINGS_TABLE,
+    TEXT_UNITS_CORPUS,
+    BM25Index,
+    load_bm25_index,
+)
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.embeddings import (
+    community_full_content_embedding,
+    entity_description_embedding,
+    text_unit_text_embedding,
+)
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.logger.standard_logging import init_loggers
+from graphrag.query.factory import (
+    get_basic_search_engine,
+    get_drift_search_engine,
+    get_global_search_engine,
+    get_local_search_engine,
+)
+from graphrag.query.indexer_adapters import (
+    SEARCH_COLUMNS,
+    read_indexer_communities,
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_report_embeddings,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from graphrag.query.input.retrieval.index import RetrievalIndex
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.api import (
+    create_storage_from_config,
+    get_embedding_store,
+    load_search_prompt,
+    truncate,
+)
+from graphrag.utils.cli import redact
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+from graphrag.vector_stores.base import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_TABLES = [
+    "entities",
+    "communities",
+    "community_reports",
+    "text_units",
+    "relationships",
+]
+OPTIONAL_TABLES = ["covariates"]
+LEXICAL_TABLES = [POSTINGS_TABLE, DOCUMENTS_TABLE]
+# every search method is served from the same tables, so read the columns any of them needs
+TABLE_COLUMNS = {
+    name: list(
+        dict.fromkeys(
+            column
+            for search_columns in SEARCH_COLUMNS.values()
+            for column in search_columns.get(name, [])
+        )
+    )
+    for name in REQUIRED_TABLES + OPTIONAL_TABLES
+}
+
+
+class QueryEngine:
+    """Long-lived query session that keeps a single index warm across queries.
+
+    Tables are read lazily on first use, limited to the columns the searches read,
+    and every adapted data-model list (entities, reports, text units, ...) is
+    memoized per community level, like the lookup tables local search retrieves
+    from. Vector stores are connected once per embedding name. Before a query the
+    engine checks the size and modification time (or blob ETag) of the output
+    tables, at most once every `refresh_interval` seconds, and drops all memoized
+    state when any of them changed, so a re-index is picked up without restarting
+    the process.
+    Pass a `cache` to cache the chat and embedding calls made while searching, and
+    `columnar` to keep the entities, relationships and text units in columnar tables
+    instead of one object per row, which large indexes need far less memory for.
+    The BM25 index is loaded on first use, for searches with `hybrid_search`
+    enabled and for keyword lookups through `lexical_index`.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        storage: PipelineStorage | None = None,
+        verbose: bool = False,
+        cache: PipelineCache | None = None,
+        columnar: bool = False,
+        refresh_interval: float = 5.0,
+    ):
+        self.config = config
+        self.verbose = verbose
+        self.columnar = columnar
+        self.refresh_interval = refresh_interval
+        self._cache = cache
+        self._storage = storage or create_storage_from_config(config.output)
+        self._signature: dict[str, str | None] | None = None
+        self._checked_at = 0.0
+        self._tables: dict[str, pd.DataFrame | None] = {}
+        self._objects: dict[tuple, Any] = {}
+        self._vector_stores: dict[str, BaseVectorStore] = {}
+        init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    @property
+    def cache(self) -> PipelineCache | None:
+        """The cache used for the chat and embedding calls, if any."""
+        return self._cache
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Drop all warm state if the output tables changed since the last load.
+
+        Unless `force` is set, the tables are not checked again within
+        `refresh_interval` seconds of the last check. Returns True when the cached
+        state was invalidated.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._signature is not None
+            and now - self._checked_at < self.refresh_interval
+        ):
+            return False
+        self._checked_at = now
+        signature = await self._read_signature()
+        if not force and signature == self._signature:
+            return False
+        if self._signature is not None:
+            logger.info("Index outputs changed, reloading query engine state")
+        self._signature = signature
+        self._tables = {}
+        self._objects = {}
+        # vector store handles may pin an old table version, reconnect after a re-index
+        self._vector_stores = {}
+        return True
+
+    async def load(self) -> None:
+        """Eagerly load every output table, e.g. to warm the engine at startup."""
+        await self.refresh()
+        for name in REQUIRED_TABLES + OPTIONAL_TABLES:
+            await self._table(name)
+
+    async def global_search(
+        self,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a global search and return the response and context data."""
+        return await self._collect(
+            self.global_search_streaming,
+            query=query,
+            community_level=community_level,
+            dynamic_community_selection=dynamic_community_selection,
+            response_type=response_type,
+            callbacks=callbacks,
+        )
+
+    async def global_search_streaming(
+        self,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Perform a global search and stream the response back."""
+        await self.refresh()
+        config = self.config
+        search_engine = get_global_search_engine(
+            config,
+            reports=await self._reports(community_level, dynamic_community_selection),
+            entities=await self._entities(community_level),
+            communities=await self._memoize(
+                ("communities",),
+                lambda tables: read_indexer_communities(
+                    tables["communities"], tables["community_reports"]
+                ),
+                ["communities", "community_reports"],
+            ),
+            response_type=response_type,
+            dynamic_community_selection=dynamic_community_selection,
+            map_system_prompt=load_search_prompt(
+                config.root_dir, config.global_search.map_prompt
+            ),
+            reduce_system_prompt=load_search_prompt(
+                config.root_dir, config.global_search.reduce_prompt
+            ),
+            general_knowledge_inclusion_prompt=load_search_prompt(
+                config.root_dir, config.global_search.knowledge_prompt
+            ),
+            callbacks=callbacks,
+            cache=self._cache,
+        )
+        logger.debug("Executing streaming global search query: %s", query)
+        async for chunk in search_engine.stream_search(query=query):
+            yield chunk
+
+    async def local_search(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a local search and return the response and context data."""
+        return await self._collect(
+            self.local_search_streaming,
+            query=query,
+            community_level=community_level,
+            response_type=response_type,
+            callbacks=callbacks,
+        )
+
+    async def local_search_streaming(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Perform a local search and stream the response back."""
+        await self.refresh()
+        search_engine = get_local_search_engine(
+            config=self.config,
+            reports=await self._reports(community_level),
+            text_units=await self._text_units(),
+            entities=await self._entities(community_level),
+            relationships=await self._relationships(),
+            covariates={"claims": await self._covariates()},
+            description_embedding_store=self._vector_store(
+                entity_description_embedding
+            ),
+            response_type=response_type,
+            system_prompt=load_search_prompt(
+                self.config.root_dir, self.config.local_search.prompt
+            ),
+            callbacks=callbacks,
+            cache=self._cache,
+            lexical_index=await self.lexical_index(ENTITIES_CORPUS)
+            if self.config.local_search.hybrid_search
+            else None,
+            retrieval_index=await self._retrieval_index(community_level),
+            covariate_indexes=await self._covariate_indexes(),
+        )
+        logger.debug("Executing streaming local search query: %s", query)
+        async for chunk in search_engine.stream_search(query=query):
+            yield chunk
+
+    async def drift_search(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a DRIFT search and return the response and context data."""
+        return await self._collect(
+            self.drift_search_streaming,
+            query=query,
+            community_level=community_level,
+            response_type=response_type,
+            callbacks=callbacks,
+        )
+
+    async def drift_search_streaming(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Perform a DRIFT search and stream the response back."""
+        await self.refresh()
+        config = self.config
+        full_content_embedding_store = self._vector_store(
+            community_full_content_embedding
+        )
+
+        def read_drift_reports(tables: dict[str, pd.DataFrame | None]) -> Any:
+            # DRIFT attaches the report embeddings in place, so keep its own copy
+            reports = read_indexer_reports(
+                tables["community_reports"],  # type: ignore
+                tables["communities"],  # type: ignore
+                community_level,
+            )
+            read_indexer_report_embeddings(reports, full_content_embedding_store)
+            return reports
+
+        search_engine = get_drift_search_engine(
+            config=config,
+            reports=await self._memoize(
+                ("drift_reports", community_level),
+                read_drift_reports,
+                ["community_reports", "communities"],
+            ),
+            text_units=await self._text_units(),
+            entities=await self._entities(community_level),
+            relationships=await self._relationships(),
+            description_embedding_store=self._vector_store(
+                entity_description_embedding
+            ),
+            local_system_prompt=load_search_prompt(
+                config.root_dir, config.drift_search.prompt
+            ),
+            reduce_system_prompt=load_search_prompt(
+                config.root_dir, config.drift_search.reduce_prompt
+            ),
+            response_type=response_type,
+            callbacks=callbacks,
+            cache=self._cache,
+        )
+        logger.debug("Executing streaming drift search query: %s", query)
+        async for chunk in search_engine.stream_search(query=query):
+            yield chunk
+
+    async def basic_search(
+        self,
+        query: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a basic search and return the response and context data."""
+        return await self._collect(
+            self.basic_search_streaming, query=query, callbacks=callbacks
+        )
+
+    async def basic_search_streaming(
+        self,
+        query: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Perform a basic search and stream the response back."""
+        await self.refresh()
+        search_engine = get_basic_search_engine(
+            config=self.config,
+            text_units=await self._text_units(),
+            text_unit_embeddings=self._vector_store(text_unit_text_embedding),
+            system_prompt=load_search_prompt(
+                self.config.root_dir, self.config.basic_search.prompt
+            ),
+            callbacks=callbacks,
+            cache=self._cache,
+            lexical_index=await self.lexical_index(TEXT_UNITS_CORPUS)
+            if self.config.basic_search.hybrid_search
+            else None,
+        )
+        logger.debug("Executing streaming basic search query: %s", query)
+        async for chunk in search_engine.stream_search(query=query):
+            yield chunk
+
+    async def lexical_index(self, corpus: str = TEXT_UNITS_CORPUS) -> BM25Index | None:
+        """Return the BM25 index of the text units or entities, or None if it was not built."""
+        await self.refresh()
+        key = ("bm25", corpus)
+        if key not in self._objects:
+            index = await load_bm25_index(corpus, self._storage)
+            if index is None:
+                logger.warning(
+                    "No BM25 index in the outputs, searching without it. Enable bm25_index and re-index to build it."
+                )
+            self._objects[key] = index
+        return self._objects[key]
+
+    async def keyword_search(self, query: str, k: int = 10) -> pd.DataFrame | None:
+        """Return the `k` text units best matching the keywords of `query`, or None without a BM25 index.
+
+        The result holds the BM25 `score` and the `id`, `human_readable_id` and `text`
+        of each text unit, best match first.
+        """
+        index = await self.lexical_index(TEXT_UNITS_CORPUS)
+        if index is None:
+            return None
+        positions = await self._memoize(
+            ("text_unit_positions",),
+            lambda tables: {
+                id: position
+                for position, id in enumerate(tables["text_units"]["id"])  # type: ignore
+            },
+            ["text_units"],
+        )
+        hits = [
+            (id, score) for id, score in index.search(query, k=k) if id in positions
+        ]
+        text_units = cast("pd.DataFrame", await self._table("text_units"))
+        result = text_units.iloc[[positions[id] for id, _ in hits]][
+            ["id", "human_readable_id", "text"]
+        ].reset_index(drop=True)
+        result.insert(0, "score", [score for _, score in hits])
+        return result
+
+    async def _collect(
+        self,
+        streaming_search: Callable[..., AsyncGenerator[str, None]],
+        callbacks: list[QueryCallbacks] | None = None,
+        **kwargs: Any,
+    ) -> tuple[str, Any]:
+        """Run a streaming search to completion, capturing its context data."""
+        callbacks = list(callbacks or [])
+        full_response = ""
+        context_data = {}
+
+        def on_context(context: Any) -> None:
+            nonlocal context_data
+            context_data = context
+
+        local_callbacks = NoopQueryCallbacks()
+        local_callbacks.on_context = on_context
+        callbacks.append(local_callbacks)
+
+        async for chunk in streaming_search(callbacks=callbacks, **kwargs):
+            full_response += chunk
+        logger.debug("Query response: %s", truncate(full_response, 400))
+        return full_response, context_data
+
+    async def _read_signature(self) -> dict[str, str | None]:
+        """Fingerprint the output tables using their storage metadata."""
+        signature = {}
+        for name in REQUIRED_TABLES + OPTIONAL_TABLES + LEXICAL_TABLES:
+            filename = f"{name}.parquet"
+            fingerprint = await self._storage.get_fingerprint(filename)
+            if fingerprint is None:
+                # storages without file metadata are treated as immutable
+                fingerprint = "" if await self._storage.has(filename) else None
+            signature[name] = fingerprint
+        return signature
+
+    async def _table(self, name: str) -> pd.DataFrame | None:
+        if name not in self._tables:
+            if name in OPTIONAL_TABLES and not await storage_has_table(
+                name, self._storage
+            ):
+                self._tables[name] = None
+            else:
+                self._tables[name] = await load_table_from_storage(
+                    name=name, storage=self._storage, columns=TABLE_COLUMNS[name]
+                )
+        return self._tables[name]
+
+    async def _memoize(
+        self,
+        key: tuple,
+        build: Callable[[dict[str, pd.DataFrame | None]], Any],
+        table_names: list[str],
+    ) -> Any:
+        if key not in self._objects:
+            tables = {name: await self._table(name) for name in table_names}
+            self._objects[key] = build(tables)
+        return self._objects[key]
+
+    async def _entities(self, community_level: int | None) -> Any:
+        return await self._memoize(
+            ("entities", community_level),
+            lambda tables: read_indexer_entities(
+                tables["entities"],  # type: ignore
+                tables["communities"],  # type: ignore
+                community_level=community_level,
+                columnar=self.columnar,
+            ),
+            ["entities", "communities"],
+        )
+
+    async def _reports(
+        self, community_level: int | None, dynamic_community_selection: bool = False
+    ) -> Any:
+        return await self._memoize(
+            ("reports", community_level, dynamic_community_selection),
+            lambda tables: read_indexer_reports(
+                tables["community_reports"],  # type: ignore
+                tables["communities"],  # type: ignore
+                community_level=community_level,
+                dynamic_community_selection=dynamic_community_selection,
+            ),
+            ["community_reports", "communities"],
+        )
+
+    async def _text_units(self) -> Any:
+        return await self._memoize(
+            ("text_units",),
+            lambda tables: read_indexer_text_units(
+                tables["text_units"],  # type: ignore
+                columnar=self.columnar,
+            ),
+            ["text_units"],
+        )
+
+    async def _relationships(self) -> Any:
+        return await self._memoize(
+            ("relationships",),
+            lambda tables: read_indexer_relationships(
+                tables["relationships"],  # type: ignore
+                columnar=self.columnar,
+            ),
+            ["relationships"],
+        )
+
+    async def _covariates(self) -> Any:
+        return await self._memoize(
+            ("covariates",),
+            lambda tables: read_indexer_covariates(tables["covariates"])
+            if tables["covariates"] is not None
+            else [],
+            ["covariates"],
+        )
+
+    async def _retrieval_index(self, community_level: int) -> RetrievalIndex:
+        key = ("retrieval_index", community_level)
+        if key not in self._objects:
+            self._objects[key] = RetrievalIndex(
+                entities=await self._entities(community_level),
+                relationships=await self._relationships(),
+                text_units=await self._text_units(),
+                community_reports=await self._reports(community_level),
+            )
+        return self._objects[key]
+
+    async def _covariate_indexes(self) -> dict[str, RetrievalIndex]:
+        key = ("covariate_indexes",)
+        if key not in self._objects:
+            self._objects[key] = {
+                "claims": RetrievalIndex(covariates=await self._covariates())
+            }
+        return self._objects[key]
+
+    def _vector_store(self, embedding_name: str) -> BaseVectorStore:
+        if embedding_name not in self._vector_stores:
+            vector_store_args = {
+                index: store.model_dump()
+                for index, store in self.config.vector_store.items()
+            }
+            logger.debug("Vector Store Args: %s", redact(vector_store_args))
+            self._vector_stores[embedding_name] = get_embedding_store(
+                config_args=vector_store_args,
+                embedding_name=embedding_name,
+            )
+        return self._vector_stores[embedding_name]
@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""German-aware text analysis for the BM25 index.
+
+Text is NFKC-normalized and case-folded, split into runs of letters and digits,
+stripped of German and English stop words and reduced with the CISTEM stemmer
+(Weissweiler and Fraser, 2017), which also folds umlauts and ß, so "Häuser",
+"Hauses" and "Haus" share a term. Queries and documents go through the same
+analysis.
+"""
+
+import re
+import unicodedata
+
+_GERMAN_STOP_WORDS = """
+    aber alle allem allen aller alles als also am an ander andere anderem anderen
+    anderer anderes auch auf aus bei beim bin bis bist da damit dann das dass dein
+    deine dem den denn der des dessen die dies diese diesem diesen dieser dieses
+    doch dort du durch ein eine einem einen einer eines er es etwas euch euer für
+    gegen hat hatte hatten hier hin hinter ich ihm ihn ihnen ihr ihre ihrem ihren
+    ihrer im in indem ins ist jede jedem jeden jeder jedes jene jetzt kann kein
+    keine können man manche mein meine mit muss nach nicht nichts noch nun nur ob
+    oder ohne sehr sein seine seinem seinen seiner sich sie sind so solche soll
+    sondern sonst über um und uns unser unter viel vom von vor war waren warst
+    was weil welche welchem welchen welcher welches wenn werde werden wie wieder
+    will wir wird wo wurde wurden zu zum zur zwar zwischen
+"""
+_ENGLISH_STOP_WORDS = """
+    a an and are as at be by for from has have in is it its of on or that the
+    this to was were will with
+"""
+GERMAN_STOP_WORDS = frozenset(_GERMAN_STOP_WORDS.split())
+ENGLISH_STOP_WORDS = frozenset(_ENGLISH_STOP_WORDS.split())
+STOP_WORDS = GERMAN_STOP_WORDS | ENGLISH_STOP_WORDS
+
+_WORD = re.compile(r"[^\W_]+")
+_UMLAUTS = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+_DOUBLE_CHAR = re.compile(r"(.)\1")
+_MARKED_DOUBLE_CHAR = re.compile(r"(.)\*")
+
+
+def analyze(text: str) -> list[str]:
+    """Split a text into the stemmed terms the index stores, in order of occurrence."""
+    return [
+        stem_german(token)
+        for token in _WORD.findall(unicodedata.normalize("NFKC", text).casefold())
+        if token not in STOP_WORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def stem_german(word: str) -> str:
+    """Stem a lowercase German word with CISTEM, ignoring case-dependent rules."""
+    word = word.translate(_UMLAUTS)
+    if word.startswith("ge") and len(word) >= 6:
+        word = word[2:]
+    word = word.replace("sch", "$").replace("ei", "%").replace("ie", "&")
+    word = _DOUBLE_CHAR.sub(r"\1*", word)
+    while len(word) > 3:
+        if len(word) > 5 and word[-2:] in ("em", "er", "nd"):
+            word = word[:-2]
+        elif word[-1] in "tesn":
+            word = word[:-1]
+        else:
+            break
+    word = _MARKED_DOUBLE_CHAR.sub(r"\1\1", word)
+    return word.replace("$", "sch").replace("%", "ei").replace("&", "ie")
@@ -0,0 +1,220 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An in-memory BM25 inverted index and its on-disk tables."""
+
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from graphrag.bm25.analysis import analyze
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+
+POSTINGS_TABLE = "bm25_postings"
+DOCUMENTS_TABLE = "bm25_documents"
+
+TEXT_UNITS_CORPUS = "text_units"
+ENTITIES_CORPUS = "entities"
+
+
+class BM25Index:
+    """A BM25 inverted index over the documents of one corpus.
+
+    Postings are held in compressed sparse row form: the documents containing the
+    term at vocabulary position `i`, in ascending order, and their term frequencies
+    are `positions[indptr[i]:indptr[i + 1]]` and `frequencies[indptr[i]:indptr[i + 1]]`.
+    Document length normalization is precomputed, so a query only touches the
+    postings of its own terms.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        lengths: np.ndarray,
+        terms: Sequence[str],
+        indptr: np.ndarray,
+        positions: np.ndarray,
+        frequencies: np.ndarray,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.ids = list(ids)
+        self.lengths = lengths
+        self.terms = list(terms)
+        self.indptr = indptr
+        self.positions = positions
+        self.frequencies = frequencies
+        self.k1 = k1
+        self.b = b
+        self._term_rows = {term: row for row, term in enumerate(self.terms)}
+        document_frequencies = np.diff(indptr)
+        self._idf = np.log(
+            1
+            + (len(self.ids) - document_frequencies + 0.5)
+            / (document_frequencies + 0.5)
+        )
+        average_length = lengths.mean() if len(lengths) and lengths.any() else 1.0
+        self._length_norms = k1 * (1 - b + b * lengths / average_length)
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self.ids)
+
+    @classmethod
+    def from_texts(
+        cls,
+        ids: Sequence[str],
+        texts: Iterable[str],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "BM25Index":
+        """Build the index for the documents `ids` with the given `texts`."""
+        vocabulary: dict[str, int] = {}
+        term_codes: list[int] = []
+        positions: list[int] = []
+        frequencies: list[int] = []
+        lengths = np.zeros(len(ids), dtype=np.int32)
+        for position, text in enumerate(texts):
+            counts = Counter(analyze(text or ""))
+            lengths[position] = sum(counts.values())
+            for term, frequency in counts.items():
+                term_codes.append(vocabulary.setdefault(term, len(vocabulary)))
+                positions.append(position)
+                frequencies.append(frequency)
+
+        # number the terms alphabetically and group the postings by term, keeping
+        # the documents of each term in ascending order
+        terms = sorted(vocabulary)
+        rows = np.empty(len(terms), dtype=np.int64)
+        rows[[vocabulary[term] for term in terms]] = np.arange(len(terms))
+        posting_rows = rows[np.asarray(term_codes, dtype=np.int64)]
+        order = np.argsort(posting_rows, kind="stable")
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(posting_rows, minlength=len(terms)), out=indptr[1:])
+        return cls(
+            ids,
+            lengths,
+            terms,
+            indptr,
+            np.asarray(positions, dtype=np.int32)[order],
+            np.asarray(frequencies, dtype=np.int32)[order],
+            k1=k1,
+            b=b,
+        )
+
+    def search(self, query: str, k: int = 10) -> list[tuple[str, float]]:
+        """Return the ids and BM25 scores of the `k` best matching documents, best first."""
+        rows = [
+            self._term_rows[term]
+            for term in dict.fromkeys(analyze(query))
+            if term in self._term_rows
+        ]
+        if not rows or k <= 0:
+            return []
+        slices = [slice(self.indptr[row], self.indptr[row + 1]) for row in rows]
+        positions = np.concatenate([self.positions[s] for s in slices])
+        frequencies = np.concatenate([self.frequencies[s] for s in slices])
+        idf = np.repeat(self._idf[rows], [s.stop - s.start for s in slices])
+        scores = (
+            idf
+            * frequencies
+            * (self.k1 + 1)
+            / (frequencies + self._length_norms[positions])
+        )
+
+        matches, inverse = np.unique(positions, return_inverse=True)
+        totals = np.bincount(inverse, weights=scores)
+        if k < len(matches):
+            candidates = np.argpartition(-totals, k - 1)[:k]
+        else:
+            candidates = np.arange(len(matches))
+        # best score first, ties in document order
+        best = candidates[np.lexsort((matches[candidates], -totals[candidates]))]
+        return [(self.ids[matches[i]], float(totals[i])) for i in best]
+
+    def to_tables(self, corpus: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Return the postings and documents tables storing the index as `corpus`.
+
+        Each posting list stores the gaps between its ascending document positions,
+        small numbers that compress well in parquet.
+        """
+        gaps = self.positions.copy()
+        starts = self.indptr[:-1][np.diff(self.indptr) > 0]
+        gaps[1:] -= self.positions[:-1]
+        gaps[starts] = self.positions[starts]
+        postings = pd.DataFrame({
+            "corpus": corpus,
+            "term": self.terms,
+            "position_gaps": _split(gaps, self.indptr),
+            "frequencies": _split(self.frequencies, self.indptr),
+        })
+        documents = pd.DataFrame({
+            "corpus": corpus,
+            "id": self.ids,
+            "length": self.lengths,
+        })
+        return postings, documents
+
+    @classmethod
+    def from_tables(
+        cls,
+        postings: pd.DataFrame,
+        documents: pd.DataFrame,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "BM25Index":
+        """Load the index of a single corpus from its postings and documents tables."""
+        counts = postings["frequencies"].map(len).to_numpy(dtype=np.int64)
+        indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        positions = _concatenate(postings["position_gaps"])
+        # undo the gap encoding: a running sum that restarts with every term
+        positions = np.cumsum(positions, dtype=np.int64)
+        term_offsets = np.repeat(
+            np.concatenate(([0], positions[indptr[1:-1] - 1]))[: len(counts)], counts
+        )
+        return cls(
+            documents["id"].astype(str).tolist(),
+            documents["length"].to_numpy(dtype=np.int32),
+            postings["term"].tolist(),
+            indptr,
+            (positions - term_offsets).astype(np.int32),
+            _concatenate(postings["frequencies"]),
+            k1=k1,
+            b=b,
+        )
+
+
+def _split(values: np.ndarray, indptr: np.ndarray) -> list[np.ndarray]:
+    return np.split(values, indptr[1:-1]) if len(indptr) > 1 else []
+
+
+def _concatenate(lists: pd.Series) -> np.ndarray:
+    if len(lists) == 0:
+        return np.zeros(0, dtype=np.int32)
+    return np.concatenate(lists.to_list()).astype(np.int32)
+
+
+async def load_bm25_index(
+    corpus: str, storage: PipelineStorage, k1: float = 1.2, b: float = 0.75
+) -> BM25Index | None:
+    """Load the index of `corpus` from the output storage, or None if it was not built."""
+    if not await storage_has_table(POSTINGS_TABLE, storage):
+        return None
+    filters = [("corpus", "==", corpus)]
+    return BM25Index.from_tables(
+        await load_table_from_storage(
+            POSTINGS_TABLE,
+            storage,
+            columns=["term", "position_gaps", "frequencies"],
+            filters=filters,
+        ),
+        await load_table_from_storage(
+            DOCUMENTS_TABLE, storage, columns=["id", "length"], filters=filters
+        ),
+        k1=k1,
+        b=b,
+    )
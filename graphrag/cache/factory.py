@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.sqlite_pipeline_cache import CACHE_FILE_NAME, SQLitePipelineCache
 from graphrag.config.enums import CacheType
 from graphrag.storage.blob_pipeline_storage import BlobPipelineStorage
 from graphrag.storage.cosmosdb_pipeline_storage import CosmosDBPipelineStorage
@@ -85,6 +87,14 @@ def create_file_cache(root_dir: str, base_dir: str, **kwargs) -> PipelineCache:
     return JsonPipelineCache(storage)
 
 
+def create_sqlite_cache(
+    root_dir: str, base_dir: str, compression: str | None = None, **_kwargs
+) -> PipelineCache:
+    """Create a single-file sqlite cache implementation."""
+    db_path = Path(root_dir) / base_dir / CACHE_FILE_NAME
+    return SQLitePipelineCache(db_path, compression=compression)
+
+
 def create_blob_cache(**kwargs) -> PipelineCache:
     """Create a blob storage-based cache implementation."""
     storage = BlobPipelineStorage(**kwargs)
@@ -113,3 +123,4 @@ CacheFactory.register(CacheType.memory.value, create_memory_cache)
 CacheFactory.register(CacheType.file.value, create_file_cache)
 CacheFactory.register(CacheType.blob.value, create_blob_cache)
 CacheFactory.register(CacheType.cosmosdb.value, create_cosmosdb_cache)
+CacheFactory.register(CacheType.sqlite.value, create_sqlite_cache)
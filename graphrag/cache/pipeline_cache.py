@@ -34,6 +34,33 @@ class PipelineCache(metaclass=ABCMeta):
             - value - The value to set.
         """
 
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values for the given keys.
+
+        Caches that support batched lookups override this; the default calls get for each key.
+
+        Args:
+            - keys - The keys to get the values for.
+
+        Returns
+        -------
+            - output - The values for the given keys, None for missing keys.
+        """
+        return [await self.get(key) for key in keys]
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set the values for the given keys.
+
+        Caches that support batched writes override this; the default calls set for each key.
+
+        Args:
+            - values - The values to set, by key.
+        """
+        for key, value in values.items():
+            await self.set(key, value, debug_data)
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the cache.
@@ -0,0 +1,306 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'SQLitePipelineCache' model."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "cache.sqlite"
+"""The name of the database file within the cache base_dir."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID
+"""
+
+# Maximum number of keys bound in a single SELECT ... IN (...) statement
+_MAX_VARIABLES = 500
+
+
+class _Connection:
+    """A SQLite connection shared by a cache and all of its children."""
+
+    def __init__(self, db_path: str | Path):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self.lock = threading.Lock()
+        # autocommit mode; batched writes open an explicit transaction
+        self.conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.execute(_SCHEMA)
+
+
+class SQLitePipelineCache(PipelineCache):
+    """Pipeline cache stored as rows of a single SQLite database file.
+
+    Entries hold the same JSON payload as the JsonPipelineCache files, keyed by the
+    `/`-joined child names and key, so that a JsonPipelineCache directory can be imported
+    and exported losslessly. The database runs in WAL mode, which keeps lookups to a
+    single indexed read and allows readers while the pipeline writes. Database access
+    runs in worker threads, so that lookups and writes never block the event loop.
+    """
+
+    _connection: _Connection
+    _prefix: str
+    _compression: str | None
+    _encoding: str
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        compression: str | None = None,
+        encoding: str = "utf-8",
+        *,
+        _connection: _Connection | None = None,
+        _prefix: str = "",
+    ):
+        """Init method definition."""
+        if _connection is None:
+            if db_path is None:
+                msg = "db_path is required for the sqlite cache."
+                raise ValueError(msg)
+            logger.info("Creating sqlite cache at %s", db_path)
+            _connection = _Connection(db_path)
+        if compression not in (None, "zstd"):
+            msg = f"Unsupported cache compression: {compression}"
+            raise ValueError(msg)
+        self._connection = _connection
+        self._prefix = _prefix
+        self._compression = compression
+        self._encoding = encoding
+        # zstd (de)compressors must not be shared between threads
+        self._codecs = threading.local()
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values for the given keys with batched lookups."""
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        await self.set_many({key: value}, debug_data)
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set the values for the given keys in a single transaction."""
+        await asyncio.to_thread(self._set_many, values, debug_data)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return await asyncio.to_thread(self._has, key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await asyncio.to_thread(self._delete, key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await asyncio.to_thread(self._clear)
+
+    def child(self, name: str) -> SQLitePipelineCache:
+        """Child method definition."""
+        return SQLitePipelineCache(
+            compression=self._compression,
+            encoding=self._encoding,
+            _connection=self._connection,
+            _prefix=f"{self._prefix}{name}/",
+        )
+
+    def keys(self) -> list[str]:
+        """Return the keys of all entries in this cache and its children, relative to this cache."""
+        with self._connection.lock:
+            if self._prefix:
+                cursor = self._connection.conn.execute(
+                    "SELECT key FROM cache WHERE key >= ? AND key < ? ORDER BY key",
+                    (self._prefix, f"{self._prefix[:-1]}0"),
+                )
+            else:
+                cursor = self._connection.conn.execute(
+                    "SELECT key FROM cache ORDER BY key"
+                )
+            return [row[0][len(self._prefix) :] for row in cursor]
+
+    def close(self) -> None:
+        """Close the underlying database connection, shared with all children."""
+        with self._connection.lock:
+            self._connection.conn.close()
+
+    def import_json_dir(self, source_dir: str | Path, batch_size: int = 1000) -> int:
+        """Import the files of a JsonPipelineCache directory, returning the number of entries imported.
+
+        File paths relative to `source_dir` become the cache keys, so child caches keep their names.
+        Files that do not contain valid JSON are skipped.
+        """
+        source_dir = Path(source_dir)
+        rows: list[tuple[str, bytes, int]] = []
+        num_imported = 0
+        for root, _, files in os.walk(source_dir):
+            for file in sorted(files):
+                path = Path(root) / file
+                payload = path.read_bytes()
+                try:
+                    json.loads(payload.decode(self._encoding))
+                except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+                    logger.warning("Skipping unreadable cache file %s", path)
+                    continue
+                key = self._key(path.relative_to(source_dir).as_posix())
+                rows.append((key, *self._compress(payload)))
+                if len(rows) >= batch_size:
+                    self._write(rows)
+                    num_imported += len(rows)
+                    rows = []
+        self._write(rows)
+        return num_imported + len(rows)
+
+    def export_json_dir(self, target_dir: str | Path) -> int:
+        """Write every entry as a JsonPipelineCache file below `target_dir`, returning the number of files written."""
+        target_dir = Path(target_dir)
+        keys = [self._key(key) for key in self.keys()]
+        for start in range(0, len(keys), _MAX_VARIABLES):
+            for key, (value, compressed) in self._select(
+                keys[start : start + _MAX_VARIABLES]
+            ).items():
+                path = target_dir / key[len(self._prefix) :]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self._decompress(value, compressed))
+        return len(keys)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    def _get_many(self, keys: list[str]) -> list[Any]:
+        full_keys = [self._key(key) for key in keys]
+        rows: dict[str, tuple[bytes, int]] = {}
+        for start in range(0, len(full_keys), _MAX_VARIABLES):
+            rows.update(self._select(full_keys[start : start + _MAX_VARIABLES]))
+
+        results = []
+        for key in full_keys:
+            row = rows.get(key)
+            results.append(None if row is None else self._decode(key, *row))
+        return results
+
+    def _set_many(self, values: dict[str, Any], debug_data: dict | None) -> None:
+        rows = [
+            (self._key(key), *self._encode({"result": value, **(debug_data or {})}))
+            for key, value in values.items()
+            if value is not None
+        ]
+        self._write(rows)
+
+    def _has(self, key: str) -> bool:
+        with self._connection.lock:
+            cursor = self._connection.conn.execute(
+                "SELECT 1 FROM cache WHERE key = ?", (self._key(key),)
+            )
+            return cursor.fetchone() is not None
+
+    def _delete(self, key: str) -> None:
+        with self._connection.lock:
+            self._connection.conn.execute(
+                "DELETE FROM cache WHERE key = ?", (self._key(key),)
+            )
+
+    def _clear(self) -> None:
+        with self._connection.lock:
+            if self._prefix:
+                # every key starting with "name/" sorts between "name/" and "name0"
+                self._connection.conn.execute(
+                    "DELETE FROM cache WHERE key >= ? AND key < ?",
+                    (self._prefix, f"{self._prefix[:-1]}0"),
+                )
+            else:
+                self._connection.conn.execute("DELETE FROM cache")
+
+    def _write(self, rows: list[tuple[str, bytes, int]]) -> None:
+        if not rows:
+            return
+        with self._connection.lock:
+            conn = self._connection.conn
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, compressed) VALUES (?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _select(self, full_keys: list[str]) -> dict[str, tuple[bytes, int]]:
+        placeholders = ",".join("?" * len(full_keys))
+        with self._connection.lock:
+            cursor = self._connection.conn.execute(
+                f"SELECT key, value, compressed FROM cache WHERE key IN ({placeholders})",  # noqa: S608
+                full_keys,
+            )
+            return {key: (value, compressed) for key, value, compressed in cursor}
+
+    def _encode(self, data: dict) -> tuple[bytes, int]:
+        return self._compress(
+            json.dumps(data, ensure_ascii=False).encode(self._encoding)
+        )
+
+    def _compress(self, payload: bytes) -> tuple[bytes, int]:
+        if self._compression == "zstd":
+            compressor = getattr(self._codecs, "compressor", None)
+            if compressor is None:
+                compressor = self._codecs.compressor = _zstd().ZstdCompressor()
+            return compressor.compress(payload), 1
+        return payload, 0
+
+    def _decompress(self, value: bytes, compressed: int) -> bytes:
+        if not compressed:
+            return value
+        decompressor = getattr(self._codecs, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._codecs.decompressor = _zstd().ZstdDecompressor()
+        return decompressor.decompress(value)
+
+    def _decode(self, key: str, value: bytes, compressed: int) -> Any:
+        try:
+            data = json.loads(
+                self._decompress(value, compressed).decode(self._encoding)
+            )
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            logger.warning("Dropping unreadable cache entry %s", key)
+            with self._connection.lock:
+                self._connection.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        return data.get("result")
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        msg = "zstd cache compression requires the `zstandard` package (pip install zstandard)."
+        raise ImportError(msg) from e
+    return zstandard
@@ -0,0 +1,232 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'TieredPipelineCache' model."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters of a memory cache tier."""
+
+    hits: int = 0
+    """Lookups answered from memory."""
+
+    misses: int = 0
+    """Lookups passed on to the backing cache, including expired entries."""
+
+    evictions: int = 0
+    """Entries dropped to stay within the entry or byte limit."""
+
+    entries: int = 0
+    """Number of entries currently held in memory."""
+
+    size_bytes: int = 0
+    """Estimated size of the entries held in memory, only tracked with a byte limit."""
+
+
+class _MemoryTier:
+    """A bounded LRU map with optional TTL, shared by a tiered cache and its children."""
+
+    def __init__(
+        self, max_entries: int | None, max_bytes: int | None, ttl: float | None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        # key -> (value, size in bytes, expiry time)
+        self.entries: OrderedDict[str, tuple[Any, int, float | None]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+            if (
+                entry is not None
+                and entry[2] is not None
+                and entry[2] < time.monotonic()
+            ):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return _MISSING
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def contains(self, key: str) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and (
+                entry[2] is None or entry[2] >= time.monotonic()
+            )
+
+    def put(self, key: str, value: Any) -> None:
+        size = self._size(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # never fits, only keep it in the backing cache
+            self.pop(key)
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self._remove(key)
+            self.entries[key] = (value, size, expires)
+            self.stats.entries += 1
+            self.stats.size_bytes += size
+            while (
+                self.max_entries is not None and self.stats.entries > self.max_entries
+            ) or (
+                self.max_bytes is not None and self.stats.size_bytes > self.max_bytes
+            ):
+                oldest = next(iter(self.entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def pop(self, key: str) -> None:
+        with self.lock:
+            self._remove(key)
+
+    def clear(self, prefix: str) -> None:
+        with self.lock:
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.stats.entries -= 1
+            self.stats.size_bytes -= entry[1]
+
+    def _size(self, value: Any) -> int:
+        if self.max_bytes is None:
+            return 0
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class TieredPipelineCache(PipelineCache):
+    """A bounded in-memory tier in front of another pipeline cache.
+
+    Reads are served from memory when possible and fill the memory tier from the backing
+    cache on a miss; writes go to both. The memory tier is limited by a number of
+    entries and/or an estimated size in bytes (least recently used entries are evicted
+    first), and entries can expire after `ttl` seconds. Children share the memory tier
+    and its counters. Values are returned as stored, callers must not mutate them.
+    """
+
+    _backend: PipelineCache
+    _tier: _MemoryTier
+    _prefix: str
+
+    def __init__(
+        self,
+        backend: PipelineCache,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        *,
+        _tier: _MemoryTier | None = None,
+        _prefix: str = "",
+    ):
+        """Init method definition."""
+        if _tier is None:
+            if max_entries is None and max_bytes is None:
+                msg = "A tiered cache needs max_entries and/or max_bytes."
+                raise ValueError(msg)
+            _tier = _MemoryTier(max_entries, max_bytes, ttl)
+        self._backend = backend
+        self._tier = _tier
+        self._prefix = _prefix
+
+    @property
+    def backend(self) -> PipelineCache:
+        """The cache behind the memory tier."""
+        return self._backend
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the memory tier counters, shared with all children."""
+        with self._tier.lock:
+            stats = self._tier.stats
+            return CacheStats(
+                hits=stats.hits,
+                misses=stats.misses,
+                evictions=stats.evictions,
+                entries=stats.entries,
+                size_bytes=stats.size_bytes,
+            )
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        value = self._tier.get(self._key(key))
+        if value is not _MISSING:
+            return value
+        value = await self._backend.get(key)
+        if value is not None:
+            self._tier.put(self._key(key), value)
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values for the given keys, reading all memory misses from the backing cache in one batch."""
+        results = [self._tier.get(self._key(key)) for key in keys]
+        missing = [i for i, value in enumerate(results) if value is _MISSING]
+        if missing:
+            values = await self._backend.get_many([keys[i] for i in missing])
+            for i, value in zip(missing, values, strict=True):
+                results[i] = value
+                if value is not None:
+                    self._tier.put(self._key(keys[i]), value)
+        return results
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        await self._backend.set(key, value, debug_data)
+        self._tier.put(self._key(key), value)
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set the values for the given keys in the backing cache and the memory tier."""
+        values = {key: value for key, value in values.items() if value is not None}
+        await self._backend.set_many(values, debug_data)
+        for key, value in values.items():
+            self._tier.put(self._key(key), value)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return self._tier.contains(self._key(key)) or await self._backend.has(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        self._tier.pop(self._key(key))
+        await self._backend.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._tier.clear(self._prefix)
+        await self._backend.clear()
+
+    def child(self, name: str) -> TieredPipelineCache:
+        """Child method definition."""
+        return TieredPipelineCache(
+            self._backend.child(name),
+            _tier=self._tier,
+            _prefix=f"{self._prefix}{name}/",
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
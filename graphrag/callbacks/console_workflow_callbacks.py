@@ -44,3 +44,9 @@ class ConsoleWorkflowCallbacks(NoopWorkflowCallbacks):
         percent = round((complete / total) * 100)
         start = f"  {complete} / {total} "
         print(f"{start:{'.'}<{percent}}", flush=True, end="\r")
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        """Handle performance metrics reported by a workflow stage."""
+        if self._verbose:
+            print("")  # account for potential return on prior progress
+            print(f"{name}: " + ", ".join(f"{k}={v:g}" for k, v in values.items()))
@@ -25,3 +25,6 @@ class NoopWorkflowCallbacks(WorkflowCallbacks):
 
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        """Handle performance metrics reported by a workflow stage."""
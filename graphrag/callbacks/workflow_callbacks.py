@@ -35,3 +35,7 @@ class WorkflowCallbacks(Protocol):
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
         ...
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        """Handle performance metrics (e.g. throughput) reported by a named workflow stage."""
+        ...
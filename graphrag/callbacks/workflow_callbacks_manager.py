@@ -50,3 +50,9 @@ class WorkflowCallbacksManager(WorkflowCallbacks):
         for callback in self._callbacks:
             if hasattr(callback, "progress"):
                 callback.progress(progress)
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        """Handle performance metrics reported by a workflow stage."""
+        for callback in self._callbacks:
+            if hasattr(callback, "metrics"):
+                callback.metrics(name, values)
@@ -0,0 +1,28 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the cache subcommands."""
+
+from pathlib import Path
+
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
+
+
+def import_cache(source_dir: Path, db_path: Path, compression: str | None) -> None:
+    """Import a file cache directory into a sqlite cache file."""
+    cache = SQLitePipelineCache(db_path, compression=compression)
+    try:
+        num_imported = cache.import_json_dir(source_dir)
+    finally:
+        cache.close()
+    print(f"Imported {num_imported} cache entries from {source_dir} into {db_path}")  # noqa: T201
+
+
+def export_cache(db_path: Path, target_dir: Path) -> None:
+    """Export a sqlite cache file into a file cache directory."""
+    cache = SQLitePipelineCache(db_path)
+    try:
+        num_exported = cache.export_json_dir(target_dir)
+    finally:
+        cache.close()
+    print(f"Exported {num_exported} cache entries from {db_path} into {target_dir}")  # noqa: T201
@@ -49,6 +49,7 @@ def index_cli(
     dry_run: bool,
     skip_validation: bool,
     output_dir: Path | None,
+    resume: bool = False,
 ):
     """Run the pipeline with the given config."""
     cli_overrides = {}
@@ -66,6 +67,7 @@ def index_cli(
         cache=cache,
         dry_run=dry_run,
         skip_validation=skip_validation,
+        resume=resume,
     )
 
 
@@ -109,6 +111,7 @@ def _run_index(
     cache,
     dry_run,
     skip_validation,
+    resume=False,
 ):
     # Configure the root logger with the specified log level
     from graphrag.logger.standard_logging import init_loggers
@@ -145,6 +148,7 @@ def _run_index(
             memory_profile=memprofile,
             callbacks=[ConsoleWorkflowCallbacks(verbose=verbose)],
             verbose=verbose,
+            resume=resume,
         )
     )
     encountered_errors = any(
@@ -186,6 +186,14 @@ def _index_cli(
         writable=True,
         resolve_path=True,
     ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help=(
+            "Skip the workflows that completed in a previous run and whose "
+            "config and inputs are unchanged, restarting at the first changed one."
+        ),
+    ),
 ) -> None:
     """Build a knowledge graph index."""
     from graphrag.cli.index import index_cli
@@ -200,6 +208,7 @@ def _index_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        resume=resume,
     )
 
 
@@ -543,3 +552,63 @@ def _query_cli(
             )
         case _:
             raise ValueError(INVALID_METHOD_ERROR)
+
+
+cache_app = typer.Typer(
+    help="Move LLM response caches between the file and sqlite cache types.",
+    no_args_is_help=True,
+)
+app.add_typer(cache_app, name="cache")
+
+
+@cache_app.command("import")
+def _cache_import_cli(
+    source: Path = typer.Argument(
+        ...,
+        help="The file cache directory to import (e.g. <root>/cache).",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        readable=True,
+        resolve_path=True,
+    ),
+    db: Path = typer.Argument(
+        ...,
+        help="The sqlite cache file to write (e.g. <root>/cache/cache.sqlite).",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    compression: str | None = typer.Option(
+        None,
+        "--compression",
+        help="Compress the imported responses. Either 'zstd' or omitted.",
+    ),
+) -> None:
+    """Import a file cache directory into a sqlite cache."""
+    from graphrag.cli.cache import import_cache
+
+    import_cache(source_dir=source, db_path=db, compression=compression)
+
+
+@cache_app.command("export")
+def _cache_export_cli(
+    db: Path = typer.Argument(
+        ...,
+        help="The sqlite cache file to export.",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+        resolve_path=True,
+    ),
+    target: Path = typer.Argument(
+        ...,
+        help="The directory to write the file cache to.",
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+) -> None:
+    """Export a sqlite cache into a file cache directory."""
+    from graphrag.cli.cache import export_cache
+
+    export_cache(db_path=db, target_dir=target)
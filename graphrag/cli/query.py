@@ -12,12 +12,15 @@ import graphrag.api as api
 from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
 from graphrag.config.load_config import load_config
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.query.indexer_adapters import SEARCH_COLUMNS, community_level_filters
 from graphrag.utils.api import create_storage_from_config
 from graphrag.utils.storage import load_table_from_storage, storage_has_table
 
 if TYPE_CHECKING:
     import pandas as pd
 
+    from graphrag.storage.pipeline_storage import PipelineStorage
+
 # ruff: noqa: T201
 
 
@@ -50,6 +53,7 @@ def run_global_search(
             "community_reports",
         ],
         optional_list=[],
+        columns=SEARCH_COLUMNS["global"],
     )
 
     # Call the Multi-Index Global Search API
@@ -165,6 +169,8 @@ def run_local_search(
         optional_list=[
             "covariates",
         ],
+        columns=SEARCH_COLUMNS["local"],
+        filters=community_level_filters(community_level),
     )
     # Call the Multi-Index Local Search API
     if dataframe_dict["multi-index"]:
@@ -294,6 +300,8 @@ def run_drift_search(
             "relationships",
             "entities",
         ],
+        columns=SEARCH_COLUMNS["drift"],
+        filters=community_level_filters(community_level),
     )
 
     # Call the Multi-Index Drift Search API
@@ -409,6 +417,7 @@ def run_basic_search(
         output_list=[
             "text_units",
         ],
+        columns=SEARCH_COLUMNS["basic"],
     )
 
     # Call the Multi-Index Basic Search API
@@ -478,9 +487,26 @@ def _resolve_output_files(
     config: GraphRagConfig,
     output_list: list[str],
     optional_list: list[str] | None = None,
+    columns: dict[str, list[str]] | None = None,
+    filters: dict[str, list[tuple[str, str, Any]]] | None = None,
 ) -> dict[str, Any]:
-    """Read indexing output files to a dataframe dict."""
+    """Read indexing output files to a dataframe dict.
+
+    Only the `columns` and the rows passing the `filters` given per output are read.
+    """
     dataframe_dict = {}
+    columns = columns or {}
+    filters = filters or {}
+
+    def load_table(name: str, storage_obj: "PipelineStorage") -> "pd.DataFrame":
+        return asyncio.run(
+            load_table_from_storage(
+                name=name,
+                storage=storage_obj,
+                columns=columns.get(name),
+                filters=filters.get(name),
+            )
+        )
 
     # Loading output files for multi-index search
     if config.outputs:
@@ -492,9 +518,7 @@ def _resolve_output_files(
             for name in output_list:
                 if name not in dataframe_dict:
                     dataframe_dict[name] = []
-                df_value = asyncio.run(
-                    load_table_from_storage(name=name, storage=storage_obj)
-                )
+                df_value = load_table(name, storage_obj)
                 dataframe_dict[name].append(df_value)
 
             # for optional output files, do not append if the dataframe does not exist
@@ -506,18 +530,14 @@ def _resolve_output_files(
                         storage_has_table(optional_file, storage_obj)
                     )
                     if file_exists:
-                        df_value = asyncio.run(
-                            load_table_from_storage(
-                                name=optional_file, storage=storage_obj
-                            )
-                        )
+                        df_value = load_table(optional_file, storage_obj)
                         dataframe_dict[optional_file].append(df_value)
         return dataframe_dict
     # Loading output files for single-index search
     dataframe_dict["multi-index"] = False
     storage_obj = create_storage_from_config(config.output)
     for name in output_list:
-        df_value = asyncio.run(load_table_from_storage(name=name, storage=storage_obj))
+        df_value = load_table(name, storage_obj)
         dataframe_dict[name] = df_value
 
     # for optional output files, set the dict entry to None instead of erroring out if it does not exist
@@ -525,9 +545,7 @@ def _resolve_output_files(
         for optional_file in optional_list:
             file_exists = asyncio.run(storage_has_table(optional_file, storage_obj))
             if file_exists:
-                df_value = asyncio.run(
-                    load_table_from_storage(name=optional_file, storage=storage_obj)
-                )
+                df_value = load_table(optional_file, storage_obj)
                 dataframe_dict[optional_file] = df_value
             else:
                 dataframe_dict[optional_file] = None
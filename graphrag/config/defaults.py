@@ -19,6 +19,8 @@ from graphrag.config.enums import (
     NounPhraseExtractorType,
     ReportingType,
     StorageType,
+    SummarizeDescriptionsMode,
+    VectorIndexType,
     VectorStoreType,
 )
 from graphrag.index.operations.build_noun_graph.np_extractors.stop_words import (
@@ -30,6 +32,9 @@ from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limite
 from graphrag.language_model.providers.litellm.services.rate_limiter.static_rate_limiter import (
     StaticRateLimiter,
 )
+from graphrag.language_model.providers.litellm.services.rate_limiter.token_bucket_rate_limiter import (
+    TokenBucketRateLimiter,
+)
 from graphrag.language_model.providers.litellm.services.retry.exponential_retry import (
     ExponentialRetry,
 )
@@ -69,6 +74,7 @@ DEFAULT_RETRY_SERVICES: dict[str, Callable[..., Retry]] = {
 
 DEFAULT_RATE_LIMITER_SERVICES: dict[str, Callable[..., RateLimiter]] = {
     "static": StaticRateLimiter,
+    "token_bucket": TokenBucketRateLimiter,
 }
 
 
@@ -81,6 +87,14 @@ class BasicSearchDefaults:
     max_context_tokens: int = 12_000
     chat_model_id: str = DEFAULT_CHAT_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    hybrid_search: bool = False
+
+
+@dataclass
+class BM25IndexDefaults:
+    """Default values for the BM25 lexical index."""
+
+    enabled: bool = True
 
 
 @dataclass
@@ -93,6 +107,10 @@ class CacheDefaults:
     container_name: None = None
     storage_account_blob_url: None = None
     cosmosdb_account_url: None = None
+    compression: None = None
+    memory_max_entries: None = None
+    memory_max_bytes: None = None
+    memory_ttl: None = None
 
 
 @dataclass
@@ -115,6 +133,7 @@ class ClusterGraphDefaults:
     max_cluster_size: int = 10
     use_lcc: bool = True
     seed: int = 0xDEADBEEF
+    incremental: bool = False
 
 
 @dataclass
@@ -248,6 +267,7 @@ class ExtractGraphNLPDefaults:
     text_analyzer: TextAnalyzerDefaults = field(default_factory=TextAnalyzerDefaults)
     concurrent_requests: int = 25
     async_mode: AsyncType = AsyncType.Threaded
+    batch_size: int = 1000
 
 
 @dataclass
@@ -333,6 +353,8 @@ class LanguageModelDefaults:
     max_retries: int = 10
     max_retry_wait: float = 10.0
     concurrent_requests: int = 25
+    adaptive_concurrency: bool = False
+    max_concurrent_requests: int = 100
     responses: None = None
     async_mode: AsyncType = AsyncType.Threaded
 
@@ -350,6 +372,7 @@ class LocalSearchDefaults:
     max_context_tokens: int = 12_000
     chat_model_id: str = DEFAULT_CHAT_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    hybrid_search: bool = False
 
 
 @dataclass
@@ -399,6 +422,7 @@ class SummarizeDescriptionsDefaults:
     prompt: None = None
     max_length: int = 500
     max_input_tokens: int = 4_000
+    mode: SummarizeDescriptionsMode = SummarizeDescriptionsMode.sequential
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
 
@@ -430,6 +454,11 @@ class VectorStoreDefaults:
     audience: None = None
     database_name: None = None
     schema: None = None
+    index_type: ClassVar[VectorIndexType] = VectorIndexType.ivf_flat
+    index_min_rows: int = 100_000
+    index_num_partitions: None = None
+    index_num_sub_vectors: None = None
+    index_nprobes: None = None
 
 
 @dataclass
@@ -465,6 +494,7 @@ class GraphRagConfigDefaults:
     prune_graph: PruneGraphDefaults = field(default_factory=PruneGraphDefaults)
     cluster_graph: ClusterGraphDefaults = field(default_factory=ClusterGraphDefaults)
     umap: UmapDefaults = field(default_factory=UmapDefaults)
+    bm25_index: BM25IndexDefaults = field(default_factory=BM25IndexDefaults)
     local_search: LocalSearchDefaults = field(default_factory=LocalSearchDefaults)
     global_search: GlobalSearchDefaults = field(default_factory=GlobalSearchDefaults)
     drift_search: DriftSearchDefaults = field(default_factory=DriftSearchDefaults)
@@ -473,6 +503,9 @@ class GraphRagConfigDefaults:
         default_factory=lambda: {DEFAULT_VECTOR_STORE_ID: VectorStoreDefaults()}
     )
     workflows: None = None
+    concurrent_workflows: int = 1
+    concurrent_llm_requests: None = None
+    write_manifest: bool = False
 
 
 language_model_defaults = LanguageModelDefaults()
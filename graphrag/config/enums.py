@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmosdb = "cosmosdb"
     """The cosmosdb cache configuration type"""
+    sqlite = "sqlite"
+    """The single-file sqlite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -67,6 +69,23 @@ class VectorStoreType(str, Enum):
     CosmosDB = "cosmosdb"
 
 
+class VectorIndexType(str, Enum):
+    """The approximate nearest neighbor index types for LanceDB vector stores."""
+
+    flat = "flat"
+    """No index, every search scans all vectors (exact)."""
+    ivf_flat = "ivf_flat"
+    """Inverted file index over uncompressed vectors."""
+    ivf_pq = "ivf_pq"
+    """Inverted file index over product-quantized vectors."""
+    ivf_hnsw_sq = "ivf_hnsw_sq"
+    """Inverted file index with an HNSW graph over scalar-quantized vectors per partition."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class ReportingType(str, Enum):
     """The reporting configuration type for the pipeline."""
 
@@ -114,6 +133,7 @@ class AsyncType(str, Enum):
 
     AsyncIO = "asyncio"
     Threaded = "threaded"
+    Process = "process"
 
 
 class ChunkStrategyType(str, Enum):
@@ -127,6 +147,19 @@ class ChunkStrategyType(str, Enum):
         return f'"{self.value}"'
 
 
+class SummarizeDescriptionsMode(str, Enum):
+    """The order in which long description lists are summarized."""
+
+    sequential = "sequential"
+    """Fold the descriptions batch by batch, carrying the partial summary forward."""
+    tree = "tree"
+    """Summarize token-bounded groups concurrently and merge the partial summaries hierarchically."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class SearchMethod(Enum):
     """The type of search to run."""
 
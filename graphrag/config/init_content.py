@@ -103,7 +103,7 @@ summarize_descriptions:
 extract_graph_nlp:
   text_analyzer:
     extractor_type: {graphrag_config_defaults.extract_graph_nlp.text_analyzer.extractor_type.value} # [regex_english, syntactic_parser, cfg]
-  async_mode: {graphrag_config_defaults.extract_graph_nlp.async_mode.value} # or asyncio
+  async_mode: {graphrag_config_defaults.extract_graph_nlp.async_mode.value} # or asyncio, process
 
 cluster_graph:
   max_cluster_size: {graphrag_config_defaults.cluster_graph.max_cluster_size}
@@ -128,6 +128,9 @@ embed_graph:
 umap:
   enabled: false # if true, will generate UMAP embeddings for nodes (embed_graph must also be enabled)
 
+bm25_index:
+  enabled: true # keyword index over text units and entity descriptions for lexical and hybrid search
+
 snapshots:
   graphml: false
   embeddings: false
@@ -31,3 +31,7 @@ class BasicSearchConfig(BaseModel):
         description="The maximum tokens.",
         default=graphrag_config_defaults.basic_search.max_context_tokens,
     )
+    hybrid_search: bool = Field(
+        description="Fuse the vector search results with the BM25 index results using reciprocal rank fusion.",
+        default=graphrag_config_defaults.basic_search.hybrid_search,
+    )
@@ -0,0 +1,17 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+from graphrag.config.defaults import graphrag_config_defaults
+
+
+class BM25IndexConfig(BaseModel):
+    """Configuration section for the BM25 lexical index."""
+
+    enabled: bool = Field(
+        description="A flag indicating whether to build the BM25 index over text units and entity descriptions.",
+        default=graphrag_config_defaults.bm25_index.enabled,
+    )
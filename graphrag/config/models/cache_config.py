@@ -36,3 +36,19 @@ class CacheConfig(BaseModel):
         description="The cosmosdb account url to use.",
         default=graphrag_config_defaults.cache.cosmosdb_account_url,
     )
+    compression: str | None = Field(
+        description="The compression to use for cached responses (sqlite only). Either None or 'zstd'.",
+        default=graphrag_config_defaults.cache.compression,
+    )
+    memory_max_entries: int | None = Field(
+        description="The maximum number of entries of an in-memory LRU tier in front of the cache. The tier is enabled when this or memory_max_bytes is set.",
+        default=graphrag_config_defaults.cache.memory_max_entries,
+    )
+    memory_max_bytes: int | None = Field(
+        description="The maximum estimated size in bytes of an in-memory LRU tier in front of the cache. The tier is enabled when this or memory_max_entries is set.",
+        default=graphrag_config_defaults.cache.memory_max_bytes,
+    )
+    memory_ttl: float | None = Field(
+        description="The number of seconds after which entries of the in-memory tier expire.",
+        default=graphrag_config_defaults.cache.memory_ttl,
+    )
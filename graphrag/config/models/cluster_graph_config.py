@@ -23,3 +23,7 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=graphrag_config_defaults.cluster_graph.seed,
     )
+    incremental: bool = Field(
+        description="Whether update runs re-cluster only the communities touched by the update, seeded with the previous partition.",
+        default=graphrag_config_defaults.cluster_graph.incremental,
+    )
@@ -72,3 +72,7 @@ class ExtractGraphNLPConfig(BaseModel):
         description="The async mode to use.",
         default=graphrag_config_defaults.extract_graph_nlp.async_mode,
     )
+    batch_size: int = Field(
+        description="The number of text units parsed at once by the text analyzer.",
+        default=graphrag_config_defaults.extract_graph_nlp.batch_size,
+    )
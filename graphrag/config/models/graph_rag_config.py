@@ -14,6 +14,7 @@ from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.config.enums import VectorStoreType
 from graphrag.config.errors import LanguageModelConfigMissingError
 from graphrag.config.models.basic_search_config import BasicSearchConfig
+from graphrag.config.models.bm25_index_config import BM25IndexConfig
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
@@ -251,6 +252,24 @@ class GraphRagConfig(BaseModel):
     )
     """List of workflows to run, in execution order."""
 
+    concurrent_workflows: int = Field(
+        description="The maximum number of independent workflows to run at the same time. Set to 1 to run workflows one after another.",
+        default=graphrag_config_defaults.concurrent_workflows,
+    )
+    """The maximum number of independent workflows to run at the same time."""
+
+    concurrent_llm_requests: int | None = Field(
+        description="The number of LLM requests shared by all running workflows. Defaults to the largest `concurrent_requests` of the configured models.",
+        default=graphrag_config_defaults.concurrent_llm_requests,
+    )
+    """The number of LLM requests shared by all running workflows."""
+
+    write_manifest: bool = Field(
+        description="Whether to record the completed workflows in a manifest, so that `--resume` can skip them in a later run.",
+        default=graphrag_config_defaults.write_manifest,
+    )
+    """Whether to record the completed workflows in a manifest."""
+
     embed_text: TextEmbeddingConfig = Field(
         description="Text embedding configuration.",
         default=TextEmbeddingConfig(),
@@ -312,6 +331,12 @@ class GraphRagConfig(BaseModel):
     )
     """The UMAP configuration to use."""
 
+    bm25_index: BM25IndexConfig = Field(
+        description="The BM25 lexical index configuration to use.",
+        default=BM25IndexConfig(),
+    )
+    """The BM25 lexical index configuration to use."""
+
     snapshots: SnapshotsConfig = Field(
         description="The snapshots configuration to use.",
         default=SnapshotsConfig(),
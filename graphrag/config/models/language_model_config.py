@@ -333,9 +333,48 @@ class LanguageModelConfig(BaseModel):
         description="Whether to use concurrent requests for the LLM service.",
         default=language_model_defaults.concurrent_requests,
     )
+    adaptive_concurrency: bool = Field(
+        description="Whether to adapt the number of concurrent requests to the latency and throttling of the LLM service.",
+        default=language_model_defaults.adaptive_concurrency,
+    )
+    max_concurrent_requests: int = Field(
+        description="The maximum number of concurrent requests when adapting the concurrency.",
+        default=language_model_defaults.max_concurrent_requests,
+    )
+
+    def _validate_adaptive_concurrency(self) -> None:
+        """Validate the adaptive concurrency settings.
+
+        Raises
+        ------
+        ValueError
+            If the model type does not support adaptive concurrency or the maximum is out of range.
+        """
+        if not self.adaptive_concurrency:
+            return
+        if self.type not in (ModelType.Chat, ModelType.Embedding):
+            msg = f"adaptive_concurrency is not supported for type '{self.type}'. Use type '{ModelType.Chat.value}' or '{ModelType.Embedding.value}'."
+            raise ValueError(msg)
+        if self.max_concurrent_requests < 1:
+            msg = f"Maximum concurrent requests must be greater than or equal to 1. Suggested value: {language_model_defaults.max_concurrent_requests}."
+            raise ValueError(msg)
+
     async_mode: AsyncType = Field(
         description="The async mode to use.", default=language_model_defaults.async_mode
     )
+
+    def _validate_async_mode(self) -> None:
+        """Validate the async mode.
+
+        Raises
+        ------
+        ValueError
+            If the async mode is not supported for language model calls.
+        """
+        if self.async_mode == AsyncType.Process:
+            msg = f"async_mode '{AsyncType.Process.value}' is only supported for extract_graph_nlp. Use '{AsyncType.AsyncIO.value}' or '{AsyncType.Threaded.value}'."
+            raise ValueError(msg)
+
     responses: list[str | BaseModel] | None = Field(
         default=language_model_defaults.responses,
         description="Static responses to use in mock mode.",
@@ -398,6 +437,8 @@ class LanguageModelConfig(BaseModel):
         self._validate_tokens_per_minute()
         self._validate_requests_per_minute()
         self._validate_max_retries()
+        self._validate_adaptive_concurrency()
+        self._validate_async_mode()
         self._validate_azure_settings()
         self._validate_encoding_model()
         return self
@@ -47,3 +47,7 @@ class LocalSearchConfig(BaseModel):
         description="The maximum tokens.",
         default=graphrag_config_defaults.local_search.max_context_tokens,
     )
+    hybrid_search: bool = Field(
+        description="Fuse the vector search results with the BM25 index results using reciprocal rank fusion.",
+        default=graphrag_config_defaults.local_search.hybrid_search,
+    )
@@ -8,6 +8,7 @@ from pathlib import Path
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import SummarizeDescriptionsMode
 from graphrag.config.models.language_model_config import LanguageModelConfig
 
 
@@ -30,6 +31,10 @@ class SummarizeDescriptionsConfig(BaseModel):
         description="Maximum tokens to submit from the input entity descriptions.",
         default=graphrag_config_defaults.summarize_descriptions.max_input_tokens,
     )
+    mode: SummarizeDescriptionsMode = Field(
+        description="Whether long description lists are folded sequentially or reduced as a tree.",
+        default=graphrag_config_defaults.summarize_descriptions.mode,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.",
         default=graphrag_config_defaults.summarize_descriptions.strategy,
@@ -53,4 +58,5 @@ class SummarizeDescriptionsConfig(BaseModel):
             else None,
             "max_summary_length": self.max_length,
             "max_input_tokens": self.max_input_tokens,
+            "mode": self.mode,
         }
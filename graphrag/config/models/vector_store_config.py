@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from graphrag.config.defaults import vector_store_defaults
 from graphrag.config.embeddings import all_embeddings
-from graphrag.config.enums import VectorStoreType
+from graphrag.config.enums import VectorIndexType, VectorStoreType
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 
 
@@ -87,6 +87,31 @@ class VectorStoreConfig(BaseModel):
         default=vector_store_defaults.overwrite,
     )
 
+    index_type: VectorIndexType = Field(
+        description="The ANN index type to build when type == lancedb.",
+        default=vector_store_defaults.index_type,
+    )
+
+    index_min_rows: int = Field(
+        description="The minimum number of rows before an ANN index is built when type == lancedb; smaller tables are searched exhaustively.",
+        default=vector_store_defaults.index_min_rows,
+    )
+
+    index_num_partitions: int | None = Field(
+        description="The number of IVF partitions of the ANN index when type == lancedb. Defaults to the square root of the number of rows.",
+        default=vector_store_defaults.index_num_partitions,
+    )
+
+    index_num_sub_vectors: int | None = Field(
+        description="The number of PQ sub-vectors of an ivf_pq index when type == lancedb. Defaults to the vector size / 16.",
+        default=vector_store_defaults.index_num_sub_vectors,
+    )
+
+    index_nprobes: int | None = Field(
+        description="The number of IVF partitions to search per query when type == lancedb.",
+        default=vector_store_defaults.index_nprobes,
+    )
+
     embeddings_schema: dict[str, VectorStoreSchemaConfig] = {}
 
     def _validate_embeddings_schema(self) -> None:
@@ -3,6 +3,8 @@
 
 """Common types for the GraphRAG knowledge model."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 TextEmbedder = Callable[[str], list[float]]
+AsyncTextEmbedder = Callable[[str], Awaitable[list[float]]]
+AsyncBatchTextEmbedder = Callable[[list[str]], Awaitable[list[list[float]]]]
@@ -3,20 +3,25 @@
 
 """Graph extraction using NLP."""
 
-from itertools import combinations
+import asyncio
+import math
+from itertools import chain
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
     BaseNounPhraseExtractor,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
-from graphrag.index.utils.graphs import calculate_pmi_edge_weights
+from graphrag.index.utils.graphs import calculate_pmi
 from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.logger.progress import progress_ticker
 
 
 async def build_noun_graph(
@@ -26,6 +31,8 @@ async def build_noun_graph(
     num_threads: int = 4,
     async_mode: AsyncType = AsyncType.Threaded,
     cache: PipelineCache | None = None,
+    batch_size: int = 1000,
+    callbacks: WorkflowCallbacks | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Build a noun graph from text units."""
     text_units = text_unit_df.loc[:, ["id", "text"]]
@@ -35,6 +42,8 @@ async def build_noun_graph(
         num_threads=num_threads,
         async_mode=async_mode,
         cache=cache,
+        batch_size=batch_size,
+        callbacks=callbacks,
     )
     edges_df = _extract_edges(nodes_df, normalize_edge_weights=normalize_edge_weights)
     return (nodes_df, edges_df)
@@ -46,33 +55,52 @@ async def _extract_nodes(
     num_threads: int = 4,
     async_mode: AsyncType = AsyncType.Threaded,
     cache: PipelineCache | None = None,
+    batch_size: int = 1000,
+    callbacks: WorkflowCallbacks | None = None,
 ) -> pd.DataFrame:
     """
     Extract initial nodes and edges from text units.
 
+    Cached noun phrases are looked up in bulk, the remaining text units are parsed in
+    batches of `batch_size`, in `num_threads` processes with the process async mode.
+    Progress is reported for the cached text units and then after every batch.
+
     Input: text unit df with schema [id, text, document_id]
     Returns a dataframe with schema [id, title, frequency, text_unit_ids].
     """
     cache = cache or NoopPipelineCache()
     cache = cache.child("extract_noun_phrases")
+    callbacks = callbacks or NoopWorkflowCallbacks()
 
-    async def extract(row):
-        text = row["text"]
-        attrs = {"text": text, "analyzer": str(text_analyzer)}
-        key = gen_sha512_hash(attrs, attrs.keys())
-        result = await cache.get(key)
-        if not result:
-            result = text_analyzer.extract(text)
-            await cache.set(key, result)
-        return result
-
-    text_unit_df["noun_phrases"] = await derive_from_rows(
-        text_unit_df,
-        extract,
-        num_threads=num_threads,
-        async_type=async_mode,
-        progress_msg="extract noun phrases progress: ",
+    texts = text_unit_df["text"].tolist()
+    tick = progress_ticker(
+        callbacks.progress,
+        num_total=len(texts),
+        description="extract noun phrases progress: ",
     )
+    keys = [_noun_phrases_cache_key(text, text_analyzer) for text in texts]
+    noun_phrases = await cache.get_many(keys)
+    missing = [i for i, result in enumerate(noun_phrases) if result is None]
+    if len(missing) < len(texts):
+        tick(len(texts) - len(missing))
+    if missing:
+        n_process = max(1, num_threads) if async_mode == AsyncType.Process else 1
+        # smaller batches when there are too few to keep every process busy
+        batch_size = max(1, min(batch_size, math.ceil(len(missing) / n_process)))
+        loop = asyncio.get_running_loop()
+        extracted = await asyncio.to_thread(
+            text_analyzer.extract_batch,
+            [texts[i] for i in missing],
+            batch_size=batch_size,
+            n_process=n_process,
+            # the batches are parsed in a worker thread, report them on the loop
+            on_parsed=lambda count: loop.call_soon_threadsafe(tick, count),
+        )
+        for i, result in zip(missing, extracted, strict=True):
+            noun_phrases[i] = result
+        await cache.set_many({keys[i]: noun_phrases[i] for i in missing})
+    tick.done()
+    text_unit_df["noun_phrases"] = noun_phrases
 
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
@@ -89,52 +117,116 @@ async def _extract_nodes(
     return grouped_node_df.loc[:, ["title", "frequency", "text_unit_ids"]]
 
 
+def _noun_phrases_cache_key(text: str, text_analyzer: BaseNounPhraseExtractor) -> str:
+    attrs = {"text": text, "analyzer": str(text_analyzer)}
+    return gen_sha512_hash(attrs, attrs.keys())
+
+
 def _extract_edges(
     nodes_df: pd.DataFrame,
     normalize_edge_weights: bool = True,
+    include_text_unit_ids: bool = True,
 ) -> pd.DataFrame:
     """
     Extract edges from nodes.
 
-    Nodes appear in the same text unit are connected.
+    Nodes appear in the same text unit are connected. Noun phrases are numbered in
+    title order and the co-occurrence counts are the upper triangle of the sparse
+    product of the text unit x noun phrase incidence matrix with itself, so the pairs
+    of a text unit are never built as Python objects.
     Input: nodes_df with schema [id, title, frequency, text_unit_ids]
-    Returns: edges_df with schema [source, target, weight, text_unit_ids]
+    Returns: edges_df with schema [source, target, weight, text_unit_ids], without the
+    text_unit_ids unless `include_text_unit_ids` is set
     """
-    text_units_df = nodes_df.explode("text_unit_ids")
-    text_units_df = text_units_df.rename(columns={"text_unit_ids": "text_unit_id"})
-
-    text_units_df = (
-        text_units_df.groupby("text_unit_id")
-        .agg({"title": lambda x: list(x) if len(x) > 1 else np.nan})
-        .reset_index()
+    titles = nodes_df["title"].to_numpy(dtype=object)
+    order = np.argsort(titles, kind="stable")
+    titles = titles[order]
+    phrase_ids = np.empty(len(order), dtype=np.int64)
+    phrase_ids[order] = np.arange(len(order))
+
+    text_unit_ids = nodes_df["text_unit_ids"].tolist()
+    lengths = np.fromiter(
+        (len(ids) for ids in text_unit_ids), dtype=np.int64, count=len(text_unit_ids)
     )
-    text_units_df = text_units_df.dropna()
-    titles = text_units_df["title"].tolist()
-    all_edges: list[list[tuple[str, str]]] = [list(combinations(t, 2)) for t in titles]
-
-    text_units_df = text_units_df.assign(edges=all_edges)  # type: ignore
-    edge_df = text_units_df.explode("edges")[["edges", "text_unit_id"]]
-
-    edge_df[["source", "target"]] = edge_df.loc[:, "edges"].to_list()
-    edge_df["min_source"] = edge_df[["source", "target"]].min(axis=1)
-    edge_df["max_target"] = edge_df[["source", "target"]].max(axis=1)
-    edge_df = edge_df.drop(columns=["source", "target"]).rename(
-        columns={"min_source": "source", "max_target": "target"}  # type: ignore
+    unit_codes, units = pd.factorize(
+        pd.Series(list(chain.from_iterable(text_unit_ids)), dtype=object), sort=True
     )
-
-    edge_df = edge_df[(edge_df.source.notna()) & (edge_df.target.notna())]
-    edge_df = edge_df.drop(columns=["edges"])
-    # group by source and target, count the number of text units
-    grouped_edge_df = (
-        edge_df.groupby(["source", "target"]).agg({"text_unit_id": list}).reset_index()
+    phrase_codes = np.repeat(phrase_ids, lengths)
+    incidence = sparse.csr_matrix(
+        (np.ones(len(unit_codes), dtype=np.int64), (unit_codes, phrase_codes)),
+        shape=(len(units), len(titles)),
     )
-    grouped_edge_df = grouped_edge_df.rename(columns={"text_unit_id": "text_unit_ids"})
-    grouped_edge_df["weight"] = grouped_edge_df["text_unit_ids"].apply(len)
-    grouped_edge_df = grouped_edge_df.loc[
-        :, ["source", "target", "weight", "text_unit_ids"]
-    ]
+
+    cooccurrence = sparse.triu(incidence.T @ incidence, k=1, format="csr")
+    # a noun phrase listed n times in a text unit is paired with itself n(n-1)/2 times
+    counts = incidence.data
+    self_pairs = np.bincount(
+        incidence.indices, weights=counts * (counts - 1) // 2, minlength=len(titles)
+    ).astype(np.int64)
+    if self_pairs.any():
+        cooccurrence = (cooccurrence + sparse.diags(self_pairs, format="csr")).tocsr()
+        cooccurrence.eliminate_zeros()
+    cooccurrence.sort_indices()
+    cooccurrence = cooccurrence.tocoo()
+    sources, targets = cooccurrence.row, cooccurrence.col
+    weights = cooccurrence.data.astype(np.int64)
+
+    edges_df = pd.DataFrame({
+        "source": titles[sources],
+        "target": titles[targets],
+        "weight": weights,
+    })
+    if include_text_unit_ids:
+        edges_df["text_unit_ids"] = _edge_text_unit_ids(
+            unit_codes, phrase_codes, units, len(titles), weights
+        )
     if normalize_edge_weights:
         # use PMI weight instead of raw weight
-        grouped_edge_df = calculate_pmi_edge_weights(nodes_df, grouped_edge_df)
+        frequencies = nodes_df["frequency"].to_numpy()[order]
+        edges_df["weight"] = calculate_pmi(
+            weights,
+            frequencies[sources],
+            frequencies[targets],
+            nodes_df["frequency"].sum(),
+        )
+
+    return edges_df
+
+
+def _edge_text_unit_ids(
+    unit_codes: np.ndarray,
+    phrase_codes: np.ndarray,
+    units: pd.Index,
+    num_phrases: int,
+    weights: np.ndarray,
+) -> list[list]:
+    """
+    List the text units of every edge, once per pair of the edge they contain.
+
+    The pairs are enumerated as integer arrays and sorted by edge, which puts them in
+    the order of the co-occurrence matrix entries and keeps the text units sorted.
+    """
+    entries = np.lexsort((phrase_codes, unit_codes))
+    unit_codes = unit_codes[entries]
+    phrase_codes = phrase_codes[entries]
 
-    return grouped_edge_df
+    # pair every entry with the entries after it in the same text unit
+    _, unit_starts, unit_lengths = np.unique(
+        unit_codes, return_index=True, return_counts=True
+    )
+    unit_ends = np.repeat(unit_starts + unit_lengths, unit_lengths)
+    num_later = unit_ends - np.arange(len(unit_codes)) - 1
+    firsts = np.repeat(np.arange(len(unit_codes)), num_later)
+    offsets = np.arange(len(firsts)) - np.repeat(
+        np.cumsum(num_later) - num_later, num_later
+    )
+    seconds = firsts + 1 + offsets
+
+    edge_keys = phrase_codes[firsts] * num_phrases + phrase_codes[seconds]
+    pair_units = unit_codes[firsts][np.argsort(edge_keys, kind="stable")]
+    pair_unit_ids = units.to_numpy()[pair_units].tolist()
+    ends = np.cumsum(weights)
+    return [
+        pair_unit_ids[start:end]
+        for start, end in zip((ends - weights).tolist(), ends.tolist(), strict=True)
+    ]
@@ -5,10 +5,14 @@
 
 import logging
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
 
 import spacy
 
 logger = logging.getLogger(__name__)
+T = TypeVar("T")
 
 
 class BaseNounPhraseExtractor(metaclass=ABCMeta):
@@ -27,6 +31,7 @@ class BaseNounPhraseExtractor(metaclass=ABCMeta):
             exclude_nouns = []
         self.exclude_nouns = [noun.upper() for noun in exclude_nouns]
         self.word_delimiter = word_delimiter
+        self.spacy_exclude: list[str] = []
 
     @abstractmethod
     def extract(self, text: str) -> list[str]:
@@ -39,10 +44,74 @@ class BaseNounPhraseExtractor(metaclass=ABCMeta):
         Returns: List of noun phrases.
         """
 
+    def extract_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1000,
+        n_process: int = 1,
+        on_parsed: Callable[[int], None] | None = None,
+    ) -> list[list[str]]:
+        """
+        Extract noun phrases from many texts, in order.
+
+        Extractors built on a SpaCy pipeline stream the texts through `nlp.pipe`.
+        The default extracts each text on its own, in `n_process` worker processes
+        when more than one is requested.
+
+        Args:
+            texts: Texts.
+            batch_size: Number of texts parsed, or sent to a worker process, at once.
+            n_process: Number of processes to parse with.
+            on_parsed: Called with the number of texts parsed after every batch.
+
+        Returns: List of noun phrases for each text.
+        """
+        if n_process <= 1:
+            return self._collect_batches(
+                (self.extract(text) for text in texts), batch_size, on_parsed
+            )
+        with ProcessPoolExecutor(max_workers=n_process) as pool:
+            return self._collect_batches(
+                pool.map(self.extract, texts, chunksize=batch_size),
+                batch_size,
+                on_parsed,
+            )
+
+    @staticmethod
+    def _collect_batches(
+        results: Iterable[T],
+        batch_size: int,
+        on_parsed: Callable[[int], None] | None,
+    ) -> list[T]:
+        """Collect the results in order, reporting every batch of them to `on_parsed`."""
+        collected = []
+        for result in results:
+            collected.append(result)
+            if on_parsed is not None and len(collected) % batch_size == 0:
+                on_parsed(batch_size)
+        if on_parsed is not None and len(collected) % batch_size:
+            on_parsed(len(collected) % batch_size)
+        return collected
+
     @abstractmethod
     def __str__(self) -> str:
         """Return string representation of the extractor, used for cache key generation."""
 
+    def __getstate__(self) -> dict:
+        """Drop the SpaCy pipeline when pickling, e.g. for process-pool workers."""
+        state = self.__dict__.copy()
+        if "nlp" in state:
+            state["nlp"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Reload the SpaCy pipeline by name when unpickling."""
+        self.__dict__.update(state)
+        if "nlp" in state and self.model_name:
+            self.nlp = self.load_spacy_model(
+                self.model_name, exclude=self.spacy_exclude
+            )
+
     @staticmethod
     def load_spacy_model(
         model_name: str, exclude: list[str] | None = None
@@ -3,6 +3,7 @@
 
 """CFG-based noun phrase extractor."""
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from spacy.tokens.doc import Doc
@@ -56,13 +57,10 @@ class CFGNounPhraseExtractor(BaseNounPhraseExtractor):
         self.include_named_entities = include_named_entities
         self.exclude_entity_tags = exclude_entity_tags
         if not include_named_entities:
-            self.nlp = self.load_spacy_model(
-                model_name, exclude=["lemmatizer", "parser", "ner"]
-            )
+            self.spacy_exclude = ["lemmatizer", "parser", "ner"]
         else:
-            self.nlp = self.load_spacy_model(
-                model_name, exclude=["lemmatizer", "parser"]
-            )
+            self.spacy_exclude = ["lemmatizer", "parser"]
+        self.nlp = self.load_spacy_model(model_name, exclude=self.spacy_exclude)
 
         self.exclude_pos_tags = exclude_pos_tags
         self.noun_phrase_grammars = noun_phrase_grammars
@@ -80,8 +78,23 @@ class CFGNounPhraseExtractor(BaseNounPhraseExtractor):
 
         Returns: List of noun phrases.
         """
-        doc = self.nlp(text)
+        return self._extract_from_doc(self.nlp(text))
 
+    def extract_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1000,
+        n_process: int = 1,
+        on_parsed: Callable[[int], None] | None = None,
+    ) -> list[list[str]]:
+        """Extract noun phrases from many texts, parsed in batches with `nlp.pipe`."""
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return self._collect_batches(
+            (self._extract_from_doc(doc) for doc in docs), batch_size, on_parsed
+        )
+
+    def _extract_from_doc(self, doc: Doc) -> list[str]:
+        """Extract the filtered noun phrases from a parsed document."""
         filtered_noun_phrases = set()
         if self.include_named_entities:
             # extract noun chunks + entities then filter overlapping spans
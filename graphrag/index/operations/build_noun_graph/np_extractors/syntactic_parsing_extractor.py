@@ -3,8 +3,10 @@
 
 """Noun phrase extractor based on dependency parsing and NER using SpaCy."""
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
+from spacy.tokens.doc import Doc
 from spacy.tokens.span import Span
 from spacy.util import filter_spans
 
@@ -54,9 +56,10 @@ class SyntacticNounPhraseExtractor(BaseNounPhraseExtractor):
         self.include_named_entities = include_named_entities
         self.exclude_entity_tags = exclude_entity_tags
         if not include_named_entities:
-            self.nlp = self.load_spacy_model(model_name, exclude=["lemmatizer", "ner"])
+            self.spacy_exclude = ["lemmatizer", "ner"]
         else:
-            self.nlp = self.load_spacy_model(model_name, exclude=["lemmatizer"])
+            self.spacy_exclude = ["lemmatizer"]
+        self.nlp = self.load_spacy_model(model_name, exclude=self.spacy_exclude)
 
         self.exclude_pos_tags = exclude_pos_tags
 
@@ -72,8 +75,23 @@ class SyntacticNounPhraseExtractor(BaseNounPhraseExtractor):
 
         Returns: List of noun phrases.
         """
-        doc = self.nlp(text)
+        return self._extract_from_doc(self.nlp(text))
 
+    def extract_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1000,
+        n_process: int = 1,
+        on_parsed: Callable[[int], None] | None = None,
+    ) -> list[list[str]]:
+        """Extract noun phrases from many texts, parsed in batches with `nlp.pipe`."""
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return self._collect_batches(
+            (self._extract_from_doc(doc) for doc in docs), batch_size, on_parsed
+        )
+
+    def _extract_from_doc(self, doc: Doc) -> list[str]:
+        """Extract the filtered noun phrases from a parsed document."""
         filtered_noun_phrases = set()
         if self.include_named_entities:
             # extract noun chunks + entities then filter overlapping spans
@@ -3,6 +3,7 @@
 
 """A module containing chunk strategies."""
 
+import os
 from collections.abc import Iterable
 
 import nltk
@@ -32,6 +33,23 @@ def get_encoding_fn(encoding_name):
     return encode, decode
 
 
+def get_batch_encoding_fn(encoding_name):
+    """Get batched encode and decode functions for the encoding model, using a thread per core."""
+    enc = tiktoken.get_encoding(encoding_name)
+    num_threads = os.cpu_count() or 8
+
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        return enc.encode_batch(
+            [text if isinstance(text, str) else f"{text}" for text in texts],
+            num_threads=num_threads,
+        )
+
+    def decode_batch(batch: list[list[int]]) -> list[str]:
+        return enc.decode_batch(batch, num_threads=num_threads)
+
+    return encode_batch, decode_batch
+
+
 def run_tokens(
     input: list[str],
     config: ChunkingConfig,
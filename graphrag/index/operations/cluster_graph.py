@@ -5,9 +5,9 @@
 
 import logging
 
-import networkx as nx
 from graspologic.partition import hierarchical_leiden
 
+from graphrag.index.utils.compact_graph import CompactGraph
 from graphrag.index.utils.stable_lcc import stable_largest_connected_component
 
 Communities = list[tuple[int, int, int, list[str]]]
@@ -17,13 +17,19 @@ logger = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    graph: nx.Graph,
+    graph: CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> Communities:
-    """Apply a hierarchical clustering algorithm to a graph."""
-    if len(graph.nodes) == 0:
+    """
+    Apply a hierarchical clustering algorithm to a graph.
+
+    `starting_communities` seeds the root level with a previous partition of (some
+    of) the node titles, so Leiden refines it instead of starting from singletons.
+    """
+    if graph.num_nodes == 0:
         logger.warning("Graph has no nodes")
         return []
 
@@ -32,6 +38,7 @@ def cluster_graph(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        starting_communities=starting_communities,
     )
 
     levels = sorted(node_id_to_community_map.keys())
@@ -55,17 +62,22 @@ def cluster_graph(
 
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
-    graph: nx.Graph | nx.DiGraph,
+    graph: CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
     """Return Leiden root communities and their hierarchy mapping."""
     if use_lcc:
         graph = stable_largest_connected_component(graph)
 
+    # hierarchical_leiden drops the self-loops of edge lists, but not of networkx graphs
     community_mapping = hierarchical_leiden(
-        graph, max_cluster_size=max_cluster_size, random_seed=seed
+        graph.to_networkx() if graph.has_self_loops() else graph.edge_list(),
+        max_cluster_size=max_cluster_size,
+        starting_communities=starting_communities,
+        random_seed=seed,
     )
     results: dict[int, dict[str, int]] = {}
     hierarchy: dict[int, int] = {}
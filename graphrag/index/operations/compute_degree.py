@@ -3,13 +3,11 @@
 
 """A module containing create_graph definition."""
 
-import networkx as nx
 import pandas as pd
 
+from graphrag.index.utils.compact_graph import CompactGraph
 
-def compute_degree(graph: nx.Graph) -> pd.DataFrame:
+
+def compute_degree(graph: CompactGraph) -> pd.DataFrame:
     """Create a new DataFrame with the degree of each node in the graph."""
-    return pd.DataFrame([
-        {"title": node, "degree": int(degree)}
-        for node, degree in graph.degree  # type: ignore
-    ])
+    return pd.DataFrame({"title": graph.titles, "degree": graph.degrees()})
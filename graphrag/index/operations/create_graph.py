@@ -3,21 +3,38 @@
 
 """A module containing create_graph definition."""
 
-import networkx as nx
+import numpy as np
 import pandas as pd
 
+from graphrag.index.utils.compact_graph import CompactGraph
+
 
 def create_graph(
     edges: pd.DataFrame,
     edge_attr: list[str | int] | None = None,
     nodes: pd.DataFrame | None = None,
     node_id: str = "title",
-) -> nx.Graph:
-    """Create a networkx graph from nodes and edges dataframes."""
-    graph = nx.from_pandas_edgelist(edges, edge_attr=edge_attr)
+) -> CompactGraph:
+    """Create a compact graph from nodes and edges dataframes."""
+    # number the titles in order of appearance, the way networkx adds the nodes
+    endpoints = np.empty(2 * len(edges), dtype=object)
+    endpoints[0::2] = edges["source"].to_numpy(dtype=object)
+    endpoints[1::2] = edges["target"].to_numpy(dtype=object)
+    if nodes is not None:
+        endpoints = np.concatenate([endpoints, nodes[node_id].to_numpy(dtype=object)])
+    codes, titles = pd.factorize(pd.Series(endpoints), use_na_sentinel=False)
 
+    node_data = None
     if nodes is not None:
-        nodes.set_index(node_id, inplace=True)
-        graph.add_nodes_from((n, dict(d)) for n, d in nodes.iterrows())
+        node_data = nodes.drop(columns=[node_id])
+        node_data.index = codes[2 * len(edges) :]
+        node_data = node_data.loc[~node_data.index.duplicated(keep="last")]
+        node_data = node_data.sort_index()
 
-    return graph
+    return CompactGraph.from_edges(
+        titles.to_numpy(dtype=object),
+        codes[0 : 2 * len(edges) : 2],
+        codes[1 : 2 * len(edges) : 2],
+        edge_data=edges.loc[:, edge_attr or []].reset_index(drop=True),
+        node_data=node_data,
+    )
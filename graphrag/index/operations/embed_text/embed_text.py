@@ -3,7 +3,11 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -15,6 +19,7 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import create_index_name
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingStrategy
+from graphrag.index.utils.llm_budget import request_limiter
 from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
 from graphrag.vector_stores.factory import VectorStoreFactory
 
@@ -24,6 +29,11 @@ logger = logging.getLogger(__name__)
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
 
+# Number of insert batches embedded at the same time while earlier batches are written
+EMBED_CONCURRENT_BATCHES = 2
+# Number of embedded batches that may wait for the vector store writer
+EMBED_QUEUE_SIZE = 2
+
 
 class TextEmbedStrategyType(str, Enum):
     """TextEmbedStrategyType class definition."""
@@ -87,7 +97,7 @@ async def _text_embed_in_memory(
 ):
     strategy_type = strategy["type"]
     strategy_exec = load_strategy(strategy_type)
-    strategy_config = {**strategy}
+    strategy_config = _strategy_config(strategy, callbacks)
 
     texts: list[str] = input[embed_column].to_numpy().tolist()
     result = await strategy_exec(texts, callbacks, cache, strategy_config)
@@ -108,7 +118,7 @@ async def _text_embed_with_vector_store(
 ):
     strategy_type = strategy["type"]
     strategy_exec = load_strategy(strategy_type)
-    strategy_config = {**strategy}
+    strategy_config = _strategy_config(strategy, callbacks)
 
     # Get vector-storage configuration
     insert_batch_size: int = (
@@ -130,36 +140,26 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[embed_column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
-
-    all_results = []
-
     num_total_batches = (input.shape[0] + insert_batch_size - 1) // insert_batch_size
-    while insert_batch_size * i < input.shape[0]:
+    embed_metrics = _StageMetrics()
+    write_metrics = _StageMetrics()
+
+    async def embed_batch(i: int) -> tuple[list, list[VectorStoreDocument]]:
         logger.info(
-            "uploading text embeddings batch %d/%d of size %d to vector store",
+            "embedding batch %d/%d of size %d for the vector store",
             i + 1,
             num_total_batches,
             insert_batch_size,
         )
+        start_time = time.perf_counter()
         batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
         texts: list[str] = batch[embed_column].to_numpy().tolist()
         titles: list[str] = batch[title].to_numpy().tolist()
         ids: list[str] = batch[id_column].to_numpy().tolist()
         result = await strategy_exec(texts, callbacks, cache, strategy_config)
-        if result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
+        embeddings = [
+            embedding for embedding in result.embeddings or [] if embedding is not None
+        ]
 
         vectors = result.embeddings or []
         documents: list[VectorStoreDocument] = []
@@ -175,14 +175,122 @@ async def _text_embed_with_vector_store(
                 attributes={"title": doc_title},
             )
             documents.append(document)
+        embed_metrics.record(len(texts), time.perf_counter() - start_time)
+        return embeddings, documents
+
+    # Embedding runs up to EMBED_CONCURRENT_BATCHES batches ahead while the writer loads
+    # finished batches into the vector store. Finished batches are handed over in input
+    # order through a bounded queue, so a slow writer holds back new embedding work.
+    queue: asyncio.Queue[list[VectorStoreDocument] | None] = asyncio.Queue(
+        maxsize=EMBED_QUEUE_SIZE
+    )
+    all_results = []
 
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
-
+    async def produce() -> None:
+        pending: deque[asyncio.Task] = deque()
+        try:
+            for i in range(num_total_batches):
+                pending.append(asyncio.create_task(embed_batch(i)))
+                if len(pending) < EMBED_CONCURRENT_BATCHES:
+                    continue
+                await _hand_over(pending.popleft(), queue, all_results, embed_metrics)
+            while pending:
+                await _hand_over(pending.popleft(), queue, all_results, embed_metrics)
+            await queue.put(None)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def consume() -> None:
+        i = 0
+        while True:
+            start_time = time.perf_counter()
+            documents = await queue.get()
+            write_metrics.wait_seconds += time.perf_counter() - start_time
+            if documents is None:
+                return
+            start_time = time.perf_counter()
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and i == 0
+            )
+            write_metrics.record(len(documents), time.perf_counter() - start_time)
+            i += 1
+
+    start_time = time.perf_counter()
+    tasks = [asyncio.create_task(produce()), asyncio.create_task(consume())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # index once over all batches instead of after every insert
+    await asyncio.to_thread(vector_store.build_index)
+
+    elapsed = time.perf_counter() - start_time
+    callbacks.metrics(
+        "embed_text",
+        {
+            "rows": embed_metrics.rows,
+            "batches": num_total_batches,
+            "seconds": elapsed,
+            "rows_per_second": embed_metrics.rows / elapsed if elapsed else 0.0,
+            **embed_metrics.as_dict("embed"),
+            **write_metrics.as_dict("write"),
+        },
+    )
     return all_results
 
 
+@dataclass
+class _StageMetrics:
+    """Throughput counters of one pipeline stage."""
+
+    rows: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    """Time blocked on the queue: back-pressure for the embedder, starvation for the writer."""
+
+    def record(self, rows: int, seconds: float) -> None:
+        self.rows += rows
+        self.busy_seconds += seconds
+
+    def as_dict(self, prefix: str) -> dict[str, float]:
+        return {
+            f"{prefix}_rows_per_second": (
+                self.rows / self.busy_seconds if self.busy_seconds else 0.0
+            ),
+            f"{prefix}_busy_seconds": self.busy_seconds,
+            f"{prefix}_wait_seconds": self.wait_seconds,
+        }
+
+
+async def _hand_over(
+    task: asyncio.Task,
+    queue: asyncio.Queue,
+    all_results: list,
+    embed_metrics: _StageMetrics,
+) -> None:
+    """Wait for an embedding batch and pass its documents to the writer."""
+    embeddings, documents = await task
+    all_results.extend(embeddings)
+    start_time = time.perf_counter()
+    await queue.put(documents)
+    embed_metrics.wait_seconds += time.perf_counter() - start_time
+
+
+def _strategy_config(strategy: dict[str, Any], callbacks: WorkflowCallbacks) -> dict:
+    """Copy the strategy config with one request limiter for all batches embedded at once."""
+    return {
+        **strategy,
+        "limiter": request_limiter(
+            strategy.get("llm"),
+            strategy.get("num_threads", 4),
+            callbacks,
+        ),
+    }
+
+
 def _create_vector_store(
     vector_store_config: dict, index_name: str, embedding_name: str | None = None
 ) -> BaseVectorStore:
@@ -15,6 +15,11 @@ from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
 from graphrag.index.utils.is_null import is_null
+from graphrag.index.utils.llm_budget import (
+    RequestLimiter,
+    llm_request_slot,
+    request_limiter,
+)
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.logger.progress import ProgressTicker, progress_ticker
@@ -45,7 +50,10 @@ async def run(
         callbacks=callbacks,
         cache=cache,
     )
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    # embed_text shares one limiter among the batches it embeds concurrently
+    semaphore = args.get("limiter") or request_limiter(
+        args["llm"], args.get("num_threads", 4), callbacks
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
@@ -89,10 +97,10 @@ async def _execute(
     model: EmbeddingModel,
     chunks: list[list[str]],
     tick: ProgressTicker,
-    semaphore: asyncio.Semaphore,
+    semaphore: RequestLimiter,
 ) -> list[list[float]]:
     async def embed(chunk: list[str]):
-        async with semaphore:
+        async with semaphore, llm_request_slot():
             chunk_embeddings = await model.aembed_batch(chunk)
             result = np.array(chunk_embeddings)
             tick(1)
@@ -21,6 +21,7 @@ from graphrag.index.operations.extract_covariates.typing import (
     CovariateExtractionResult,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.llm_budget import llm_request_slot, request_limiter
 from graphrag.language_model.manager import ModelManager
 
 logger = logging.getLogger(__name__)
@@ -52,14 +53,15 @@ async def extract_covariates(
 
     async def run_strategy(row):
         text = row[column]
-        result = await run_extract_claims(
-            input=text,
-            entity_types=entity_types,
-            resolved_entities_map=resolved_entities_map,
-            callbacks=callbacks,
-            cache=cache,
-            strategy_config=strategy_config,
-        )
+        async with llm_request_slot():
+            result = await run_extract_claims(
+                input=text,
+                entity_types=entity_types,
+                resolved_entities_map=resolved_entities_map,
+                callbacks=callbacks,
+                cache=cache,
+                strategy_config=strategy_config,
+            )
         return [
             create_row_from_claim_data(row, item, covariate_type)
             for item in result.covariate_data
@@ -72,6 +74,7 @@ async def extract_covariates(
         async_type=async_mode,
         num_threads=num_threads,
         progress_msg="extract covariates progress: ",
+        limiter=request_limiter(strategy_config.get("llm"), num_threads, callbacks),
     )
     return pd.DataFrame([item for row in results for item in row or []])
 
@@ -3,6 +3,8 @@
 
 """A module containing entity_extract methods."""
 
+import hashlib
+import json
 import logging
 from typing import Any
 
@@ -17,6 +19,7 @@ from graphrag.index.operations.extract_graph.typing import (
     ExtractEntityStrategyType,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.llm_budget import llm_request_slot, request_limiter
 from graphrag.logger.progress import Progress
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,9 @@ async def extract_graph(
         strategy.get("type", ExtractEntityStrategyType.graph_intelligence)
     )
     strategy_config = {**strategy}
+    # the parsed result of each text unit is checkpointed, so an interrupted run
+    # resumes without replaying the extraction and gleaning calls of finished rows
+    row_cache = cache.child("extract_graph_rows")
 
     num_started = 0
 
@@ -64,11 +70,27 @@ async def extract_graph(
             )
         except Exception:
             pass
-        result = await strategy_exec(
-            [Document(text=text, id=id)],
-            entity_types,
-            cache,
-            strategy_config,
+        row_key = _row_cache_key(text, id, entity_types, strategy_config)
+        checkpoint = await row_cache.get(row_key)
+        if checkpoint is not None:
+            return [
+                checkpoint["entities"],
+                pd.DataFrame(checkpoint["relationships"]),
+                None,
+            ]
+        async with llm_request_slot():
+            result = await strategy_exec(
+                [Document(text=text, id=id)],
+                entity_types,
+                cache,
+                strategy_config,
+            )
+        await row_cache.set(
+            row_key,
+            {
+                "entities": result.entities,
+                "relationships": pd.DataFrame(result.relationships).to_dict("list"),
+            },
         )
         return [result.entities, result.relationships, result.graph]
 
@@ -79,6 +101,7 @@ async def extract_graph(
         async_type=async_mode,
         num_threads=num_threads,
         progress_msg="extract graph progress: ",
+        limiter=request_limiter(strategy_config.get("llm"), num_threads, callbacks),
     )
 
     entity_dfs = []
@@ -109,6 +132,16 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
+def _row_cache_key(
+    text: str, id: str, entity_types: list[str], strategy_config: dict[str, Any]
+) -> str:
+    """Return the checkpoint key of a text unit's extraction result."""
+    key = json.dumps(
+        [text, id, entity_types, strategy_config], sort_keys=True, default=str
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
 def _merge_entities(entity_dfs) -> pd.DataFrame:
     all_entities = pd.concat(entity_dfs, ignore_index=True)
     return (
@@ -26,11 +26,12 @@ def finalize_entities(
     graph_embeddings = None
     if embed_config is not None and embed_config.enabled:
         graph_embeddings = embed_graph(
-            graph,
+            graph.to_networkx(),
             embed_config,
         )
+    # the layout only reads the nodes
     layout = layout_graph(
-        graph,
+        graph.to_networkx(include_edges=False),
         layout_enabled,
         embeddings=graph_embeddings,
     )
@@ -3,31 +3,36 @@
 
 """A module containing create_graph definition."""
 
-import networkx as nx
+import numpy as np
 import pandas as pd
 
+from graphrag.index.utils.compact_graph import CompactGraph
+
 
 def graph_to_dataframes(
-    graph: nx.Graph,
+    graph: CompactGraph,
     node_columns: list[str] | None = None,
     edge_columns: list[str] | None = None,
     node_id: str = "title",
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Deconstructs an nx.Graph into nodes and edges dataframes."""
-    # nx graph nodes are a tuple, and creating a df from them results in the id being the index
-    nodes = pd.DataFrame.from_dict(dict(graph.nodes(data=True)), orient="index")
-    nodes[node_id] = nodes.index
+    """Deconstructs a CompactGraph into nodes and edges dataframes."""
+    nodes = graph.node_data.reindex(pd.RangeIndex(graph.num_nodes))
+    nodes[node_id] = graph.titles
     nodes.reset_index(inplace=True, drop=True)
 
-    edges = nx.to_pandas_edgelist(graph)
-
-    # we don't deal in directed graphs, but we do need to ensure consistent ordering for df joins
-    # nx loses the initial ordering
-    edges["min_source"] = edges[["source", "target"]].min(axis=1)
-    edges["max_target"] = edges[["source", "target"]].max(axis=1)
-    edges = edges.drop(columns=["source", "target"]).rename(
-        columns={"min_source": "source", "max_target": "target"}  # type: ignore
+    # edges in networkx edge order, each from its lower to its higher title so the
+    # rows join consistently
+    order = graph.edge_order()
+    edges = graph.edge_data.iloc[order].reset_index(drop=True)
+    sources = graph.titles[graph.sources[order]]
+    targets = graph.titles[graph.targets[order]]
+    swap = np.fromiter(
+        (source > target for source, target in zip(sources, targets, strict=True)),
+        dtype=bool,
+        count=len(order),
     )
+    edges["source"] = np.where(swap, targets, sources)
+    edges["target"] = np.where(swap, sources, targets)
 
     if node_columns:
         nodes = nodes.loc[:, node_columns]
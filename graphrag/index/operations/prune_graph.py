@@ -3,20 +3,14 @@
 
 """Graph pruning."""
 
-from typing import TYPE_CHECKING, cast
-
-import graspologic as glc
-import networkx as nx
 import numpy as np
 
 import graphrag.data_model.schemas as schemas
-
-if TYPE_CHECKING:
-    from networkx.classes.reportviews import DegreeView
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 def prune_graph(
-    graph: nx.Graph,
+    graph: CompactGraph,
     min_node_freq: int = 1,
     max_node_freq_std: float | None = None,
     min_node_degree: int = 1,
@@ -24,68 +18,45 @@ def prune_graph(
     min_edge_weight_pct: float = 40,
     remove_ego_nodes: bool = False,
     lcc_only: bool = False,
-) -> nx.Graph:
+) -> CompactGraph:
     """Prune graph by removing nodes that are out of frequency/degree ranges and edges with low weights."""
+    degrees = graph.degrees()
+    keep_nodes = np.ones(graph.num_nodes, dtype=bool)
     # remove ego nodes if needed
-    degree = cast("DegreeView", graph.degree)
-    degrees = list(degree())  # type: ignore
     if remove_ego_nodes:
         # ego node is one with highest degree
-        ego_node = max(degrees, key=lambda x: x[1])
-        graph.remove_nodes_from([ego_node[0]])
+        keep_nodes[np.argmax(degrees)] = False
 
     # remove nodes that are not within the predefined degree range
-    graph.remove_nodes_from([
-        node for node, degree in degrees if degree < min_node_degree
-    ])
+    keep_nodes &= degrees >= min_node_degree
     if max_node_degree_std is not None:
-        upper_threshold = _get_upper_threshold_by_std(
-            [degree for _, degree in degrees], max_node_degree_std
-        )
-        graph.remove_nodes_from([
-            node for node, degree in degrees if degree > upper_threshold
-        ])
+        upper_threshold = _get_upper_threshold_by_std(degrees, max_node_degree_std)
+        keep_nodes &= degrees <= upper_threshold
 
     # remove nodes that are not within the predefined frequency range
-    graph.remove_nodes_from([
-        node
-        for node, data in graph.nodes(data=True)
-        if data[schemas.NODE_FREQUENCY] < min_node_freq
-    ])
+    frequencies = graph.node_values(schemas.NODE_FREQUENCY)
+    keep_nodes &= ~(frequencies < min_node_freq)
     if max_node_freq_std is not None:
         upper_threshold = _get_upper_threshold_by_std(
-            [data[schemas.NODE_FREQUENCY] for _, data in graph.nodes(data=True)],
-            max_node_freq_std,
+            frequencies[keep_nodes], max_node_freq_std
         )
-        graph.remove_nodes_from([
-            node
-            for node, data in graph.nodes(data=True)
-            if data[schemas.NODE_FREQUENCY] > upper_threshold
-        ])
+        keep_nodes &= ~(frequencies > upper_threshold)
 
     # remove edges by min weight
+    keep_edges = keep_nodes[graph.sources] & keep_nodes[graph.targets]
     if min_edge_weight_pct > 0:
-        min_edge_weight = np.percentile(
-            [data[schemas.EDGE_WEIGHT] for _, _, data in graph.edges(data=True)],
-            min_edge_weight_pct,
-        )
-        graph.remove_edges_from([
-            (source, target)
-            for source, target, data in graph.edges(data=True)
-            if source in graph.nodes()
-            and target in graph.nodes()
-            and data[schemas.EDGE_WEIGHT] < min_edge_weight
-        ])
+        weights = graph.edge_data[schemas.EDGE_WEIGHT].to_numpy()
+        min_edge_weight = np.percentile(weights[keep_edges], min_edge_weight_pct)
+        keep_edges &= ~(weights < min_edge_weight)
 
+    graph = graph.subgraph(keep_nodes, keep_edges)
     if lcc_only:
-        return glc.utils.largest_connected_component(graph)  # type: ignore
+        return graph.largest_connected_component()
 
     return graph
 
 
-def _get_upper_threshold_by_std(
-    data: list[float] | list[int], std_trim: float
-) -> float:
+def _get_upper_threshold_by_std(data: np.ndarray, std_trim: float) -> float:
     """Get upper threshold by standard deviation."""
     mean = np.mean(data)
     std = np.std(data)
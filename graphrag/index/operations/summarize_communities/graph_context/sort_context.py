@@ -2,12 +2,195 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+from bisect import bisect_right
+
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.tokenizer.tokenizer import Tokenizer
 
 
+def _get_context_string(
+    entities: list[dict],
+    edges: list[dict],
+    claims: list[dict],
+    sub_community_reports: list[dict] | None = None,
+) -> str:
+    """Concatenate structured data into a context string."""
+    contexts = []
+    if sub_community_reports:
+        report_df = pd.DataFrame(sub_community_reports)
+        if not report_df.empty:
+            contexts.append(
+                f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+            )
+
+    for label, data in [
+        ("Entities", entities),
+        ("Claims", claims),
+        ("Relationships", edges),
+    ]:
+        if data:
+            data_df = pd.DataFrame(data)
+            if not data_df.empty:
+                contexts.append(
+                    f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
+                )
+
+    return "\n\n".join(contexts)
+
+
+class _ContextSection:
+    """Append-only table section with a running token estimate."""
+
+    def __init__(self, label: str, tokenizer: Tokenizer):
+        self.label = label
+        self.tokenizer = tokenizer
+        self.rows: list[dict] = []
+        self.ids: set = set()
+        self.columns: dict[str, None] = {}
+        self.header_tokens = 0
+        self.row_tokens = 0
+
+    def add(self, row: dict) -> bool:
+        """Append a row unless its id was already added."""
+        if row[schemas.SHORT_ID] in self.ids:
+            return False
+        self.ids.add(row[schemas.SHORT_ID])
+        self.rows.append(row)
+        if any(column not in self.columns for column in row):
+            self.columns.update(dict.fromkeys(row))
+            self.header_tokens = self.tokenizer.num_tokens(
+                f"-----{self.label}-----\n{','.join(self.columns)}\n"
+            )
+        self.row_tokens += self.tokenizer.num_tokens(
+            ",".join("" if value is None else str(value) for value in row.values())
+            + "\n"
+        )
+        return True
+
+    @property
+    def num_tokens(self) -> int:
+        """Estimated token count of the rendered section."""
+        return self.header_tokens + self.row_tokens if self.rows else 0
+
+
+class SortedContextBuilder:
+    """Build a community context string by appending nodes, claims and edges.
+
+    Rendering the context through pandas and re-tokenizing it after every edge is
+    quadratic in the number of edges. Instead, each appended row is tokenized once and
+    a running token count is kept per section (sub-reports, nodes, claims, edges).
+    After every edge a checkpoint records the section sizes and the estimated total.
+    `build` uses the estimates to locate the step where the budget is exceeded and
+    then confirms it with exact `num_tokens` calls on the rendered context, so only
+    a logarithmic number of full renders is needed and the output is the same as
+    checking the full context after every edge.
+    """
+
+    def __init__(
+        self, tokenizer: Tokenizer, sub_community_reports: list[dict] | None = None
+    ):
+        self.tokenizer = tokenizer
+        self.sub_community_reports = sub_community_reports
+        self.nodes = _ContextSection("Entities", tokenizer)
+        self.claims = _ContextSection("Claims", tokenizer)
+        self.edges = _ContextSection("Relationships", tokenizer)
+        reports_string = _get_context_string([], [], [], sub_community_reports)
+        self.report_tokens = tokenizer.num_tokens(reports_string)
+        self._checkpoints: list[tuple[int, int, int]] = []
+        self._estimates: list[int] = []
+        self._exact_tokens: dict[int, int] = {}
+
+    def add_node(self, node: dict) -> bool:
+        """Append node details, skipping nodes already in the context."""
+        return self.nodes.add(node)
+
+    def add_claim(self, claim: dict) -> bool:
+        """Append claim details, skipping claims already in the context."""
+        return self.claims.add(claim)
+
+    def add_edge(self, edge: dict) -> bool:
+        """Append edge details, skipping edges already in the context."""
+        return self.edges.add(edge)
+
+    @property
+    def num_tokens(self) -> int:
+        """Estimated token count of the current context."""
+        sections = [
+            section.num_tokens
+            for section in (self.nodes, self.claims, self.edges)
+            if section.rows
+        ]
+        # each section is joined with a blank line
+        return self.report_tokens + sum(sections) + len(sections)
+
+    def checkpoint(self) -> None:
+        """Record the current context as a candidate cut-off point."""
+        self._checkpoints.append((
+            len(self.nodes.rows),
+            len(self.claims.rows),
+            len(self.edges.rows),
+        ))
+        self._estimates.append(self.num_tokens)
+
+    def context_string(self, step: int | None = None) -> str:
+        """Render the context as it was at the given checkpoint (default: current)."""
+        if step is None:
+            num_nodes, num_claims, num_edges = (
+                len(self.nodes.rows),
+                len(self.claims.rows),
+                len(self.edges.rows),
+            )
+        else:
+            num_nodes, num_claims, num_edges = self._checkpoints[step]
+        return _get_context_string(
+            self.nodes.rows[:num_nodes],
+            self.edges.rows[:num_edges],
+            self.claims.rows[:num_claims],
+            self.sub_community_reports,
+        )
+
+    def build(self, max_context_tokens: int | None = None) -> str:
+        """Return the largest checkpointed context that fits the token budget.
+
+        If even the first checkpoint exceeds the budget it is returned as is.
+        """
+        num_steps = len(self._checkpoints)
+        if num_steps == 0 or not max_context_tokens:
+            return self.context_string()
+
+        def exceeds(step: int) -> bool:
+            if step not in self._exact_tokens:
+                self._exact_tokens[step] = self.tokenizer.num_tokens(
+                    self.context_string(step)
+                )
+            return self._exact_tokens[step] > max_context_tokens
+
+        # bracket the first exceeding checkpoint around the estimate, then bisect
+        start = min(bisect_right(self._estimates, max_context_tokens), num_steps - 1)
+        if exceeds(start):
+            low, high, stride = start - 1, start, 1
+            while low >= 0 and exceeds(low):
+                high, stride = low, stride * 2
+                low = high - stride
+            low = max(low, -1)
+        else:
+            low, high, stride = start, start + 1, 1
+            while high < num_steps and not exceeds(high):
+                low, stride = high, stride * 2
+                high = low + stride
+            high = min(high, num_steps)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if exceeds(middle):
+                high = middle
+            else:
+                low = middle
+
+        return self.context_string(max(high - 1, 0) if high < num_steps else None)
+
+
 def sort_context(
     local_context: list[dict],
     tokenizer: Tokenizer,
@@ -23,36 +206,6 @@ def sort_context(
     claim_details_column: str = schemas.CLAIM_DETAILS,
 ) -> str:
     """Sort context by degree in descending order, optimizing for performance."""
-
-    def _get_context_string(
-        entities: list[dict],
-        edges: list[dict],
-        claims: list[dict],
-        sub_community_reports: list[dict] | None = None,
-    ) -> str:
-        """Concatenate structured data into a context string."""
-        contexts = []
-        if sub_community_reports:
-            report_df = pd.DataFrame(sub_community_reports)
-            if not report_df.empty:
-                contexts.append(
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                )
-
-        for label, data in [
-            ("Entities", entities),
-            ("Claims", claims),
-            ("Relationships", edges),
-        ]:
-            if data:
-                data_df = pd.DataFrame(data)
-                if not data_df.empty:
-                    contexts.append(
-                        f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
-                    )
-
-        return "\n\n".join(contexts)
-
     # Preprocess local context
     edges = [
         {**e, schemas.SHORT_ID: int(e[schemas.SHORT_ID])}
@@ -83,47 +236,27 @@ def sort_context(
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
     # Deduplicate and build context incrementally
-    edge_ids, nodes_ids, claims_ids = set(), set(), set()
-    sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    builder = SortedContextBuilder(tokenizer, sub_community_reports)
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
 
         # Add source and target node details
         for node in [node_details.get(source), node_details.get(target)]:
-            if node and node[schemas.SHORT_ID] not in nodes_ids:
-                nodes_ids.add(node[schemas.SHORT_ID])
-                sorted_nodes.append(node)
+            if node:
+                builder.add_node(node)
 
         # Add claims related to source and target
         for claims in [claim_details.get(source), claim_details.get(target)]:
             if claims:
                 for claim in claims:
-                    if claim[schemas.SHORT_ID] not in claims_ids:
-                        claims_ids.add(claim[schemas.SHORT_ID])
-                        sorted_claims.append(claim)
+                    builder.add_claim(claim)
 
         # Add the edge
-        if edge[schemas.SHORT_ID] not in edge_ids:
-            edge_ids.add(edge[schemas.SHORT_ID])
-            sorted_edges.append(edge)
+        builder.add_edge(edge)
+        builder.checkpoint()
 
-        # Generate new context string
-        new_context_string = _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-        )
-        if (
-            max_context_tokens
-            and tokenizer.num_tokens(new_context_string) > max_context_tokens
-        ):
-            break
-        context_string = new_context_string
-
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-    )
+    return builder.build(max_context_tokens)
 
 
 def parallel_sort_context_batch(
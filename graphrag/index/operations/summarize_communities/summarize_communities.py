@@ -4,7 +4,7 @@
 """A module containing create_community_reports and load_strategy methods definition."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 
 import pandas as pd
 
@@ -22,6 +22,7 @@ from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.llm_budget import llm_request_slot, request_limiter
 from graphrag.logger.progress import progress_ticker
 from graphrag.tokenizer.tokenizer import Tokenizer
 
@@ -40,10 +41,16 @@ async def summarize_communities(
     max_input_length: int,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    community_ids: Collection[int] | None = None,
 ):
-    """Generate community summaries."""
+    """Generate community summaries, only of the `community_ids` if given."""
     reports: list[CommunityReport | None] = []
-    tick = progress_ticker(callbacks.progress, len(local_contexts))
+    total = (
+        len(local_contexts)
+        if community_ids is None
+        else int(local_contexts[schemas.COMMUNITY_ID].isin(list(community_ids)).sum())
+    )
+    tick = progress_ticker(callbacks.progress, total)
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
     community_hierarchy = (
@@ -53,6 +60,7 @@ async def summarize_communities(
     ).dropna()
 
     levels = get_levels(nodes)
+    limiter = request_limiter(strategy_config.get("llm"), num_threads, callbacks)
 
     level_contexts = []
     for level in levels:
@@ -64,20 +72,25 @@ async def summarize_communities(
             tokenizer=tokenizer,
             max_context_tokens=max_input_length,
         )
+        if community_ids is not None:
+            level_context = level_context.loc[
+                level_context[schemas.COMMUNITY_ID].isin(list(community_ids))
+            ]
         level_contexts.append(level_context)
 
     for i, level_context in enumerate(level_contexts):
 
         async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
-            )
+            async with llm_request_slot():
+                result = await _generate_report(
+                    strategy_exec,
+                    community_id=record[schemas.COMMUNITY_ID],
+                    community_level=record[schemas.COMMUNITY_LEVEL],
+                    community_context=record[schemas.CONTEXT_STRING],
+                    callbacks=callbacks,
+                    cache=cache,
+                    strategy=strategy_config,
+                )
             tick()
             return result
 
@@ -88,6 +101,7 @@ async def summarize_communities(
             num_threads=num_threads,
             async_type=async_mode,
             progress_msg=f"level {levels[i]} summarize communities progress: ",
+            limiter=limiter,
         )
         reports.extend([lr for lr in local_reports if lr is not None])
 
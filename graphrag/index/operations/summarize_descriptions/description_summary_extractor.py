@@ -3,10 +3,14 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import json
+from contextlib import nullcontext
 from dataclasses import dataclass
 
+from graphrag.config.enums import SummarizeDescriptionsMode
 from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.index.utils.llm_budget import RequestLimiter, llm_request_slot
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
@@ -33,6 +37,8 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _mode: SummarizeDescriptionsMode
+    _request_limiter: RequestLimiter | None
 
     def __init__(
         self,
@@ -41,6 +47,8 @@ class SummarizeExtractor:
         max_input_tokens: int,
         summarization_prompt: str | None = None,
         on_error: ErrorHandlerFn | None = None,
+        mode: SummarizeDescriptionsMode = SummarizeDescriptionsMode.sequential,
+        request_limiter: RequestLimiter | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -50,6 +58,9 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length
         self._max_input_tokens = max_input_tokens
+        self._mode = SummarizeDescriptionsMode(mode)
+        self._request_limiter = request_limiter
+        self._prompt_tokens = self._tokenizer.num_tokens(self._summarization_prompt)
 
     async def __call__(
         self,
@@ -84,15 +95,29 @@ class SummarizeExtractor:
         if len(descriptions) > 1:
             descriptions = sorted(descriptions)
 
+        token_counts = [self._tokenizer.num_tokens(d) for d in descriptions]
+        if self._mode == SummarizeDescriptionsMode.tree:
+            return await self._reduce_descriptions(
+                sorted_id, descriptions, token_counts
+            )
+        return await self._fold_descriptions(sorted_id, descriptions, token_counts)
+
+    async def _fold_descriptions(
+        self,
+        id: str | tuple[str, str] | list[str],
+        descriptions: list[str],
+        token_counts: list[int],
+    ) -> str:
+        """Summarize descriptions one batch at a time, carrying the partial summary forward."""
         # Iterate over descriptions, adding all until the max input tokens is reached
-        usable_tokens = self._max_input_tokens - self._tokenizer.num_tokens(
-            self._summarization_prompt
-        )
+        usable_tokens = self._max_input_tokens - self._prompt_tokens
         descriptions_collected = []
         result = ""
 
-        for i, description in enumerate(descriptions):
-            usable_tokens -= self._tokenizer.num_tokens(description)
+        for i, (description, num_tokens) in enumerate(
+            zip(descriptions, token_counts, strict=True)
+        ):
+            usable_tokens -= num_tokens
             descriptions_collected.append(description)
 
             # If buffer is full, or all descriptions have been added, summarize
@@ -101,7 +126,7 @@ class SummarizeExtractor:
             ):
                 # Calculate result (final or partial)
                 result = await self._summarize_descriptions_with_llm(
-                    sorted_id, descriptions_collected
+                    id, descriptions_collected
                 )
 
                 # If we go for another loop, reset values to new
@@ -109,25 +134,80 @@ class SummarizeExtractor:
                     descriptions_collected = [result]
                     usable_tokens = (
                         self._max_input_tokens
-                        - self._tokenizer.num_tokens(self._summarization_prompt)
+                        - self._prompt_tokens
                         - self._tokenizer.num_tokens(result)
                     )
 
         return result
 
+    async def _reduce_descriptions(
+        self,
+        id: str | tuple[str, str] | list[str],
+        descriptions: list[str],
+        token_counts: list[int],
+    ) -> str:
+        """Summarize token-bounded groups of descriptions concurrently, then merge the partial summaries the same way until one remains."""
+        while True:
+            groups = self._group_descriptions(token_counts)
+            partials = await asyncio.gather(
+                *(
+                    self._summarize_group(id, [descriptions[i] for i in group])
+                    for group in groups
+                )
+            )
+            if len(partials) == 1:
+                return partials[0]
+            descriptions = partials
+            token_counts = [
+                token_counts[group[0]]
+                if len(group) == 1
+                else self._tokenizer.num_tokens(partial)
+                for group, partial in zip(groups, partials, strict=True)
+            ]
+
+    def _group_descriptions(self, token_counts: list[int]) -> list[list[int]]:
+        """Partition description positions into consecutive groups within the input budget.
+
+        A group takes at least two descriptions, even past the budget, so that every
+        round of the reduction shrinks the list; only the last group may hold one.
+        """
+        usable_tokens = self._max_input_tokens - self._prompt_tokens
+        groups: list[list[int]] = [[]]
+        group_tokens = 0
+        for i, num_tokens in enumerate(token_counts):
+            group = groups[-1]
+            if len(group) > 1 and group_tokens + num_tokens > usable_tokens:
+                groups.append([i])
+                group_tokens = num_tokens
+            else:
+                group.append(i)
+                group_tokens += num_tokens
+        return groups
+
+    async def _summarize_group(
+        self, id: str | tuple[str, str] | list[str], descriptions: list[str]
+    ) -> str:
+        """Summarize a group of descriptions, passing a single one through as is."""
+        if len(descriptions) == 1:
+            return descriptions[0]
+        return await self._summarize_descriptions_with_llm(id, descriptions)
+
     async def _summarize_descriptions_with_llm(
         self, id: str | tuple[str, str] | list[str], descriptions: list[str]
     ):
         """Summarize descriptions using the LLM."""
-        response = await self._model.achat(
-            self._summarization_prompt.format(**{
-                ENTITY_NAME_KEY: json.dumps(id, ensure_ascii=False),
-                DESCRIPTION_LIST_KEY: json.dumps(
-                    sorted(descriptions), ensure_ascii=False
-                ),
-                MAX_LENGTH_KEY: self._max_summary_length,
-            }),
-            name="summarize",
-        )
+        # every request takes its own slot, so the groups of a tree reduction stay
+        # within the concurrent_requests of the model and the pipeline budget
+        async with self._request_limiter or nullcontext(), llm_request_slot():
+            response = await self._model.achat(
+                self._summarization_prompt.format(**{
+                    ENTITY_NAME_KEY: json.dumps(id, ensure_ascii=False),
+                    DESCRIPTION_LIST_KEY: json.dumps(
+                        sorted(descriptions), ensure_ascii=False
+                    ),
+                    MAX_LENGTH_KEY: self._max_summary_length,
+                }),
+                name="summarize",
+            )
         # Calculate result
         return str(response.output.content)
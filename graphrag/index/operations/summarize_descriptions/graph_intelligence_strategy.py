@@ -6,6 +6,7 @@
 import logging
 
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.config.enums import SummarizeDescriptionsMode
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
     SummarizeExtractor,
@@ -49,6 +50,7 @@ async def run_summarize_descriptions(
     summarize_prompt = args.get("summarize_prompt", None)
     max_input_tokens = args["max_input_tokens"]
     max_summary_length = args["max_summary_length"]
+    mode = args.get("mode", SummarizeDescriptionsMode.sequential)
     extractor = SummarizeExtractor(
         model_invoker=model,
         summarization_prompt=summarize_prompt,
@@ -59,6 +61,8 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=max_summary_length,
         max_input_tokens=max_input_tokens,
+        mode=mode,
+        request_limiter=args.get("limiter"),
     )
 
     result = await extractor(id=id, descriptions=descriptions)
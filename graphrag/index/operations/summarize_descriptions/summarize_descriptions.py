@@ -15,6 +15,7 @@ from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizationStrategy,
     SummarizeStrategyType,
 )
+from graphrag.index.utils.llm_budget import request_limiter
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -34,11 +35,13 @@ async def summarize_descriptions(
     strategy_exec = load_strategy(
         strategy.get("type", SummarizeStrategyType.graph_intelligence)
     )
-    strategy_config = {**strategy}
+    # the strategy takes a slot of the limiter around each LLM request it makes
+    strategy_config = {
+        **strategy,
+        "limiter": request_limiter(strategy.get("llm"), num_threads, callbacks),
+    }
 
-    async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
-    ):
+    async def get_summarized(nodes: pd.DataFrame, edges: pd.DataFrame):
         ticker_length = len(nodes) + len(edges)
 
         ticker = progress_ticker(
@@ -52,7 +55,6 @@ async def summarize_descriptions(
                 str(row.title),  # type: ignore
                 sorted(set(row.description)),  # type: ignore
                 ticker,
-                semaphore,
             )
             for row in nodes.itertuples(index=False)
         ]
@@ -72,7 +74,6 @@ async def summarize_descriptions(
                 (str(row.source), str(row.target)),  # type: ignore
                 sorted(set(row.description)),  # type: ignore
                 ticker,
-                semaphore,
             )
             for row in edges.itertuples(index=False)
         ]
@@ -96,16 +97,12 @@ async def summarize_descriptions(
         id: str | tuple[str, str],
         descriptions: list[str],
         ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
     ):
-        async with semaphore:
-            results = await strategy_exec(id, descriptions, cache, strategy_config)
-            ticker(1)
+        results = await strategy_exec(id, descriptions, cache, strategy_config)
+        ticker(1)
         return results
 
-    semaphore = asyncio.Semaphore(num_threads)
-
-    return await get_summarized(entities_df, relationships_df, semaphore)
+    return await get_summarized(entities_df, relationships_df)
 
 
 def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy:
@@ -0,0 +1,263 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Checkpoints of completed workflows, used to resume an interrupted pipeline run."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+INPUT_TABLE = "input"
+"""Pseudo table standing for the raw input files of the input storage."""
+
+# config sections read by the built-in workflows. Language models referenced by a
+# section through `model_id` are included automatically. Workflows not listed here
+# are fingerprinted with the whole configuration.
+WORKFLOW_CONFIG_SECTIONS: dict[str, list[str]] = {
+    "load_input_documents": ["input"],
+    "load_update_documents": ["input"],
+    "create_base_text_units": ["chunks"],
+    "create_final_documents": [],
+    "extract_graph": ["extract_graph", "summarize_descriptions", "snapshots"],
+    "extract_graph_nlp": ["extract_graph_nlp", "snapshots"],
+    "prune_graph": ["prune_graph"],
+    "finalize_graph": ["embed_graph", "umap", "snapshots"],
+    "extract_covariates": ["extract_claims"],
+    "create_communities": ["cluster_graph"],
+    "create_final_text_units": ["extract_claims"],
+    "create_community_reports": ["community_reports", "extract_claims"],
+    "create_community_reports_text": ["community_reports"],
+    "generate_text_embeddings": ["embed_text", "vector_store", "snapshots"],
+    "create_bm25_index": ["bm25_index"],
+}
+
+# language model settings that change how fast results arrive, not what they are
+_OPERATIONAL_MODEL_FIELDS = {
+    "api_key",
+    "auth_type",
+    "organization",
+    "proxy",
+    "audience",
+    "request_timeout",
+    "tokens_per_minute",
+    "requests_per_minute",
+    "rate_limit_strategy",
+    "retry_strategy",
+    "max_retries",
+    "max_retry_wait",
+    "concurrent_requests",
+    "adaptive_concurrency",
+    "max_concurrent_requests",
+    "async_mode",
+}
+
+
+@dataclass
+class WorkflowCheckpoint:
+    """Fingerprints of a completed workflow."""
+
+    config: str
+    """Hash of the config sections the workflow reads."""
+    inputs: dict[str, str | None] = field(default_factory=dict)
+    """Fingerprints of the tables the workflow read, None for missing tables."""
+    outputs: dict[str, str | None] = field(default_factory=dict)
+    """Fingerprints of the tables the workflow wrote, None for missing tables."""
+
+
+class PipelineManifest:
+    """The checkpoints of the workflows completed in the output storage."""
+
+    def __init__(
+        self,
+        storage: PipelineStorage,
+        checkpoints: dict[str, WorkflowCheckpoint] | None = None,
+    ):
+        self.storage = storage
+        self.checkpoints = checkpoints or {}
+
+    @classmethod
+    async def load(cls, storage: PipelineStorage) -> "PipelineManifest":
+        """Load the manifest of the previous run, or an empty manifest."""
+        manifest_json = await storage.get(MANIFEST_FILE)
+        if not manifest_json:
+            return cls(storage)
+        checkpoints = json.loads(manifest_json).get("workflows", {})
+        return cls(
+            storage,
+            {name: WorkflowCheckpoint(**value) for name, value in checkpoints.items()},
+        )
+
+    async def save(self) -> None:
+        """Write the manifest to the storage."""
+        workflows = {name: asdict(value) for name, value in self.checkpoints.items()}
+        await self.storage.set(
+            MANIFEST_FILE, json.dumps({"workflows": workflows}, indent=4)
+        )
+
+    def keep(self, names: list[str]) -> None:
+        """Drop the checkpoints of every workflow not in `names`."""
+        self.checkpoints = {
+            name: value for name, value in self.checkpoints.items() if name in names
+        }
+
+
+async def hash_tables(
+    tables: set[str] | frozenset[str],
+    storage: PipelineStorage,
+    input_storage: PipelineStorage,
+    config: GraphRagConfig,
+) -> dict[str, str | None]:
+    """Fingerprint the stored `tables`, None for tables that do not exist.
+
+    Tables are fingerprinted by their storage metadata where the storage keeps it,
+    and by the hash of their content otherwise.
+    """
+    hashes = {}
+    for table in sorted(tables):
+        if table == INPUT_TABLE:
+            hashes[table] = await _hash_input(input_storage, config)
+        else:
+            hashes[table] = await _fingerprint(storage, f"{table}.parquet")
+    return hashes
+
+
+def hash_config(config: GraphRagConfig, workflow: str) -> str:
+    """Hash the config sections a workflow reads, including models and prompt files."""
+    sections = WORKFLOW_CONFIG_SECTIONS.get(workflow)
+    if sections is None:
+        values: dict[str, Any] = config.model_dump(mode="json")
+    else:
+        values = {}
+        for name in sections:
+            section = getattr(config, name)
+            values[name] = _dump(section)
+            model_id = getattr(section, "model_id", None)
+            if model_id and model_id in config.models:
+                values[f"models.{model_id}"] = {
+                    key: value
+                    for key, value in _dump(config.models[model_id]).items()
+                    if key not in _OPERATIONAL_MODEL_FIELDS
+                }
+    for value in list(values.values()):
+        if isinstance(value, dict):
+            _add_prompt_hashes(value, config.root_dir)
+    return _hash_bytes(json.dumps(values, sort_keys=True, default=str).encode())
+
+
+async def find_resumable_workflows(
+    pipeline: Pipeline,
+    config: GraphRagConfig,
+    manifest: PipelineManifest,
+    input_storage: PipelineStorage,
+) -> list[str]:
+    """
+    Return the leading workflows of the pipeline whose results are still valid.
+
+    A workflow is still valid when the manifest has a checkpoint for it with the
+    same config hash, it read the tables written by the valid workflows before it
+    (or the same stored tables when no earlier workflow writes them), and the tables
+    left in the storage are the ones the last valid workflow wrote. The run restarts
+    at the first workflow that is not valid; workflows without declared tables are
+    never skipped.
+    """
+    stored: dict[str, str | None] = {}
+
+    async def stored_hash(table: str) -> str | None:
+        if table not in stored:
+            stored.update(
+                await hash_tables({table}, manifest.storage, input_storage, config)
+            )
+        return stored[table]
+
+    resumable: list[str] = []
+    written: dict[str, str | None] = {}
+    for name in pipeline.names():
+        checkpoint = manifest.checkpoints.get(name)
+        tables = pipeline.tables.get(name)
+        if (
+            checkpoint is None
+            or tables is None
+            or checkpoint.config != hash_config(config, name)
+            or set(checkpoint.inputs) != tables.reads
+            or set(checkpoint.outputs) != tables.writes
+        ):
+            break
+        inputs_unchanged = True
+        for table, value in checkpoint.inputs.items():
+            expected = written[table] if table in written else await stored_hash(table)
+            if value != expected:
+                inputs_unchanged = False
+                break
+        if not inputs_unchanged:
+            break
+        written.update(checkpoint.outputs)
+        resumable.append(name)
+
+    # later workflows of the previous run may have rewritten the tables the skipped
+    # workflows leave behind, restart earlier until the storage holds their output
+    while resumable:
+        outputs: dict[str, str | None] = {}
+        for name in resumable:
+            outputs.update(manifest.checkpoints[name].outputs)
+        if all([await stored_hash(table) == value for table, value in outputs.items()]):
+            break
+        resumable.pop()
+    return resumable
+
+
+async def _hash_input(storage: PipelineStorage, config: GraphRagConfig) -> str:
+    """Hash the names and fingerprints of the input files."""
+    digest = hashlib.sha256()
+    files = sorted(
+        file for file, _ in storage.find(re.compile(config.input.file_pattern))
+    )
+    for file in files:
+        digest.update(file.encode())
+        digest.update(str(await _fingerprint(storage, file)).encode())
+    return digest.hexdigest()
+
+
+async def _fingerprint(storage: PipelineStorage, key: str) -> str | None:
+    """Return the metadata fingerprint of a stored value, or else the hash of its content."""
+    fingerprint = await storage.get_fingerprint(key)
+    if fingerprint is not None:
+        return fingerprint
+    content = await storage.get(key, as_bytes=True)
+    if content is None:
+        return None
+    # hashing large tables takes a while, keep it off the event loop
+    return await asyncio.to_thread(_hash_bytes, content)
+
+
+def _add_prompt_hashes(values: dict[str, Any], root_dir: str) -> None:
+    """Add the content hash of prompt files, whose paths are all the config holds."""
+    for key, value in list(values.items()):
+        if key.endswith("prompt") and isinstance(value, str):
+            path = Path(root_dir) / value
+            if path.is_file():
+                values[f"{key}_content"] = _hash_bytes(path.read_bytes())
+
+
+def _dump(section: Any) -> Any:
+    if isinstance(section, dict):
+        return {key: _dump(value) for key, value in section.items()}
+    if hasattr(section, "model_dump"):
+        return section.model_dump(mode="json")
+    return section
+
+
+def _hash_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import json
 import logging
 import re
@@ -15,13 +16,26 @@ import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.manifest import (
+    PipelineManifest,
+    WorkflowCheckpoint,
+    find_resumable_workflows,
+    hash_config,
+    hash_tables,
+)
 from graphrag.index.run.utils import create_run_context
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.pipeline import Pipeline
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
+from graphrag.index.typing.workflow import WorkflowFunction, WorkflowFunctionOutput
+from graphrag.index.utils.llm_budget import set_llm_budget
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.api import create_cache_from_config, create_storage_from_config
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +47,16 @@ async def run_pipeline(
     is_update_run: bool = False,
     additional_context: dict[str, Any] | None = None,
     input_documents: pd.DataFrame | None = None,
+    resume: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
-    """Run all workflows using a simplified pipeline."""
+    """Run all workflows using a simplified pipeline.
+
+    With `resume`, the leading workflows whose config and input tables are unchanged
+    since they completed, according to the manifest in the output storage, are
+    skipped and the run restarts at the first workflow with changes. The manifest is
+    only written, and the tables only fingerprinted, by runs with `resume` or with
+    `write_manifest` set in the config.
+    """
     root_dir = config.root_dir
 
     input_storage = create_storage_from_config(config.input.storage)
@@ -76,13 +98,21 @@ async def run_pipeline(
             callbacks=callbacks,
             state=state,
         )
+        if resume:
+            logger.warning("Update runs cannot be resumed, running all workflows.")
+        manifest = PipelineManifest(delta_storage) if config.write_manifest else None
 
     else:
         logger.info("Running standard indexing.")
 
         # if the user passes in a df directly, write directly to storage so we can skip finding/parsing later
         if input_documents is not None:
-            await write_table_to_storage(input_documents, "documents", output_storage)
+            # rewriting identical documents would change their fingerprint and make
+            # a resumed run start over
+            if not resume or not await _has_documents(input_documents, output_storage):
+                await write_table_to_storage(
+                    input_documents, "documents", output_storage
+                )
             pipeline.remove("load_input_documents")
 
         context = create_run_context(
@@ -93,10 +123,27 @@ async def run_pipeline(
             state=state,
         )
 
+        if resume:
+            manifest = await PipelineManifest.load(output_storage)
+            completed = await find_resumable_workflows(
+                pipeline, config, manifest, input_storage
+            )
+            manifest.keep(completed)
+            for name in completed:
+                pipeline.remove(name)
+            logger.info(
+                "Resuming pipeline, skipping unchanged workflows: %s", completed
+            )
+        elif config.write_manifest:
+            manifest = PipelineManifest(output_storage)
+        else:
+            manifest = None
+
     async for table in _run_pipeline(
         pipeline=pipeline,
         config=config,
         context=context,
+        manifest=manifest,
     ):
         yield table
 
@@ -105,29 +152,77 @@ async def _run_pipeline(
     pipeline: Pipeline,
     config: GraphRagConfig,
     context: PipelineRunContext,
+    manifest: PipelineManifest | None = None,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
     last_workflow = "<startup>"
+    workflows = list(pipeline.run())
+    dependencies = pipeline.dependencies()
+    max_running = max(1, config.concurrent_workflows)
+    llm_budget = asyncio.Semaphore(_llm_budget_size(config))
+    running: dict[asyncio.Task, str] = {}
+    started: set[str] = set()
+    completed: set[str] = set()
+    halted = False
+    # hashes of the tables each running workflow read, for the manifest
+    inputs: dict[str, dict[str, str | None]] = {}
 
     try:
         await _dump_json(context)
+        if manifest:
+            await manifest.save()
 
         logger.info("Executing pipeline...")
-        for name, workflow_function in pipeline.run():
-            last_workflow = name
-            context.callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(config, context)
-            context.callbacks.workflow_end(name, result)
-            yield PipelineRunResult(
-                workflow=name, result=result.result, state=context.state, errors=None
-            )
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
-            if result.stop:
-                logger.info("Halting pipeline at workflow request")
+        while True:
+            # start every workflow whose dependencies are done, in pipeline order
+            for name, workflow_function in workflows:
+                if halted or len(running) >= max_running:
+                    break
+                if name in started or not dependencies[name] <= completed:
+                    continue
+                started.add(name)
+                last_workflow = name
+                if manifest and name in pipeline.tables:
+                    inputs[name] = await _hash_tables(
+                        pipeline.tables[name].reads, config, context
+                    )
+                context.callbacks.workflow_start(name, None)
+                task = asyncio.create_task(
+                    _run_workflow(workflow_function, config, context, llm_budget)
+                )
+                running[task] = name
+            if not running:
                 break
 
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: pipeline.names().index(running[t])):
+                name = running.pop(task)
+                last_workflow = name
+                result, work_time = task.result()
+                context.callbacks.workflow_end(name, result)
+                yield PipelineRunResult(
+                    workflow=name,
+                    result=result.result,
+                    state=context.state,
+                    errors=None,
+                )
+                context.stats.workflows[name] = {"overall": work_time}
+                completed.add(name)
+                if manifest and name in inputs:
+                    manifest.checkpoints[name] = WorkflowCheckpoint(
+                        config=hash_config(config, name),
+                        inputs=inputs.pop(name),
+                        outputs=await _hash_tables(
+                            pipeline.tables[name].writes, config, context
+                        ),
+                    )
+                    await manifest.save()
+                if result.stop:
+                    # workflows already running do not depend on this one and finish
+                    logger.info("Halting pipeline at workflow request")
+                    halted = True
+
         context.stats.total_runtime = time.time() - start_time
         logger.info("Indexing pipeline complete.")
         await _dump_json(context)
@@ -138,6 +233,42 @@ async def _run_pipeline(
             workflow=last_workflow, result=None, state=context.state, errors=[e]
         )
 
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def _run_workflow(
+    workflow_function: WorkflowFunction,
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    llm_budget: asyncio.Semaphore,
+) -> tuple[WorkflowFunctionOutput, float]:
+    """Run a workflow in its own task, returning its output and runtime."""
+    # the budget is set in the task's own context and shared with the tasks it starts
+    set_llm_budget(llm_budget)
+    work_time = time.time()
+    result = await workflow_function(config, context)
+    return result, time.time() - work_time
+
+
+async def _hash_tables(
+    tables: frozenset[str], config: GraphRagConfig, context: PipelineRunContext
+) -> dict[str, str | None]:
+    return await hash_tables(
+        tables, context.output_storage, context.input_storage, config
+    )
+
+
+def _llm_budget_size(config: GraphRagConfig) -> int:
+    """Return the number of LLM requests shared by the running workflows."""
+    if config.concurrent_llm_requests is not None:
+        return max(1, config.concurrent_llm_requests)
+    return max(
+        (model.concurrent_requests for model in config.models.values()), default=1
+    )
+
 
 async def _dump_json(context: PipelineRunContext) -> None:
     """Dump the stats and context state to the storage."""
@@ -157,6 +288,14 @@ async def _dump_json(context: PipelineRunContext) -> None:
     await context.output_storage.set("context.json", state_blob)
 
 
+async def _has_documents(documents: pd.DataFrame, storage: PipelineStorage) -> bool:
+    """Check whether the storage already holds exactly these documents."""
+    if not await storage_has_table("documents", storage):
+        return False
+    stored = await load_table_from_storage("documents", storage)
+    return stored.equals(documents)
+
+
 async def _copy_previous_output(
     storage: PipelineStorage,
     copy_storage: PipelineStorage,
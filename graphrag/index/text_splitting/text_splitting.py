@@ -5,10 +5,12 @@
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
 from graphrag.index.operations.chunk_text.typing import TextChunk
@@ -20,6 +22,12 @@ EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
 LengthFn = Callable[[str], int]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
+DecodeBatchFn = Callable[[list[EncodedText]], list[str]]
+
+# Number of texts encoded per batch by split_grouped_texts_on_tokens. Groups are never
+# split across batches, so this bounds the size of the token arrays kept in memory.
+DEFAULT_ENCODE_BATCH_SIZE = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -143,31 +151,126 @@ def split_multiple_texts_on_tokens(
     texts: list[str], tokenizer: TokenChunkerOptions, tick: ProgressTicker
 ) -> list[TextChunk]:
     """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
-        if tick:
-            tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
-
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
+    return [
+        chunk
+        for _, chunk in split_grouped_texts_on_tokens(
+            [texts],
+            tokens_per_chunk=tokenizer.tokens_per_chunk,
+            chunk_overlap=tokenizer.chunk_overlap,
+            encode_batch=lambda batch: [tokenizer.encode(text) for text in batch],
+            decode_batch=lambda batch: [tokenizer.decode(ids) for ids in batch],
+            tick=tick,
+        )
     ]
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        if cur_idx == len(input_ids):
-            break
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
-
-    return result
+def split_grouped_texts_on_tokens(
+    groups: Sequence[list[str]],
+    tokens_per_chunk: int | Sequence[int],
+    chunk_overlap: int,
+    encode_batch: EncodeBatchFn,
+    decode_batch: DecodeBatchFn,
+    tick: ProgressTicker | None = None,
+    batch_size: int = DEFAULT_ENCODE_BATCH_SIZE,
+) -> Iterator[tuple[int, TextChunk]]:
+    """
+    Split groups of texts into token chunks, yielding (group index, chunk) pairs in order.
+
+    The texts of each group are concatenated on the token level and chunked with a sliding
+    window, exactly like split_multiple_texts_on_tokens does for a single group. Texts are
+    encoded in batches, token ids and document boundaries are kept in numpy arrays and the
+    chunk windows of a whole batch are computed with array arithmetic before decoding them
+    in one call. `tokens_per_chunk` can be given per group.
+    """
+    if isinstance(tokens_per_chunk, int):
+        tokens_per_chunk = [tokens_per_chunk] * len(groups)
+
+    batch_start = 0
+    num_texts = 0
+    for group_idx, group in enumerate(groups):
+        num_texts += len(group)
+        if num_texts >= batch_size or group_idx == len(groups) - 1:
+            batch_end = group_idx + 1
+            for batch_group_idx, chunk in _split_group_batch(
+                groups[batch_start:batch_end],
+                np.asarray(tokens_per_chunk[batch_start:batch_end], dtype=np.int64),
+                chunk_overlap,
+                encode_batch,
+                decode_batch,
+            ):
+                yield batch_start + batch_group_idx, chunk
+            if tick:
+                tick(num_texts)  # Track progress if tick callback is provided
+            batch_start = batch_end
+            num_texts = 0
+
+
+def _split_group_batch(
+    groups: Sequence[list[str]],
+    tokens_per_chunk: np.ndarray,
+    chunk_overlap: int,
+    encode_batch: EncodeBatchFn,
+    decode_batch: DecodeBatchFn,
+) -> Iterator[tuple[int, TextChunk]]:
+    texts = [text for group in groups for text in group]
+    encoded = encode_batch(texts)
+    doc_lengths = np.fromiter(
+        (len(ids) for ids in encoded), dtype=np.int64, count=len(encoded)
+    )
+    token_ids = np.fromiter(
+        chain.from_iterable(encoded), dtype=np.int64, count=int(doc_lengths.sum())
+    )
+    del encoded
+
+    # token and document boundaries of every group within the batch
+    doc_ends = np.cumsum(doc_lengths)
+    group_doc_ends = np.cumsum([len(group) for group in groups], dtype=np.int64)
+    group_doc_starts = group_doc_ends - [len(group) for group in groups]
+    token_bounds = np.concatenate([[0], doc_ends])
+    group_starts = token_bounds[group_doc_starts]
+    group_lengths = token_bounds[group_doc_ends] - group_starts
+
+    # number of windows per group: start at 0, advance by the stride until a window
+    # reaches the end of the group
+    stride = tokens_per_chunk - chunk_overlap
+    overflow = np.maximum(group_lengths - tokens_per_chunk, 0)
+    if np.any((overflow > 0) & (stride <= 0)):
+        msg = "Chunk overlap must be smaller than the chunk size."
+        raise ValueError(msg)
+    num_chunks = np.where(
+        group_lengths == 0, 0, 1 + -(-overflow // np.maximum(stride, 1))
+    )
+
+    chunk_groups = np.repeat(np.arange(len(groups)), num_chunks)
+    chunk_positions = np.arange(len(chunk_groups)) - np.repeat(
+        np.cumsum(num_chunks) - num_chunks, num_chunks
+    )
+    starts = group_starts[chunk_groups] + chunk_positions * stride[chunk_groups]
+    ends = np.minimum(
+        starts + tokens_per_chunk[chunk_groups],
+        group_starts[chunk_groups] + group_lengths[chunk_groups],
+    )
+    first_docs = np.searchsorted(doc_ends, starts, side="right")
+    last_docs = np.searchsorted(doc_ends, ends - 1, side="right")
+
+    chunk_texts = decode_batch([
+        token_ids[start:end].tolist()
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+    ])
+    for group_idx, first_doc, last_doc, start, end, chunk_text in zip(
+        chunk_groups.tolist(),
+        first_docs.tolist(),
+        last_docs.tolist(),
+        starts.tolist(),
+        ends.tolist(),
+        chunk_texts,
+        strict=True,
+    ):
+        offset = int(group_doc_starts[group_idx])
+        # documents without tokens do not contribute to a chunk
+        doc_indices = list({
+            doc_idx - offset
+            for doc_idx in range(first_doc, last_doc + 1)
+            if doc_lengths[doc_idx] > 0
+        })
+        yield group_idx, TextChunk(chunk_text, doc_indices, end - start)
@@ -5,14 +5,19 @@
 
 from collections.abc import Generator
 
-from graphrag.index.typing.workflow import Workflow
+from graphrag.index.typing.workflow import Workflow, WorkflowTables
 
 
 class Pipeline:
     """Encapsulates running workflows."""
 
-    def __init__(self, workflows: list[Workflow]):
+    def __init__(
+        self,
+        workflows: list[Workflow],
+        tables: dict[str, WorkflowTables] | None = None,
+    ):
         self.workflows = workflows
+        self.tables = tables or {}
 
     def run(self) -> Generator[Workflow]:
         """Return a Generator over the pipeline workflows."""
@@ -25,3 +30,37 @@ class Pipeline:
     def remove(self, name: str) -> None:
         """Remove a workflow from the pipeline by name."""
         self.workflows = [w for w in self.workflows if w[0] != name]
+
+    def dependencies(self) -> dict[str, set[str]]:
+        """
+        Return the workflows each workflow has to wait for.
+
+        A workflow waits for the last earlier workflow writing a table it reads or
+        writes, and for the earlier workflows reading a table it overwrites. Workflows
+        without declared tables (custom workflows, or workflows passing data through
+        the context state) keep their place in the list: they wait for every earlier
+        workflow and every later workflow waits for them.
+        """
+        dependencies: dict[str, set[str]] = {}
+        last_writer: dict[str, str] = {}
+        readers: dict[str, set[str]] = {}
+        barrier: str | None = None
+        for name in self.names():
+            tables = self.tables.get(name)
+            if tables is None:
+                dependencies[name] = set(dependencies)
+                barrier = name
+                continue
+
+            depends_on = {barrier} if barrier else set()
+            for table in tables.reads | tables.writes:
+                if table in last_writer:
+                    depends_on.add(last_writer[table])
+            for table in tables.writes:
+                depends_on.update(readers.pop(table, set()))
+                last_writer[table] = name
+            for table in tables.reads - tables.writes:
+                readers.setdefault(table, set()).add(name)
+            depends_on.discard(name)
+            dependencies[name] = depends_on
+        return dependencies
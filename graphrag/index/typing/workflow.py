@@ -26,3 +26,13 @@ WorkflowFunction = Callable[
     Awaitable[WorkflowFunctionOutput],
 ]
 Workflow = tuple[str, WorkflowFunction]
+
+
+@dataclass(frozen=True)
+class WorkflowTables:
+    """The output tables a workflow reads and writes, used to order workflows in the pipeline."""
+
+    reads: frozenset[str] = frozenset()
+    """Tables the workflow loads from the output storage."""
+    writes: frozenset[str] = frozenset()
+    """Tables the workflow writes to the output storage, including tables it rewrites."""
@@ -3,12 +3,18 @@
 
 """Dataframe operations and utils for Incremental Indexing."""
 
+from collections import Counter
+from collections.abc import Collection
+
 import pandas as pd
 
 from graphrag.data_model.schemas import (
     COMMUNITIES_FINAL_COLUMNS,
     COMMUNITY_REPORTS_FINAL_COLUMNS,
 )
+from graphrag.index.operations.cluster_graph import Communities, cluster_graph
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.stable_lcc import stable_largest_connected_component
 
 
 def _update_and_merge_communities(
@@ -149,3 +155,281 @@ def _update_and_merge_community_reports(
     ]
 
     return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
+
+
+def _recluster_touched_communities(
+    old_communities: pd.DataFrame,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    touched_titles: Collection[str],
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[Communities, set[int]]:
+    """Re-cluster the root communities holding touched entities, seeded with their previous partition.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The communities of the previous index.
+    entities : pd.DataFrame
+        The merged entities, keeping the ids of the previous entities.
+    relationships : pd.DataFrame
+        The merged relationships.
+    touched_titles : Collection[str]
+        The titles of the new or changed entities and relationship endpoints.
+    max_cluster_size : int
+        The maximum cluster size.
+    use_lcc : bool
+        Whether to cluster only the largest connected component.
+    seed : int | None
+        The clustering seed.
+
+    Returns
+    -------
+    Communities
+        The new clusters of the touched region, numbered like the previous
+        community at the same level they mostly overlap and after the previous
+        communities otherwise.
+    set[int]
+        The previous communities the clusters replace.
+    """
+    titles_by_id = dict(zip(entities["id"], entities["title"], strict=True))
+    members = (
+        old_communities.loc[:, ["community", "level", "entity_ids"]]
+        .explode("entity_ids")
+        .dropna(subset=["entity_ids"])
+    )
+    members["community"] = members["community"].astype(int)
+    members["title"] = members["entity_ids"].map(titles_by_id)
+    roots = members.loc[members["level"] == 0]
+    root_by_title = dict(zip(roots["title"], roots["community"], strict=True))
+    touched_roots = {root_by_title[t] for t in touched_titles if t in root_by_title}
+
+    graph = create_graph(relationships, edge_attr=["weight"])
+    if use_lcc:
+        graph = stable_largest_connected_component(graph)
+    # the touched root communities and the nodes no root community holds yet
+    node_roots = pd.Series(graph.titles).map(root_by_title)
+    graph = graph.subgraph(
+        (node_roots.isna() | node_roots.isin(touched_roots)).to_numpy()
+    )
+    # nodes whose every edge leads out of the region are not re-clustered, they are
+    # carried over to their previous communities below
+    graph = graph.subgraph(graph.degrees() > 0)
+
+    starting_communities = {
+        title: root_by_title[title]
+        for title in graph.titles.tolist()
+        if title in root_by_title
+    }
+    clusters = cluster_graph(
+        graph,
+        max_cluster_size,
+        use_lcc=False,
+        seed=seed,
+        starting_communities=starting_communities,
+    )
+
+    replaced_members = members.loc[
+        members["title"].map(root_by_title).isin(touched_roots)
+    ]
+    old_community_by_title = dict(
+        zip(
+            zip(replaced_members["level"], replaced_members["title"], strict=True),
+            replaced_members["community"],
+            strict=True,
+        )
+    )
+    old_sizes = replaced_members["community"].value_counts().to_dict()
+    # a cluster keeps the number of the previous community at its level it overlaps
+    # most, if they share at least half of their joint members
+    candidates = []
+    for index, (level, _, _, titles) in enumerate(clusters):
+        overlaps = Counter(
+            old_community_by_title[level, title]
+            for title in titles
+            if (level, title) in old_community_by_title
+        )
+        for community, overlap in overlaps.items():
+            similarity = overlap / (len(titles) + old_sizes[community] - overlap)
+            if similarity >= 0.5:
+                candidates.append((-similarity, index, community))
+    numbers: dict[int, int] = {}
+    taken: set[int] = set()
+    for _, index, community in sorted(candidates):
+        if index not in numbers and community not in taken:
+            numbers[index] = community
+            taken.add(community)
+
+    next_id = int(old_communities["community"].max()) + 1 if len(old_communities) else 0
+    ids: dict[int, int] = {-1: -1}
+    for index, (_, cluster, _, _) in enumerate(clusters):
+        if index not in numbers:
+            numbers[index], next_id = next_id, next_id + 1
+        ids[cluster] = numbers[index]
+    clusters = [
+        (level, ids[cluster], ids[parent], titles)
+        for level, cluster, parent, titles in clusters
+    ]
+    # members of the replaced communities left out of the region graph, either
+    # without edges inside it or outside the largest connected component
+    dropped_members = replaced_members.loc[
+        ~replaced_members["title"].isin(graph.titles.tolist())
+    ]
+    return _carry_forward_members(clusters, dropped_members), set(
+        replaced_members["community"]
+    )
+
+
+def _carry_forward_members(
+    clusters: Communities, dropped_members: pd.DataFrame
+) -> Communities:
+    """Add the nodes left out of the re-clustering back to their previous communities.
+
+    From the root down, a node rejoins its previous community at each level as long as
+    that community still lies below the one it rejoined at the level above. Previous
+    communities the re-clustering did not keep are carried over for these nodes.
+
+    Parameters
+    ----------
+    clusters : Communities
+        The new clusters of the region, numbered after the previous communities.
+    dropped_members : pd.DataFrame
+        The previous memberships of the left out nodes, with the columns
+        `community`, `level` and `title`.
+
+    Returns
+    -------
+    Communities
+        The clusters including the left out nodes.
+    """
+    clusters = [
+        (level, cluster, parent, list(titles))
+        for level, cluster, parent, titles in clusters
+    ]
+    position_by_id = {cluster: i for i, (_, cluster, _, _) in enumerate(clusters)}
+    for title, rows in dropped_members.sort_values("level").groupby(
+        "title", sort=False
+    ):
+        parent = -1
+        for level, community in zip(rows["level"], rows["community"], strict=True):
+            if community not in position_by_id:
+                position_by_id[community] = len(clusters)
+                clusters.append((int(level), int(community), parent, []))
+            _, _, cluster_parent, titles = clusters[position_by_id[community]]
+            if cluster_parent != parent:
+                break
+            titles.append(str(title))
+            parent = int(community)
+    return clusters
+
+
+def _merge_incremental_communities(
+    old_communities: pd.DataFrame,
+    region_communities: pd.DataFrame,
+    replaced_communities: Collection[int],
+    touched_entity_ids: Collection[str],
+) -> tuple[pd.DataFrame, list[int]]:
+    """Replace the re-clustered communities, keeping the rows of the unchanged ones.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The communities of the previous index.
+    region_communities : pd.DataFrame
+        The final communities of the re-clustered region.
+    replaced_communities : Collection[int]
+        The previous communities the region replaces.
+    touched_entity_ids : Collection[str]
+        The ids of the new or changed entities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The merged communities.
+    list[int]
+        The communities whose members, relationships or entities changed.
+    """
+    if "size" not in old_communities.columns:
+        old_communities["size"] = None
+    if "period" not in old_communities.columns:
+        old_communities["period"] = None
+    old_communities["community"] = old_communities["community"].astype(int)
+
+    replaced = old_communities["community"].isin(list(replaced_communities))
+    previous = old_communities.loc[replaced].set_index("community")
+    touched = set(touched_entity_ids)
+
+    def unchanged(row: pd.Series) -> bool:
+        if row["community"] not in previous.index:
+            return False
+        old = previous.loc[row["community"]]
+        return touched.isdisjoint(row["entity_ids"]) and all(
+            sorted(row[column]) == sorted(old[column])
+            for column in ["entity_ids", "relationship_ids", "text_unit_ids"]
+        )
+
+    region = region_communities.copy()
+    same = (
+        region.apply(unchanged, axis=1).astype(bool)
+        if len(region)
+        else pd.Series(dtype=bool)
+    )
+    # reused community numbers keep their ids, unchanged communities their period
+    reused = region["community"].isin(previous.index)
+    region.loc[reused, "id"] = region.loc[reused, "community"].map(previous["id"])
+    region.loc[same, "period"] = region.loc[same, "community"].map(previous["period"])
+
+    merged_communities = pd.concat(
+        [old_communities.loc[~replaced], region], ignore_index=True, copy=False
+    )
+    merged_communities["community"] = merged_communities["community"].astype(int)
+    changed = sorted(region.loc[~same, "community"].astype(int).tolist())
+    return merged_communities.loc[:, COMMUNITIES_FINAL_COLUMNS], changed
+
+
+def _merge_regenerated_community_reports(
+    old_community_reports: pd.DataFrame,
+    regenerated_community_reports: pd.DataFrame,
+    merged_communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Replace the reports of the regenerated communities and drop those of removed ones.
+
+    Parameters
+    ----------
+    old_community_reports : pd.DataFrame
+        The community reports of the previous index.
+    regenerated_community_reports : pd.DataFrame
+        The reports of the changed communities.
+    merged_communities : pd.DataFrame
+        The merged communities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated community reports.
+    """
+    old_community_reports["community"] = old_community_reports["community"].astype(int)
+    kept = old_community_reports.loc[
+        old_community_reports["community"].isin(merged_communities["community"])
+        & ~old_community_reports["community"].isin(
+            regenerated_community_reports["community"]
+        )
+    ]
+    # refresh the fields shared with the communities, the hierarchy may have moved
+    shared = ["parent", "children", "size", "period"]
+    kept = kept.drop(columns=shared, errors="ignore").merge(
+        merged_communities.loc[:, ["community", *shared]], on="community", how="left"
+    )
+
+    merged_community_reports = pd.concat(
+        [kept, regenerated_community_reports], ignore_index=True, copy=False
+    )
+    merged_community_reports["community"] = merged_community_reports[
+        "community"
+    ].astype(int)
+    merged_community_reports["human_readable_id"] = merged_community_reports[
+        "community"
+    ]
+    return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
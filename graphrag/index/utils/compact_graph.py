@@ -0,0 +1,246 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An undirected graph stored as arrays of integer node ids."""
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+@dataclass
+class CompactGraph:
+    """
+    An undirected graph whose node titles are interned to the ids 0..n-1.
+
+    Nodes are numbered in the order networkx would add them and every edge is stored
+    once, in the order it was first added, so the graph converts to the exact
+    networkx graph (node order, adjacency order and edge iteration order included)
+    only where a networkx graph is needed.
+    """
+
+    titles: np.ndarray
+    """The title of each node id."""
+    sources: np.ndarray
+    """The source node id of each edge."""
+    targets: np.ndarray
+    """The target node id of each edge."""
+    edge_data: pd.DataFrame
+    """The attributes of each edge, one row per edge."""
+    node_data: pd.DataFrame
+    """The attributes of the nodes that have any, indexed by node id."""
+
+    @classmethod
+    def from_edges(
+        cls,
+        titles: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        edge_data: pd.DataFrame | None = None,
+        node_data: pd.DataFrame | None = None,
+    ) -> "CompactGraph":
+        """
+        Create a graph from edges that may repeat, in either direction.
+
+        Like adding the edges to a networkx graph one by one, a repeated edge keeps
+        the position and direction it was first added with and the attributes it was
+        last added with.
+        """
+        num_nodes = len(titles)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if edge_data is None:
+            edge_data = pd.DataFrame(index=pd.RangeIndex(len(sources)))
+        keys = np.minimum(sources, targets) * num_nodes + np.maximum(sources, targets)
+        _, first = np.unique(keys, return_index=True)
+        _, last_reversed = np.unique(keys[::-1], return_index=True)
+        order = np.argsort(first)
+        first = first[order]
+        last = len(keys) - 1 - last_reversed[order]
+        if node_data is None:
+            node_data = pd.DataFrame(index=pd.Index([], dtype=np.int64))
+        return cls(
+            titles=np.asarray(titles, dtype=object),
+            sources=sources[first],
+            targets=targets[first],
+            edge_data=edge_data.iloc[last].reset_index(drop=True),
+            node_data=node_data,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self.titles)
+
+    @property
+    def num_edges(self) -> int:
+        """Return the number of edges."""
+        return len(self.sources)
+
+    def degrees(self) -> np.ndarray:
+        """Return the degree of each node id, self-loops counting twice."""
+        return np.bincount(self.sources, minlength=self.num_nodes) + np.bincount(
+            self.targets, minlength=self.num_nodes
+        )
+
+    def adjacency(self) -> sparse.csr_matrix:
+        """Return the symmetric CSR adjacency matrix, counting each edge once."""
+        rows = np.concatenate([self.sources, self.targets])
+        columns = np.concatenate([self.targets, self.sources])
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int8), (rows, columns)),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+        matrix.data[:] = 1
+        return matrix
+
+    def node_values(self, attribute: str) -> np.ndarray:
+        """Return an attribute of each node id, NaN for nodes without it."""
+        if attribute not in self.node_data.columns:
+            return np.full(self.num_nodes, np.nan)
+        return (
+            self.node_data[attribute].reindex(pd.RangeIndex(self.num_nodes)).to_numpy()
+        )
+
+    def edge_order(self) -> np.ndarray:
+        """Return the edge indices in networkx edge iteration order."""
+        return np.lexsort((
+            np.arange(self.num_edges),
+            np.minimum(self.sources, self.targets),
+        ))
+
+    def edge_list(
+        self, weight_attribute: str = "weight", weight_default: float = 1.0
+    ) -> list[tuple[Any, Any, float]]:
+        """Return the (source, target, weight) titles of the edges in networkx edge iteration order."""
+        order = self.edge_order()
+        sources = self.sources[order]
+        targets = self.targets[order]
+        if weight_attribute in self.edge_data.columns:
+            weights = (
+                self.edge_data[weight_attribute].iloc[order].astype(float).tolist()
+            )
+        else:
+            weights = [weight_default] * len(order)
+        return list(
+            zip(
+                self.titles[np.minimum(sources, targets)].tolist(),
+                self.titles[np.maximum(sources, targets)].tolist(),
+                weights,
+                strict=True,
+            )
+        )
+
+    def has_self_loops(self) -> bool:
+        """Return whether any edge connects a node to itself."""
+        return bool(np.any(self.sources == self.targets))
+
+    def subgraph(
+        self, node_mask: np.ndarray, edge_mask: np.ndarray | None = None
+    ) -> "CompactGraph":
+        """Return the graph of the masked nodes and of the masked edges between them, in the same order."""
+        new_ids = np.cumsum(node_mask) - 1
+        keep_edges = node_mask[self.sources] & node_mask[self.targets]
+        if edge_mask is not None:
+            keep_edges &= edge_mask
+        node_data = self.node_data.loc[node_mask[self.node_data.index.to_numpy()]]
+        node_data.index = new_ids[node_data.index.to_numpy()]
+        return CompactGraph(
+            titles=self.titles[node_mask],
+            sources=new_ids[self.sources[keep_edges]],
+            targets=new_ids[self.targets[keep_edges]],
+            edge_data=self.edge_data.loc[keep_edges].reset_index(drop=True),
+            node_data=node_data,
+        )
+
+    def largest_connected_component(self) -> "CompactGraph":
+        """Return the largest connected component, the one with the lowest node ids on ties."""
+        if self.num_nodes == 0:
+            return self
+        _, labels = connected_components(self.adjacency(), directed=False)
+        # components are labeled in the order of their lowest node id
+        largest = np.argmax(np.bincount(labels))
+        return self.subgraph(labels == largest)
+
+    def relabel(self, titles: Sequence[Hashable] | np.ndarray) -> "CompactGraph":
+        """
+        Give every node id a new title, merging the nodes that end up with the same one.
+
+        Matches networkx.relabel_nodes: merged nodes keep the attributes of the last
+        node and merged edges the attributes of the last edge in edge iteration order.
+        """
+        codes, unique_titles = pd.factorize(
+            pd.Series(np.asarray(titles, dtype=object)), use_na_sentinel=False
+        )
+        order = self.edge_order()
+        sources = np.minimum(self.sources, self.targets)[order]
+        targets = np.maximum(self.sources, self.targets)[order]
+        node_data = self.node_data.copy()
+        node_data.index = codes[node_data.index.to_numpy()]
+        node_data = node_data.loc[~node_data.index.duplicated(keep="last")]
+        return CompactGraph.from_edges(
+            unique_titles.to_numpy(dtype=object),
+            codes[sources],
+            codes[targets],
+            self.edge_data.iloc[order].reset_index(drop=True),
+            node_data.sort_index(),
+        )
+
+    def sorted(self) -> "CompactGraph":
+        """
+        Return the graph with the nodes sorted by title and the edges by (source, target).
+
+        Every edge points from its lower to its higher title, so the same relationships
+        always read the same way.
+        """
+        order = np.argsort(self.titles, kind="stable")
+        ranks = np.empty(self.num_nodes, dtype=np.int64)
+        ranks[order] = np.arange(self.num_nodes)
+        sources = np.minimum(ranks[self.sources], ranks[self.targets])
+        targets = np.maximum(ranks[self.sources], ranks[self.targets])
+        edge_order = np.lexsort((targets, sources))
+        node_data = self.node_data.copy()
+        node_data.index = ranks[node_data.index.to_numpy()]
+        return CompactGraph(
+            titles=self.titles[order],
+            sources=sources[edge_order],
+            targets=targets[edge_order],
+            edge_data=self.edge_data.iloc[edge_order].reset_index(drop=True),
+            node_data=node_data.sort_index(),
+        )
+
+    def to_networkx(self, include_edges: bool = True) -> nx.Graph:
+        """Build the networkx graph, without its edges unless `include_edges` is set."""
+        graph = nx.Graph()
+        titles = self.titles.tolist()
+        data = dict(
+            zip(
+                self.node_data.index.tolist(),
+                _records(self.node_data),
+                strict=True,
+            )
+        )
+        graph.add_nodes_from((title, data.get(i, {})) for i, title in enumerate(titles))
+        if include_edges:
+            graph.add_edges_from(
+                zip(
+                    self.titles[self.sources].tolist(),
+                    self.titles[self.targets].tolist(),
+                    _records(self.edge_data),
+                    strict=True,
+                )
+            )
+        return graph
+
+
+def _records(data: pd.DataFrame) -> list[dict[str, Any]]:
+    """Return the rows as dicts, also for frames without columns."""
+    if len(data.columns) == 0:
+        return [{} for _ in range(len(data))]
+    return data.to_dict("records")  # type: ignore
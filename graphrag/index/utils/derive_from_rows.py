@@ -15,6 +15,7 @@ import pandas as pd
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.utils.llm_budget import RequestLimiter
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -38,17 +39,22 @@ async def derive_from_rows(
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
     progress_msg: str = "",
+    limiter: RequestLimiter | None = None,
 ) -> list[ItemType | None]:
-    """Apply a generic transform function to each row. Any errors will be reported and thrown."""
+    """Apply a generic transform function to each row. Any errors will be reported and thrown.
+
+    The asyncio and threaded modes run up to `num_threads` rows at once, or as many as
+    `limiter` allows if given.
+    """
     callbacks = callbacks or NoopWorkflowCallbacks()
     match async_type:
         case AsyncType.AsyncIO:
             return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads, progress_msg
+                input, transform, callbacks, num_threads, progress_msg, limiter
             )
         case AsyncType.Threaded:
             return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads, progress_msg
+                input, transform, callbacks, num_threads, progress_msg, limiter
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
@@ -64,13 +70,14 @@ async def derive_from_rows_asyncio_threads(
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
     progress_msg: str = "",
+    limiter: RequestLimiter | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    semaphore = limiter or asyncio.Semaphore(num_threads or 4)
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
         tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
@@ -97,13 +104,14 @@ async def derive_from_rows_asyncio(
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
     progress_msg: str = "",
+    limiter: RequestLimiter | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    semaphore = limiter or asyncio.Semaphore(num_threads or 4)
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
         async def execute_row_protected(
@@ -13,6 +13,7 @@ from graspologic.partition import hierarchical_leiden, modularity
 from graspologic.utils import largest_connected_component
 
 from graphrag.config.enums import ModularityMetric
+from graphrag.utils.rank_fusion import reciprocal_rank
 
 logger = logging.getLogger(__name__)
 
@@ -171,34 +172,46 @@ def calculate_pmi_edge_weights(
 
     """
     copied_nodes_df = nodes_df[[node_name_col, node_freq_col]]
-
-    total_edge_weights = edges_df[edge_weight_col].sum()
-    total_freq_occurrences = nodes_df[node_freq_col].sum()
-    copied_nodes_df["prop_occurrence"] = (
-        copied_nodes_df[node_freq_col] / total_freq_occurrences
-    )
-    copied_nodes_df = copied_nodes_df.loc[:, [node_name_col, "prop_occurrence"]]
-
-    edges_df["prop_weight"] = edges_df[edge_weight_col] / total_edge_weights
     edges_df = (
         edges_df.merge(
             copied_nodes_df, left_on=edge_source_col, right_on=node_name_col, how="left"
         )
         .drop(columns=[node_name_col])
-        .rename(columns={"prop_occurrence": "source_prop"})
+        .rename(columns={node_freq_col: "source_freq"})
     )
     edges_df = (
         edges_df.merge(
             copied_nodes_df, left_on=edge_target_col, right_on=node_name_col, how="left"
         )
         .drop(columns=[node_name_col])
-        .rename(columns={"prop_occurrence": "target_prop"})
+        .rename(columns={node_freq_col: "target_freq"})
     )
-    edges_df[edge_weight_col] = edges_df["prop_weight"] * np.log2(
-        edges_df["prop_weight"] / (edges_df["source_prop"] * edges_df["target_prop"])
+    edges_df[edge_weight_col] = calculate_pmi(
+        edges_df[edge_weight_col].to_numpy(),
+        edges_df["source_freq"].to_numpy(),
+        edges_df["target_freq"].to_numpy(),
+        nodes_df[node_freq_col].sum(),
     )
 
-    return edges_df.drop(columns=["prop_weight", "source_prop", "target_prop"])
+    return edges_df.drop(columns=["source_freq", "target_freq"])
+
+
+def calculate_pmi(
+    weights: np.ndarray,
+    source_freqs: np.ndarray,
+    target_freqs: np.ndarray,
+    total_freq_occurrences: float,
+) -> np.ndarray:
+    """
+    Calculate the PMI weights of `calculate_pmi_edge_weights` on arrays.
+
+    `weights` holds the raw edge weights, `source_freqs` and `target_freqs` the
+    occurrence frequencies of each edge's nodes.
+    """
+    prop_weight = weights / weights.sum()
+    source_prop = source_freqs / total_freq_occurrences
+    target_prop = target_freqs / total_freq_occurrences
+    return prop_weight * np.log2(prop_weight / (source_prop * target_prop))
 
 
 def calculate_rrf_edge_weights(
@@ -226,11 +239,9 @@ def calculate_rrf_edge_weights(
     edges_df["raw_weight_rank"] = edges_df[edge_weight_col].rank(
         method="min", ascending=False
     )
-    edges_df[edge_weight_col] = edges_df.apply(
-        lambda x: (1 / (rrf_smoothing_factor + x["pmi_rank"]))
-        + (1 / (rrf_smoothing_factor + x["raw_weight_rank"])),
-        axis=1,
-    )
+    edges_df[edge_weight_col] = reciprocal_rank(
+        edges_df["pmi_rank"], rrf_smoothing_factor
+    ) + reciprocal_rank(edges_df["raw_weight_rank"], rrf_smoothing_factor)
 
     return edges_df.drop(columns=["pmi_rank", "raw_weight_rank"])
 
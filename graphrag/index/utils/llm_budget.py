@@ -0,0 +1,64 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A pipeline-wide budget for concurrent LLM requests.
+
+Every workflow limits its own requests with the `concurrent_requests` setting of its
+model. When the pipeline runs several workflows at once, those limits add up, so the
+runner shares a single semaphore with all workflow tasks and the operations take a
+slot from it around each LLM request.
+
+Within a workflow, a fan-out of LLM requests is limited by a semaphore of
+`concurrent_requests` slots, or by the adaptive limiter its model shares with all
+operations using the same model and endpoint if the model adapts its concurrency.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.language_model.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from graphrag.language_model.manager import ModelManager
+
+RequestLimiter = asyncio.Semaphore | AdaptiveConcurrencyLimiter
+
+_llm_budget: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "llm_budget", default=None
+)
+
+
+def set_llm_budget(budget: asyncio.Semaphore | None) -> None:
+    """Share `budget` with the current task and every task it starts afterwards."""
+    _llm_budget.set(budget)
+
+
+@asynccontextmanager
+async def llm_request_slot() -> AsyncIterator[None]:
+    """Hold a slot of the LLM budget, if one was set, while making a request."""
+    budget = _llm_budget.get()
+    if budget is None:
+        yield
+        return
+    async with budget:
+        yield
+
+
+def request_limiter(
+    llm: dict[str, Any] | None,
+    num_threads: int,
+    callbacks: WorkflowCallbacks | None = None,
+) -> RequestLimiter:
+    """Return the limit for a fan-out of requests to the model configured by `llm`.
+
+    `llm` is the model configuration of the operation strategy. Without adaptive
+    concurrency this is a semaphore of `num_threads` slots.
+    """
+    if llm and llm.get("adaptive_concurrency"):
+        return ModelManager().get_or_create_concurrency_limiter(
+            LanguageModelConfig(**llm), callbacks
+        )
+    return asyncio.Semaphore(num_threads)
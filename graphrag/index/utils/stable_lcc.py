@@ -4,13 +4,29 @@
 """A module for producing a stable largest connected component, i.e. same input graph == same output lcc."""
 
 import html
-from typing import Any, cast
+from typing import Any, cast, overload
 
 import networkx as nx
 
+from graphrag.index.utils.compact_graph import CompactGraph
 
-def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
+
+@overload
+def stable_largest_connected_component(graph: CompactGraph) -> CompactGraph: ...
+
+
+@overload
+def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph: ...
+
+
+def stable_largest_connected_component(
+    graph: nx.Graph | CompactGraph,
+) -> nx.Graph | CompactGraph:
     """Return the largest connected component of the graph, with nodes and edges sorted in a stable way."""
+    if isinstance(graph, CompactGraph):
+        # the array counterpart of the steps below
+        return normalize_node_names(graph.largest_connected_component()).sorted()
+
     # NOTE: The import is done here to reduce the initial import time of the module
     from graspologic.utils import largest_connected_component
 
@@ -61,7 +77,21 @@ def _stabilize_graph(graph: nx.Graph) -> nx.Graph:
     return fixed_graph
 
 
-def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph:
+@overload
+def normalize_node_names(graph: CompactGraph) -> CompactGraph: ...
+
+
+@overload
+def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph: ...
+
+
+def normalize_node_names(
+    graph: nx.Graph | nx.DiGraph | CompactGraph,
+) -> nx.Graph | nx.DiGraph | CompactGraph:
     """Normalize node names."""
+    if isinstance(graph, CompactGraph):
+        return graph.relabel([
+            html.unescape(title.upper().strip()) for title in graph.titles
+        ])
     node_mapping = {node: html.unescape(node.upper().strip()) for node in graph.nodes()}  # type: ignore
     return nx.relabel_nodes(graph, node_mapping)
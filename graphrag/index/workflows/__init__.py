@@ -9,6 +9,9 @@ from graphrag.index.workflows.factory import PipelineFactory
 from .create_base_text_units import (
     run_workflow as run_create_base_text_units,
 )
+from .create_bm25_index import (
+    run_workflow as run_create_bm25_index,
+)
 from .create_communities import (
     run_workflow as run_create_communities,
 )
@@ -48,6 +51,9 @@ from .load_update_documents import (
 from .prune_graph import (
     run_workflow as run_prune_graph,
 )
+from .update_bm25_index import (
+    run_workflow as run_update_bm25_index,
+)
 from .update_clean_state import (
     run_workflow as run_update_clean_state,
 )
@@ -57,6 +63,9 @@ from .update_communities import (
 from .update_community_reports import (
     run_workflow as run_update_community_reports,
 )
+from .update_community_reports_text import (
+    run_workflow as run_update_community_reports_text,
+)
 from .update_covariates import (
     run_workflow as run_update_covariates,
 )
@@ -78,6 +87,7 @@ PipelineFactory.register_all({
     "load_input_documents": run_load_input_documents,
     "load_update_documents": run_load_update_documents,
     "create_base_text_units": run_create_base_text_units,
+    "create_bm25_index": run_create_bm25_index,
     "create_communities": run_create_communities,
     "create_community_reports_text": run_create_community_reports_text,
     "create_community_reports": run_create_community_reports,
@@ -92,9 +102,53 @@ PipelineFactory.register_all({
     "update_final_documents": run_update_final_documents,
     "update_text_embeddings": run_update_text_embeddings,
     "update_community_reports": run_update_community_reports,
+    "update_community_reports_text": run_update_community_reports_text,
     "update_entities_relationships": run_update_entities_relationships,
     "update_communities": run_update_communities,
     "update_covariates": run_update_covariates,
     "update_text_units": run_update_text_units,
+    "update_bm25_index": run_update_bm25_index,
     "update_clean_state": run_update_clean_state,
 })
+
+# declare the output tables of the built-in workflows, so independent workflows can
+# run concurrently. The update workflows pass their results through the context
+# state and keep running in list order.
+for _name, _reads, _writes in [
+    ("load_input_documents", ["input"], ["documents"]),
+    ("load_update_documents", ["input"], ["documents"]),
+    ("create_base_text_units", ["documents"], ["text_units"]),
+    ("create_final_documents", ["documents", "text_units"], ["documents"]),
+    ("extract_graph", ["text_units"], ["entities", "relationships"]),
+    ("extract_graph_nlp", ["text_units"], ["entities", "relationships"]),
+    ("prune_graph", ["entities", "relationships"], ["entities", "relationships"]),
+    ("finalize_graph", ["entities", "relationships"], ["entities", "relationships"]),
+    ("extract_covariates", ["text_units"], ["covariates"]),
+    ("create_communities", ["entities", "relationships"], ["communities"]),
+    (
+        "create_final_text_units",
+        ["text_units", "entities", "relationships", "covariates"],
+        ["text_units"],
+    ),
+    (
+        "create_community_reports",
+        ["entities", "relationships", "communities", "covariates"],
+        ["community_reports"],
+    ),
+    (
+        "create_community_reports_text",
+        ["entities", "communities", "text_units"],
+        ["community_reports"],
+    ),
+    (
+        "generate_text_embeddings",
+        ["documents", "text_units", "entities", "relationships", "community_reports"],
+        [],
+    ),
+    (
+        "create_bm25_index",
+        ["text_units", "entities"],
+        ["bm25_postings", "bm25_documents"],
+    ),
+]:
+    PipelineFactory.register_tables(_name, _reads, _writes)
@@ -5,6 +5,7 @@
 
 import json
 import logging
+from collections.abc import Callable
 from typing import Any, cast
 
 import pandas as pd
@@ -13,10 +14,15 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.chunk_text.chunk_text import chunk_text
-from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+from graphrag.index.operations.chunk_text.strategies import (
+    get_batch_encoding_fn,
+    get_encoding_fn,
+)
+from graphrag.index.text_splitting.text_splitting import split_grouped_texts_on_tokens
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.logger.progress import progress_ticker
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
@@ -83,27 +89,27 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
+    metadata_prefixes = [("", 0)] * len(aggregated)
+    if prepend_metadata and "metadata" in aggregated:
+        encode, _ = get_encoding_fn(encoding_model)
+        metadata_prefixes = [
+            _get_metadata_prefix(metadata, chunk_size_includes_metadata, size, encode)
+            for metadata in aggregated["metadata"]
+        ]
+
+    if strategy == ChunkStrategyType.tokens:
+        return _create_token_text_units(
+            aggregated,
+            callbacks,
+            group_by_columns,
+            size,
+            overlap,
+            encoding_model,
+            metadata_prefixes,
+        )
+
     def chunker(row: pd.Series) -> Any:
-        line_delimiter = ".\n"
-        metadata_str = ""
-        metadata_tokens = 0
-
-        if prepend_metadata and "metadata" in row:
-            metadata = row["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-            if isinstance(metadata, dict):
-                metadata_str = (
-                    line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
-                    + line_delimiter
-                )
-
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
-                metadata_tokens = len(encode(metadata_str))
-                if metadata_tokens >= size:
-                    message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
-                    raise ValueError(message)
+        metadata_str, metadata_tokens = metadata_prefixes[row.name]  # type: ignore
 
         chunked = chunk_text(
             pd.DataFrame([row]).reset_index(drop=True),
@@ -161,3 +167,82 @@ def create_base_text_units(
     return cast(
         "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
     )
+
+
+def _get_metadata_prefix(
+    metadata: Any,
+    chunk_size_includes_metadata: bool,
+    size: int,
+    encode: Callable[[str], list[int]],
+) -> tuple[str, int]:
+    """Return the metadata string prepended to each chunk of a group and its token count, if it counts towards the chunk size."""
+    line_delimiter = ".\n"
+    metadata_str = ""
+    metadata_tokens = 0
+
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if isinstance(metadata, dict):
+        metadata_str = (
+            line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
+            + line_delimiter
+        )
+
+    if chunk_size_includes_metadata:
+        metadata_tokens = len(encode(metadata_str))
+        if metadata_tokens >= size:
+            message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
+            raise ValueError(message)
+
+    return metadata_str, metadata_tokens
+
+
+def _create_token_text_units(
+    aggregated: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    group_by_columns: list[str],
+    size: int,
+    overlap: int,
+    encoding_model: str,
+    metadata_prefixes: list[tuple[str, int]],
+) -> pd.DataFrame:
+    """Chunk all groups on tokens in batches and build the text units table directly."""
+    texts_with_ids: list[list[tuple[str, str]]] = aggregated["texts"].tolist()
+    total_texts = sum(len(texts) for texts in texts_with_ids)
+    logger.info("Starting chunking process for %d documents", total_texts)
+    tick = progress_ticker(
+        callbacks.progress, total_texts, description="chunker progress: "
+    )
+
+    encode_batch, decode_batch = get_batch_encoding_fn(encoding_model)
+    group_indices: list[int] = []
+    chunk_texts: list[str] = []
+    document_ids: list[list[str]] = []
+    n_tokens: list[int] = []
+    for group_idx, chunk in split_grouped_texts_on_tokens(
+        [[text for _, text in texts] for texts in texts_with_ids],
+        tokens_per_chunk=[size - tokens for _, tokens in metadata_prefixes],
+        chunk_overlap=overlap,
+        encode_batch=encode_batch,
+        decode_batch=decode_batch,
+        tick=tick,
+    ):
+        texts = texts_with_ids[group_idx]
+        group_indices.append(group_idx)
+        chunk_texts.append(metadata_prefixes[group_idx][0] + chunk.text_chunk)
+        document_ids.append([texts[doc_idx][0] for doc_idx in chunk.source_doc_indices])
+        n_tokens.append(cast("int", chunk.n_tokens))
+    tick.done()
+
+    output = cast(
+        "pd.DataFrame", aggregated[group_by_columns].iloc[group_indices]
+    ).reset_index(drop=True)
+    output["text"] = chunk_texts
+    # same hash input as the row-wise chunker: the (document_ids, text, n_tokens) tuple
+    output["id"] = [
+        gen_sha512_hash({"chunk": chunk}, ["chunk"])
+        for chunk in zip(document_ids, chunk_texts, n_tokens, strict=True)
+    ]
+    output["document_ids"] = document_ids
+    output["n_tokens"] = n_tokens
+    return output
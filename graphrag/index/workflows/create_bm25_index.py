@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import asyncio
+import logging
+
+import pandas as pd
+
+from graphrag.bm25.index import (
+    DOCUMENTS_TABLE,
+    ENTITIES_CORPUS,
+    POSTINGS_TABLE,
+    TEXT_UNITS_CORPUS,
+    BM25Index,
+)
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    delete_table_from_storage,
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """All the steps to build the BM25 index of the text units and entities."""
+    logger.info("Workflow started: create_bm25_index")
+    if not config.bm25_index.enabled:
+        await delete_bm25_index(context.output_storage)
+        logger.info("Workflow completed: create_bm25_index (disabled)")
+        return WorkflowFunctionOutput(result=None)
+
+    text_units = await load_table_from_storage(
+        "text_units", context.output_storage, columns=["id", "text"]
+    )
+    entities = await load_table_from_storage(
+        "entities", context.output_storage, columns=["id", "title", "description"]
+    )
+
+    # tokenizing the corpora is CPU bound, keep it off the event loop
+    postings, documents = await asyncio.to_thread(
+        create_bm25_index, text_units, entities
+    )
+
+    await write_table_to_storage(postings, POSTINGS_TABLE, context.output_storage)
+    await write_table_to_storage(documents, DOCUMENTS_TABLE, context.output_storage)
+
+    logger.info("Workflow completed: create_bm25_index")
+    return WorkflowFunctionOutput(
+        result={
+            POSTINGS_TABLE: postings,
+            DOCUMENTS_TABLE: documents,
+        }
+    )
+
+
+def create_bm25_index(
+    text_units: pd.DataFrame, entities: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the BM25 postings and documents tables of the text units and entities.
+
+    Text units are indexed by their text, entities by their title and description.
+    """
+    entity_texts = (
+        entities["title"].fillna("").astype(str)
+        + "\n"
+        + entities["description"].fillna("").astype(str)
+    )
+    indexes = {
+        TEXT_UNITS_CORPUS: BM25Index.from_texts(
+            text_units["id"].tolist(), text_units["text"].fillna("").astype(str)
+        ),
+        ENTITIES_CORPUS: BM25Index.from_texts(entities["id"].tolist(), entity_texts),
+    }
+    tables = [index.to_tables(corpus) for corpus, index in indexes.items()]
+    return (
+        pd.concat([postings for postings, _ in tables], ignore_index=True),
+        pd.concat([documents for _, documents in tables], ignore_index=True),
+    )
+
+
+async def delete_bm25_index(storage: PipelineStorage) -> None:
+    """Delete the BM25 tables of an earlier run, so that queries do not use a stale index."""
+    for name in (POSTINGS_TABLE, DOCUMENTS_TABLE):
+        if await storage_has_table(name, storage):
+            await delete_table_from_storage(name, storage)
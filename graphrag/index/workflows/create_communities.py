@@ -13,7 +13,7 @@ import pandas as pd
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
-from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.cluster_graph import Communities, cluster_graph
 from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
@@ -68,6 +68,15 @@ def create_communities(
         seed=seed,
     )
 
+    return build_communities(clusters, entities, relationships)
+
+
+def build_communities(
+    clusters: Communities,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+) -> pd.DataFrame:
+    """Build the final communities table of the clusters of a graph."""
     communities = pd.DataFrame(
         clusters, columns=pd.Index(["level", "community", "parent", "title"])
     ).explode("title")
@@ -4,6 +4,7 @@
 """A module containing run_workflow method definition."""
 
 import logging
+from collections.abc import Collection
 
 import pandas as pd
 
@@ -91,8 +92,9 @@ async def create_community_reports(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    community_ids: Collection[int] | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform community reports."""
+    """All the steps to transform community reports, only of the `community_ids` if given."""
     nodes = explode_communities(communities, entities)
 
     nodes = _prep_nodes(nodes)
@@ -132,6 +134,7 @@ async def create_community_reports(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        community_ids=community_ids,
     )
 
     return finalize_community_reports(community_reports, communities)
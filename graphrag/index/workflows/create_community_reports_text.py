@@ -4,6 +4,7 @@
 """A module containing run_workflow method definition."""
 
 import logging
+from collections.abc import Collection
 
 import pandas as pd
 
@@ -80,8 +81,9 @@ async def create_community_reports_text(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    community_ids: Collection[int] | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform community reports."""
+    """All the steps to transform community reports, only of the `community_ids` if given."""
     nodes = explode_communities(communities, entities)
 
     summarization_strategy["extraction_prompt"] = summarization_strategy["text_prompt"]
@@ -109,6 +111,7 @@ async def create_community_reports_text(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        community_ids=community_ids,
     )
 
     return finalize_community_reports(community_reports, communities)
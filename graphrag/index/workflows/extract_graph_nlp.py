@@ -8,6 +8,7 @@ import logging
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.extract_graph_nlp_config import ExtractGraphNLPConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.build_noun_graph.build_noun_graph import build_noun_graph
@@ -33,6 +34,7 @@ async def run_workflow(
         text_units,
         context.cache,
         extraction_config=config.extract_graph_nlp,
+        callbacks=context.callbacks,
     )
 
     await write_table_to_storage(entities, "entities", context.output_storage)
@@ -52,6 +54,7 @@ async def extract_graph_nlp(
     text_units: pd.DataFrame,
     cache: PipelineCache,
     extraction_config: ExtractGraphNLPConfig,
+    callbacks: WorkflowCallbacks | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     text_analyzer_config = extraction_config.text_analyzer
@@ -63,6 +66,8 @@ async def extract_graph_nlp(
         num_threads=extraction_config.concurrent_requests,
         async_mode=extraction_config.async_mode,
         cache=cache,
+        batch_size=extraction_config.batch_size,
+        callbacks=callbacks,
     )
 
     # add in any other columns required by downstream workflows
@@ -9,7 +9,7 @@ from typing import ClassVar
 from graphrag.config.enums import IndexingMethod
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.typing.pipeline import Pipeline
-from graphrag.index.typing.workflow import WorkflowFunction
+from graphrag.index.typing.workflow import WorkflowFunction, WorkflowTables
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +19,28 @@ class PipelineFactory:
 
     workflows: ClassVar[dict[str, WorkflowFunction]] = {}
     pipelines: ClassVar[dict[str, list[str]]] = {}
+    tables: ClassVar[dict[str, WorkflowTables]] = {}
 
     @classmethod
-    def register(cls, name: str, workflow: WorkflowFunction):
-        """Register a custom workflow function."""
+    def register(
+        cls,
+        name: str,
+        workflow: WorkflowFunction,
+        reads: list[str] | None = None,
+        writes: list[str] | None = None,
+    ):
+        """
+        Register a custom workflow function.
+
+        Workflows declaring the tables they read and write can run concurrently with
+        the workflows they do not depend on. Workflows without declarations run in
+        list order.
+        """
         cls.workflows[name] = workflow
+        if reads is None and writes is None:
+            cls.tables.pop(name, None)
+        else:
+            cls.register_tables(name, reads or [], writes or [])
 
     @classmethod
     def register_all(cls, workflows: dict[str, WorkflowFunction]):
@@ -31,6 +48,13 @@ class PipelineFactory:
         for name, workflow in workflows.items():
             cls.register(name, workflow)
 
+    @classmethod
+    def register_tables(cls, name: str, reads: list[str], writes: list[str]):
+        """Declare the output tables a registered workflow reads and writes."""
+        cls.tables[name] = WorkflowTables(
+            reads=frozenset(reads), writes=frozenset(writes)
+        )
+
     @classmethod
     def register_pipeline(cls, name: str, workflows: list[str]):
         """Register a new pipeline method as a list of workflow names."""
@@ -45,7 +69,10 @@ class PipelineFactory:
         """Create a pipeline generator."""
         workflows = config.workflows or cls.pipelines.get(method, [])
         logger.info("Creating pipeline with workflows: %s", workflows)
-        return Pipeline([(name, cls.workflows[name]) for name in workflows])
+        return Pipeline(
+            [(name, cls.workflows[name]) for name in workflows],
+            tables={name: cls.tables[name] for name in workflows if name in cls.tables},
+        )
 
 
 # --- Register default implementations ---
@@ -59,6 +86,7 @@ _standard_workflows = [
     "create_final_text_units",
     "create_community_reports",
     "generate_text_embeddings",
+    "create_bm25_index",
 ]
 _fast_workflows = [
     "create_base_text_units",
@@ -70,6 +98,7 @@ _fast_workflows = [
     "create_final_text_units",
     "create_community_reports_text",
     "generate_text_embeddings",
+    "create_bm25_index",
 ]
 _update_workflows = [
     "update_final_documents",
@@ -79,6 +108,18 @@ _update_workflows = [
     "update_communities",
     "update_community_reports",
     "update_text_embeddings",
+    "update_bm25_index",
+    "update_clean_state",
+]
+_fast_update_workflows = [
+    "update_final_documents",
+    "update_entities_relationships",
+    "update_text_units",
+    "update_covariates",
+    "update_communities",
+    "update_community_reports_text",
+    "update_text_embeddings",
+    "update_bm25_index",
     "update_clean_state",
 ]
 PipelineFactory.register_pipeline(
@@ -93,5 +134,5 @@ PipelineFactory.register_pipeline(
 )
 PipelineFactory.register_pipeline(
     IndexingMethod.FastUpdate,
-    ["load_update_documents", *_fast_workflows, *_update_workflows],
+    ["load_update_documents", *_fast_workflows, *_fast_update_workflows],
 )
@@ -45,7 +45,7 @@ async def run_workflow(
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
-        graph = create_graph(final_relationships, edge_attr=["weight"])
+        graph = create_graph(final_relationships, edge_attr=["weight"]).to_networkx()
 
         await snapshot_graphml(
             graph,
@@ -0,0 +1,47 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import asyncio
+import logging
+
+from graphrag.bm25.index import DOCUMENTS_TABLE, POSTINGS_TABLE
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.utils import get_update_storages
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.workflows.create_bm25_index import (
+    create_bm25_index,
+    delete_bm25_index,
+)
+from graphrag.utils.storage import write_table_to_storage
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Rebuild the BM25 index over the merged text units and entities of an incremental index run."""
+    logger.info("Workflow started: update_bm25_index")
+    output_storage, _, _ = get_update_storages(
+        config, context.state["update_timestamp"]
+    )
+    if not config.bm25_index.enabled:
+        await delete_bm25_index(output_storage)
+        logger.info("Workflow completed: update_bm25_index (disabled)")
+        return WorkflowFunctionOutput(result=None)
+
+    postings, documents = await asyncio.to_thread(
+        create_bm25_index,
+        context.state["incremental_update_merged_text_units"],
+        context.state["incremental_update_merged_entities"],
+    )
+
+    await write_table_to_storage(postings, POSTINGS_TABLE, output_storage)
+    await write_table_to_storage(documents, DOCUMENTS_TABLE, output_storage)
+
+    logger.info("Workflow completed: update_bm25_index")
+    return WorkflowFunctionOutput(result=None)
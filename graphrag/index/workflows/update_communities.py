@@ -5,11 +5,20 @@
 
 import logging
 
+import pandas as pd
+
+from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
 from graphrag.index.run.utils import get_update_storages
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.update.communities import _update_and_merge_communities
+from graphrag.index.update.communities import (
+    _merge_incremental_communities,
+    _recluster_touched_communities,
+    _update_and_merge_communities,
+)
+from graphrag.index.workflows.create_communities import build_communities
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
@@ -26,11 +35,16 @@ async def run_workflow(
         config, context.state["update_timestamp"]
     )
 
-    community_id_mapping = await _update_communities(
-        previous_storage, delta_storage, output_storage
-    )
-
-    context.state["incremental_update_community_id_mapping"] = community_id_mapping
+    if config.cluster_graph.incremental:
+        changed_communities = await _recluster_communities(
+            previous_storage, delta_storage, output_storage, config.cluster_graph
+        )
+        context.state["incremental_update_changed_communities"] = changed_communities
+    else:
+        community_id_mapping = await _update_communities(
+            previous_storage, delta_storage, output_storage
+        )
+        context.state["incremental_update_community_id_mapping"] = community_id_mapping
 
     logger.info("Workflow completed: update_communities")
     return WorkflowFunctionOutput(result=None)
@@ -51,3 +65,80 @@ async def _update_communities(
     await write_table_to_storage(merged_communities, "communities", output_storage)
 
     return community_id_mapping
+
+
+async def _recluster_communities(
+    previous_storage: PipelineStorage,
+    delta_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    config: ClusterGraphConfig,
+) -> list[int]:
+    """Re-cluster the communities touched by the update and return the changed ones."""
+    old_communities = await load_table_from_storage("communities", previous_storage)
+    delta_entities = await load_table_from_storage("entities", delta_storage)
+    delta_relationships = await load_table_from_storage("relationships", delta_storage)
+    # the merged entities and relationships written by update_entities_relationships
+    entities = await load_table_from_storage("entities", output_storage)
+    relationships = await load_table_from_storage("relationships", output_storage)
+
+    merged_communities, changed_communities = incremental_update_communities(
+        old_communities,
+        entities,
+        relationships,
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=config.max_cluster_size,
+        use_lcc=config.use_lcc,
+        seed=config.seed,
+    )
+    logger.info(
+        "Re-clustered %d of %d communities",
+        len(changed_communities),
+        len(merged_communities),
+    )
+
+    await write_table_to_storage(merged_communities, "communities", output_storage)
+
+    return changed_communities
+
+
+def incremental_update_communities(
+    old_communities: pd.DataFrame,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    delta_entities: pd.DataFrame,
+    delta_relationships: pd.DataFrame,
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, list[int]]:
+    """Re-cluster the previous communities touched by the delta entities and relationships.
+
+    Returns the merged communities and the ids of the communities that changed.
+    """
+    touched_titles = (
+        set(delta_entities["title"])
+        | set(delta_relationships["source"])
+        | set(delta_relationships["target"])
+    )
+    clusters, replaced_communities = _recluster_touched_communities(
+        old_communities,
+        entities,
+        relationships,
+        touched_titles,
+        max_cluster_size=max_cluster_size,
+        use_lcc=use_lcc,
+        seed=seed,
+    )
+    region_communities = (
+        build_communities(clusters, entities, relationships)
+        if clusters
+        else pd.DataFrame(columns=COMMUNITIES_FINAL_COLUMNS)
+    )
+    touched_entity_ids = entities.loc[entities["title"].isin(touched_titles), "id"]
+    return _merge_incremental_communities(
+        old_communities,
+        region_communities,
+        replaced_communities,
+        touched_entity_ids.tolist(),
+    )
@@ -11,9 +11,22 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.run.utils import get_update_storages
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.update.communities import _update_and_merge_community_reports
+from graphrag.index.update.communities import (
+    _merge_regenerated_community_reports,
+    _update_and_merge_community_reports,
+)
+from graphrag.index.workflows.create_community_reports import (
+    create_community_reports,
+)
+from graphrag.index.workflows.create_community_reports_text import (
+    create_community_reports_text,
+)
 from graphrag.storage.pipeline_storage import PipelineStorage
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,23 +37,44 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """Update the community reports from a incremental index run."""
     logger.info("Workflow started: update_community_reports")
+    await run_update_community_reports(config, context, text_context=False)
+    logger.info("Workflow completed: update_community_reports")
+    return WorkflowFunctionOutput(result=None)
+
+
+async def run_update_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    text_context: bool,
+) -> None:
+    """Merge or regenerate the community reports of an incremental index run.
+
+    With incremental clustering only the reports of the changed communities are
+    regenerated, from the graph or, with `text_context`, from the text units.
+    """
     output_storage, previous_storage, delta_storage = get_update_storages(
         config, context.state["update_timestamp"]
     )
 
-    community_id_mapping = context.state["incremental_update_community_id_mapping"]
-
-    merged_community_reports = await _update_community_reports(
-        previous_storage, delta_storage, output_storage, community_id_mapping
-    )
+    if config.cluster_graph.incremental:
+        merged_community_reports = await _regenerate_community_reports(
+            config,
+            context,
+            previous_storage,
+            output_storage,
+            context.state["incremental_update_changed_communities"],
+            text_context=text_context,
+        )
+    else:
+        community_id_mapping = context.state["incremental_update_community_id_mapping"]
+        merged_community_reports = await _update_community_reports(
+            previous_storage, delta_storage, output_storage, community_id_mapping
+        )
 
     context.state["incremental_update_merged_community_reports"] = (
         merged_community_reports
     )
 
-    logger.info("Workflow completed: update_community_reports")
-    return WorkflowFunctionOutput(result=None)
-
 
 async def _update_community_reports(
     previous_storage: PipelineStorage,
@@ -64,3 +98,78 @@ async def _update_community_reports(
     )
 
     return merged_community_reports
+
+
+async def _regenerate_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    previous_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    changed_communities: list[int],
+    text_context: bool,
+) -> pd.DataFrame:
+    """Regenerate the reports of the changed communities of the merged index."""
+    old_community_reports = await load_table_from_storage(
+        "community_reports", previous_storage
+    )
+    communities = await load_table_from_storage("communities", output_storage)
+    entities = await load_table_from_storage("entities", output_storage)
+
+    # the changed communities and their sub-communities, whose contexts can stand in
+    # for the context of a community that exceeds the limit
+    changed = communities["community"].isin(changed_communities)
+    children = communities["community"].isin(
+        communities.loc[changed, "children"].explode().dropna().astype(int)
+    )
+    selected_communities = communities.loc[changed | children].reset_index(drop=True)
+
+    community_reports_llm_settings = config.get_language_model_config(
+        config.community_reports.model_id
+    )
+    summarization_strategy = config.community_reports.resolved_strategy(
+        config.root_dir, community_reports_llm_settings
+    )
+    logger.info("Regenerating %d community reports", len(changed_communities))
+
+    if text_context:
+        text_units = await load_table_from_storage("text_units", output_storage)
+        regenerated = await create_community_reports_text(
+            entities,
+            selected_communities,
+            text_units,
+            context.callbacks,
+            context.cache,
+            summarization_strategy,
+            async_mode=community_reports_llm_settings.async_mode,
+            num_threads=community_reports_llm_settings.concurrent_requests,
+            community_ids=changed_communities,
+        )
+    else:
+        relationships = await load_table_from_storage("relationships", output_storage)
+        claims = None
+        if config.extract_claims.enabled and await storage_has_table(
+            "covariates", output_storage
+        ):
+            claims = await load_table_from_storage("covariates", output_storage)
+        regenerated = await create_community_reports(
+            edges_input=relationships,
+            entities=entities,
+            communities=selected_communities,
+            claims_input=claims,
+            callbacks=context.callbacks,
+            cache=context.cache,
+            summarization_strategy=summarization_strategy,
+            async_mode=community_reports_llm_settings.async_mode,
+            num_threads=community_reports_llm_settings.concurrent_requests,
+            community_ids=changed_communities,
+        )
+
+    merged_community_reports = _merge_regenerated_community_reports(
+        old_community_reports, regenerated, communities
+    )
+
+    await write_table_to_storage(
+        merged_community_reports, "community_reports", output_storage
+    )
+
+    return merged_community_reports
@@ -0,0 +1,26 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import logging
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.workflows.update_community_reports import (
+    run_update_community_reports,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Update the text-based community reports from a incremental index run."""
+    logger.info("Workflow started: update_community_reports_text")
+    await run_update_community_reports(config, context, text_context=True)
+    logger.info("Workflow completed: update_community_reports_text")
+    return WorkflowFunctionOutput(result=None)
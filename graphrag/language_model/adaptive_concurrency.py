@@ -0,0 +1,216 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An AIMD concurrency limit for the requests of a language model."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+
+# smoothing of the recent and of the baseline request latency
+_RECENT_LATENCY_WEIGHT = 0.5
+_BASELINE_LATENCY_WEIGHT = 0.05
+# the window the reported throughput is averaged over, in seconds
+_THROUGHPUT_WINDOW = 60.0
+# the least number of seconds between two reports that do not change the limit
+_REPORT_INTERVAL = 1.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A concurrency limit that adapts to the provider, used like an asyncio.Semaphore.
+
+    The limit grows additively, by one per limit's worth of responses, as long as the
+    recent latency stays within `latency_tolerance` times the baseline latency, and
+    shrinks multiplicatively by `backoff_ratio` when a request is throttled (429) or
+    times out, at most once per round trip. A `retry-after` hint pauses all requests
+    of the model until it has passed.
+
+    The limit, the requests in flight and the completed requests per second are
+    reported to `callbacks.metrics` under `concurrency:<name>`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        callbacks: WorkflowCallbacks | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            msg = "The concurrency limits must satisfy 1 <= min_limit <= max_limit."
+            raise ValueError(msg)
+        if not 0 < backoff_ratio < 1:
+            msg = "backoff_ratio must be between 0 and 1."
+            raise ValueError(msg)
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.callbacks = callbacks
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._stable_responses = 0
+        self._in_flight = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = (
+            deque()
+        )
+        self._paused_until = -math.inf
+        self._last_decrease = -math.inf
+        self._recent_latency: float | None = None
+        self._baseline_latency: float | None = None
+        self._started = clock()
+        self._completed: deque[float] = deque()
+        self._throttled = 0
+        self._last_report = -math.inf
+
+    @property
+    def limit(self) -> int:
+        """Return the number of requests currently allowed at once."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of slots currently held."""
+        return self._in_flight
+
+    def throughput(self) -> float:
+        """Return the completed requests per second over the last minute."""
+        with self._lock:
+            return self._throughput(self._clock())
+
+    def pause_remaining(self) -> float:
+        """Return the seconds until a `retry-after` pause has passed."""
+        return max(0.0, self._paused_until - self._clock())
+
+    async def acquire(self) -> None:
+        """Wait for a slot, in arrival order, and for any pause to pass."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                future = None
+            else:
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+        try:
+            if future is not None:
+                await future
+            # a throttled request may extend the pause while waiting
+            while (delay := self.pause_remaining()) > 0:  # noqa: ASYNC110
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if future is None or (future.done() and not future.cancelled()):
+                # the slot was handed over already
+                self.release()
+            else:
+                with self._lock:
+                    if (loop, future) in self._waiters:
+                        self._waiters.remove((loop, future))
+            raise
+
+    def release(self) -> None:
+        """Return a slot, handing it to the next waiter if the limit allows."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    async def __aenter__(self) -> None:
+        """Acquire a slot."""
+        await self.acquire()
+
+    async def __aexit__(self, *args: object) -> None:
+        """Release the slot."""
+        self.release()
+
+    def record_success(self, latency: float) -> None:
+        """Record a response that took `latency` seconds."""
+        with self._lock:
+            now = self._clock()
+            self._completed.append(now)
+            self._recent_latency = _smooth(
+                self._recent_latency, latency, _RECENT_LATENCY_WEIGHT
+            )
+            self._baseline_latency = _smooth(
+                self._baseline_latency, latency, _BASELINE_LATENCY_WEIGHT
+            )
+            changed = False
+            if self._recent_latency <= self._baseline_latency * self.latency_tolerance:
+                self._stable_responses += 1
+                if self._stable_responses >= self._limit < self.max_limit:
+                    self._stable_responses = 0
+                    self._limit += 1
+                    changed = True
+                    self._wake_waiters()
+            self._report(now, changed=changed)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Record a throttled (429) or timed out request, pausing for `retry_after` seconds if given."""
+        with self._lock:
+            now = self._clock()
+            self._throttled += 1
+            if retry_after is not None and retry_after > 0:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            limit = self._limit
+            # the requests of one round trip all meet the same congestion, back off once
+            if now - self._last_decrease >= (self._recent_latency or 0.0):
+                self._last_decrease = now
+                self._stable_responses = 0
+                self._limit = max(
+                    self.min_limit, math.floor(self._limit * self.backoff_ratio)
+                )
+            self._report(now, changed=self._limit != limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._hand_over, future)
+
+    def _hand_over(self, future: asyncio.Future[None]) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def _throughput(self, now: float) -> float:
+        while self._completed and self._completed[0] <= now - _THROUGHPUT_WINDOW:
+            self._completed.popleft()
+        elapsed = min(_THROUGHPUT_WINDOW, now - self._started)
+        return len(self._completed) / elapsed if elapsed > 0 else 0.0
+
+    def _report(self, now: float, changed: bool) -> None:
+        if self.callbacks is None or (
+            not changed and now - self._last_report < _REPORT_INTERVAL
+        ):
+            return
+        self._last_report = now
+        self.callbacks.metrics(
+            f"concurrency:{self.name}",
+            {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "throughput": self._throughput(now),
+                "throttled": self._throttled,
+            },
+        )
+
+
+def _smooth(average: float | None, sample: float, weight: float) -> float:
+    return sample if average is None else average + weight * (sample - average)
@@ -13,9 +13,12 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 from typing_extensions import Self
 
+from graphrag.language_model.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from graphrag.language_model.factory import ModelFactory
 
 if TYPE_CHECKING:
+    from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+    from graphrag.config.models.language_model_config import LanguageModelConfig
     from graphrag.language_model.protocol.base import ChatModel, EmbeddingModel
 
 
@@ -35,6 +38,9 @@ class ModelManager:
         if not hasattr(self, "_initialized"):
             self.chat_models: dict[str, ChatModel] = {}
             self.embedding_models: dict[str, EmbeddingModel] = {}
+            self.concurrency_limiters: dict[
+                tuple[str | None, ...], AdaptiveConcurrencyLimiter
+            ] = {}
             self._initialized = True
 
     @classmethod
@@ -54,6 +60,7 @@ class ModelManager:
             **chat_kwargs: Additional parameters for instantiation.
         """
         chat_kwargs["name"] = name
+        self._add_concurrency_limiter(chat_kwargs)
         self.chat_models[name] = ModelFactory.create_chat_model(
             model_type, **chat_kwargs
         )
@@ -71,11 +78,58 @@ class ModelManager:
             **embedding_kwargs: Additional parameters for instantiation.
         """
         embedding_kwargs["name"] = name
+        self._add_concurrency_limiter(embedding_kwargs)
         self.embedding_models[name] = ModelFactory.create_embedding_model(
             model_type, **embedding_kwargs
         )
         return self.embedding_models[name]
 
+    def _add_concurrency_limiter(self, model_kwargs: dict[str, Any]) -> None:
+        """Give a model with adaptive concurrency the limiter it reports its requests to."""
+        config = model_kwargs.get("config")
+        if config is not None and config.adaptive_concurrency:
+            model_kwargs["concurrency_limiter"] = (
+                self.get_or_create_concurrency_limiter(
+                    config, model_kwargs.get("callbacks")
+                )
+            )
+
+    def get_or_create_concurrency_limiter(
+        self,
+        config: LanguageModelConfig,
+        callbacks: WorkflowCallbacks | None = None,
+    ) -> AdaptiveConcurrencyLimiter:
+        """
+        Retrieve the adaptive concurrency limiter shared by the requests of a model.
+
+        Every model instance configured for the same provider, model and endpoint
+        shares one limiter, whichever operation registered it, since they draw on
+        the same quota. If the limiter does not exist, it is created starting at the
+        `concurrent_requests` of the model. Given callbacks replace the ones the
+        limiter reports its metrics to.
+
+        Args:
+            config: The configuration of the model.
+            callbacks: Callbacks to report the concurrency metrics to.
+        """
+        key = (
+            config.model_provider,
+            config.model,
+            config.api_base,
+            config.api_version,
+            config.deployment_name,
+        )
+        if key not in self.concurrency_limiters:
+            self.concurrency_limiters[key] = AdaptiveConcurrencyLimiter(
+                config.model,
+                initial_limit=config.concurrent_requests,
+                max_limit=config.max_concurrent_requests,
+            )
+        limiter = self.concurrency_limiters[key]
+        if callbacks is not None:
+            limiter.callbacks = callbacks
+        return limiter
+
     def get_chat_model(self, name: str) -> ChatModel | None:
         """
         Retrieve the ChatLLM instance registered under the given name.
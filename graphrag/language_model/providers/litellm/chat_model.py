@@ -23,6 +23,9 @@ from graphrag.config.enums import AuthType
 from graphrag.language_model.providers.litellm.request_wrappers.with_cache import (
     with_cache,
 )
+from graphrag.language_model.providers.litellm.request_wrappers.with_concurrency_feedback import (
+    with_concurrency_feedback,
+)
 from graphrag.language_model.providers.litellm.request_wrappers.with_logging import (
     with_logging,
 )
@@ -40,12 +43,16 @@ from graphrag.language_model.providers.litellm.types import (
 if TYPE_CHECKING:
     from graphrag.cache.pipeline_cache import PipelineCache
     from graphrag.config.models.language_model_config import LanguageModelConfig
+    from graphrag.language_model.adaptive_concurrency import (
+        AdaptiveConcurrencyLimiter,
+    )
     from graphrag.language_model.response.base import ModelResponse as MR  # noqa: N817
 
 litellm.suppress_debug_info = True
 # Reduce/disable LiteLLM background logging workers to avoid event loop binding issues in Streamlit
 try:
     import os as _os
+
     _os.environ.setdefault("LITELLM_LOGGING", "")
     _os.environ.setdefault("LITELLM_USE_BACKGROUND_THREAD", "false")
     _os.environ.setdefault("LITELLM_LOGGING_QUEUE", "false")
@@ -133,6 +140,7 @@ def _create_completions(
     model_config: "LanguageModelConfig",
     cache: "PipelineCache | None",
     cache_key_prefix: str,
+    concurrency_limiter: "AdaptiveConcurrencyLimiter | None" = None,
 ) -> tuple[FixedModelCompletion, AFixedModelCompletion]:
     """Wrap the base litellm completion function with the model configuration and additional features.
 
@@ -140,13 +148,14 @@ def _create_completions(
     Then wrap additional features such as rate limiting, retries, and caching, if enabled.
 
     Final function composition order:
-    - Logging(Cache(Retries(RateLimiter(ModelCompletion()))))
+    - Logging(Cache(Retries(RateLimiter(ConcurrencyFeedback(ModelCompletion())))))
 
     Args
     ----
         model_config: The configuration for the language model.
         cache: Optional cache for storing responses.
         cache_key_prefix: Prefix for cache keys.
+        concurrency_limiter: Optional adaptive concurrency limiter to report each request attempt to.
 
     Returns
     -------
@@ -155,6 +164,13 @@ def _create_completions(
     """
     completion, acompletion = _create_base_completions(model_config)
 
+    if concurrency_limiter is not None:
+        completion, acompletion = with_concurrency_feedback(
+            sync_fn=completion,
+            async_fn=acompletion,
+            limiter=concurrency_limiter,
+        )
+
     # TODO: For v2.x release, rpm/tpm can be int or str (auto) for backwards compatibility with fnllm.
     # LiteLLM does not support "auto", so we have to check those values here.
     # For v3 release, force rpm/tpm to be int and remove the type checks below
@@ -234,13 +250,15 @@ class LitellmChatModel:
         name: str,
         config: "LanguageModelConfig",
         cache: "PipelineCache | None" = None,
+        concurrency_limiter: "AdaptiveConcurrencyLimiter | None" = None,
         **kwargs: Any,
     ):
         self.name = name
         self.config = config
         self.cache = cache.child(self.name) if cache else None
+        self.concurrency_limiter = concurrency_limiter
         self.completion, self.acompletion = _create_completions(
-            config, self.cache, "chat"
+            config, self.cache, "chat", concurrency_limiter
         )
 
     def _get_kwargs(self, **kwargs: Any) -> dict[str, Any]:
@@ -18,6 +18,9 @@ from graphrag.config.enums import AuthType
 from graphrag.language_model.providers.litellm.request_wrappers.with_cache import (
     with_cache,
 )
+from graphrag.language_model.providers.litellm.request_wrappers.with_concurrency_feedback import (
+    with_concurrency_feedback,
+)
 from graphrag.language_model.providers.litellm.request_wrappers.with_logging import (
     with_logging,
 )
@@ -35,11 +38,15 @@ from graphrag.language_model.providers.litellm.types import (
 if TYPE_CHECKING:
     from graphrag.cache.pipeline_cache import PipelineCache
     from graphrag.config.models.language_model_config import LanguageModelConfig
+    from graphrag.language_model.adaptive_concurrency import (
+        AdaptiveConcurrencyLimiter,
+    )
 
 litellm.suppress_debug_info = True
 # Reduce/disable LiteLLM background logging workers to avoid event loop binding issues in Streamlit
 try:
     import os as _os
+
     _os.environ.setdefault("LITELLM_LOGGING", "")
     _os.environ.setdefault("LITELLM_USE_BACKGROUND_THREAD", "false")
     _os.environ.setdefault("LITELLM_LOGGING_QUEUE", "false")
@@ -119,6 +126,7 @@ def _create_embeddings(
     model_config: "LanguageModelConfig",
     cache: "PipelineCache | None",
     cache_key_prefix: str,
+    concurrency_limiter: "AdaptiveConcurrencyLimiter | None" = None,
 ) -> tuple[FixedModelEmbedding, AFixedModelEmbedding]:
     """Wrap the base litellm embedding function with the model configuration and additional features.
 
@@ -126,13 +134,14 @@ def _create_embeddings(
     Then wrap additional features such as rate limiting, retries, and caching, if enabled.
 
     Final function composition order:
-    - Logging(Cache(Retries(RateLimiter(ModelEmbedding()))))
+    - Logging(Cache(Retries(RateLimiter(ConcurrencyFeedback(ModelEmbedding())))))
 
     Args
     ----
         model_config: The configuration for the language model.
         cache: Optional cache for storing responses.
         cache_key_prefix: Prefix for cache keys.
+        concurrency_limiter: Optional adaptive concurrency limiter to report each request attempt to.
 
     Returns
     -------
@@ -141,6 +150,13 @@ def _create_embeddings(
     """
     embedding, aembedding = _create_base_embeddings(model_config)
 
+    if concurrency_limiter is not None:
+        embedding, aembedding = with_concurrency_feedback(
+            sync_fn=embedding,
+            async_fn=aembedding,
+            limiter=concurrency_limiter,
+        )
+
     # TODO: For v2.x release, rpm/tpm can be int or str (auto) for backwards compatibility with fnllm.
     # LiteLLM does not support "auto", so we have to check those values here.
     # For v3 release, force rpm/tpm to be int and remove the type checks below
@@ -198,13 +214,15 @@ class LitellmEmbeddingModel:
         name: str,
         config: "LanguageModelConfig",
         cache: "PipelineCache | None" = None,
+        concurrency_limiter: "AdaptiveConcurrencyLimiter | None" = None,
         **kwargs: Any,
     ):
         self.name = name
         self.config = config
         self.cache = cache.child(self.name) if cache else None
+        self.concurrency_limiter = concurrency_limiter
         self.embedding, self.aembedding = _create_embeddings(
-            config, self.cache, "embeddings"
+            config, self.cache, "embeddings", concurrency_limiter
         )
 
     def _get_kwargs(self, **kwargs: Any) -> dict[str, Any]:
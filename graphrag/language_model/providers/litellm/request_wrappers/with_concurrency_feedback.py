@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""LiteLLM completion/embedding adaptive concurrency feedback wrapper."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from graphrag.language_model.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from graphrag.language_model.providers.litellm.types import (
+    AsyncLitellmRequestFunc,
+    LitellmRequestFunc,
+)
+
+_THROTTLING_STATUS_CODES = {408, 429}
+
+
+def with_concurrency_feedback(
+    *,
+    sync_fn: LitellmRequestFunc,
+    async_fn: AsyncLitellmRequestFunc,
+    limiter: AdaptiveConcurrencyLimiter,
+) -> tuple[LitellmRequestFunc, AsyncLitellmRequestFunc]:
+    """
+    Wrap the synchronous and asynchronous request functions to report to an adaptive concurrency limiter.
+
+    Every request attempt waits out a `retry-after` pause of the limiter and reports
+    its latency, or whether it was throttled or timed out, to the limiter.
+
+    Args
+    ----
+        sync_fn: The synchronous chat/embedding request function to wrap.
+        async_fn: The asynchronous chat/embedding request function to wrap.
+        limiter: The adaptive concurrency limiter of the model.
+
+    Returns
+    -------
+        A tuple containing the wrapped synchronous and asynchronous chat/embedding request functions.
+    """
+
+    def _wrapped_with_concurrency_feedback(**kwargs: Any) -> Any:
+        if (delay := limiter.pause_remaining()) > 0:
+            time.sleep(delay)
+        start = time.monotonic()
+        try:
+            response = sync_fn(**kwargs)
+        except Exception as e:
+            _record_failure(limiter, e)
+            raise
+        limiter.record_success(time.monotonic() - start)
+        return response
+
+    async def _wrapped_with_concurrency_feedback_async(**kwargs: Any) -> Any:
+        if (delay := limiter.pause_remaining()) > 0:
+            await asyncio.sleep(delay)
+        start = time.monotonic()
+        try:
+            response = await async_fn(**kwargs)
+        except Exception as e:
+            _record_failure(limiter, e)
+            raise
+        limiter.record_success(time.monotonic() - start)
+        return response
+
+    return (
+        _wrapped_with_concurrency_feedback,
+        _wrapped_with_concurrency_feedback_async,
+    )
+
+
+def _record_failure(limiter: AdaptiveConcurrencyLimiter, error: Exception) -> None:
+    """Report a throttled or timed out request, other errors say nothing about the load."""
+    if (
+        isinstance(error, TimeoutError | asyncio.TimeoutError)
+        or getattr(error, "status_code", None) in _THROTTLING_STATUS_CODES
+    ):
+        limiter.record_throttle(retry_after(error))
+
+
+def retry_after(error: Exception) -> float | None:
+    """Return the seconds a `retry-after-ms` or `retry-after` response header of the error asks to wait."""
+    headers = getattr(error, "litellm_response_headers", None) or getattr(
+        getattr(error, "response", None), "headers", None
+    )
+    if not headers:
+        return None
+    for header, scale in (("retry-after-ms", 1000), ("retry-after", 1)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return float(value) / scale
+        except ValueError:
+            pass
+        # retry-after may also be an HTTP date
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            continue
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+    return None
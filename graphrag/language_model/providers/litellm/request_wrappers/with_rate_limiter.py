@@ -40,6 +40,8 @@ def with_rate_limiter(
         tpm: An optional tokens per minute limit.
 
     If `rpm` and `tpm` is set to 0 or None, rate limiting is disabled.
+    Requests are acquired with their estimated tokens and reconciled with the tokens
+    their responses report as used.
 
     Returns
     -------
@@ -60,7 +62,7 @@ def with_rate_limiter(
 
     max_tokens = model_config.max_completion_tokens or model_config.max_tokens or 0
 
-    def _wrapped_with_rate_limiter(**kwargs: Any) -> Any:
+    def _estimate_tokens(kwargs: dict[str, Any]) -> int:
         token_count = max_tokens
         if "messages" in kwargs:
             token_count += token_counter(
@@ -72,26 +74,40 @@ def with_rate_limiter(
                 model=model_config.model,
                 text=kwargs["input"],
             )
+        return token_count
+
+    def _reconcile(token_count: int, response: Any) -> None:
+        actual_token_count = _used_tokens(response)
+        if actual_token_count is not None:
+            rate_limiter_service.reconcile(
+                token_count=token_count, actual_token_count=actual_token_count
+            )
 
+    def _wrapped_with_rate_limiter(**kwargs: Any) -> Any:
+        token_count = _estimate_tokens(kwargs)
         with rate_limiter_service.acquire(token_count=token_count):
-            return sync_fn(**kwargs)
+            response = sync_fn(**kwargs)
+        _reconcile(token_count, response)
+        return response
 
     async def _wrapped_with_rate_limiter_async(
         **kwargs: Any,
     ) -> Any:
-        token_count = max_tokens
-        if "messages" in kwargs:
-            token_count += token_counter(
-                model=model_config.model,
-                messages=kwargs["messages"],
-            )
-        elif "input" in kwargs:
-            token_count += token_counter(
-                model=model_config.model,
-                text=kwargs["input"],
-            )
-
-        with rate_limiter_service.acquire(token_count=token_count):
-            return await async_fn(**kwargs)
+        token_count = _estimate_tokens(kwargs)
+        async with rate_limiter_service.aacquire(token_count=token_count):
+            response = await async_fn(**kwargs)
+        _reconcile(token_count, response)
+        return response
 
     return (_wrapped_with_rate_limiter, _wrapped_with_rate_limiter_async)
+
+
+def _used_tokens(response: Any) -> int | None:
+    """Return the total tokens a response reports as used, None for responses without usage, like streams."""
+    # some services report zero usage, which says nothing about the tokens used
+    usage = getattr(response, "usage", None)
+    if isinstance(usage, dict):
+        total_tokens = usage.get("total_tokens")
+    else:
+        total_tokens = getattr(usage, "total_tokens", None)
+    return total_tokens if isinstance(total_tokens, int) and total_tokens > 0 else None
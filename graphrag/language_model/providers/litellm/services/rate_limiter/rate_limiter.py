@@ -3,9 +3,11 @@
 
 """LiteLLM Rate Limiter."""
 
+import asyncio
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
 
@@ -35,3 +37,38 @@ class RateLimiter(ABC):
         """
         msg = "RateLimiter subclasses must implement the acquire method."
         raise NotImplementedError(msg)
+
+    @asynccontextmanager
+    async def aacquire(self, *, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Rate limiters that wait synchronously are entered in a worker thread,
+        subclasses that can wait natively should override this method.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        context = self.acquire(token_count=token_count)
+        await asyncio.to_thread(context.__enter__)
+        try:
+            yield
+        finally:
+            context.__exit__(*sys.exc_info())
+
+    def reconcile(self, *, token_count: int, actual_token_count: int) -> None:  # noqa: B027
+        """
+        Correct the tokens of a request from its estimate to the tokens it used.
+
+        Args
+        ----
+            token_count: The estimated number of tokens the request acquired.
+            actual_token_count: The number of tokens the response reported as used.
+
+        Rate limiters that account for the estimates only ignore it.
+        """
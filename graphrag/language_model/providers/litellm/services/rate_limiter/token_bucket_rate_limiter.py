@@ -0,0 +1,187 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""LiteLLM Token Bucket Rate Limiter."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limiter import (
+    RateLimiter,
+)
+
+BURST_SHARE = 0.1
+"""The share of the period budget that can be sent at once."""
+
+
+@dataclass
+class _Bucket:
+    """A bucket refilling `rate` units per second up to `capacity`.
+
+    `level` is the budget left at `updated`, the send time of the last reserved
+    request, which lies in the future while requests are waiting.
+    """
+
+    capacity: float
+    rate: float
+    level: float
+    updated: float
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.level = min(
+                self.capacity, self.level + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def ready(self, amount: float, now: float) -> float:
+        """Return the earliest time the bucket covers `amount` after the requests reserved before."""
+        self.refill(now)
+        return self.updated + max(0.0, (amount - self.level) / self.rate)
+
+    def take(self, amount: float, send_time: float) -> None:
+        # the refill caps a request larger than the bucket at a full bucket, so it
+        # leaves a debt that keeps the period after it in the limit
+        self.refill(send_time)
+        self.level -= amount
+
+    def give_back(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+def _bucket(limit: int, period_in_seconds: int, now: float) -> _Bucket:
+    """Return a full bucket whose burst and refill over a period add up to `limit`."""
+    burst = limit * BURST_SHARE
+    return _Bucket(burst, (limit - burst) / period_in_seconds, burst, now)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token Bucket Rate Limiter implementation.
+
+    Requests and tokens each have a bucket holding a tenth of the period budget as
+    burst and refilling the other nine tenths over the period. Every request reserves
+    its budget when it arrives and is sent once both buckets cover all of it, after
+    the requests reserved before it, so waiters are served in arrival order whatever
+    their size and no window of one period takes in more than the limit, not even
+    after an idle spell. Asynchronous waiters sleep without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        period_in_seconds: int = 60,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs: Any,
+    ):
+        if rpm is None and tpm is None:
+            msg = "Both TPM and RPM cannot be None (disabled), one or both must be set to a positive integer."
+            raise ValueError(msg)
+        if (rpm is not None and rpm <= 0) or (tpm is not None and tpm <= 0):
+            msg = "RPM and TPM must be either None (disabled) or positive integers."
+            raise ValueError(msg)
+        if period_in_seconds <= 0:
+            msg = "Period in seconds must be a positive integer."
+            raise ValueError(msg)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.period_in_seconds = period_in_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._requests = (
+            _bucket(rpm, period_in_seconds, now) if rpm is not None else None
+        )
+        self._tokens = _bucket(tpm, period_in_seconds, now) if tpm is not None else None
+
+    def reserve(self, token_count: int) -> float:
+        """Reserve the budget of a request and return the seconds to wait before sending it."""
+        with self._lock:
+            now = self._clock()
+            amounts = self._amounts(token_count)
+            send_time = max([
+                now,
+                *(bucket.ready(amount, now) for bucket, amount in amounts),
+            ])
+            for bucket, amount in amounts:
+                bucket.take(amount, send_time)
+            return send_time - now
+
+    def cancel(self, token_count: int) -> None:
+        """Give back the budget of a reserved request that was not sent."""
+        with self._lock:
+            now = self._clock()
+            for bucket, amount in self._amounts(token_count):
+                bucket.give_back(amount, now)
+
+    def _amounts(self, token_count: int) -> list[tuple[_Bucket, float]]:
+        """Return the buckets a request draws on with the amount it takes from each."""
+        amounts = [(self._requests, 1), (self._tokens, token_count)]
+        return [(bucket, amount) for bucket, amount in amounts if bucket is not None]
+
+    @contextmanager
+    def acquire(self, *, token_count: int) -> Iterator[None]:
+        """
+        Acquire Rate Limiter.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        delay = self.reserve(token_count)
+        if delay > 0:
+            time.sleep(delay)
+        yield
+
+    @asynccontextmanager
+    async def aacquire(self, *, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        delay = self.reserve(token_count)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancel(token_count)
+            raise
+        yield
+
+    def reconcile(self, *, token_count: int, actual_token_count: int) -> None:
+        """
+        Correct the tokens of a request from its estimate to the tokens it used.
+
+        Args
+        ----
+            token_count: The estimated number of tokens the request acquired.
+            actual_token_count: The number of tokens the response reported as used.
+        """
+        if self._tokens is None:
+            return
+        with self._lock:
+            now = self._clock()
+            difference = token_count - actual_token_count
+            if difference >= 0:
+                self._tokens.give_back(difference, now)
+            else:
+                self._tokens.refill(now)
+                self._tokens.level += difference
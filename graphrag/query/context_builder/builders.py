@@ -49,6 +49,15 @@ class LocalContextBuilder(ABC):
     ) -> ContextBuilderResult:
         """Build the context for the local search mode."""
 
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        **kwargs,
+    ) -> ContextBuilderResult:
+        """Build the context for the local search mode, awaiting any I/O it needs."""
+        return self.build_context(query, conversation_history, **kwargs)
+
 
 class DRIFTContextBuilder(ABC):
     """Base class for DRIFT-search context builders."""
@@ -73,3 +82,12 @@ class BasicContextBuilder(ABC):
         **kwargs,
     ) -> ContextBuilderResult:
         """Build the context for the basic search mode."""
+
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        **kwargs,
+    ) -> ContextBuilderResult:
+        """Build the context for the basic search mode, awaiting any I/O it needs."""
+        return self.build_context(query, conversation_history, **kwargs)
@@ -5,6 +5,7 @@
 
 from enum import Enum
 
+from graphrag.bm25.index import BM25Index
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.language_model.protocol.base import EmbeddingModel
@@ -13,7 +14,13 @@ from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
-from graphrag.vector_stores.base import BaseVectorStore
+from graphrag.query.input.retrieval.index import RetrievalIndex
+from graphrag.utils.rank_fusion import reciprocal_rank_fusion
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
 
 
 class EntityVectorStoreKey(str, Enum):
@@ -44,14 +51,14 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    lexical_index: BM25Index | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
-    if include_entity_names is None:
-        include_entity_names = []
-    if exclude_entity_names is None:
-        exclude_entity_names = []
-    all_entities = list(all_entities_dict.values())
-    matched_entities = []
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    With a `lexical_index` over the entities, the semantic matches are fused with
+    the best BM25 matches of the query using reciprocal rank fusion.
+    """
+    search_results = []
     if query != "":
         # get entities with highest semantic similarity to query
         # oversample to account for excluded entities
@@ -60,6 +67,109 @@ def map_query_to_entities(
             text_embedder=lambda t: text_embedder.embed(t),
             k=k * oversample_scaler,
         )
+        search_results = _fuse_lexical_results(
+            query,
+            search_results,
+            lexical_index,
+            all_entities_dict,
+            embedding_vectorstore_key,
+            k * oversample_scaler,
+        )
+    return _select_entities(
+        query,
+        search_results,
+        all_entities_dict,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+    )
+
+
+async def amap_query_to_entities(
+    query: str,
+    text_embedding_vectorstore: BaseVectorStore,
+    text_embedder: EmbeddingModel,
+    all_entities_dict: dict[str, Entity],
+    embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+    include_entity_names: list[str] | None = None,
+    exclude_entity_names: list[str] | None = None,
+    k: int = 10,
+    oversample_scaler: int = 2,
+    lexical_index: BM25Index | None = None,
+) -> list[Entity]:
+    """Async variant of `map_query_to_entities` that embeds the query and searches the vector store without blocking the event loop."""
+    search_results = []
+    if query != "":
+        search_results = await text_embedding_vectorstore.asimilarity_search_by_text(
+            text=query,
+            text_embedder=lambda t: text_embedder.aembed(t),
+            k=k * oversample_scaler,
+        )
+        search_results = _fuse_lexical_results(
+            query,
+            search_results,
+            lexical_index,
+            all_entities_dict,
+            embedding_vectorstore_key,
+            k * oversample_scaler,
+        )
+    return _select_entities(
+        query,
+        search_results,
+        all_entities_dict,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+    )
+
+
+def _fuse_lexical_results(
+    query: str,
+    search_results: list[VectorStoreSearchResult],
+    lexical_index: BM25Index | None,
+    all_entities_dict: dict[str, Entity],
+    embedding_vectorstore_key: str,
+    k: int,
+) -> list[VectorStoreSearchResult]:
+    """Fuse the vector search hits with the best BM25 matches, keyed like the vector store."""
+    if lexical_index is None:
+        return search_results
+    lexical_keys = [
+        getattr(all_entities_dict[id], embedding_vectorstore_key)
+        for id, _ in lexical_index.search(query, k=k)
+        if id in all_entities_dict
+    ]
+    vector_results = {result.document.id: result for result in search_results}
+    return [
+        vector_results.get(key)
+        or VectorStoreSearchResult(
+            document=VectorStoreDocument(id=key, text=None, vector=None), score=score
+        )
+        for key, score in reciprocal_rank_fusion([list(vector_results), lexical_keys])[
+            :k
+        ]
+    ]
+
+
+def _select_entities(
+    query: str,
+    search_results: list[VectorStoreSearchResult],
+    all_entities_dict: dict[str, Entity],
+    embedding_vectorstore_key: str,
+    include_entity_names: list[str] | None,
+    exclude_entity_names: list[str] | None,
+    k: int,
+) -> list[Entity]:
+    """Map vector search hits to entities and apply the include/exclude lists."""
+    if include_entity_names is None:
+        include_entity_names = []
+    if exclude_entity_names is None:
+        exclude_entity_names = []
+    all_entities = list(all_entities_dict.values())
+    matched_entities = []
+    if query != "":
         for result in search_results:
             if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
                 result.document.id, str
@@ -98,23 +208,33 @@ def find_nearest_neighbors_by_entity_rank(
     all_relationships: list[Relationship],
     exclude_entity_names: list[str] | None = None,
     k: int | None = 10,
+    index: RetrievalIndex | None = None,
 ) -> list[Entity]:
-    """Retrieve entities that have direct connections with the target entity, sorted by entity rank."""
+    """Retrieve entities that have direct connections with the target entity, sorted by entity rank.
+
+    An index over the entities and relationships answers the lookups in place of scanning them.
+    """
     if exclude_entity_names is None:
         exclude_entity_names = []
-    entity_relationships = [
-        rel
-        for rel in all_relationships
-        if rel.source == entity_name or rel.target == entity_name
-    ]
+    if index is not None:
+        entity_relationships = index.relationships_of([entity_name])
+    else:
+        entity_relationships = [
+            rel
+            for rel in all_relationships
+            if rel.source == entity_name or rel.target == entity_name
+        ]
     source_entity_names = {rel.source for rel in entity_relationships}
     target_entity_names = {rel.target for rel in entity_relationships}
     related_entity_names = (source_entity_names.union(target_entity_names)).difference(
         set(exclude_entity_names)
     )
-    top_relations = [
-        entity for entity in all_entities if entity.title in related_entity_names
-    ]
+    if index is not None:
+        top_relations = index.entities_titled(related_entity_names)
+    else:
+        top_relations = [
+            entity for entity in all_entities if entity.title in related_entity_names
+        ]
     top_relations.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
     if k:
         return top_relations[:k]
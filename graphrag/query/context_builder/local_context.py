@@ -16,6 +16,7 @@ from graphrag.query.input.retrieval.covariates import (
     to_covariate_dataframe,
 )
 from graphrag.query.input.retrieval.entities import to_entity_dataframe
+from graphrag.query.input.retrieval.index import RetrievalIndex
 from graphrag.query.input.retrieval.relationships import (
     get_candidate_relationships,
     get_entities_from_relationships,
@@ -97,8 +98,9 @@ def build_covariates_context(
     max_context_tokens: int = 8000,
     column_delimiter: str = "|",
     context_name: str = "Covariates",
+    index: RetrievalIndex | None = None,
 ) -> tuple[str, pd.DataFrame]:
-    """Prepare covariate data tables as context data for system prompt."""
+    """Prepare covariate data tables as context data for system prompt, looking the covariates of each entity up in an index over them if given."""
     tokenizer = tokenizer or get_tokenizer()
     # create an empty list of covariates
     if len(selected_entities) == 0 or len(covariates) == 0:
@@ -120,9 +122,12 @@ def build_covariates_context(
 
     all_context_records = [header]
     for entity in selected_entities:
-        selected_covariates.extend([
-            cov for cov in covariates if cov.subject_id == entity.title
-        ])
+        if index is not None:
+            selected_covariates.extend(index.covariates_of([entity.title]))
+        else:
+            selected_covariates.extend([
+                cov for cov in covariates if cov.subject_id == entity.title
+            ])
 
     for covariate in selected_covariates:
         new_context = [
@@ -165,14 +170,16 @@ def build_relationship_context(
     relationship_ranking_attribute: str = "rank",
     column_delimiter: str = "|",
     context_name: str = "Relationships",
+    index: RetrievalIndex | None = None,
 ) -> tuple[str, pd.DataFrame]:
-    """Prepare relationship data tables as context data for system prompt."""
+    """Prepare relationship data tables as context data for system prompt, using an index over the relationships if given."""
     tokenizer = tokenizer or get_tokenizer()
     selected_relationships = _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         top_k_relationships=top_k_relationships,
         relationship_ranking_attribute=relationship_ranking_attribute,
+        index=index,
     )
 
     if len(selected_entities) == 0 or len(selected_relationships) == 0:
@@ -234,6 +241,7 @@ def _filter_relationships(
     relationships: list[Relationship],
     top_k_relationships: int = 10,
     relationship_ranking_attribute: str = "rank",
+    index: RetrievalIndex | None = None,
 ) -> list[Relationship]:
     """Filter and sort relationships based on a set of selected entities and a ranking attribute."""
     # First priority: in-network relationships (i.e. relationships between selected entities)
@@ -241,6 +249,7 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        index=index,
     )
 
     # Second priority -  out-of-network relationships
@@ -249,65 +258,49 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        index=index,
     )
     if len(out_network_relationships) <= 1:
         return in_network_relationships + out_network_relationships
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
+    selected_entity_names = {entity.title for entity in selected_entities}
+    out_network_neighbors = defaultdict(set)
+    for relationship in out_network_relationships:
+        out_network_neighbors[relationship.source].add(relationship.target)
+        out_network_neighbors[relationship.target].add(relationship.source)
     out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
-
-    # sort out-network relationships by number of links and rank_attributes
-    for rel in out_network_relationships:
-        if rel.attributes is None:
-            rel.attributes = {}
-        rel.attributes["links"] = (
+    for entity_name, neighbors in out_network_neighbors.items():
+        if entity_name not in selected_entity_names:
+            out_network_entity_links[entity_name] = len(neighbors)
+
+    # sort out-network relationships by number of links and rank_attributes; the
+    # links are kept per query, the relationships may be shared between queries
+    links = {
+        rel.id: (
             out_network_entity_links[rel.source]
             if rel.source in out_network_entity_links
             else out_network_entity_links[rel.target]
         )
+        for rel in out_network_relationships
+    }
 
-    # sort by attributes[links] first, then by ranking_attribute
+    # sort by links first, then by ranking_attribute
     if relationship_ranking_attribute == "rank":
         out_network_relationships.sort(
-            key=lambda x: (x.attributes["links"], x.rank),  # type: ignore
+            key=lambda x: (links[x.id], x.rank),  # type: ignore
             reverse=True,  # type: ignore
         )
     elif relationship_ranking_attribute == "weight":
         out_network_relationships.sort(
-            key=lambda x: (x.attributes["links"], x.weight),  # type: ignore
+            key=lambda x: (links[x.id], x.weight),  # type: ignore
             reverse=True,  # type: ignore
         )
     else:
         out_network_relationships.sort(
             key=lambda x: (
-                x.attributes["links"],  # type: ignore
+                links[x.id],
                 x.attributes[relationship_ranking_attribute],  # type: ignore
             ),  # type: ignore
             reverse=True,
@@ -325,19 +318,27 @@ def get_candidate_context(
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
+    index: RetrievalIndex | None = None,
+    covariate_indexes: dict[str, RetrievalIndex] | None = None,
 ) -> dict[str, pd.DataFrame]:
-    """Prepare entity, relationship, and covariate data tables as context data for system prompt."""
+    """Prepare entity, relationship, and covariate data tables as context data for system prompt.
+
+    An index over the entities and relationships, and one per covariate type, answer
+    the lookups in place of scanning the collections.
+    """
     candidate_context = {}
+    covariate_indexes = covariate_indexes or {}
     candidate_relationships = get_candidate_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
+        index=index,
     )
     candidate_context["relationships"] = to_relationship_dataframe(
         relationships=candidate_relationships,
         include_relationship_weight=include_relationship_weight,
     )
     candidate_entities = get_entities_from_relationships(
-        relationships=candidate_relationships, entities=entities
+        relationships=candidate_relationships, entities=entities, index=index
     )
     candidate_context["entities"] = to_entity_dataframe(
         entities=candidate_entities,
@@ -349,6 +350,7 @@ def get_candidate_context(
         candidate_covariates = get_candidate_covariates(
             selected_entities=selected_entities,
             covariates=covariates[covariate],
+            index=covariate_indexes.get(covariate),
         )
         candidate_context[covariate.lower()] = to_covariate_dataframe(
             candidate_covariates
@@ -3,6 +3,8 @@
 
 """Query Factory methods to support CLI."""
 
+from graphrag.bm25.index import BM25Index
+from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.query_callbacks import QueryCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.community import Community
@@ -16,6 +18,7 @@ from graphrag.language_model.providers.fnllm.utils import (
     get_openai_model_parameters_from_config,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.retrieval.index import RetrievalIndex
 from graphrag.query.structured_search.basic_search.basic_context import (
     BasicSearchContext,
 )
@@ -47,14 +50,24 @@ def get_local_search_engine(
     description_embedding_store: BaseVectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    cache: PipelineCache | None = None,
+    lexical_index: BM25Index | None = None,
+    retrieval_index: RetrievalIndex | None = None,
+    covariate_indexes: dict[str, RetrievalIndex] | None = None,
 ) -> LocalSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    Pass the BM25 `lexical_index` of the entities to map the query to entities with
+    hybrid search, and a prebuilt `retrieval_index` and `covariate_indexes` over the
+    same data to skip building them for this engine.
+    """
     model_settings = config.get_language_model_config(config.local_search.chat_model_id)
 
     chat_model = ModelManager().get_or_create_chat_model(
         name="local_search_chat",
         model_type=model_settings.type,
         config=model_settings,
+        cache=cache,
     )
 
     embedding_settings = config.get_language_model_config(
@@ -65,6 +78,7 @@ def get_local_search_engine(
         name="local_search_embedding",
         model_type=embedding_settings.type,
         config=embedding_settings,
+        cache=cache,
     )
 
     tokenizer = get_tokenizer(model_config=model_settings)
@@ -86,6 +100,9 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=embedding_model,
             tokenizer=tokenizer,
+            lexical_index=lexical_index,
+            retrieval_index=retrieval_index,
+            covariate_indexes=covariate_indexes,
         ),
         tokenizer=tokenizer,
         model_params=model_params,
@@ -119,6 +136,7 @@ def get_global_search_engine(
     reduce_system_prompt: str | None = None,
     general_knowledge_inclusion_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    cache: PipelineCache | None = None,
 ) -> GlobalSearch:
     """Create a global search engine based on data + configuration."""
     model_settings = config.get_language_model_config(
@@ -129,6 +147,7 @@ def get_global_search_engine(
         name="global_search",
         model_type=model_settings.type,
         config=model_settings,
+        cache=cache,
     )
 
     model_params = get_openai_model_parameters_from_config(model_settings)
@@ -203,6 +222,7 @@ def get_drift_search_engine(
     local_system_prompt: str | None = None,
     reduce_system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    cache: PipelineCache | None = None,
 ) -> DRIFTSearch:
     """Create a local search engine based on data + configuration."""
     chat_model_settings = config.get_language_model_config(
@@ -213,6 +233,7 @@ def get_drift_search_engine(
         name="drift_search_chat",
         model_type=chat_model_settings.type,
         config=chat_model_settings,
+        cache=cache,
     )
 
     embedding_model_settings = config.get_language_model_config(
@@ -223,6 +244,7 @@ def get_drift_search_engine(
         name="drift_search_embedding",
         model_type=embedding_model_settings.type,
         config=embedding_model_settings,
+        cache=cache,
     )
 
     tokenizer = get_tokenizer(model_config=chat_model_settings)
@@ -254,8 +276,14 @@ def get_basic_search_engine(
     system_prompt: str | None = None,
     response_type: str = "multiple paragraphs",
     callbacks: list[QueryCallbacks] | None = None,
+    cache: PipelineCache | None = None,
+    lexical_index: BM25Index | None = None,
 ) -> BasicSearch:
-    """Create a basic search engine based on data + configuration."""
+    """Create a basic search engine based on data + configuration.
+
+    Pass the BM25 `lexical_index` of the text units to retrieve them with hybrid
+    search.
+    """
     chat_model_settings = config.get_language_model_config(
         config.basic_search.chat_model_id
     )
@@ -264,6 +292,7 @@ def get_basic_search_engine(
         name="basic_search_chat",
         model_type=chat_model_settings.type,
         config=chat_model_settings,
+        cache=cache,
     )
 
     embedding_model_settings = config.get_language_model_config(
@@ -274,6 +303,7 @@ def get_basic_search_engine(
         name="basic_search_embedding",
         model_type=embedding_model_settings.type,
         config=embedding_model_settings,
+        cache=cache,
     )
 
     tokenizer = get_tokenizer(model_config=chat_model_settings)
@@ -291,6 +321,7 @@ def get_basic_search_engine(
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
             tokenizer=tokenizer,
+            lexical_index=lexical_index,
         ),
         tokenizer=tokenizer,
         model_params=model_params,
@@ -7,7 +7,7 @@ Ideally this is just a straight read-through into the object model.
 """
 
 import logging
-from typing import cast
+from typing import Literal, cast, overload
 
 import pandas as pd
 
@@ -20,6 +20,11 @@ from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol.base import EmbeddingModel
+from graphrag.query.input.columnar import (
+    EntityTable,
+    RelationshipTable,
+    TextUnitTable,
+)
 from graphrag.query.input.loaders.dfs import (
     read_communities,
     read_community_reports,
@@ -32,9 +37,140 @@ from graphrag.vector_stores.base import BaseVectorStore
 
 logger = logging.getLogger(__name__)
 
+# The columns of the indexing outputs the adapters read, per table. Loading only these
+# skips e.g. the entity layout and the raw report JSON of large indexes.
+ENTITY_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "title",
+    "type",
+    "description",
+    "text_unit_ids",
+    "degree",
+    "description_embedding",
+]
+COMMUNITY_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "community",
+    "level",
+    "parent",
+    "children",
+    "title",
+    "entity_ids",
+]
+COMMUNITY_REPORT_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "community",
+    "level",
+    "title",
+    "summary",
+    "full_content",
+    "rank",
+    "full_content_embedding",
+]
+TEXT_UNIT_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "text",
+    "n_tokens",
+    "document_ids",
+    "entity_ids",
+    "relationship_ids",
+]
+RELATIONSHIP_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "source",
+    "target",
+    "description",
+    "weight",
+    "combined_degree",
+    "text_unit_ids",
+]
+COVARIATE_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "type",
+    "subject_id",
+    "object_id",
+    "status",
+    "start_date",
+    "end_date",
+    "description",
+    "text_unit_id",
+]
+
+# The tables and columns each search method reads.
+SEARCH_COLUMNS: dict[str, dict[str, list[str]]] = {
+    "global": {
+        "entities": ENTITY_COLUMNS,
+        "communities": COMMUNITY_COLUMNS,
+        "community_reports": COMMUNITY_REPORT_COLUMNS,
+    },
+    "local": {
+        "entities": ENTITY_COLUMNS,
+        "communities": COMMUNITY_COLUMNS,
+        "community_reports": COMMUNITY_REPORT_COLUMNS,
+        "text_units": TEXT_UNIT_COLUMNS,
+        "relationships": RELATIONSHIP_COLUMNS,
+        "covariates": COVARIATE_COLUMNS,
+    },
+    "drift": {
+        "entities": ENTITY_COLUMNS,
+        "communities": COMMUNITY_COLUMNS,
+        "community_reports": COMMUNITY_REPORT_COLUMNS,
+        "text_units": TEXT_UNIT_COLUMNS,
+        "relationships": RELATIONSHIP_COLUMNS,
+    },
+    "basic": {
+        "text_units": ["id", "human_readable_id", "text"],
+    },
+}
+
+
+def community_level_filters(
+    community_level: int | None,
+) -> dict[str, list[tuple[str, str, int]]]:
+    """Return the row filters that read only the communities and reports up to a community level.
+
+    Only local and DRIFT search may push the level down, global search reads the whole
+    community hierarchy.
+    """
+    if community_level is None:
+        return {}
+    level_filter = [("level", "<=", community_level)]
+    return {"communities": level_filter, "community_reports": level_filter}
+
+
+@overload
+def read_indexer_text_units(
+    final_text_units: pd.DataFrame, columnar: Literal[False] = False
+) -> list[TextUnit]: ...
+
+
+@overload
+def read_indexer_text_units(
+    final_text_units: pd.DataFrame, columnar: Literal[True]
+) -> TextUnitTable: ...
+
+
+@overload
+def read_indexer_text_units(
+    final_text_units: pd.DataFrame, columnar: bool
+) -> list[TextUnit] | TextUnitTable: ...
+
 
-def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
-    """Read in the Text Units from the raw indexing outputs."""
+def read_indexer_text_units(
+    final_text_units: pd.DataFrame, columnar: bool = False
+) -> list[TextUnit] | TextUnitTable:
+    """Read in the Text Units from the raw indexing outputs.
+
+    With `columnar`, the text units are kept in a `TextUnitTable` instead of a list.
+    """
+    if columnar:
+        return TextUnitTable.from_dataframe(final_text_units, covariates_col=None)
     return read_text_units(
         df=final_text_units,
         # expects a covariate map of type -> ids
@@ -60,10 +196,34 @@ def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
     )
 
 
-def read_indexer_relationships(final_relationships: pd.DataFrame) -> list[Relationship]:
-    """Read in the Relationships from the raw indexing outputs."""
-    return read_relationships(
-        df=final_relationships,
+@overload
+def read_indexer_relationships(
+    final_relationships: pd.DataFrame, columnar: Literal[False] = False
+) -> list[Relationship]: ...
+
+
+@overload
+def read_indexer_relationships(
+    final_relationships: pd.DataFrame, columnar: Literal[True]
+) -> RelationshipTable: ...
+
+
+@overload
+def read_indexer_relationships(
+    final_relationships: pd.DataFrame, columnar: bool
+) -> list[Relationship] | RelationshipTable: ...
+
+
+def read_indexer_relationships(
+    final_relationships: pd.DataFrame, columnar: bool = False
+) -> list[Relationship] | RelationshipTable:
+    """Read in the Relationships from the raw indexing outputs.
+
+    With `columnar`, the relationships are kept in a `RelationshipTable` instead of a list.
+    """
+    read = RelationshipTable.from_dataframe if columnar else read_relationships
+    return read(
+        final_relationships,
         short_id_col="human_readable_id",
         rank_col="combined_degree",
         description_embedding_col=None,
@@ -136,12 +296,43 @@ def read_indexer_report_embeddings(
         report.full_content_embedding = embeddings_store.search_by_id(report.id).vector
 
 
+@overload
 def read_indexer_entities(
     entities: pd.DataFrame,
     communities: pd.DataFrame,
     community_level: int | None,
-) -> list[Entity]:
-    """Read in the Entities from the raw indexing outputs."""
+    columnar: Literal[False] = False,
+) -> list[Entity]: ...
+
+
+@overload
+def read_indexer_entities(
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_level: int | None,
+    columnar: Literal[True],
+) -> EntityTable: ...
+
+
+@overload
+def read_indexer_entities(
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_level: int | None,
+    columnar: bool,
+) -> list[Entity] | EntityTable: ...
+
+
+def read_indexer_entities(
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_level: int | None,
+    columnar: bool = False,
+) -> list[Entity] | EntityTable:
+    """Read in the Entities from the raw indexing outputs.
+
+    With `columnar`, the entities are kept in an `EntityTable` instead of a list.
+    """
     community_join = communities.explode("entity_ids").loc[
         :, ["community", "level", "entity_ids"]
     ]
@@ -163,8 +354,9 @@ def read_indexer_entities(
         subset=["id"]
     )
     # read entity dataframe to knowledge model objects
-    return read_entities(
-        df=final_df,
+    read = EntityTable.from_dataframe if columnar else read_entities
+    return read(
+        final_df,
         id_col="id",
         title_col="title",
         type_col="type",
@@ -209,6 +401,7 @@ def read_indexer_communities(
         level_col="level",
         entities_col=None,
         relationships_col=None,
+        text_units_col=None,
         covariates_col=None,
         parent_col="parent",
         children_col="children",
@@ -0,0 +1,418 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Columnar collections of entities, relationships and text units.
+
+The `read_*` loaders build one dataclass per row, holding embeddings as lists of
+Python floats, which takes gigabytes and tens of seconds for millions of rows. The
+tables here keep every column in one block instead: ids and titles as lists of
+interned strings, long texts and id lists as Arrow arrays, and ranks, weights and
+embeddings (as float32) in NumPy arrays.
+
+Indexing or iterating a table yields lightweight row views. The views are instances of
+the data model classes, so the context builders read them through the same attribute
+access. Their fields are read-only.
+"""
+
+import sys
+from collections.abc import Iterator, Sequence
+from typing import Any, TypeVar, overload
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+
+T = TypeVar("T")
+
+
+class _ColumnarTable(Sequence[T]):
+    """A table of columns read through row views of type `_row_type`."""
+
+    _row_type: type
+
+    def __init__(
+        self,
+        num_rows: int,
+        columns: dict[str, Sequence[Any]],
+        attribute_columns: dict[str, list[Any]] | None = None,
+    ):
+        self._num_rows = num_rows
+        self._columns = columns
+        self._attribute_columns = attribute_columns or {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Return a view of the row, or a list of views of the sliced rows."""
+        if isinstance(index, slice):
+            return [self._view(row) for row in range(self._num_rows)[index]]
+        if index < 0:
+            index += self._num_rows
+        if not 0 <= index < self._num_rows:
+            msg = f"row {index} out of range"
+            raise IndexError(msg)
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over views of the rows."""
+        return (self._view(row) for row in range(self._num_rows))
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Return the column of a field, e.g. the NumPy array of the ranks."""
+        return self._columns[name]
+
+    def _view(self, row: int) -> T:
+        view = object.__new__(self._row_type)
+        view._table = self  # noqa: SLF001
+        view._row = row  # noqa: SLF001
+        return view
+
+    def _value(self, name: str, row: int) -> Any:
+        return self._columns[name][row]
+
+    def _attributes(self, row: int) -> dict[str, Any] | None:
+        return (
+            {name: values[row] for name, values in self._attribute_columns.items()}
+            if self._attribute_columns
+            else None
+        )
+
+
+def _field(name: str) -> Any:
+    """Return a read-only property reading the field from the table of the row."""
+    return property(lambda view: view._table._value(name, view._row))  # noqa: SLF001
+
+
+def _attributes_field() -> Any:
+    """Return a read-only property building the attributes of the row on each access."""
+    return property(lambda view: view._table._attributes(view._row))  # noqa: SLF001
+
+
+class EntityRow(Entity):
+    """An entity viewed from a row of an `EntityTable`."""
+
+    __slots__ = ("_row", "_table")
+
+    id = _field("id")
+    short_id = _field("short_id")
+    title = _field("title")
+    type = _field("type")
+    description = _field("description")
+    description_embedding = _field("description_embedding")
+    name_embedding = _field("name_embedding")
+    community_ids = _field("community_ids")
+    text_unit_ids = _field("text_unit_ids")
+    rank = _field("rank")
+    attributes = _attributes_field()
+
+
+class RelationshipRow(Relationship):
+    """A relationship viewed from a row of a `RelationshipTable`."""
+
+    __slots__ = ("_row", "_table")
+
+    id = _field("id")
+    short_id = _field("short_id")
+    source = _field("source")
+    target = _field("target")
+    weight = _field("weight")
+    description = _field("description")
+    description_embedding = _field("description_embedding")
+    text_unit_ids = _field("text_unit_ids")
+    rank = _field("rank")
+    attributes = _attributes_field()
+
+
+class TextUnitRow(TextUnit):
+    """A text unit viewed from a row of a `TextUnitTable`."""
+
+    __slots__ = ("_row", "_table")
+
+    id = _field("id")
+    short_id = _field("short_id")
+    text = _field("text")
+    entity_ids = _field("entity_ids")
+    relationship_ids = _field("relationship_ids")
+    covariate_ids = _field("covariate_ids")
+    n_tokens = _field("n_tokens")
+    document_ids = _field("document_ids")
+    attributes = _attributes_field()
+
+
+class EntityTable(_ColumnarTable[Entity]):
+    """A columnar collection of entities, see `read_entities` for the columns."""
+
+    _row_type = EntityRow
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        id_col: str = "id",
+        short_id_col: str | None = "human_readable_id",
+        title_col: str = "title",
+        type_col: str | None = "type",
+        description_col: str | None = "description",
+        name_embedding_col: str | None = "name_embedding",
+        description_embedding_col: str | None = "description_embedding",
+        community_col: str | None = "community_ids",
+        text_unit_ids_col: str | None = "text_unit_ids",
+        rank_col: str | None = "degree",
+        attributes_cols: list[str] | None = None,
+    ) -> "EntityTable":
+        """Read entities from a dataframe."""
+        return cls(
+            len(df),
+            {
+                "id": _interned_strings(df, id_col),
+                "short_id": _short_ids(df, short_id_col),
+                "title": _interned_strings(df, title_col),
+                "type": _interned_strings(df, type_col, nullable=True),
+                "description": _text(df, description_col),
+                "name_embedding": _embeddings(df, name_embedding_col),
+                "description_embedding": _embeddings(df, description_embedding_col),
+                "community_ids": _lists(df, community_col),
+                "text_unit_ids": _lists(df, text_unit_ids_col),
+                "rank": _numbers(df, rank_col, int),
+            },
+            _attribute_columns(df, attributes_cols),
+        )
+
+
+class RelationshipTable(_ColumnarTable[Relationship]):
+    """A columnar collection of relationships, see `read_relationships` for the columns."""
+
+    _row_type = RelationshipRow
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        id_col: str = "id",
+        short_id_col: str | None = "human_readable_id",
+        source_col: str = "source",
+        target_col: str = "target",
+        description_col: str | None = "description",
+        rank_col: str | None = "combined_degree",
+        description_embedding_col: str | None = "description_embedding",
+        weight_col: str | None = "weight",
+        text_unit_ids_col: str | None = "text_unit_ids",
+        attributes_cols: list[str] | None = None,
+    ) -> "RelationshipTable":
+        """Read relationships from a dataframe."""
+        return cls(
+            len(df),
+            {
+                "id": _interned_strings(df, id_col),
+                "short_id": _short_ids(df, short_id_col),
+                "source": _interned_strings(df, source_col),
+                "target": _interned_strings(df, target_col),
+                "description": _text(df, description_col),
+                "description_embedding": _embeddings(df, description_embedding_col),
+                "weight": _numbers(df, weight_col, float),
+                "text_unit_ids": _lists(df, text_unit_ids_col),
+                "rank": _numbers(df, rank_col, int),
+            },
+            _attribute_columns(df, attributes_cols),
+        )
+
+
+class TextUnitTable(_ColumnarTable[TextUnit]):
+    """A columnar collection of text units, see `read_text_units` for the columns."""
+
+    _row_type = TextUnitRow
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        id_col: str = "id",
+        text_col: str = "text",
+        entities_col: str | None = "entity_ids",
+        relationships_col: str | None = "relationship_ids",
+        covariates_col: str | None = "covariate_ids",
+        tokens_col: str | None = "n_tokens",
+        document_ids_col: str | None = "document_ids",
+        attributes_cols: list[str] | None = None,
+    ) -> "TextUnitTable":
+        """Read text units from a dataframe."""
+        return cls(
+            len(df),
+            {
+                "id": _interned_strings(df, id_col),
+                "short_id": _short_ids(df, None),
+                "text": _text(df, text_col, nullable=False),
+                "entity_ids": _lists(df, entities_col),
+                "relationship_ids": _lists(df, relationships_col),
+                "covariate_ids": _objects(df, covariates_col),
+                "n_tokens": _numbers(df, tokens_col, int),
+                "document_ids": _lists(df, document_ids_col),
+            },
+            _attribute_columns(df, attributes_cols),
+        )
+
+
+class _Constant(Sequence[Any]):
+    """A column of a field that is not read, holding None in every row."""
+
+    def __init__(self, num_rows: int):
+        self._num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, row: Any) -> None:
+        return None
+
+
+class _ArrowColumn(Sequence[Any]):
+    """A column of strings or lists kept in an Arrow array, converted on access."""
+
+    def __init__(self, array: pa.Array):
+        self.array = array
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, row: Any) -> Any:
+        return self.array[row].as_py()
+
+
+class _NumberColumn(Sequence[Any]):
+    """A column of optional numbers kept in a float64 array, NaN standing for None."""
+
+    def __init__(self, values: np.ndarray, number_type: type):
+        self.values = values
+        self._number_type = number_type
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: Any) -> Any:
+        value = self.values[row]
+        return None if np.isnan(value) else self._number_type(value)
+
+
+class _EmbeddingColumn(Sequence[Any]):
+    """A column of equally long embeddings kept in a float32 matrix, converted to lists on access."""
+
+    def __init__(self, matrix: np.ndarray):
+        self.matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def __getitem__(self, row: Any) -> Any:
+        return self.matrix[row].tolist()
+
+
+def _values(df: pd.DataFrame, column: str, optional: bool) -> list[Any] | None:
+    if column not in df.columns:
+        if optional:
+            return None
+        msg = f"Column [{column}] not found in data"
+        raise ValueError(msg)
+    return df[column].tolist()
+
+
+def _interned_strings(
+    df: pd.DataFrame, column: str | None, nullable: bool = False
+) -> Sequence[Any]:
+    """Read a column of ids or titles, sharing one string object per distinct value."""
+    if column is None:
+        return _Constant(len(df))
+    return [
+        None if nullable and value is None else sys.intern(str(value))
+        for value in _values(df, column, optional=False) or []
+    ]
+
+
+def _short_ids(df: pd.DataFrame, column: str | None) -> Sequence[Any]:
+    if column is None:
+        return [str(index) for index in df.index]
+    return _interned_strings(df, column, nullable=True)
+
+
+def _text(df: pd.DataFrame, column: str | None, nullable: bool = True) -> Sequence[Any]:
+    """Read a column of long strings into one Arrow buffer."""
+    if column is None:
+        return _Constant(len(df))
+    return _ArrowColumn(
+        pa.array(
+            [
+                None if nullable and value is None else str(value)
+                for value in _values(df, column, optional=False) or []
+            ],
+            type=pa.large_string(),
+        )
+    )
+
+
+def _lists(df: pd.DataFrame, column: str | None) -> Sequence[Any]:
+    """Read a column of optional lists, e.g. of ids, into an Arrow list array."""
+    values = _values(df, column, optional=True) if column else None
+    if values is None:
+        return _Constant(len(df))
+    lists = [
+        None if value is None else [value] if isinstance(value, str) else list(value)
+        for value in values
+    ]
+    try:
+        return _ArrowColumn(pa.array(lists))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return lists
+
+
+def _numbers(df: pd.DataFrame, column: str | None, number_type: type) -> Sequence[Any]:
+    values = _values(df, column, optional=True) if column else None
+    if values is None:
+        return _Constant(len(df))
+    return _NumberColumn(
+        np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        ),
+        number_type,
+    )
+
+
+def _embeddings(df: pd.DataFrame, column: str | None) -> Sequence[Any]:
+    """Read a column of embeddings into a float32 matrix, or an Arrow list array if some are missing or of another size."""
+    values = _values(df, column, optional=True) if column else None
+    if values is None:
+        return _Constant(len(df))
+    if values and all(value is not None for value in values):
+        sizes = {len(value) for value in values}
+        if len(sizes) == 1:
+            return _EmbeddingColumn(np.asarray(np.stack(values), dtype=np.float32))
+    return _ArrowColumn(
+        pa.array(
+            [None if value is None else list(value) for value in values],
+            type=pa.list_(pa.float32()),
+        )
+    )
+
+
+def _objects(df: pd.DataFrame, column: str | None) -> Sequence[Any]:
+    values = _values(df, column, optional=True) if column else None
+    return _Constant(len(df)) if values is None else values
+
+
+def _attribute_columns(
+    df: pd.DataFrame, columns: list[str] | None
+) -> dict[str, list[Any]]:
+    return {
+        column: df[column].tolist() if column in df.columns else [None] * len(df)
+        for column in columns or []
+    }
@@ -9,6 +9,7 @@ import pandas as pd
 
 from graphrag.data_model.community_report import CommunityReport
 from graphrag.data_model.entity import Entity
+from graphrag.query.input.retrieval.index import RetrievalIndex
 
 
 def get_candidate_communities(
@@ -16,19 +17,23 @@ def get_candidate_communities(
     community_reports: list[CommunityReport],
     include_community_rank: bool = False,
     use_community_summary: bool = False,
+    index: RetrievalIndex | None = None,
 ) -> pd.DataFrame:
-    """Get all communities that are related to selected entities."""
-    selected_community_ids = [
-        entity.community_ids for entity in selected_entities if entity.community_ids
-    ]
-    selected_community_ids = [
-        item for sublist in selected_community_ids for item in sublist
-    ]
-    selected_reports = [
-        community
-        for community in community_reports
-        if community.id in selected_community_ids
-    ]
+    """Get all communities that are related to selected entities, using an index over the reports if given."""
+    selected_community_ids = {
+        community_id
+        for entity in selected_entities
+        if entity.community_ids
+        for community_id in entity.community_ids
+    }
+    if index is not None:
+        selected_reports = index.community_reports_with_ids(selected_community_ids)
+    else:
+        selected_reports = [
+            community
+            for community in community_reports
+            if community.id in selected_community_ids
+        ]
     return to_community_report_dataframe(
         reports=selected_reports,
         include_community_rank=include_community_rank,
@@ -9,14 +9,18 @@ import pandas as pd
 
 from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
+from graphrag.query.input.retrieval.index import RetrievalIndex
 
 
 def get_candidate_covariates(
     selected_entities: list[Entity],
     covariates: list[Covariate],
+    index: RetrievalIndex | None = None,
 ) -> list[Covariate]:
-    """Get all covariates that are related to selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    """Get all covariates that are related to selected entities, using an index over the covariates if given."""
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if index is not None:
+        return index.covariates_of(selected_entity_names)
     return [
         covariate
         for covariate in covariates
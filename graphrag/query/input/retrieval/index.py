@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A query-time index over the collections of the knowledge model."""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+
+T = TypeVar("T")
+
+
+class RetrievalIndex:
+    """
+    Lookup tables over the entities, relationships, covariates, text units and community reports of a query.
+
+    The tables are built once, so every lookup takes time proportional to the number of
+    matches rather than to the size of the collection. Matches are returned in the order
+    of the collection, which keeps the results identical to a linear scan of it.
+
+    An index holds a single list of covariates, index every covariate type on its own.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[Entity] | None = None,
+        relationships: Iterable[Relationship] | None = None,
+        covariates: Iterable[Covariate] | None = None,
+        text_units: Iterable[TextUnit] | None = None,
+        community_reports: Iterable[CommunityReport] | None = None,
+    ):
+        self.entities = list(entities or [])
+        self.relationships = list(relationships or [])
+        self.covariates = list(covariates or [])
+        self.text_units = list(text_units or [])
+        self.community_reports = list(community_reports or [])
+        self._entities_by_title = _positions(
+            self.entities, lambda entity: (entity.title,)
+        )
+        self._relationships_by_title = _positions(
+            self.relationships,
+            lambda relationship: (relationship.source, relationship.target),
+        )
+        self._covariates_by_subject = _positions(
+            self.covariates, lambda covariate: (covariate.subject_id,)
+        )
+        self._text_units_by_id = _positions(self.text_units, lambda unit: (unit.id,))
+        self._community_reports_by_id = _positions(
+            self.community_reports, lambda report: (report.id,)
+        )
+
+    def entities_titled(self, titles: Iterable[str]) -> list[Entity]:
+        """Return the entities with any of the titles."""
+        return _select(self.entities, self._entities_by_title, titles)
+
+    def relationships_of(self, titles: Iterable[str]) -> list[Relationship]:
+        """Return the relationships with any of the titles as their source or target."""
+        return _select(self.relationships, self._relationships_by_title, titles)
+
+    def covariates_of(self, titles: Iterable[str]) -> list[Covariate]:
+        """Return the covariates with any of the titles as their subject."""
+        return _select(self.covariates, self._covariates_by_subject, titles)
+
+    def text_units_with_ids(self, ids: Iterable[str]) -> list[TextUnit]:
+        """Return the text units with any of the ids."""
+        return _select(self.text_units, self._text_units_by_id, ids)
+
+    def community_reports_with_ids(self, ids: Iterable[str]) -> list[CommunityReport]:
+        """Return the community reports with any of the ids."""
+        return _select(self.community_reports, self._community_reports_by_id, ids)
+
+
+def _positions(
+    items: list[T], keys: Callable[[T], Iterable[str]]
+) -> dict[str, list[int]]:
+    """Map every key to the positions of the items it belongs to."""
+    positions = defaultdict(list)
+    for position, item in enumerate(items):
+        for key in set(keys(item)):
+            positions[key].append(position)
+    return dict(positions)
+
+
+def _select(
+    items: list[T], positions: dict[str, list[int]], keys: Iterable[str]
+) -> list[T]:
+    """Return the items of any of the keys, once each and in collection order."""
+    selected = set()
+    for key in set(keys):
+        selected.update(positions.get(key, ()))
+    return [items[position] for position in sorted(selected)]
@@ -9,15 +9,22 @@ import pandas as pd
 
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
+from graphrag.query.input.retrieval.index import RetrievalIndex
 
 
 def get_in_network_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
+    index: RetrievalIndex | None = None,
 ) -> list[Relationship]:
-    """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    """Get all directed relationships between selected entities, sorted by ranking_attribute.
+
+    An index over the relationships narrows them down to those of the selected entities.
+    """
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if index is not None:
+        relationships = index.relationships_of(selected_entity_names)
     selected_relationships = [
         relationship
         for relationship in relationships
@@ -35,9 +42,15 @@ def get_out_network_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
+    index: RetrievalIndex | None = None,
 ) -> list[Relationship]:
-    """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute.
+
+    An index over the relationships narrows them down to those of the selected entities.
+    """
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if index is not None:
+        relationships = index.relationships_of(selected_entity_names)
     source_relationships = [
         relationship
         for relationship in relationships
@@ -57,9 +70,12 @@ def get_out_network_relationships(
 def get_candidate_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
+    index: RetrievalIndex | None = None,
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if index is not None:
+        return index.relationships_of(selected_entity_names)
     return [
         relationship
         for relationship in relationships
@@ -69,12 +85,16 @@ def get_candidate_relationships(
 
 
 def get_entities_from_relationships(
-    relationships: list[Relationship], entities: list[Entity]
+    relationships: list[Relationship],
+    entities: list[Entity],
+    index: RetrievalIndex | None = None,
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
+    selected_entity_names = {relationship.source for relationship in relationships} | {
         relationship.target for relationship in relationships
-    ]
+    }
+    if index is not None:
+        return index.entities_titled(selected_entity_names)
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
@@ -8,6 +8,7 @@ from typing import cast
 
 import pandas as pd
 
+from graphrag.bm25.index import BM25Index
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.context_builder.builders import (
@@ -17,13 +18,22 @@ from graphrag.query.context_builder.builders import (
 from graphrag.query.context_builder.conversation_history import ConversationHistory
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
-from graphrag.vector_stores.base import BaseVectorStore
+from graphrag.utils.rank_fusion import reciprocal_rank_fusion
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class BasicSearchContext(BasicContextBuilder):
-    """Class representing the Basic Search Context Builder."""
+    """Class representing the Basic Search Context Builder.
+
+    With a `lexical_index` over the text units, the vector search results are fused
+    with the best BM25 matches of the query using reciprocal rank fusion.
+    """
 
     def __init__(
         self,
@@ -32,13 +42,21 @@ class BasicSearchContext(BasicContextBuilder):
         text_units: list[TextUnit] | None = None,
         tokenizer: Tokenizer | None = None,
         embedding_vectorstore_key: str = "id",
+        lexical_index: BM25Index | None = None,
     ):
         self.text_embedder = text_embedder
         self.tokenizer = tokenizer or get_tokenizer()
         self.text_units = text_units
         self.text_unit_embeddings = text_unit_embeddings
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.lexical_index = lexical_index
         self.text_id_map = self._map_ids()
+        # the texts of the units only the lexical search finds
+        self.text_unit_map = (
+            {unit.id: unit for unit in text_units or []}
+            if lexical_index is not None
+            else {}
+        )
 
     def build_context(
         self,
@@ -53,12 +71,91 @@ class BasicSearchContext(BasicContextBuilder):
         **kwargs,
     ) -> ContextBuilderResult:
         """Build the context for the basic search mode."""
+        related_texts = []
         if query != "":
             related_texts = self.text_unit_embeddings.similarity_search_by_text(
                 text=query,
                 text_embedder=lambda t: self.text_embedder.embed(t),
                 k=k,
             )
+        return self._build_context_from_results(
+            query,
+            self._fuse_lexical_results(query, related_texts, k),
+            max_context_tokens=max_context_tokens,
+            context_name=context_name,
+            column_delimiter=column_delimiter,
+            text_id_col=text_id_col,
+            text_col=text_col,
+        )
+
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        k: int = 10,
+        max_context_tokens: int = 12_000,
+        context_name: str = "Sources",
+        column_delimiter: str = "|",
+        text_id_col: str = "source_id",
+        text_col: str = "text",
+        **kwargs,
+    ) -> ContextBuilderResult:
+        """Build the context for the basic search mode without blocking the event loop on the vector search."""
+        related_texts = []
+        if query != "":
+            related_texts = await self.text_unit_embeddings.asimilarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: self.text_embedder.aembed(t),
+                k=k,
+            )
+        return self._build_context_from_results(
+            query,
+            self._fuse_lexical_results(query, related_texts, k),
+            max_context_tokens=max_context_tokens,
+            context_name=context_name,
+            column_delimiter=column_delimiter,
+            text_id_col=text_id_col,
+            text_col=text_col,
+        )
+
+    def _fuse_lexical_results(
+        self, query: str, related_texts: list[VectorStoreSearchResult], k: int
+    ) -> list[VectorStoreSearchResult]:
+        """Fuse the vector search results with the best BM25 matches of the query."""
+        if self.lexical_index is None or query == "":
+            return related_texts
+        vector_results = {f"{result.document.id}": result for result in related_texts}
+        fused = reciprocal_rank_fusion([
+            list(vector_results),
+            [
+                id
+                for id, _ in self.lexical_index.search(query, k=k)
+                if id in self.text_unit_map
+            ],
+        ])
+        return [
+            vector_results.get(id)
+            or VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=id, text=self.text_unit_map[id].text, vector=None
+                ),
+                score=score,
+            )
+            for id, score in fused[:k]
+        ]
+
+    def _build_context_from_results(
+        self,
+        query: str,
+        related_texts: list[VectorStoreSearchResult],
+        max_context_tokens: int,
+        context_name: str,
+        column_delimiter: str,
+        text_id_col: str,
+        text_col: str,
+    ) -> ContextBuilderResult:
+        """Fill the context window with the text units found by the vector search."""
+        if query != "":
             related_text_list = [
                 {
                     text_id_col: self.text_id_map[f"{chunk.document.id}"],
@@ -60,7 +60,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -134,7 +134,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         """Build basic search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
@@ -3,11 +3,11 @@
 """Algorithms to build context data for local search prompt."""
 
 import logging
-from copy import deepcopy
 from typing import Any
 
 import pandas as pd
 
+from graphrag.bm25.index import BM25Index
 from graphrag.data_model.community_report import CommunityReport
 from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
@@ -23,6 +23,7 @@ from graphrag.query.context_builder.conversation_history import (
 )
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
+    amap_query_to_entities,
     map_query_to_entities,
 )
 from graphrag.query.context_builder.local_context import (
@@ -38,6 +39,7 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.index import RetrievalIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.structured_search.base import LocalContextBuilder
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
@@ -48,7 +50,13 @@ logger = logging.getLogger(__name__)
 
 
 class LocalSearchMixedContext(LocalContextBuilder):
-    """Build data context for local search prompt combining community reports and entity/relationship/covariate tables."""
+    """Build data context for local search prompt combining community reports and entity/relationship/covariate tables.
+
+    With a `lexical_index` over the entities, the entities the query maps to are
+    found by fusing the description embedding matches with the best BM25 matches.
+    Long-lived callers can pass the `retrieval_index` and `covariate_indexes` over the
+    same collections, built once, instead of having them rebuilt for every builder.
+    """
 
     def __init__(
         self,
@@ -61,6 +69,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         tokenizer: Tokenizer | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        lexical_index: BM25Index | None = None,
+        retrieval_index: RetrievalIndex | None = None,
+        covariate_indexes: dict[str, RetrievalIndex] | None = None,
     ):
         if community_reports is None:
             community_reports = []
@@ -79,10 +90,22 @@ class LocalSearchMixedContext(LocalContextBuilder):
             relationship.id: relationship for relationship in relationships
         }
         self.covariates = covariates
+        # lookup tables answering the per-entity lookups of the context builders
+        self.index = retrieval_index or RetrievalIndex(
+            entities=self.entities.values(),
+            relationships=self.relationships.values(),
+            text_units=self.text_units.values(),
+            community_reports=self.community_reports.values(),
+        )
+        self.covariate_indexes = covariate_indexes or {
+            name: RetrievalIndex(covariates=values)
+            for name, values in covariates.items()
+        }
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
         self.tokenizer = tokenizer or get_tokenizer()
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.lexical_index = lexical_index
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
@@ -111,6 +134,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         min_community_rank: int = 0,
         community_context_name: str = "Reports",
         column_delimiter: str = "|",
+        selected_entities: list[Entity] | None = None,
         **kwargs: dict[str, Any],
     ) -> ContextBuilderResult:
         """
@@ -128,25 +152,22 @@ class LocalSearchMixedContext(LocalContextBuilder):
             )
             raise ValueError(value_error)
 
-        # map user query to entities
-        # if there is conversation history, attached the previous user questions to the current query
-        if conversation_history:
-            pre_user_questions = "\n".join(
-                conversation_history.get_user_turns(conversation_history_max_turns)
+        # map user query to entities, unless that was already done asynchronously
+        if selected_entities is None:
+            selected_entities = map_query_to_entities(
+                query=self._entity_query(
+                    query, conversation_history, conversation_history_max_turns
+                ),
+                text_embedding_vectorstore=self.entity_text_embeddings,
+                text_embedder=self.text_embedder,
+                all_entities_dict=self.entities,
+                embedding_vectorstore_key=self.embedding_vectorstore_key,
+                include_entity_names=include_entity_names,
+                exclude_entity_names=exclude_entity_names,
+                k=top_k_mapped_entities,
+                oversample_scaler=2,
+                lexical_index=self.lexical_index,
             )
-            query = f"{query}\n{pre_user_questions}"
-
-        selected_entities = map_query_to_entities(
-            query=query,
-            text_embedding_vectorstore=self.entity_text_embeddings,
-            text_embedder=self.text_embedder,
-            all_entities_dict=self.entities,
-            embedding_vectorstore_key=self.embedding_vectorstore_key,
-            include_entity_names=include_entity_names,
-            exclude_entity_names=exclude_entity_names,
-            k=top_k_mapped_entities,
-            oversample_scaler=2,
-        )
 
         # build context
         final_context = list[str]()
@@ -221,6 +242,56 @@ class LocalSearchMixedContext(LocalContextBuilder):
             context_records=final_context_data,
         )
 
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        include_entity_names: list[str] | None = None,
+        exclude_entity_names: list[str] | None = None,
+        conversation_history_max_turns: int | None = 5,
+        top_k_mapped_entities: int = 10,
+        **kwargs: Any,
+    ) -> ContextBuilderResult:
+        """Build data context for local search prompt, mapping the query to entities without blocking the event loop."""
+        selected_entities = await amap_query_to_entities(
+            query=self._entity_query(
+                query, conversation_history, conversation_history_max_turns
+            ),
+            text_embedding_vectorstore=self.entity_text_embeddings,
+            text_embedder=self.text_embedder,
+            all_entities_dict=self.entities,
+            embedding_vectorstore_key=self.embedding_vectorstore_key,
+            include_entity_names=include_entity_names,
+            exclude_entity_names=exclude_entity_names,
+            k=top_k_mapped_entities,
+            oversample_scaler=2,
+            lexical_index=self.lexical_index,
+        )
+        return self.build_context(
+            query=query,
+            conversation_history=conversation_history,
+            include_entity_names=include_entity_names,
+            exclude_entity_names=exclude_entity_names,
+            conversation_history_max_turns=conversation_history_max_turns,
+            top_k_mapped_entities=top_k_mapped_entities,
+            selected_entities=selected_entities,
+            **kwargs,
+        )
+
+    def _entity_query(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None,
+        conversation_history_max_turns: int | None,
+    ) -> str:
+        """Attach the previous user questions to the query used to map entities."""
+        if conversation_history:
+            pre_user_questions = "\n".join(
+                conversation_history.get_user_turns(conversation_history_max_turns)
+            )
+            return f"{query}\n{pre_user_questions}"
+        return query
+
     def _build_community_context(
         self,
         selected_entities: list[Entity],
@@ -251,16 +322,10 @@ class LocalSearchMixedContext(LocalContextBuilder):
             for community_id in community_matches
             if community_id in self.community_reports
         ]
-        for community in selected_communities:
-            if community.attributes is None:
-                community.attributes = {}
-            community.attributes["matches"] = community_matches[community.community_id]
         selected_communities.sort(
-            key=lambda x: (x.attributes["matches"], x.rank),  # type: ignore
+            key=lambda x: (community_matches[x.community_id], x.rank),  # type: ignore
             reverse=True,  # type: ignore
         )
-        for community in selected_communities:
-            del community.attributes["matches"]  # type: ignore
 
         context_text, context_data = build_community_context(
             community_reports=selected_communities,
@@ -280,9 +345,10 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if return_candidate_context:
             candidate_context_data = get_candidate_communities(
                 selected_entities=selected_entities,
-                community_reports=list(self.community_reports.values()),
+                community_reports=self.index.community_reports,
                 use_community_summary=use_community_summary,
                 include_community_rank=include_community_rank,
+                index=self.index,
             )
             context_key = context_name.lower()
             if context_key not in context_data:
@@ -318,19 +384,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
+            entity_relationships = self.index.relationships_of([entity.title])
 
             for text_id in entity.text_unit_ids or []:
                 if text_id not in text_unit_ids_set and text_id in self.text_units:
-                    selected_unit = deepcopy(self.text_units[text_id])
+                    selected_unit = self.text_units[text_id]
                     num_relationships = count_relationships(
                         entity_relationships, selected_unit
                     )
@@ -354,7 +415,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if return_candidate_context:
             candidate_context_data = get_candidate_text_units(
                 selected_entities=selected_entities,
-                text_units=list(self.text_units.values()),
+                text_units=self.index.text_units,
+                index=self.index,
             )
             context_key = context_name.lower()
             if context_key not in context_data:
@@ -416,7 +478,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.index.relationships,
                 tokenizer=self.tokenizer,
                 max_context_tokens=max_context_tokens,
                 column_delimiter=column_delimiter,
@@ -424,6 +486,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 include_relationship_weight=include_relationship_weight,
                 relationship_ranking_attribute=relationship_ranking_attribute,
                 context_name="Relationships",
+                index=self.index,
             )
             current_context.append(relationship_context)
             current_context_data["relationships"] = relationship_context_data
@@ -440,6 +503,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                     max_context_tokens=max_context_tokens,
                     column_delimiter=column_delimiter,
                     context_name=covariate,
+                    index=self.covariate_indexes[covariate],
                 )
                 total_tokens += len(self.tokenizer.encode(covariate_context))
                 current_context.append(covariate_context)
@@ -463,12 +527,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
             # and add a tag to indicate which records were included in the context window
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
-                entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
+                entities=self.index.entities,
+                relationships=self.index.relationships,
                 covariates=self.covariates,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
+                index=self.index,
+                covariate_indexes=self.covariate_indexes,
             )
             for key in candidate_context_data:
                 candidate_df = candidate_context_data[key]
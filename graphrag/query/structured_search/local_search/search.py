@@ -58,7 +58,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         start_time = time.time()
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -137,7 +137,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         """Build local search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
@@ -297,6 +297,19 @@ class BlobPipelineStorage(PipelineStorage):
         path = str(Path(self._container_name) / self._path_prefix / key)
         return f"abfs://{path}"
 
+    async def get_fingerprint(self, key: str) -> str | None:
+        """Return the ETag of the blob, read without downloading it."""
+        try:
+            key = self._keyname(key)
+            container_client = self._blob_service_client.get_container_client(
+                self._container_name
+            )
+            blob_client = container_client.get_blob_client(key)
+            return blob_client.get_blob_properties().etag
+        except Exception:  # noqa: BLE001
+            logger.warning("Error getting key %s", key)
+            return None
+
     async def get_creation_date(self, key: str) -> str:
         """Get a value from the cache."""
         try:
@@ -132,6 +132,10 @@ class FilePipelineStorage(PipelineStorage):
         """Has method definition."""
         return await exists(join_path(self._root_dir, key))
 
+    def local_path(self, key: str) -> Path | None:
+        """Return the path of the file of the key."""
+        return join_path(self._root_dir, key)
+
     async def delete(self, key: str) -> None:
         """Delete method definition."""
         if await self.has(key):
@@ -156,6 +160,14 @@ class FilePipelineStorage(PipelineStorage):
         """Return the keys in the storage."""
         return [item.name for item in Path(self._root_dir).iterdir() if item.is_file()]
 
+    async def get_fingerprint(self, key: str) -> str | None:
+        """Return the size and modification time of the file."""
+        try:
+            stat = join_path(self._root_dir, key).stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
     async def get_creation_date(self, key: str) -> str:
         """Get the creation date of a file."""
         file_path = Path(join_path(self._root_dir, key))
@@ -57,6 +57,10 @@ class MemoryPipelineStorage(FilePipelineStorage):
         """
         return key in self._storage
 
+    def local_path(self, key: str) -> None:
+        """Return None, the values are kept in memory."""
+        return
+
     async def delete(self, key: str) -> None:
         """Delete the given key from the storage.
 
@@ -7,6 +7,7 @@ import re
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 
@@ -79,6 +80,23 @@ class PipelineStorage(metaclass=ABCMeta):
     def keys(self) -> list[str]:
         """List all keys in the storage."""
 
+    def local_path(self, key: str) -> Path | None:
+        """Return the path of the given key on the local filesystem, if the storage keeps it there.
+
+        Readers use the path to memory-map the file instead of reading it into memory.
+        """
+        return None
+
+    async def get_fingerprint(self, key: str) -> str | None:
+        """Return a fingerprint of the stored value read from its metadata, if the storage keeps any.
+
+        The fingerprint changes whenever the value is written, like the size and
+        modification time of a file or the ETag of a blob, so callers can detect
+        changes without reading the value. Returns None for storages without such
+        metadata and for missing keys.
+        """
+        return None
+
     @abstractmethod
     async def get_creation_date(self, key: str) -> str:
         """Get the creation date for the given key.
@@ -3,16 +3,20 @@
 
 """API functions for the GraphRAG module."""
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from graphrag.cache.factory import CacheFactory
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
 from graphrag.config.embeddings import create_index_name
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.storage_config import StorageConfig
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
-from graphrag.data_model.types import TextEmbedder
+from graphrag.data_model.types import AsyncTextEmbedder, TextEmbedder
 from graphrag.storage.factory import StorageFactory
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.vector_stores.base import (
@@ -93,6 +97,68 @@ class MultiVectorStore(BaseVectorStore):
             )
         return []
 
+    def similarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for several queries, one batch per store."""
+        all_results: list[list[VectorStoreSearchResult]] = [
+            [] for _ in range(len(query_embeddings))
+        ]
+        for index_name, embedding_store in zip(
+            self.index_names, self.embedding_stores, strict=False
+        ):
+            store_results = embedding_store.similarity_search_batch(
+                query_embeddings=query_embeddings, k=k
+            )
+            for query_results, results in zip(all_results, store_results, strict=True):
+                for r in results:
+                    r.document.id = str(r.document.id) + f"-{index_name}"
+                query_results += results
+        return [
+            sorted(results, key=lambda x: x.score, reverse=True)[:k]
+            for results in all_results
+        ]
+
+    async def asimilarity_search_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search on all stores concurrently."""
+        results = await asyncio.gather(*[
+            embedding_store.asimilarity_search_by_vector(
+                query_embedding=query_embedding, k=k, include_vectors=include_vectors
+            )
+            for embedding_store in self.embedding_stores
+        ])
+        all_results = []
+        for index_name, store_results in zip(self.index_names, results, strict=False):
+            for r in store_results:
+                r.document.id = str(r.document.id) + f"-{index_name}"
+            all_results += store_results
+        return sorted(all_results, key=lambda x: x.score, reverse=True)[:k]
+
+    async def asimilarity_search_by_text(
+        self,
+        text: str,
+        text_embedder: AsyncTextEmbedder,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a text-based similarity search without blocking the event loop."""
+        query_embedding = await text_embedder(text)
+        if query_embedding:
+            return await self.asimilarity_search_by_vector(
+                query_embedding=query_embedding, k=k, include_vectors=include_vectors
+            )
+        return []
+
 
 def get_embedding_store(
     config_args: dict[str, dict],
@@ -273,11 +339,19 @@ def create_storage_from_config(output: StorageConfig) -> PipelineStorage:
 def create_cache_from_config(cache: CacheConfig, root_dir: str) -> PipelineCache:
     """Create a cache object from the config."""
     cache_config = cache.model_dump()
+    memory_tier = {
+        "max_entries": cache_config.pop("memory_max_entries"),
+        "max_bytes": cache_config.pop("memory_max_bytes"),
+        "ttl": cache_config.pop("memory_ttl"),
+    }
     kwargs = {**cache_config, "root_dir": root_dir}
-    return CacheFactory().create_cache(
+    backend = CacheFactory().create_cache(
         cache_type=cache_config["type"],
         kwargs=kwargs,
     )
+    if memory_tier["max_entries"] is None and memory_tier["max_bytes"] is None:
+        return backend
+    return TieredPipelineCache(backend, **memory_tier)
 
 
 def truncate(text: str, max_length: int) -> str:
@@ -0,0 +1,41 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Reciprocal rank fusion (RRF) of rankings from different retrievers."""
+
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TypeVar
+
+import numpy as np
+import pandas as pd
+
+K = TypeVar("K", bound=Hashable)
+ArrayOrFloat = TypeVar("ArrayOrFloat", float, np.ndarray, pd.Series)
+
+DEFAULT_SMOOTHING_FACTOR = 60
+
+
+def reciprocal_rank(
+    rank: ArrayOrFloat, smoothing_factor: int = DEFAULT_SMOOTHING_FACTOR
+) -> ArrayOrFloat:
+    """Return the RRF contribution of a 1-based rank, or of an array of ranks."""
+    return 1 / (smoothing_factor + rank)
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[K]],
+    smoothing_factor: int = DEFAULT_SMOOTHING_FACTOR,
+) -> list[tuple[K, float]]:
+    """Fuse rankings of keys, best first, into one ranking with its RRF scores.
+
+    A key scores the sum of its reciprocal ranks over the rankings it appears in, so
+    keys found by several retrievers rise to the top. Ties keep the order in which
+    the keys were first seen.
+    """
+    scores: dict[K, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(dict.fromkeys(ranking), start=1):
+            scores[key] = scores.get(key, 0.0) + reciprocal_rank(
+                float(rank), smoothing_factor
+            )
+    return sorted(scores.items(), key=lambda item: -item[1])
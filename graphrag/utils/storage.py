@@ -5,23 +5,57 @@
 
 import logging
 from io import BytesIO
+from typing import Any
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 logger = logging.getLogger(__name__)
 
 
-async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.DataFrame:
-    """Load a parquet from the storage instance."""
+async def load_table_from_storage(
+    name: str,
+    storage: PipelineStorage,
+    columns: list[str] | None = None,
+    filters: list[tuple[str, str, Any]] | None = None,
+) -> pd.DataFrame:
+    """Load a parquet from the storage instance.
+
+    Only the `columns` present in the table are read, and the `filters`, pyarrow
+    predicates such as `("level", "<=", 2)`, skip rows while reading. Predicates on
+    columns missing from the table are ignored. Tables on the local filesystem are
+    memory-mapped instead of copied into memory.
+    """
     filename = f"{name}.parquet"
     if not await storage.has(filename):
         msg = f"Could not find {filename} in storage!"
         raise ValueError(msg)
     try:
         logger.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        path = storage.local_path(filename)
+        source = (
+            str(path)
+            if path is not None
+            else BytesIO(await storage.get(filename, as_bytes=True))
+        )
+        if columns is None and not filters:
+            return pd.read_parquet(source, memory_map=path is not None)
+        table_columns = set(pq.read_schema(source, memory_map=path is not None).names)
+        if isinstance(source, BytesIO):
+            source.seek(0)
+        if columns is not None:
+            columns = [column for column in columns if column in table_columns]
+        filters = [
+            predicate for predicate in filters or [] if predicate[0] in table_columns
+        ]
+        return pd.read_parquet(
+            source,
+            columns=columns,
+            filters=filters or None,
+            memory_map=path is not None,
+        )
     except Exception:
         logger.exception("error loading table from storage: %s", filename)
         raise
@@ -4,8 +4,10 @@
 """A package containing the Azure AI Search  vector store implementation."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import DefaultAzureCredential
 from azure.search.documents import SearchClient
@@ -32,6 +34,9 @@ from graphrag.vector_stores.base import (
     VectorStoreSearchResult,
 )
 
+MAX_CONCURRENT_SEARCHES = 8
+"""Maximum number of search requests sent at once by `similarity_search_batch`."""
+
 
 class AzureAISearchVectorStore(BaseVectorStore):
     """Azure AI Search vector storage implementation."""
@@ -192,6 +197,29 @@ class AzureAISearchVectorStore(BaseVectorStore):
             for doc in response
         ]
 
+    def similarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for several queries, sending the requests concurrently.
+
+        Azure AI Search fuses all vector queries of a request into one ranking, so every
+        query still needs its own request; they share the client's connection pool.
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float64).tolist()
+        if not queries:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(queries), MAX_CONCURRENT_SEARCHES)
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query: self.similarity_search_by_vector(query, k), queries
+                )
+            )
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
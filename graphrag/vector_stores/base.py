@@ -3,12 +3,20 @@
 
 """Base classes for vector stores."""
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
-from graphrag.data_model.types import TextEmbedder
+from graphrag.data_model.types import (
+    AsyncBatchTextEmbedder,
+    AsyncTextEmbedder,
+    TextEmbedder,
+)
 
 
 @dataclass
@@ -25,6 +33,40 @@ class VectorStoreDocument:
     """store any additional metadata, e.g. title, date ranges, etc"""
 
 
+class LazyVectorStoreDocument(VectorStoreDocument):
+    """A document whose JSON-encoded attributes are only parsed when first accessed.
+
+    Search results are mostly used for their id and text, so stores that keep the
+    attributes as a JSON string can skip decoding them for every hit.
+    """
+
+    def __init__(
+        self,
+        id: str | int,
+        text: str | None,
+        vector: list[float] | None,
+        raw_attributes: str | None,
+    ):
+        self.id = id
+        self.text = text
+        self.vector = vector
+        self._raw_attributes = raw_attributes
+        self._attributes: dict[str, Any] | None = None
+
+    @property
+    def attributes(self) -> dict[str, Any]:  # type: ignore[override]
+        """The document attributes, decoded on first access."""
+        if self._attributes is None:
+            self._attributes = (
+                json.loads(self._raw_attributes) if self._raw_attributes else {}
+            )
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value: dict[str, Any]) -> None:
+        self._attributes = value
+
+
 @dataclass
 class VectorStoreSearchResult:
     """A vector storage search result."""
@@ -69,6 +111,9 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    def build_index(self) -> None:  # noqa: B027
+        """Build the search index once all documents are loaded; stores that index on insert do nothing."""
+
     @abstractmethod
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
@@ -81,6 +126,81 @@ class BaseVectorStore(ABC):
     ) -> list[VectorStoreSearchResult]:
         """Perform ANN search by text."""
 
+    async def asimilarity_search_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by vector without blocking the event loop.
+
+        Stores without a native async client run the synchronous search in a worker
+        thread. Result vectors are only guaranteed when `include_vectors` is set.
+        """
+        return await asyncio.to_thread(
+            self.similarity_search_by_vector, query_embedding, k, **kwargs
+        )
+
+    async def asimilarity_search_by_text(
+        self,
+        text: str,
+        text_embedder: AsyncTextEmbedder,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by text without blocking the event loop."""
+        query_embedding = await text_embedder(text)
+        if query_embedding:
+            return await self.asimilarity_search_by_vector(
+                query_embedding, k, include_vectors=include_vectors, **kwargs
+            )
+        return []
+
+    def similarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several query vectors, returning the hits of each query in order.
+
+        Stores with a multi-query API override this; the default runs one search per query.
+        """
+        return [
+            self.similarity_search_by_vector(query_embedding, k, **kwargs)
+            for query_embedding in query_embeddings
+        ]
+
+    async def asimilarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several query vectors without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.similarity_search_batch, query_embeddings, k, **kwargs
+        )
+
+    async def asimilarity_search_batch_by_text(
+        self,
+        texts: list[str],
+        text_embedder: AsyncBatchTextEmbedder,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several texts, embedding all of them in a single call."""
+        if not texts:
+            return []
+        query_embeddings = await text_embedder(texts)
+        return await self.asimilarity_search_batch(
+            query_embeddings, k, include_vectors=include_vectors, **kwargs
+        )
+
     @abstractmethod
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
@@ -88,3 +208,23 @@ class BaseVectorStore(ABC):
     @abstractmethod
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
+
+
+def top_k_by_cosine_similarity(
+    query_embeddings: np.ndarray, document_embeddings: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Exact top-k search for stores that cannot rank vectors themselves.
+
+    Returns the indices of the `k` most similar documents for every query and their
+    cosine similarities, both of shape (num_queries, min(k, num_documents)). Zero
+    vectors have a similarity of 0 to everything; ties keep the document order.
+    """
+    query_norms = np.linalg.norm(query_embeddings, axis=1, keepdims=True)
+    document_norms = np.linalg.norm(document_embeddings, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (query_embeddings @ document_embeddings.T) / (
+            query_norms * document_norms
+        )
+    scores = np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+    indices = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+    return indices, np.take_along_axis(scores, indices, axis=1)
@@ -6,6 +6,7 @@
 import json
 from typing import Any
 
+import numpy as np
 from azure.cosmos import ContainerProxy, CosmosClient, DatabaseProxy
 from azure.cosmos.exceptions import CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
@@ -17,6 +18,7 @@ from graphrag.vector_stores.base import (
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
+    top_k_by_cosine_similarity,
 )
 
 
@@ -182,64 +184,85 @@ class CosmosDBVectorStore(BaseVectorStore):
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
+        return self.similarity_search_batch([query_embedding], k)[0]
+
+    def similarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for several queries.
+
+        CosmosDB ranks one query vector per request. Where `VectorDistance` is not
+        supported, all items are fetched once and ranked locally for every query.
+        """
         if self._container_client is None:
             msg = "Container client is not initialized."
             raise ValueError(msg)
 
+        queries = np.asarray(query_embeddings, dtype=np.float64)
+        if len(queries) == 0:
+            return []
         try:
             query = f"SELECT TOP {k} c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field}, VectorDistance(c.{self.vector_field}, @embedding) AS SimilarityScore FROM c ORDER BY VectorDistance(c.{self.vector_field}, @embedding)"  # noqa: S608
-            query_params = [{"name": "@embedding", "value": query_embedding}]
-            items = list(
-                self._container_client.query_items(
-                    query=query,
-                    parameters=query_params,
-                    enable_cross_partition_query=True,
-                )
-            )
+            results = [
+                [
+                    self._to_search_result(item, item.get("SimilarityScore", 0.0))
+                    for item in self._container_client.query_items(
+                        query=query,
+                        parameters=[{"name": "@embedding", "value": query_embedding}],
+                        enable_cross_partition_query=True,
+                    )
+                ]
+                for query_embedding in queries.tolist()
+            ]
         except (CosmosHttpResponseError, ValueError):
             # Currently, the CosmosDB emulator does not support the VectorDistance function.
             # For emulator or test environments - fetch all items and calculate distance locally
-            query = f"SELECT c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field} FROM c"  # noqa: S608
-            items = list(
-                self._container_client.query_items(
-                    query=query,
-                    enable_cross_partition_query=True,
-                )
+            results = self._local_similarity_search(queries, k)
+        return results
+
+    def _local_similarity_search(
+        self, queries: np.ndarray, k: int
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Rank all items by cosine similarity (1 - cosine distance) to every query."""
+        query = f"SELECT c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field} FROM c"  # noqa: S608
+        items = list(
+            self._container_client.query_items(
+                query=query,
+                enable_cross_partition_query=True,
             )
-
-            # Calculate cosine similarity locally (1 - cosine distance)
-            from numpy import dot
-            from numpy.linalg import norm
-
-            def cosine_similarity(a, b):
-                if norm(a) * norm(b) == 0:
-                    return 0.0
-                return dot(a, b) / (norm(a) * norm(b))
-
-            # Calculate scores for all items
-            for item in items:
-                item_vector = item.get(self.vector_field, [])
-                similarity = cosine_similarity(query_embedding, item_vector)
-                item["SimilarityScore"] = similarity
-
-            # Sort by similarity score (higher is better) and take top k
-            items = sorted(
-                items, key=lambda x: x.get("SimilarityScore", 0.0), reverse=True
-            )[:k]
-
+        )
+        if not items:
+            return [[] for _ in range(len(queries))]
+
+        # items without a vector of the query size score 0, like a zero vector
+        vectors = np.zeros((len(items), queries.shape[1]))
+        for row, item in enumerate(items):
+            item_vector = item.get(self.vector_field) or []
+            if len(item_vector) == queries.shape[1]:
+                vectors[row] = item_vector
+        indices, scores = top_k_by_cosine_similarity(queries, vectors, k)
         return [
-            VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=item.get(self.id_field, ""),
-                    text=item.get(self.text_field, ""),
-                    vector=item.get(self.vector_field, []),
-                    attributes=(json.loads(item.get(self.attributes_field, "{}"))),
-                ),
-                score=item.get("SimilarityScore", 0.0),
-            )
-            for item in items
+            [
+                self._to_search_result(items[index], float(score))
+                for index, score in zip(query_indices, query_scores, strict=True)
+            ]
+            for query_indices, query_scores in zip(indices, scores, strict=True)
         ]
 
+    def _to_search_result(self, item: dict, score: float) -> VectorStoreSearchResult:
+        return VectorStoreSearchResult(
+            document=VectorStoreDocument(
+                id=item.get(self.id_field, ""),
+                text=item.get(self.text_field, ""),
+                vector=item.get(self.vector_field, []),
+                attributes=(json.loads(item.get(self.attributes_field, "{}"))),
+            ),
+            score=score,
+        )
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
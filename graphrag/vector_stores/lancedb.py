@@ -4,22 +4,34 @@
 """The LanceDB vector storage implementation package."""
 
 import json  # noqa: I001
+import logging
 from typing import Any
 import pyarrow as pa
 import numpy as np
+from graphrag.config.defaults import vector_store_defaults
+from graphrag.config.enums import VectorIndexType
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.data_model.types import TextEmbedder
 
 from graphrag.vector_stores.base import (
     BaseVectorStore,
+    LazyVectorStoreDocument,
     VectorStoreDocument,
     VectorStoreSearchResult,
 )
 import lancedb
+from lancedb.query import LanceVectorQueryBuilder
+from lancedb.table import AsyncTable
+
+logger = logging.getLogger(__name__)
 
 
 class LanceDBVectorStore(BaseVectorStore):
-    """LanceDB vector storage implementation."""
+    """LanceDB vector storage implementation.
+
+    The ANN index is configured through the `index_*` vector store settings and built by
+    `build_index` once all documents are loaded.
+    """
 
     def __init__(
         self, vector_store_schema_config: VectorStoreSchemaConfig, **kwargs: Any
@@ -27,10 +39,26 @@ class LanceDBVectorStore(BaseVectorStore):
         super().__init__(
             vector_store_schema_config=vector_store_schema_config, **kwargs
         )
+        self.db_uri: str | None = None
+        self._async_table: AsyncTable | None = None
+        self.index_type = VectorIndexType(
+            kwargs.get("index_type") or vector_store_defaults.index_type
+        )
+        index_min_rows = kwargs.get("index_min_rows")
+        self.index_min_rows: int = (
+            vector_store_defaults.index_min_rows
+            if index_min_rows is None
+            else index_min_rows
+        )
+        self.index_num_partitions: int | None = kwargs.get("index_num_partitions")
+        self.index_num_sub_vectors: int | None = kwargs.get("index_num_sub_vectors")
+        self.index_nprobes: int | None = kwargs.get("index_nprobes")
 
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
-        self.db_connection = lancedb.connect(kwargs["db_uri"])
+        self.db_uri = kwargs["db_uri"]
+        self.db_connection = lancedb.connect(self.db_uri)
+        self._async_table = None
 
         if self.index_name and self.index_name in self.db_connection.table_names():
             self.document_collection = self.db_connection.open_table(self.index_name)
@@ -39,6 +67,9 @@ class LanceDBVectorStore(BaseVectorStore):
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
         """Load documents into vector storage."""
+        # the async handle pins a table version, reopen it on the next async search
+        self._async_table = None
+
         # Step 1: Prepare data columns manually
         ids = []
         texts = []
@@ -89,9 +120,6 @@ class LanceDBVectorStore(BaseVectorStore):
                 self.document_collection = self.db_connection.create_table(
                     self.index_name if self.index_name else "", mode="overwrite"
                 )
-            self.document_collection.create_index(
-                vector_column_name=self.vector_field, index_type="IVF_FLAT"
-            )
         else:
             # add data to existing table
             self.document_collection = self.db_connection.open_table(
@@ -100,6 +128,46 @@ class LanceDBVectorStore(BaseVectorStore):
             if data:
                 self.document_collection.add(data)
 
+    def build_index(self) -> None:
+        """Build the configured ANN index over all loaded documents, replacing any previous one.
+
+        Tables with fewer than `index_min_rows` rows and the `flat` index type are left
+        without an index, so searches scan every vector.
+        """
+        if self.document_collection is None or self.index_type == VectorIndexType.flat:
+            return
+        num_rows = self.document_collection.count_rows()
+        if num_rows == 0 or num_rows < self.index_min_rows:
+            logger.info(
+                "Skipping %s index for %s with %d rows",
+                self.index_type.value,
+                self.index_name,
+                num_rows,
+            )
+            return
+
+        index_kwargs: dict[str, Any] = {}
+        if self.index_num_partitions is not None:
+            index_kwargs["num_partitions"] = self.index_num_partitions
+        if (
+            self.index_num_sub_vectors is not None
+            and self.index_type == VectorIndexType.ivf_pq
+        ):
+            index_kwargs["num_sub_vectors"] = self.index_num_sub_vectors
+        logger.info(
+            "Building %s index for %s with %d rows",
+            self.index_type.value,
+            self.index_name,
+            num_rows,
+        )
+        self.document_collection.create_index(
+            vector_column_name=self.vector_field,
+            index_type=self.index_type.value.upper(),
+            replace=True,
+            **index_kwargs,
+        )
+        self._async_table = None
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
         if len(include_ids) == 0:
@@ -118,36 +186,133 @@ class LanceDBVectorStore(BaseVectorStore):
         self, query_embedding: list[float] | np.ndarray, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
-        if self.query_filter:
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name=self.vector_field
-                )
-                .where(self.query_filter, prefilter=True)
-                .limit(k)
-                .to_list()
+        query = self._search(np.asarray(query_embedding, dtype=np.float32))
+        return self._to_search_results(query.limit(k).to_arrow())
+
+    async def asimilarity_search_by_vector(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search on the LanceDB async client."""
+        return self._to_search_results(
+            await self.asimilarity_search_arrow(query_embedding, k, include_vectors)
+        )
+
+    def similarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for all queries in a single LanceDB query."""
+        query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+        if len(query_matrix) == 0:
+            return []
+        query = self._search(list(query_matrix))
+        return self._split_by_query(query.limit(k).to_arrow(), len(query_matrix))
+
+    async def asimilarity_search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for all queries in a single query on the LanceDB async client."""
+        query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+        if len(query_matrix) == 0:
+            return []
+        return self._split_by_query(
+            await self.asimilarity_search_arrow(query_matrix, k, include_vectors),
+            len(query_matrix),
+        )
+
+    async def asimilarity_search_arrow(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+    ) -> pa.Table:
+        """Perform a vector-based similarity search and return the raw Arrow table.
+
+        The table holds the id, text and attributes columns plus `_distance`; the vector
+        column is only read when `include_vectors` is set. A 2-D `query_embedding` runs
+        one search per row, the `k` hits of each are marked by a `query_index` column.
+        """
+        columns = [self.id_field, self.text_field, self.attributes_field]
+        if include_vectors:
+            columns.append(self.vector_field)
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query = (
+            (await self._get_async_table())
+            .vector_search(
+                list(query_vector) if query_vector.ndim == 2 else query_vector
             )
-        else:
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+            .column(self.vector_field)
+            .select(columns)
+            .limit(k)
+        )
+        if self.query_filter:
+            query = query.where(self.query_filter)
+        if self.index_nprobes:
+            query = query.nprobes(self.index_nprobes)
+        return await query.to_arrow()
 
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name=self.vector_field
-                )
-                .limit(k)
-                .to_list()
+    def _search(self, query: Any) -> LanceVectorQueryBuilder:
+        builder = self.document_collection.search(
+            query=query, vector_column_name=self.vector_field
+        )
+        if self.query_filter:
+            builder = builder.where(self.query_filter, prefilter=True)
+        if self.index_nprobes:
+            builder = builder.nprobes(self.index_nprobes)
+        return builder
+
+    async def _get_async_table(self) -> AsyncTable:
+        if self._async_table is None:
+            connection = await lancedb.connect_async(self.db_uri)
+            self._async_table = await connection.open_table(
+                self.index_name if self.index_name else ""
             )
+        return self._async_table
+
+    def _split_by_query(
+        self, table: pa.Table, num_queries: int
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Group the hits of a multi-vector search by their `query_index`."""
+        if "query_index" not in table.column_names:
+            return [self._to_search_results(table)]
+        query_index = table["query_index"].to_numpy()
+        # a stable sort keeps the hits of each query in distance order
+        order = np.argsort(query_index, kind="stable")
+        results = self._to_search_results(table.take(order))
+        bounds = np.searchsorted(query_index[order], np.arange(num_queries + 1))
+        return [results[bounds[i] : bounds[i + 1]] for i in range(num_queries)]
+
+    def _to_search_results(self, table: pa.Table) -> list[VectorStoreSearchResult]:
+        """Convert an Arrow search result column-wise, leaving attributes undecoded."""
+        ids = table[self.id_field].to_pylist()
+        texts = table[self.text_field].to_pylist()
+        attributes = table[self.attributes_field].to_pylist()
+        scores = 1 - np.abs(table["_distance"].to_numpy())
+        vectors: list[Any] = [None] * table.num_rows
+        if self.vector_field in table.column_names and table.num_rows > 0:
+            column = table[self.vector_field].combine_chunks()
+            vectors = column.flatten().to_numpy().reshape(len(column), -1).tolist()
         return [
             VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=doc[self.id_field],
-                    text=doc[self.text_field],
-                    vector=doc[self.vector_field],
-                    attributes=json.loads(doc[self.attributes_field]),
+                document=LazyVectorStoreDocument(
+                    id=ids[i],
+                    text=texts[i],
+                    vector=vectors[i],
+                    raw_attributes=attributes[i],
                 ),
-                score=1 - abs(float(doc["_distance"])),
+                score=float(scores[i]),
             )
-            for doc in docs
+            for i in range(table.num_rows)
         ]
 
     def similarity_search_by_text(
@@ -0,0 +1,142 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Benchmark recall@k against query latency for the LanceDB ANN index types.
+
+Loads a synthetic clustered corpus in insert batches, builds each configured index type
+once through `LanceDBVectorStore.build_index` and searches it with several `nprobes`
+settings. Recall is measured against exact L2 neighbors computed with numpy; `flat`
+is the exhaustive baseline without an index.
+
+Run with: python -m tests.benchmarks.bench_lancedb_index --rows 200000 --dim 256
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from graphrag.config.enums import VectorIndexType
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+
+
+def synthetic_corpus(
+    num_rows: int, dim: int, num_clusters: int, seed: int = 42
+) -> np.ndarray:
+    """Create unit vectors scattered around `num_clusters` centers, like topical embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_clusters, dim))
+    vectors = centers[rng.integers(num_clusters, size=num_rows)]
+    vectors += rng.normal(scale=0.6, size=(num_rows, dim))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def exact_neighbors(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Return the ids of the exact `k` nearest neighbors (L2) of every query."""
+    corpus_norms = (corpus**2).sum(axis=1)
+    neighbors = []
+    for query in queries:
+        distances = corpus_norms - 2 * corpus @ query
+        top = np.argpartition(distances, k)[:k]
+        neighbors.append(top[np.argsort(distances[top])])
+    return np.array(neighbors)
+
+
+def load_store(
+    db_uri: str, corpus: np.ndarray, index_type: VectorIndexType, args
+) -> tuple[LanceDBVectorStore, float]:
+    """Load the corpus in insert batches and build the index once, returning the build time."""
+    vector_store = LanceDBVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(
+            index_name=f"bench_{index_type.value}", vector_size=corpus.shape[1]
+        ),
+        index_type=index_type,
+        index_min_rows=0,
+        index_num_partitions=args.partitions,
+        index_num_sub_vectors=args.sub_vectors,
+    )
+    vector_store.connect(db_uri=db_uri)
+    for start in range(0, len(corpus), args.batch_size):
+        vector_store.load_documents(
+            [
+                VectorStoreDocument(id=str(i), text="", vector=corpus[i].tolist())
+                for i in range(start, min(start + args.batch_size, len(corpus)))
+            ],
+            overwrite=start == 0,
+        )
+    start_time = time.perf_counter()
+    vector_store.build_index()
+    return vector_store, time.perf_counter() - start_time
+
+
+def run_queries(
+    vector_store: LanceDBVectorStore, queries: np.ndarray, truth: np.ndarray, k: int
+) -> tuple[float, float, float]:
+    """Return recall@k, mean and p95 latency in milliseconds."""
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth, strict=True):
+        start_time = time.perf_counter()
+        results = vector_store.similarity_search_by_vector(query, k=k)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        found = {int(result.document.id) for result in results}
+        hits += len(found.intersection(expected.tolist()))
+    return (
+        hits / truth.size,
+        float(np.mean(latencies)),
+        float(np.percentile(latencies, 95)),
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--partitions", type=int, default=None)
+    parser.add_argument("--sub-vectors", type=int, default=None)
+    parser.add_argument("--nprobes", type=int, nargs="+", default=[10, 20, 50])
+    parser.add_argument(
+        "--index-types",
+        nargs="+",
+        default=[t.value for t in VectorIndexType],
+        choices=[t.value for t in VectorIndexType],
+    )
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.rows + args.queries, args.dim, args.clusters)
+    corpus, queries = corpus[: args.rows], corpus[args.rows :]
+    truth = exact_neighbors(corpus, queries, args.k)
+    print(
+        f"corpus: {args.rows} x {args.dim}, {args.clusters} clusters, "
+        f"{args.queries} queries, k={args.k}"
+    )
+    print(
+        f"{'index':>12} {'nprobes':>8} {'build s':>8} {'recall':>7} "
+        f"{'mean ms':>8} {'p95 ms':>8}"
+    )
+    with tempfile.TemporaryDirectory() as db_uri:
+        for index_type in map(VectorIndexType, args.index_types):
+            vector_store, build_time = load_store(db_uri, corpus, index_type, args)
+            nprobes_values = (
+                [None] if index_type == VectorIndexType.flat else args.nprobes
+            )
+            for nprobes in nprobes_values:
+                vector_store.index_nprobes = nprobes
+                recall, mean_ms, p95_ms = run_queries(
+                    vector_store, queries, truth, args.k
+                )
+                print(
+                    f"{index_type.value:>12} {nprobes or '-':>8} {build_time:>8.2f} "
+                    f"{recall:>7.3f} {mean_ms:>8.2f} {p95_ms:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
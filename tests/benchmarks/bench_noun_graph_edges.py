@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Benchmark building the co-occurrence edges of the NLP noun graph.
+
+Creates synthetic text units whose noun phrases follow a Zipf distribution, groups
+them into noun graph nodes like `_extract_nodes` and times `_extract_edges` with and
+without the text unit id lists, next to the previous pandas implementation that
+exploded `itertools.combinations` pairs (skip it with `--skip-pandas` on large runs).
+Peak memory is the traced Python allocation peak, numpy and pandas buffers included.
+
+Run with: python -m tests.benchmarks.bench_noun_graph_edges --units 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.operations.build_noun_graph.build_noun_graph import _extract_edges
+from graphrag.index.utils.graphs import calculate_pmi_edge_weights
+
+
+def synthetic_nodes(
+    num_units: int, mean_phrases: float, vocabulary: int, seed: int = 42
+) -> pd.DataFrame:
+    """Create noun graph nodes [title, frequency, text_unit_ids] of synthetic text units."""
+    rng = np.random.default_rng(seed)
+    lengths = rng.poisson(mean_phrases, size=num_units)
+    phrases = (rng.zipf(1.3, size=int(lengths.sum())) - 1) % vocabulary
+    units = np.repeat(np.arange(num_units), lengths)
+    pairs = pd.DataFrame({
+        "title": pd.Series(phrases).map(lambda i: f"PHRASE {i}"),
+        "text_unit_id": pd.Series(units).map(lambda i: f"unit-{i:08d}"),
+    }).drop_duplicates()
+    nodes = pairs.groupby("title").agg({"text_unit_id": list}).reset_index()
+    nodes = nodes.rename(columns={"text_unit_id": "text_unit_ids"})
+    nodes["frequency"] = nodes["text_unit_ids"].apply(len)
+    return nodes.loc[:, ["title", "frequency", "text_unit_ids"]]
+
+
+def pandas_extract_edges(
+    nodes_df: pd.DataFrame, normalize_edge_weights: bool = True
+) -> pd.DataFrame:
+    """Build the edges by exploding the noun phrase pairs of every text unit."""
+    text_units_df = nodes_df.explode("text_unit_ids")
+    text_units_df = text_units_df.rename(columns={"text_unit_ids": "text_unit_id"})
+    text_units_df = (
+        text_units_df.groupby("text_unit_id")
+        .agg({"title": lambda x: list(x) if len(x) > 1 else np.nan})
+        .reset_index()
+    )
+    text_units_df = text_units_df.dropna()
+    all_edges = [list(combinations(t, 2)) for t in text_units_df["title"].tolist()]
+    text_units_df = text_units_df.assign(edges=all_edges)
+    edge_df = text_units_df.explode("edges")[["edges", "text_unit_id"]]
+    edge_df[["source", "target"]] = edge_df.loc[:, "edges"].to_list()
+    edge_df["min_source"] = edge_df[["source", "target"]].min(axis=1)
+    edge_df["max_target"] = edge_df[["source", "target"]].max(axis=1)
+    edge_df = edge_df.drop(columns=["source", "target", "edges"]).rename(
+        columns={"min_source": "source", "max_target": "target"}
+    )
+    grouped_edge_df = (
+        edge_df.groupby(["source", "target"]).agg({"text_unit_id": list}).reset_index()
+    )
+    grouped_edge_df = grouped_edge_df.rename(columns={"text_unit_id": "text_unit_ids"})
+    grouped_edge_df["weight"] = grouped_edge_df["text_unit_ids"].apply(len)
+    grouped_edge_df = grouped_edge_df.loc[
+        :, ["source", "target", "weight", "text_unit_ids"]
+    ]
+    if normalize_edge_weights:
+        grouped_edge_df = calculate_pmi_edge_weights(nodes_df, grouped_edge_df)
+    return grouped_edge_df
+
+
+def measure(function, *args, **kwargs) -> tuple[pd.DataFrame, float, float]:
+    """Return the result, seconds and traced peak memory in MiB of a call."""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--units", type=int, default=100_000)
+    parser.add_argument("--mean-phrases", type=float, default=8.0)
+    parser.add_argument("--vocabulary", type=int, default=200_000)
+    parser.add_argument("--skip-pandas", action="store_true")
+    args = parser.parse_args()
+
+    nodes = synthetic_nodes(args.units, args.mean_phrases, args.vocabulary)
+    print(
+        f"text units: {args.units}, noun phrases: {len(nodes)}, "
+        f"occurrences: {nodes['frequency'].sum()}"
+    )
+    print(f"{'builder':>22} {'edges':>10} {'seconds':>8} {'peak MiB':>9}")
+    edges, elapsed, peak = measure(_extract_edges, nodes)
+    print(f"{'sparse':>22} {len(edges):>10} {elapsed:>8.2f} {peak:>9.1f}")
+    weights_only, elapsed, peak = measure(
+        _extract_edges, nodes, include_text_unit_ids=False
+    )
+    print(
+        f"{'sparse, no unit ids':>22} {len(weights_only):>10} {elapsed:>8.2f} {peak:>9.1f}"
+    )
+    if not args.skip_pandas:
+        expected, elapsed, peak = measure(pandas_extract_edges, nodes)
+        print(
+            f"{'pandas combinations':>22} {len(expected):>10} {elapsed:>8.2f} {peak:>9.1f}"
+        )
+        pd.testing.assert_frame_equal(edges, expected)
+        print("outputs are identical")
+
+
+if __name__ == "__main__":
+    main()
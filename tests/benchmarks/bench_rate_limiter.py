@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Benchmark the throughput the token bucket rate limiter achieves on a simulated clock.
+
+Simulates concurrent clients that each send a request, wait for its simulated latency
+and send the next one. Every request acquires the prompt tokens plus the max tokens,
+like `with_rate_limiter`, while its response uses only part of the max tokens. The
+clock only moves between events, so hours of traffic take a second and the achieved
+requests and tokens per period can be compared with the configured limits, with and
+without reconciling the estimates with the used tokens. The peak columns count the
+busiest sliding period, which should stay within the limits.
+
+Run with: python -m tests.benchmarks.bench_rate_limiter --rpm 600 --tpm 200000
+"""
+
+import argparse
+import heapq
+import time
+from bisect import bisect_left
+
+import numpy as np
+
+from graphrag.language_model.providers.litellm.services.rate_limiter.token_bucket_rate_limiter import (
+    TokenBucketRateLimiter,
+)
+
+
+class SimulatedClock:
+    """A clock the simulation moves forward."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def simulate(
+    args: argparse.Namespace, reconcile: bool
+) -> tuple[list[float], list[int]]:
+    """Return the send times and used tokens of the simulated requests."""
+    rng = np.random.default_rng(args.seed)
+    clock = SimulatedClock()
+    rate_limiter = TokenBucketRateLimiter(
+        rpm=args.rpm, tpm=args.tpm, period_in_seconds=args.period, clock=clock
+    )
+    send_times: list[float] = []
+    used_tokens: list[int] = []
+    # (time, client, phase): clients acquire, then complete after the latency
+    events = [(0.0, client, "acquire", 0, 0) for client in range(args.clients)]
+    heapq.heapify(events)
+    while events:
+        now, client, phase, estimate, used = heapq.heappop(events)
+        clock.now = now
+        if phase == "complete":
+            if reconcile:
+                rate_limiter.reconcile(token_count=estimate, actual_token_count=used)
+            if now < args.duration:
+                heapq.heappush(events, (now, client, "acquire", 0, 0))
+            continue
+        prompt = int(rng.integers(args.prompt_tokens // 2, args.prompt_tokens * 2))
+        estimate = prompt + args.max_tokens
+        used = prompt + int(rng.integers(0, args.max_tokens))
+        send_time = now + rate_limiter.reserve(estimate)
+        send_times.append(send_time)
+        used_tokens.append(used)
+        latency = float(rng.lognormal(np.log(args.latency), 0.5))
+        heapq.heappush(
+            events, (send_time + latency, client, "complete", estimate, used)
+        )
+    return send_times, used_tokens
+
+
+def peak_per_period(send_times: list[float], values: list[int], period: float) -> float:
+    """Return the largest sum of values sent within any sliding period."""
+    order = np.argsort(send_times, kind="stable")
+    times = np.asarray(send_times)[order]
+    totals = np.concatenate([[0], np.cumsum(np.asarray(values)[order])])
+    starts = [bisect_left(times, t - period + 1e-9) for t in times]
+    return float(max(totals[i + 1] - totals[start] for i, start in enumerate(starts)))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rpm", type=int, default=600)
+    parser.add_argument("--tpm", type=int, default=200_000)
+    parser.add_argument("--period", type=int, default=60)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=3600.0)
+    parser.add_argument("--latency", type=float, default=4.0)
+    parser.add_argument("--prompt-tokens", type=int, default=300)
+    parser.add_argument("--max-tokens", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"limits per {args.period}s: {args.rpm} requests, {args.tpm} tokens; "
+        f"{args.clients} clients for {args.duration:.0f} simulated seconds"
+    )
+    print(
+        f"{'mode':>12} {'requests':>9} {'req/period':>11} {'tok/period':>11} "
+        f"{'peak req':>9} {'peak tok':>9} {'seconds':>8}"
+    )
+    for mode, reconcile in [("estimates", False), ("reconciled", True)]:
+        start = time.perf_counter()
+        send_times, used_tokens = simulate(args, reconcile)
+        elapsed = time.perf_counter() - start
+        periods = max(send_times) / args.period
+        print(
+            f"{mode:>12} {len(send_times):>9} "
+            f"{len(send_times) / periods:>11.1f} {sum(used_tokens) / periods:>11.0f} "
+            f"{peak_per_period(send_times, [1] * len(send_times), args.period):>9.0f} "
+            f"{peak_per_period(send_times, used_tokens, args.period):>9.0f} "
+            f"{elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Benchmark community-report context sorting on synthetic communities.
+
+Compares the previous approach (re-render and re-tokenize the whole context after every
+edge) with the incremental `SortedContextBuilder` used by `sort_context`, and checks that
+both produce the same context string.
+
+Run with: python -m tests.benchmarks.bench_sort_context --edges 10000
+"""
+
+import argparse
+import random
+import time
+
+import graphrag.data_model.schemas as schemas
+from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
+    _get_context_string,
+    sort_context,
+)
+from graphrag.tokenizer.get_tokenizer import get_tokenizer
+from graphrag.tokenizer.tokenizer import Tokenizer
+
+WORDS = [
+    "alpha", "beta", "gamma", "delta", "risk", "data", "governance", "report",
+    "quarterly", "capital", "liquidity", "exposure", "counterparty", "aggregation",
+    "accuracy", "timeliness", "bank", "supervisor", "principle", "framework",
+    "control", "owner", "lineage", "quality",
+]  # fmt: skip
+
+
+def synthetic_community(
+    num_edges: int, num_nodes: int, claim_ratio: float, seed: int = 42
+) -> list[dict]:
+    """Create a local context of `num_nodes` nodes connected by `num_edges` edges."""
+    rng = random.Random(seed)
+
+    def sentence(length: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(length))
+
+    titles = [f"ENTITY {i}" for i in range(num_nodes)]
+    records = {
+        title: {
+            schemas.TITLE: title,
+            schemas.NODE_DEGREE: 0,
+            schemas.NODE_DETAILS: {
+                schemas.SHORT_ID: i,
+                schemas.TITLE: title,
+                schemas.DESCRIPTION: sentence(20),
+                schemas.NODE_DEGREE: 0,
+            },
+            schemas.EDGE_DETAILS: [],
+            schemas.CLAIM_DETAILS: [
+                {
+                    schemas.SHORT_ID: i,
+                    schemas.CLAIM_SUBJECT: title,
+                    schemas.TYPE: "FINDING",
+                    schemas.CLAIM_STATUS: "TRUE",
+                    schemas.DESCRIPTION: sentence(15),
+                }
+            ]
+            if rng.random() < claim_ratio
+            else [],
+        }
+        for i, title in enumerate(titles)
+    }
+    for edge_id in range(num_edges):
+        source, target = rng.sample(titles, 2)
+        edge = {
+            schemas.SHORT_ID: edge_id,
+            schemas.EDGE_SOURCE: source,
+            schemas.EDGE_TARGET: target,
+            schemas.DESCRIPTION: sentence(12),
+            schemas.EDGE_DEGREE: rng.randint(2, 200),
+        }
+        # edges are listed on both endpoints, as in the indexing context
+        records[source][schemas.EDGE_DETAILS].append(edge)
+        records[target][schemas.EDGE_DETAILS].append(edge)
+    return list(records.values())
+
+
+def legacy_sort_context(
+    local_context: list[dict],
+    tokenizer: Tokenizer,
+    max_context_tokens: int | None = None,
+) -> str:
+    """Re-render and re-tokenize the full context after every edge."""
+    edges = [
+        {**e, schemas.SHORT_ID: int(e[schemas.SHORT_ID])}
+        for record in local_context
+        for e in record.get(schemas.EDGE_DETAILS, [])
+        if isinstance(e, dict)
+    ]
+    node_details = {
+        record[schemas.TITLE]: record[schemas.NODE_DETAILS] for record in local_context
+    }
+    claim_details = {
+        record[schemas.TITLE]: record[schemas.CLAIM_DETAILS] for record in local_context
+    }
+    edges.sort(
+        key=lambda x: (-x.get(schemas.EDGE_DEGREE, 0), x.get(schemas.SHORT_ID, ""))
+    )
+
+    edge_ids, nodes_ids, claims_ids = set(), set(), set()
+    sorted_edges, sorted_nodes, sorted_claims = [], [], []
+    context_string = ""
+    for edge in edges:
+        source, target = edge[schemas.EDGE_SOURCE], edge[schemas.EDGE_TARGET]
+        for node in [node_details.get(source), node_details.get(target)]:
+            if node and node[schemas.SHORT_ID] not in nodes_ids:
+                nodes_ids.add(node[schemas.SHORT_ID])
+                sorted_nodes.append(node)
+        for claims in [claim_details.get(source), claim_details.get(target)]:
+            for claim in claims or []:
+                if claim[schemas.SHORT_ID] not in claims_ids:
+                    claims_ids.add(claim[schemas.SHORT_ID])
+                    sorted_claims.append(claim)
+        if edge[schemas.SHORT_ID] not in edge_ids:
+            edge_ids.add(edge[schemas.SHORT_ID])
+            sorted_edges.append(edge)
+        new_context_string = _get_context_string(
+            sorted_nodes, sorted_edges, sorted_claims
+        )
+        if (
+            max_context_tokens
+            and tokenizer.num_tokens(new_context_string) > max_context_tokens
+        ):
+            break
+        context_string = new_context_string
+    return context_string or _get_context_string(
+        sorted_nodes, sorted_edges, sorted_claims
+    )
+
+
+def _timed(fn, *args, **kwargs) -> tuple[str, float]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=10_000)
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--claim-ratio", type=float, default=0.2)
+    parser.add_argument(
+        "--max-context-tokens",
+        type=int,
+        nargs="+",
+        default=[8_000, 32_000, 128_000],
+    )
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="Only time the incremental builder (the legacy path is quadratic).",
+    )
+    args = parser.parse_args()
+
+    tokenizer = get_tokenizer()
+    local_context = synthetic_community(args.edges, args.nodes, args.claim_ratio)
+    print(
+        f"community: {args.edges} edges, {args.nodes} nodes, "
+        f"claim ratio {args.claim_ratio}"
+    )
+    print(
+        f"{'budget':>10} {'tokens':>8} {'legacy s':>10} {'builder s':>10} {'speedup':>8}"
+    )
+    for max_context_tokens in args.max_context_tokens:
+        result, builder_time = _timed(
+            sort_context,
+            local_context,
+            tokenizer,
+            max_context_tokens=max_context_tokens,
+        )
+        legacy_time = float("nan")
+        if not args.skip_legacy:
+            expected, legacy_time = _timed(
+                legacy_sort_context, local_context, tokenizer, max_context_tokens
+            )
+            if expected != result:
+                msg = f"context mismatch at budget {max_context_tokens}"
+                raise AssertionError(msg)
+        print(
+            f"{max_context_tokens:>10} {tokenizer.num_tokens(result):>8} "
+            f"{legacy_time:>10.2f} {builder_time:>10.2f} "
+            f"{legacy_time / builder_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
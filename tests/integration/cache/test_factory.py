@@ -14,6 +14,7 @@ from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
 from graphrag.config.enums import CacheType
 
 # cspell:disable-next-line well-known-key
@@ -40,6 +41,13 @@ def test_create_file_cache():
     assert isinstance(cache, JsonPipelineCache)
 
 
+def test_create_sqlite_cache(tmp_path):
+    kwargs = {"root_dir": str(tmp_path), "base_dir": "testcache"}
+    cache = CacheFactory.create_cache(CacheType.sqlite.value, kwargs)
+    assert isinstance(cache, SQLitePipelineCache)
+    assert (tmp_path / "testcache" / "cache.sqlite").exists()
+
+
 def test_create_blob_cache():
     kwargs = {
         "connection_string": WELL_KNOWN_BLOB_STORAGE_KEY,
@@ -48,6 +48,19 @@ async def test_get_creation_date():
     assert parsed_datetime.strftime(datetime_format) == creation_date
 
 
+async def test_get_fingerprint(tmp_path):
+    storage = FilePipelineStorage(base_dir=str(tmp_path))
+    assert await storage.get_fingerprint("test.txt") is None
+
+    await storage.set("test.txt", "Hello, World!", encoding="utf-8")
+    fingerprint = await storage.get_fingerprint("test.txt")
+    assert fingerprint is not None
+    assert await storage.get_fingerprint("test.txt") == fingerprint
+
+    await storage.set("test.txt", "Hello, World, again!", encoding="utf-8")
+    assert await storage.get_fingerprint("test.txt") != fingerprint
+
+
 async def test_child():
     storage = FilePipelineStorage()
     storage = storage.child("tests/fixtures/text/input")
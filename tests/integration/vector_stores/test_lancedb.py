@@ -10,6 +10,7 @@ import numpy as np
 import pytest
 
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.utils.api import MultiVectorStore
 from graphrag.vector_stores.base import VectorStoreDocument
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
 
@@ -262,3 +263,154 @@ class TestLanceDBVectorStore:
             assert non_existent.vector is None
         finally:
             shutil.rmtree(temp_dir)
+
+    async def test_async_similarity_search(self, sample_documents):
+        """Test the async search path with LanceDB."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="async_collection", vector_size=5
+                )
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(sample_documents[:2])
+
+            results = await vector_store.asimilarity_search_by_vector(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=2
+            )
+            expected = vector_store.similarity_search_by_vector(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=2
+            )
+            assert [r.document.id for r in results] == [r.document.id for r in expected]
+            assert [r.score for r in results] == [r.score for r in expected]
+            assert results[0].document.vector is None
+            assert results[0].document.attributes == {
+                "title": "Doc 1",
+                "category": "test",
+            }
+
+            results = await vector_store.asimilarity_search_by_vector(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=1, include_vectors=True
+            )
+            assert np.allclose(results[0].document.vector, [0.1, 0.2, 0.3, 0.4, 0.5])
+
+            # appended documents and filters are picked up by the async client
+            vector_store.load_documents([sample_documents[2]], overwrite=False)
+            vector_store.filter_by_id(["3"])
+
+            async def mock_embedder(text: str) -> list[float]:  # noqa: RUF029
+                return [0.1, 0.2, 0.3, 0.4, 0.5]
+
+            text_results = await vector_store.asimilarity_search_by_text(
+                "test query", mock_embedder, k=2
+            )
+            assert [r.document.id for r in text_results] == ["3"]
+
+            table = await vector_store.asimilarity_search_arrow(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=2
+            )
+            assert vector_store.vector_field not in table.column_names
+            assert "_distance" in table.column_names
+        finally:
+            shutil.rmtree(temp_dir)
+
+    async def test_similarity_search_batch(self, sample_documents):
+        """Test multi-query search with LanceDB and through a MultiVectorStore."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            stores = []
+            for index_name in ["batch_a", "batch_b"]:
+                vector_store = LanceDBVectorStore(
+                    vector_store_schema_config=VectorStoreSchemaConfig(
+                        index_name=index_name, vector_size=5
+                    )
+                )
+                vector_store.connect(db_uri=temp_dir)
+                vector_store.load_documents(sample_documents)
+                stores.append(vector_store)
+            vector_store = stores[0]
+
+            queries = [[0.3, 0.4, 0.5, 0.6, 0.7], [0.1, 0.2, 0.3, 0.4, 0.5]]
+            expected = [
+                [
+                    r.document.id
+                    for r in vector_store.similarity_search_by_vector(q, k=2)
+                ]
+                for q in queries
+            ]
+            results = vector_store.similarity_search_batch(queries, k=2)
+            assert [[r.document.id for r in hits] for hits in results] == expected
+            results = await vector_store.asimilarity_search_batch(queries, k=2)
+            assert [[r.document.id for r in hits] for hits in results] == expected
+            assert vector_store.similarity_search_batch([], k=2) == []
+
+            multi_store = MultiVectorStore(stores, ["a", "b"])
+            results = multi_store.similarity_search_batch(queries, k=2)
+            assert [
+                {r.document.id.split("-")[0] for r in hits} for hits in results
+            ] == [{expected[0][0]}, {expected[1][0]}]
+            assert {r.document.id for r in results[0]} == {
+                f"{expected[0][0]}-a",
+                f"{expected[0][0]}-b",
+            }
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @pytest.mark.parametrize(
+        ("index_type", "index_kwargs"),
+        [
+            ("ivf_pq", {"index_num_partitions": 2, "index_num_sub_vectors": 4}),
+            ("ivf_hnsw_sq", {"index_num_partitions": 2}),
+        ],
+    )
+    def test_build_index(self, index_type, index_kwargs):
+        """Test building the configured ANN index once after loading."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            rng = np.random.default_rng(42)
+            documents = [
+                VectorStoreDocument(
+                    id=str(i), text=f"doc {i}", vector=rng.random(16).tolist()
+                )
+                for i in range(300)
+            ]
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="indexed", vector_size=16
+                ),
+                index_type=index_type,
+                index_min_rows=300,
+                index_nprobes=2,
+                **index_kwargs,
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(documents[:200])
+            vector_store.load_documents(documents[200:], overwrite=False)
+            assert vector_store.document_collection.list_indices() == []
+
+            vector_store.build_index()
+            indices = vector_store.document_collection.list_indices()
+            assert len(indices) == 1
+            assert indices[0].index_type.lower() == index_type.replace("_", "")
+
+            results = vector_store.similarity_search_by_vector(documents[7].vector, k=3)
+            assert len(results) == 3
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_build_index_below_threshold(self, sample_documents):
+        """Test that small tables are left without an index."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="small", vector_size=5
+                ),
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(sample_documents)
+            vector_store.build_index()
+            assert vector_store.document_collection.list_indices() == []
+        finally:
+            shutil.rmtree(temp_dir)
@@ -0,0 +1,108 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sentence_transformers")
+
+from apps.local_embedding_server import server
+from apps.local_embedding_server.server import (
+    EmbeddingCache,
+    MicroBatcher,
+)
+
+
+class _Model:
+    """Encodes each text as its length, recording the size of every batch."""
+
+    def __init__(self):
+        self.batches: list[int] = []
+
+    def encode(self, texts: list[str], **_kwargs) -> np.ndarray:
+        self.batches.append(len(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def model(monkeypatch) -> _Model:
+    model = _Model()
+    monkeypatch.setattr(server, "get_model", lambda _model_id: model)
+    return model
+
+
+async def test_micro_batcher_merges_concurrent_requests(model):
+    batcher = MicroBatcher("model", max_batch_size=4, max_wait=0.1)
+
+    results = await asyncio.gather(
+        batcher.encode(["a"]), batcher.encode(["bb", "ccc"]), batcher.encode(["dddd"])
+    )
+
+    assert model.batches == [4]
+    assert [result[:, 0].tolist() for result in results] == [[1], [2, 3], [4]]
+    assert batcher.snapshot()["batches"] == 1
+
+
+async def test_micro_batcher_flushes_full_batches(model):
+    batcher = MicroBatcher("model", max_batch_size=2, max_wait=0.1)
+
+    results = await asyncio.gather(
+        batcher.encode(["aa", "b"]), batcher.encode(["ccc"]), batcher.encode(["d"])
+    )
+
+    assert model.batches == [2, 2]
+    assert [result[:, 0].tolist() for result in results] == [[2, 1], [3], [1]]
+
+
+async def test_micro_batcher_encodes_cache_misses_only(model):
+    cache = EmbeddingCache("model", max_entries=10, directory=None, dim=2)
+    batcher = MicroBatcher("model", max_batch_size=4, max_wait=0, cache=cache)
+
+    await batcher.encode(["a", "bb"])
+    result = await batcher.encode([" bb", "ccc", "a"])
+
+    assert model.batches == [2, 1]
+    assert result[:, 0].tolist() == [2, 3, 1]
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = EmbeddingCache("model", max_entries=2, directory=None, dim=2)
+    keys = [cache.key(text) for text in ["a", "b", "c"]]
+    vectors = np.eye(3, 2, dtype=np.float32)
+
+    cache.put_many(keys[:2], vectors[:2])
+    assert cache.get(keys[0]) is not None
+    cache.put_many(keys[2:], vectors[2:])
+
+    assert cache.get(keys[1]) is None
+    np.testing.assert_array_equal(cache.get(keys[0]), vectors[0])
+    np.testing.assert_array_equal(cache.get(keys[2]), vectors[2])
+    assert cache.snapshot()["memory_entries"] == 2
+
+
+def test_embedding_cache_disk_round_trip(tmp_path):
+    cache = EmbeddingCache("model", max_entries=0, directory=str(tmp_path), dim=2)
+    keys = [cache.key(text) for text in ["a", "b"]]
+    vectors = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+    cache.put_many(keys, vectors)
+
+    reopened = EmbeddingCache("model", max_entries=0, directory=str(tmp_path), dim=2)
+
+    np.testing.assert_array_equal(reopened.get(keys[1]), vectors[1])
+    np.testing.assert_array_equal(reopened.get(keys[0]), vectors[0])
+    assert reopened.get(reopened.key("c")) is None
+    assert reopened.snapshot()["disk_entries"] == 2
+    assert reopened.snapshot()["memory_entries"] == 0
+
+
+def test_embeddings_body_reports_usage():
+    vectors = np.array([[0.5, 0.25]], dtype=np.float32)
+
+    body = json.loads(server._embeddings_body(vectors, "model", "float", 7))  # noqa: SLF001
+
+    assert body["data"][0]["embedding"] == [0.5, 0.25]
+    assert body["usage"] == {"prompt_tokens": 7, "total_tokens": 7}
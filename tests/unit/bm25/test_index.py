@@ -0,0 +1,113 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import math
+import random
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from graphrag.bm25.analysis import analyze
+from graphrag.bm25.index import BM25Index, load_bm25_index
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import write_table_to_storage
+
+WORDS = [
+    "Bank",
+    "Banken",
+    "Risiko",
+    "Risiken",
+    "Meldewesen",
+    "Aufsicht",
+    "Häuser",
+    "Haus",
+    "Daten",
+    "Straße",
+    "239",
+    "Kapital",
+]
+
+
+def _corpus(num_documents: int = 200, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 30)))
+        for _ in range(num_documents)
+    ]
+
+
+def _reference_scores(texts: list[str], query: str, k1=1.2, b=0.75):
+    """Score every document with a direct transcription of the BM25 formula."""
+    documents = [Counter(analyze(text)) for text in texts]
+    lengths = [sum(counts.values()) for counts in documents]
+    average_length = sum(lengths) / len(lengths)
+    scores = {}
+    for position, counts in enumerate(documents):
+        score = 0.0
+        for term in set(analyze(query)):
+            frequency = counts[term]
+            if not frequency:
+                continue
+            df = sum(1 for other in documents if term in other)
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            norm = k1 * (1 - b + b * lengths[position] / average_length)
+            score += idf * frequency * (k1 + 1) / (frequency + norm)
+        if score:
+            scores[str(position)] = score
+    return scores
+
+
+def test_analyze_folds_german_inflections():
+    assert analyze("Die Häuser des Hauses") == analyze("haus haus")
+    assert analyze("Straße") == analyze("STRASSE")
+    assert analyze("BCBS-239 und die Bank") == ["bcb", "239", "bank"]
+    assert analyze("der die das und") == []
+
+
+@pytest.mark.parametrize("query", ["Banken Risiko", "Häuser 239", "Aufsicht", "nichts"])
+def test_search_matches_the_bm25_formula(query):
+    texts = _corpus()
+    index = BM25Index.from_texts([str(i) for i in range(len(texts))], texts)
+
+    expected = _reference_scores(texts, query)
+    results = index.search(query, k=10)
+    assert len(results) == min(10, len(expected))
+    for id, score in results:
+        assert score == pytest.approx(expected[id])
+    # best first, and nothing left out scores higher than the last result
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    if results:
+        kept = {id for id, _ in results}
+        assert all(
+            score <= scores[-1] + 1e-9
+            for id, score in expected.items()
+            if id not in kept
+        )
+
+
+async def test_index_round_trips_through_storage():
+    storage = MemoryPipelineStorage()
+    assert await load_bm25_index("text_units", storage) is None
+
+    texts = _corpus()
+    index = BM25Index.from_texts([f"unit{i}" for i in range(len(texts))], texts)
+    other = BM25Index.from_texts(["entity"], ["Bank Aufsicht"])
+    postings, documents = index.to_tables("text_units")
+    other_postings, other_documents = other.to_tables("entities")
+    await write_table_to_storage(
+        pd.concat([postings, other_postings]), "bm25_postings", storage
+    )
+    await write_table_to_storage(
+        pd.concat([documents, other_documents]), "bm25_documents", storage
+    )
+
+    loaded = await load_bm25_index("text_units", storage)
+    assert loaded is not None
+    assert loaded.ids == index.ids
+    assert (loaded.positions == index.positions).all()
+    assert loaded.search("Bank Haus", k=20) == index.search("Bank Haus", k=20)
+    entities = await load_bm25_index("entities", storage)
+    assert entities is not None
+    assert entities.search("Banken") == [("entity", pytest.approx(0.2876821))]
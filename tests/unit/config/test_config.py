@@ -13,6 +13,7 @@ from graphrag.config.create_graphrag_config import create_graphrag_config
 from graphrag.config.enums import AuthType, ModelType
 from graphrag.config.load_config import load_config
 from tests.unit.config.utils import (
+    DEFAULT_CHAT_MODEL_CONFIG,
     DEFAULT_EMBEDDING_MODEL_CONFIG,
     DEFAULT_MODEL_CONFIG,
     FAKE_API_KEY,
@@ -133,6 +134,20 @@ def test_missing_azure_api_version() -> None:
         })
 
 
+def test_process_async_mode_for_models() -> None:
+    model_config = {
+        defs.DEFAULT_CHAT_MODEL_ID: {
+            **DEFAULT_CHAT_MODEL_CONFIG,
+            "async_mode": "process",
+        },
+        defs.DEFAULT_EMBEDDING_MODEL_ID: DEFAULT_EMBEDDING_MODEL_CONFIG,
+    }
+
+    # language model calls only run as asyncio tasks or threads
+    with pytest.raises(ValidationError, match="async_mode"):
+        create_graphrag_config({"models": model_config})
+
+
 def test_default_config() -> None:
     expected = get_default_graphrag_config()
     actual = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
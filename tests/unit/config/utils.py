@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 import graphrag.config.defaults as defs
 from graphrag.config.models.basic_search_config import BasicSearchConfig
+from graphrag.config.models.bm25_index_config import BM25IndexConfig
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
@@ -94,6 +95,8 @@ def assert_language_model_configs(
     assert actual.max_retries == expected.max_retries
     assert actual.max_retry_wait == expected.max_retry_wait
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.adaptive_concurrency == expected.adaptive_concurrency
+    assert actual.max_concurrent_requests == expected.max_concurrent_requests
     assert actual.async_mode == expected.async_mode
     if actual.responses is not None:
         assert expected.responses is not None
@@ -124,6 +127,11 @@ def assert_vector_store_configs(
         assert store_a.container_name == store_e.container_name
         assert store_a.overwrite == store_e.overwrite
         assert store_a.database_name == store_e.database_name
+        assert store_a.index_type == store_e.index_type
+        assert store_a.index_min_rows == store_e.index_min_rows
+        assert store_a.index_num_partitions == store_e.index_num_partitions
+        assert store_a.index_num_sub_vectors == store_e.index_num_sub_vectors
+        assert store_a.index_nprobes == store_e.index_nprobes
 
 
 def assert_reporting_configs(
@@ -163,6 +171,10 @@ def assert_cache_configs(actual: CacheConfig, expected: CacheConfig) -> None:
     assert actual.container_name == expected.container_name
     assert actual.storage_account_blob_url == expected.storage_account_blob_url
     assert actual.cosmosdb_account_url == expected.cosmosdb_account_url
+    assert actual.compression == expected.compression
+    assert actual.memory_max_entries == expected.memory_max_entries
+    assert actual.memory_max_bytes == expected.memory_max_bytes
+    assert actual.memory_ttl == expected.memory_ttl
 
 
 def assert_input_configs(actual: InputConfig, expected: InputConfig) -> None:
@@ -255,6 +267,8 @@ def assert_extract_graph_nlp_configs(
     assert actual.normalize_edge_weights == expected.normalize_edge_weights
     assert_text_analyzer_configs(actual.text_analyzer, expected.text_analyzer)
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.async_mode == expected.async_mode
+    assert actual.batch_size == expected.batch_size
 
 
 def assert_prune_graph_configs(
@@ -274,6 +288,7 @@ def assert_summarize_descriptions_configs(
 ) -> None:
     assert actual.prompt == expected.prompt
     assert actual.max_length == expected.max_length
+    assert actual.mode == expected.mode
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -306,12 +321,19 @@ def assert_cluster_graph_configs(
     assert actual.max_cluster_size == expected.max_cluster_size
     assert actual.use_lcc == expected.use_lcc
     assert actual.seed == expected.seed
+    assert actual.incremental == expected.incremental
 
 
 def assert_umap_configs(actual: UmapConfig, expected: UmapConfig) -> None:
     assert actual.enabled == expected.enabled
 
 
+def assert_bm25_index_configs(
+    actual: BM25IndexConfig, expected: BM25IndexConfig
+) -> None:
+    assert actual.enabled == expected.enabled
+
+
 def assert_local_search_configs(
     actual: LocalSearchConfig, expected: LocalSearchConfig
 ) -> None:
@@ -324,6 +346,7 @@ def assert_local_search_configs(
     assert actual.top_k_entities == expected.top_k_entities
     assert actual.top_k_relationships == expected.top_k_relationships
     assert actual.max_context_tokens == expected.max_context_tokens
+    assert actual.hybrid_search == expected.hybrid_search
 
 
 def assert_global_search_configs(
@@ -381,10 +404,15 @@ def assert_basic_search_configs(
 ) -> None:
     assert actual.prompt == expected.prompt
     assert actual.k == expected.k
+    assert actual.hybrid_search == expected.hybrid_search
 
 
 def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) -> None:
     assert actual.root_dir == expected.root_dir
+    assert actual.workflows == expected.workflows
+    assert actual.concurrent_workflows == expected.concurrent_workflows
+    assert actual.concurrent_llm_requests == expected.concurrent_llm_requests
+    assert actual.write_manifest == expected.write_manifest
 
     a_keys = sorted(actual.models.keys())
     e_keys = sorted(expected.models.keys())
@@ -429,6 +457,7 @@ def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) ->
     assert_prune_graph_configs(actual.prune_graph, expected.prune_graph)
     assert_cluster_graph_configs(actual.cluster_graph, expected.cluster_graph)
     assert_umap_configs(actual.umap, expected.umap)
+    assert_bm25_index_configs(actual.bm25_index, expected.bm25_index)
     assert_local_search_configs(actual.local_search, expected.local_search)
     assert_global_search_configs(actual.global_search, expected.global_search)
     assert_drift_search_configs(actual.drift_search, expected.drift_search)
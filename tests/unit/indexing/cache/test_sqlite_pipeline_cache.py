@@ -0,0 +1,111 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+
+import pytest
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+async def test_get_set_roundtrip(tmp_path):
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+
+    await cache.set("key", {"response": ["a", "b"]}, {"input": "prompt"})
+    await cache.set("none", None)
+
+    assert await cache.get("key") == {"response": ["a", "b"]}
+    assert await cache.has("key")
+    assert await cache.get("missing") is None
+    assert not await cache.has("none")
+
+    await cache.delete("key")
+    assert not await cache.has("key")
+
+
+async def test_batched_get_set(tmp_path):
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    values = {f"key{i}": f"value{i}" for i in range(1200)}
+
+    await cache.set_many(values)
+
+    keys = ["missing", *values.keys()]
+    assert await cache.get_many(keys) == [None, *values.values()]
+
+
+async def test_children_share_the_file(tmp_path):
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    child = cache.child("extract_graph")
+    grandchild = child.child("chat")
+    sibling = cache.child("extract_graph0")
+
+    await cache.set("root", 1)
+    await child.set("key", 2)
+    await grandchild.set("key", 3)
+    await sibling.set("key", 4)
+
+    assert await child.get("key") == 2
+    assert await grandchild.get("key") == 3
+    assert cache.keys() == [
+        "extract_graph/chat/key",
+        "extract_graph/key",
+        "extract_graph0/key",
+        "root",
+    ]
+
+    await child.clear()
+    assert cache.keys() == ["extract_graph0/key", "root"]
+
+    reopened = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    assert await reopened.child("extract_graph0").get("key") == 4
+
+
+async def test_import_export_json_cache(tmp_path):
+    source = JsonPipelineCache(FilePipelineStorage(base_dir=str(tmp_path / "json")))
+    await source.set("root", "value", {"input": "äöü"})
+    await source.child("summarize").set("key", {"nested": [1, 2]})
+    (tmp_path / "json" / "broken").write_text("not json")
+
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    assert cache.import_json_dir(tmp_path / "json", batch_size=1) == 2
+    assert await cache.get("root") == "value"
+    assert await cache.child("summarize").get("key") == {"nested": [1, 2]}
+
+    assert cache.export_json_dir(tmp_path / "export") == 2
+    for name in ["root", "summarize/key"]:
+        assert (tmp_path / "export" / name).read_bytes() == (
+            tmp_path / "json" / name
+        ).read_bytes()
+    assert json.loads((tmp_path / "export" / "root").read_text())["input"] == "äöü"
+
+
+async def test_zstd_compression(tmp_path):
+    pytest.importorskip("zstandard")
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite", compression="zstd")
+
+    await cache.set("key", "x" * 10_000)
+
+    assert await cache.get("key") == "x" * 10_000
+    uncompressed = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    assert await uncompressed.get("key") == "x" * 10_000
+
+
+async def test_concurrent_get_set(tmp_path):
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    children = [cache.child(f"child{i}") for i in range(8)]
+
+    await asyncio.gather(
+        *(
+            child.set(f"key{j}", f"value{i}-{j}")
+            for i, child in enumerate(children)
+            for j in range(20)
+        )
+    )
+    values = await asyncio.gather(
+        *(child.get(f"key{j}") for child in children for j in range(20))
+    )
+
+    assert values == [f"value{i}-{j}" for i in range(8) for j in range(20)]
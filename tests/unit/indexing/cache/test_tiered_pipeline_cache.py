@@ -0,0 +1,152 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import time
+
+import pytest
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+from graphrag.config.enums import CacheType
+from graphrag.config.models.cache_config import CacheConfig
+from graphrag.utils.api import create_cache_from_config
+
+
+class CountingCache(InMemoryCache):
+    """An in-memory cache that records the calls reaching it."""
+
+    def __init__(self, name: str | None = None):
+        super().__init__(name)
+        self.gets: list[str] = []
+        self.get_manys: list[list[str]] = []
+
+    async def get(self, key: str):
+        self.gets.append(key)
+        return await super().get(key)
+
+    async def get_many(self, keys: list[str]):
+        self.get_manys.append(keys)
+        return await super().get_many(keys)
+
+    def child(self, name: str) -> "CountingCache":
+        return CountingCache(name)
+
+
+def test_requires_a_limit():
+    with pytest.raises(ValueError, match="max_entries"):
+        TieredPipelineCache(InMemoryCache())
+
+
+async def test_read_through_and_write_through():
+    backend = CountingCache()
+    await backend.set("a", {"x": 1})
+    cache = TieredPipelineCache(backend, max_entries=10)
+
+    assert await cache.get("a") == {"x": 1}
+    assert await cache.get("a") == {"x": 1}
+    assert backend.gets == ["a"]
+
+    await cache.set("b", "value")
+    assert await backend.get("b") == "value"
+    assert await cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.entries == 2
+
+
+async def test_evicts_least_recently_used_entries():
+    backend = CountingCache()
+    cache = TieredPipelineCache(backend, max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert cache.stats().evictions == 1
+    assert cache.stats().entries == 2
+    # "b" was least recently used and is read from the backend again
+    assert await cache.get("b") == 2
+    assert backend.gets == ["b"]
+
+
+async def test_byte_limit():
+    cache = TieredPipelineCache(InMemoryCache(), max_bytes=20)
+    # each value takes 12 bytes as JSON
+    await cache.set("a", "x" * 10)
+    await cache.set("b", "y" * 10)
+    assert cache.stats().evictions == 1
+    assert cache.stats().size_bytes <= 20
+
+    # values larger than the tier only live in the backend
+    await cache.set("big", "z" * 100)
+    assert cache.stats().entries == 1
+    assert await cache.get("big") == "z" * 100
+
+
+async def test_ttl_expiry(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    backend = CountingCache()
+    cache = TieredPipelineCache(backend, max_entries=10, ttl=5)
+    await cache.set("a", 1)
+    assert await cache.get("a") == 1
+    assert backend.gets == []
+
+    now += 10
+    assert await cache.get("a") == 1
+    assert backend.gets == ["a"]
+    assert cache.stats().misses == 1
+
+
+async def test_get_many_batches_misses():
+    backend = CountingCache()
+    await backend.set_many({"a": 1, "b": 2, "c": 3})
+    cache = TieredPipelineCache(backend, max_entries=10)
+    await cache.get("b")
+
+    assert await cache.get_many(["a", "b", "c", "d"]) == [1, 2, 3, None]
+    assert backend.get_manys == [["a", "c", "d"]]
+    assert await cache.get_many(["a", "c"]) == [1, 3]
+    assert len(backend.get_manys) == 1
+
+
+async def test_children_share_the_tier(tmp_path):
+    backend = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    cache = TieredPipelineCache(backend, max_entries=10)
+    child = cache.child("chat")
+    await child.set("a", 1)
+    await cache.set("a", 2)
+
+    assert await child.get("a") == 1
+    assert await cache.get("a") == 2
+    assert await backend.child("chat").get("a") == 1
+    assert cache.stats().entries == 2
+
+    await child.clear()
+    assert await child.get("a") is None
+    assert await cache.get("a") == 2
+    backend.close()
+
+
+async def test_delete():
+    cache = TieredPipelineCache(InMemoryCache(), max_entries=10)
+    await cache.set("a", 1)
+    assert await cache.has("a")
+    await cache.delete("a")
+    assert not await cache.has("a")
+    assert await cache.get("a") is None
+
+
+def test_create_cache_from_config_wraps_with_memory_tier(tmp_path):
+    config = CacheConfig(type=CacheType.file, memory_max_entries=5)
+    cache = create_cache_from_config(config, str(tmp_path))
+    assert isinstance(cache, TieredPipelineCache)
+    assert isinstance(cache.backend, JsonPipelineCache)
+
+    config = CacheConfig(type=CacheType.file)
+    assert isinstance(
+        create_cache_from_config(config, str(tmp_path)), JsonPipelineCache
+    )
@@ -4,6 +4,7 @@ import math
 import platform
 
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
+    _get_context_string,
     sort_context,
 )
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
@@ -219,3 +220,41 @@ def test_sort_context_max_tokens():
     assert ctx is not None, "Context is none"
     num = tokenizer.num_tokens(ctx)
     assert num <= 800, f"num_tokens is not less than or equal to 800: {num}"
+
+
+def _reference_sort_context(local_context, tokenizer, max_context_tokens):
+    """Re-render and re-tokenize the full context after every edge."""
+    edges = sorted(
+        (
+            {**e, "human_readable_id": int(e["human_readable_id"])}
+            for record in local_context
+            for e in record.get("edge_details", [])
+            if isinstance(e, dict)
+        ),
+        key=lambda x: (-x.get("combined_degree", 0), x.get("human_readable_id", "")),
+    )
+    nodes = {record["title"]: record["node_details"] for record in local_context}
+    edge_ids, node_ids = set(), set()
+    sorted_edges, sorted_nodes = [], []
+    context_string = ""
+    for edge in edges:
+        for node in [nodes.get(edge["source"]), nodes.get(edge["target"])]:
+            if node and node["human_readable_id"] not in node_ids:
+                node_ids.add(node["human_readable_id"])
+                sorted_nodes.append(node)
+        if edge["human_readable_id"] not in edge_ids:
+            edge_ids.add(edge["human_readable_id"])
+            sorted_edges.append(edge)
+        new_context_string = _get_context_string(sorted_nodes, sorted_edges, [])
+        if tokenizer.num_tokens(new_context_string) > max_context_tokens:
+            break
+        context_string = new_context_string
+    return context_string or _get_context_string(sorted_nodes, sorted_edges, [])
+
+
+def test_sort_context_matches_full_recount():
+    tokenizer = get_tokenizer()
+    for max_context_tokens in [10, 100, 250, 400, 600, 800, 826, 827, 5000]:
+        assert sort_context(
+            context, tokenizer=tokenizer, max_context_tokens=max_context_tokens
+        ) == _reference_sort_context(context, tokenizer, max_context_tokens)
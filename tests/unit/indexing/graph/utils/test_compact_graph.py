@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import numpy as np
+import pandas as pd
+from graspologic.partition import hierarchical_leiden
+
+from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.compute_degree import compute_degree
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.prune_graph import prune_graph
+from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+
+EDGES = pd.DataFrame({
+    "source": ["b", "A - B", "C", "A", "b", "D", "E"],
+    "target": ["A", "A", "A", "b", "b", "C", "F"],
+    "weight": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+})
+NODES = pd.DataFrame({
+    "title": ["A", "b", "A - B", "C", "D", "E", "F", "LONELY"],
+    "frequency": [5, 1, 3, 4, 2, 8, 3, 1],
+})
+
+
+def _graphml(graph: nx.Graph) -> str:
+    return "\n".join(nx.generate_graphml(graph))
+
+
+def _networkx_graph() -> nx.Graph:
+    graph = nx.from_pandas_edgelist(EDGES, edge_attr=["weight"])
+    graph.add_nodes_from(
+        (title, {"frequency": frequency})
+        for title, frequency in zip(NODES["title"], NODES["frequency"], strict=True)
+    )
+    return graph
+
+
+def test_create_graph_matches_networkx():
+    graph = create_graph(EDGES, edge_attr=["weight"], nodes=NODES)
+    expected = _networkx_graph()
+
+    # the reversed duplicate keeps its first position with the last weight
+    assert graph.num_edges == 6
+    assert _graphml(graph.to_networkx()) == _graphml(expected)
+    assert graph.edge_list() == list(expected.edges(data="weight"))
+    assert "title" in NODES.columns
+
+
+def test_compute_degree_matches_networkx():
+    graph = create_graph(EDGES, edge_attr=["weight"], nodes=NODES)
+    degrees = compute_degree(graph)
+    assert dict(zip(degrees["title"], degrees["degree"], strict=True)) == dict(
+        _networkx_graph().degree
+    )
+
+
+def test_prune_graph():
+    graph = create_graph(EDGES, edge_attr=["weight"], nodes=NODES)
+
+    pruned = prune_graph(graph, min_node_freq=2, min_edge_weight_pct=50)
+    # b is too infrequent, LONELY has no edges and the lower half of the weights go
+    assert pruned.titles.tolist() == ["A", "A - B", "C", "D", "E", "F"]
+    assert pruned.edge_list() == [("C", "D", 6.0), ("E", "F", 7.0)]
+
+    lcc = prune_graph(graph, min_edge_weight_pct=0, lcc_only=True)
+    assert lcc.titles.tolist() == ["b", "A", "A - B", "C", "D"]
+
+    # b ties with A for the highest degree, its self-loop counting twice
+    ego = prune_graph(graph, min_edge_weight_pct=0, remove_ego_nodes=True)
+    assert "b" not in ego.titles.tolist()
+    assert ego.num_edges == 4
+
+
+def test_stable_largest_connected_component_matches_networkx():
+    graph = create_graph(EDGES, edge_attr=["weight"], nodes=NODES)
+    stable = stable_largest_connected_component(graph)
+
+    # lower-cased "b" merges into "B", the edge to "A" keeping the last weight
+    expected = stable_largest_connected_component(_networkx_graph())
+    assert stable.titles.tolist() == ["A", "A - B", "B", "C", "D"]
+    assert _graphml(stable.to_networkx()) == _graphml(expected)
+    assert stable.edge_list() == list(expected.edges(data="weight"))
+
+
+def test_cluster_graph_matches_networkx_input():
+    rng = np.random.default_rng(7)
+    sources = rng.integers(0, 40, 150)
+    targets = (sources + rng.integers(1, 5, 150)) % 40
+    edges = pd.DataFrame({
+        "source": [f"N{i}" for i in sources],
+        "target": [f"N{i}" for i in targets],
+        "weight": rng.random(150),
+    })
+    graph = create_graph(edges, edge_attr=["weight"])
+
+    for use_lcc in (False, True):
+        clusters = cluster_graph(graph, 5, use_lcc, seed=0xDEADBEEF)
+        # hierarchical_leiden on the equivalent networkx graph
+        networkx_graph = graph.to_networkx()
+        if use_lcc:
+            networkx_graph = stable_largest_connected_component(networkx_graph)
+        expected = _group(
+            hierarchical_leiden(
+                networkx_graph, max_cluster_size=5, random_seed=0xDEADBEEF
+            )
+        )
+        assert len(clusters) > 0
+        assert sorted(
+            (level, community, sorted(nodes)) for level, community, _, nodes in clusters
+        ) == sorted(expected)
+
+
+def _group(partitions) -> list[tuple[int, int, list[str]]]:
+    groups: dict[tuple[int, int], list[str]] = {}
+    for partition in partitions:
+        groups.setdefault((partition.level, partition.cluster), []).append(
+            partition.node
+        )
+    return [
+        (level, community, sorted(nodes))
+        for (level, community), nodes in groups.items()
+    ]
@@ -0,0 +1,176 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+import spacy
+
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import AsyncType
+from graphrag.index.operations.build_noun_graph.build_noun_graph import (
+    _extract_edges,
+    _extract_nodes,
+)
+from graphrag.index.operations.build_noun_graph.np_extractors.base import (
+    BaseNounPhraseExtractor,
+)
+from graphrag.index.operations.build_noun_graph.np_extractors.cfg_extractor import (
+    CFGNounPhraseExtractor,
+)
+from graphrag.index.utils.graphs import calculate_pmi_edge_weights
+
+TEXTS = [
+    "Anna Schmidt sells apple pie in Berlin",
+    "",
+    "the Berlin market opens early",
+    "Anna Schmidt",
+]
+
+
+class WordExtractor(BaseNounPhraseExtractor):
+    """Treats every capitalized word as a noun phrase and records the batches."""
+
+    def __init__(self):
+        super().__init__(model_name=None)
+        self.batches: list[list[str]] = []
+
+    def extract(self, text: str) -> list[str]:
+        return [word.upper() for word in text.split() if word.istitle()]
+
+    def extract_batch(self, texts, batch_size=1000, n_process=1, on_parsed=None):
+        self.batches.append(list(texts))
+        return super().extract_batch(
+            texts, batch_size=batch_size, n_process=n_process, on_parsed=on_parsed
+        )
+
+    def __str__(self) -> str:
+        return "words"
+
+
+def _tagging_pipeline(*_args, **_kwargs) -> spacy.language.Language:
+    # a blank pipeline tagging titles as proper nouns and other words as nouns
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("attribute_ruler")
+    ruler.add([[{"IS_TITLE": True}]], {"POS": "PROPN"})  # type: ignore
+    ruler.add([[{"IS_ALPHA": True, "IS_TITLE": False}]], {"POS": "NOUN"})  # type: ignore
+    return nlp
+
+
+def test_cfg_extract_batch_matches_extract(monkeypatch):
+    monkeypatch.setattr(
+        BaseNounPhraseExtractor, "load_spacy_model", staticmethod(_tagging_pipeline)
+    )
+    defaults = graphrag_config_defaults.extract_graph_nlp.text_analyzer
+    extractor = CFGNounPhraseExtractor(
+        model_name="blank",
+        max_word_length=defaults.max_word_length,
+        include_named_entities=False,
+        exclude_entity_tags=[],
+        exclude_pos_tags=defaults.exclude_pos_tags,
+        exclude_nouns=[],
+        word_delimiter=defaults.word_delimiter,
+        noun_phrase_grammars=defaults.noun_phrase_grammars,
+        noun_phrase_tags=defaults.noun_phrase_tags,
+    )
+
+    expected = [extractor.extract(text) for text in TEXTS]
+    assert {"ANNA", "BERLIN"} <= set(expected[0])
+    assert extractor.extract_batch(TEXTS, batch_size=2) == expected
+
+
+def test_default_extract_batch_in_processes():
+    extractor = WordExtractor()
+    parsed = []
+    assert extractor.extract_batch(
+        TEXTS, batch_size=3, n_process=2, on_parsed=parsed.append
+    ) == [extractor.extract(text) for text in TEXTS]
+    assert parsed == [3, 1]
+
+
+async def test_extract_nodes_parses_only_uncached_texts(tmp_path):
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    extractor = WordExtractor()
+    text_units = pd.DataFrame({"id": ["1", "2", "3"], "text": TEXTS[:3]})
+    nodes = await _extract_nodes(text_units.copy(), extractor, cache=cache)
+
+    assert extractor.batches == [TEXTS[:3]]
+    assert nodes["title"].tolist() == ["ANNA", "BERLIN", "SCHMIDT"]
+    assert nodes["text_unit_ids"].tolist() == [["1"], ["1", "3"], ["1"]]
+
+    # empty results are cached as well, only the new text is parsed
+    text_units = pd.DataFrame({"id": ["1", "2", "3", "4"], "text": TEXTS})
+    rerun = await _extract_nodes(
+        text_units, extractor, num_threads=2, async_mode=AsyncType.Process, cache=cache
+    )
+    assert extractor.batches == [TEXTS[:3], [TEXTS[3]]]
+    assert rerun["frequency"].tolist() == [2, 2, 2]
+    cache.close()
+
+
+async def test_extract_nodes_reports_progress():
+    callbacks = NoopWorkflowCallbacks()
+    completed = []
+    callbacks.progress = lambda progress: completed.append(progress.completed_items)
+    text_units = pd.DataFrame({"id": ["1", "2", "3", "4"], "text": TEXTS})
+
+    await _extract_nodes(text_units, WordExtractor(), batch_size=3, callbacks=callbacks)
+
+    # after every parsed batch, then once when done
+    assert completed == [3, 4, 4]
+
+
+def _nodes(text_unit_ids: dict[str, list[str]]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "title": list(text_unit_ids),
+        "frequency": [len(ids) for ids in text_unit_ids.values()],
+        "text_unit_ids": list(text_unit_ids.values()),
+    })
+
+
+def test_extract_edges_counts_cooccurrences():
+    # titles out of order, the edges are still oriented and sorted by title
+    nodes = _nodes({
+        "C": ["2", "1"],
+        "A": ["1", "2", "3"],
+        "B": ["1"],
+        "D": ["4"],
+    })
+    edges = _extract_edges(nodes, normalize_edge_weights=False)
+
+    expected = pd.DataFrame({
+        "source": ["A", "A", "B"],
+        "target": ["B", "C", "C"],
+        "weight": [1, 2, 1],
+        "text_unit_ids": [["1"], ["1", "2"], ["1"]],
+    })
+    pd.testing.assert_frame_equal(edges, expected)
+
+    weights_only = _extract_edges(
+        nodes, normalize_edge_weights=False, include_text_unit_ids=False
+    )
+    pd.testing.assert_frame_equal(weights_only, expected.drop(columns="text_unit_ids"))
+
+    normalized = _extract_edges(nodes)
+    pd.testing.assert_frame_equal(
+        normalized, calculate_pmi_edge_weights(nodes, expected)
+    )
+
+
+def test_extract_edges_repeated_text_units():
+    # a phrase listed twice in a text unit forms a pair with itself, like combinations
+    edges = _extract_edges(
+        _nodes({"A": ["1", "1"], "B": ["1", "2"], "C": ["2"]}),
+        normalize_edge_weights=False,
+    )
+    assert edges.to_dict("list") == {
+        "source": ["A", "A", "B"],
+        "target": ["A", "B", "C"],
+        "weight": [1, 2, 1],
+        "text_unit_ids": [["1"], ["1", "1"], ["2"]],
+    }
+
+
+def test_extract_edges_without_cooccurrences():
+    edges = _extract_edges(_nodes({"A": ["1"], "B": ["2"]}))
+    assert edges.empty
+    assert list(edges.columns) == ["source", "target", "weight", "text_unit_ids"]
@@ -0,0 +1,163 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import time
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import graphrag.index.operations.embed_text.embed_text as embed_text_module
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.data_model.types import TextEmbedder
+from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+
+class RecordingVectorStore(BaseVectorStore):
+    """A vector store that records writes and takes a while to load each batch."""
+
+    def __init__(self, events: list[tuple[str, int, float]], fail: bool = False):
+        super().__init__(vector_store_schema_config=VectorStoreSchemaConfig())
+        self.events = events
+        self.fail = fail
+        self.loads: list[tuple[list[str], bool]] = []
+        self.indexed = False
+
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        if self.fail:
+            msg = "write failed"
+            raise RuntimeError(msg)
+        batch = len(self.loads)
+        self.events.append(("write_start", batch, time.perf_counter()))
+        time.sleep(0.05)
+        self.loads.append(([str(document.id) for document in documents], overwrite))
+        self.events.append(("write_end", batch, time.perf_counter()))
+
+    def build_index(self) -> None:
+        self.indexed = True
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        raise NotImplementedError
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        raise NotImplementedError
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        raise NotImplementedError
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        raise NotImplementedError
+
+
+class MetricsCallbacks(NoopWorkflowCallbacks):
+    def __init__(self):
+        self.reported: dict[str, dict[str, float]] = {}
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        self.reported[name] = values
+
+
+def _slow_strategy(events: list[tuple[str, int, float]], limiters: list | None = None):
+    async def run(input, callbacks, cache, args) -> TextEmbeddingResult:
+        if limiters is not None:
+            limiters.append(args["limiter"])
+        events.append(("embed_start", int(input[0]), time.perf_counter()))
+        await asyncio.sleep(0.05)
+        return TextEmbeddingResult(embeddings=[[float(text), 1.0] for text in input])
+
+    return run
+
+
+async def _run(
+    monkeypatch, vector_store, events, callbacks, rows: int = 10, limiters=None
+):
+    monkeypatch.setattr(
+        embed_text_module, "load_strategy", lambda _: _slow_strategy(events, limiters)
+    )
+    input = pd.DataFrame({"id": [f"id{i}" for i in range(rows)]})
+    input["text"] = [str(i) for i in range(rows)]
+    return await embed_text_module._text_embed_with_vector_store(  # noqa: SLF001
+        input=input,
+        callbacks=callbacks,
+        cache=InMemoryCache(),
+        embed_column="text",
+        strategy={"type": "mock", "num_threads": 3},
+        vector_store=vector_store,
+        vector_store_config={"batch_size": 2, "overwrite": True},
+    )
+
+
+async def test_embeddings_stream_into_vector_store(monkeypatch):
+    events = []
+    vector_store = RecordingVectorStore(events)
+    callbacks = MetricsCallbacks()
+    results = await _run(monkeypatch, vector_store, events, callbacks)
+
+    # embeddings keep the input order, batches are written in order
+    assert results == [[float(i), 1.0] for i in range(10)]
+    assert [ids for ids, _ in vector_store.loads] == [
+        [f"id{i}", f"id{i + 1}"] for i in range(0, 10, 2)
+    ]
+    assert [overwrite for _, overwrite in vector_store.loads] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert vector_store.indexed
+
+    # later batches are embedded while the first one is being written
+    first_write_end = next(t for e, i, t in events if e == "write_end" and i == 0)
+    later_embed_starts = [t for e, i, t in events if e == "embed_start" and i >= 4]
+    assert min(later_embed_starts) < first_write_end
+
+    metrics = callbacks.reported["embed_text"]
+    assert metrics["rows"] == 10
+    assert metrics["batches"] == 5
+    assert metrics["embed_rows_per_second"] > 0
+    assert metrics["write_rows_per_second"] > 0
+
+
+async def test_vector_store_errors_propagate(monkeypatch):
+    events = []
+    with pytest.raises(RuntimeError, match="write failed"):
+        await _run(
+            monkeypatch,
+            RecordingVectorStore(events, fail=True),
+            events,
+            NoopWorkflowCallbacks(),
+        )
+
+
+async def test_concurrent_batches_share_the_request_limit(monkeypatch):
+    events, limiters = [], []
+    await _run(
+        monkeypatch,
+        RecordingVectorStore(events),
+        events,
+        NoopWorkflowCallbacks(),
+        limiters=limiters,
+    )
+
+    # batches embedded at the same time draw on the same concurrent_requests slots
+    assert len(limiters) == 5
+    assert all(limiter is limiters[0] for limiter in limiters)
+    assert isinstance(limiters[0], asyncio.Semaphore)
+    assert limiters[0]._value == 3  # noqa: SLF001
@@ -0,0 +1,64 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import pandas as pd
+
+import graphrag.index.operations.extract_graph.extract_graph as extract_graph_module
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.sqlite_pipeline_cache import SQLitePipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.extract_graph.typing import EntityExtractionResult
+
+
+def _counting_strategy(calls: list[str]):
+    async def run(docs, entity_types, cache, args):  # noqa: RUF029
+        calls.append(docs[0].id)
+        graph = nx.Graph()
+        graph.add_node(
+            docs[0].text, type="thing", description="d", source_id=docs[0].id
+        )
+        graph.add_node("shared", type="thing", description="s", source_id=docs[0].id)
+        graph.add_edge(
+            docs[0].text, "shared", weight=1.0, description="r", source_id=docs[0].id
+        )
+        entities = [{"title": title, **data} for title, data in graph.nodes(data=True)]
+        return EntityExtractionResult(entities, nx.to_pandas_edgelist(graph), graph)
+
+    return run
+
+
+async def _extract(text_units: pd.DataFrame, cache: PipelineCache, strategy):
+    return await extract_graph_module.extract_graph(
+        text_units=text_units,
+        callbacks=NoopWorkflowCallbacks(),
+        cache=cache,
+        text_column="text",
+        id_column="id",
+        strategy=strategy,
+    )
+
+
+async def test_rows_resume_from_their_checkpoints(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        extract_graph_module, "_load_strategy", lambda _: _counting_strategy(calls)
+    )
+    cache = SQLitePipelineCache(tmp_path / "cache.sqlite")
+    text_units = pd.DataFrame({"id": ["1", "2"], "text": ["a", "b"]})
+    entities, relationships = await _extract(text_units.iloc[:1], cache, {})
+    assert calls == ["1"]
+
+    # the completed row is served from its checkpoint, the new one is extracted
+    resumed_entities, resumed_relationships = await _extract(text_units, cache, {})
+    assert calls == ["1", "2"]
+    assert sorted(resumed_entities["title"]) == ["a", "b", "shared"]
+    assert resumed_relationships["weight"].sum() == 2.0
+
+    # a different strategy config does not reuse the checkpoints
+    await _extract(text_units, cache, {"max_gleanings": 3})
+    assert calls == ["1", "2", "1", "2"]
+
+    again_entities, again_relationships = await _extract(text_units.iloc[:1], cache, {})
+    pd.testing.assert_frame_equal(again_entities, entities)
+    pd.testing.assert_frame_equal(again_relationships, relationships)
+    cache.close()
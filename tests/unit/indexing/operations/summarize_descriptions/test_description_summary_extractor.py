@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from graphrag.config.enums import SummarizeDescriptionsMode
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    SummarizeExtractor,
+)
+from graphrag.index.operations.summarize_descriptions.graph_intelligence_strategy import (
+    run_summarize_descriptions,
+)
+from graphrag.index.utils.llm_budget import set_llm_budget
+
+PROMPT = "{entity_name}|{max_length}|{description_list}"
+
+
+class _RecordingModel:
+    """Answers every prompt with a short summary and records the description lists."""
+
+    config = None
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def achat(self, prompt: str, **_kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.calls.append(json.loads(prompt.split("|", 2)[2]))
+        return SimpleNamespace(
+            output=SimpleNamespace(content=f"summary {len(self.calls)}")
+        )
+
+
+def _extractor(model: _RecordingModel, mode: SummarizeDescriptionsMode):
+    return SummarizeExtractor(
+        model_invoker=model,  # type: ignore
+        max_summary_length=50,
+        max_input_tokens=40,
+        summarization_prompt=PROMPT,
+        mode=mode,
+    )
+
+
+async def test_tree_mode_summarizes_groups_concurrently():
+    descriptions = [f"description number {i:02d}" for i in range(40)]
+    sequential, tree = _RecordingModel(), _RecordingModel()
+    await _extractor(sequential, SummarizeDescriptionsMode.sequential)(
+        "ENTITY", descriptions
+    )
+    result = await _extractor(tree, SummarizeDescriptionsMode.tree)(
+        "ENTITY", descriptions
+    )
+
+    assert sequential.max_in_flight == 1
+    assert tree.max_in_flight > 1
+    # the last call merges the partial summaries into the result
+    assert result.description == f"summary {len(tree.calls)}"
+    assert all(summary.startswith("summary") for summary in tree.calls[-1])
+    # every description goes into exactly one first-round group
+    first_round = [d for call in tree.calls for d in call if d.startswith("desc")]
+    assert sorted(first_round) == descriptions
+
+
+@pytest.mark.parametrize("mode", list(SummarizeDescriptionsMode))
+async def test_descriptions_within_budget_take_a_single_call(mode):
+    model = _RecordingModel()
+    result = await _extractor(model, mode)("ENTITY", ["b", "a", "c"])
+    assert model.calls == [["a", "b", "c"]]
+    assert result.description == "summary 1"
+
+
+async def test_tree_mode_requests_stay_within_the_limits():
+    descriptions = [f"description number {i:02d}" for i in range(40)]
+    model = _RecordingModel()
+    args = {
+        "summarize_prompt": PROMPT,
+        "max_input_tokens": 40,
+        "max_summary_length": 50,
+        "mode": SummarizeDescriptionsMode.tree,
+        "limiter": asyncio.Semaphore(3),
+    }
+    await run_summarize_descriptions(model, "ENTITY", descriptions, args)  # type: ignore
+    assert model.max_in_flight == 3
+
+    # the pipeline-wide budget applies to every group request as well
+    model = _RecordingModel()
+    set_llm_budget(asyncio.Semaphore(2))
+    try:
+        await run_summarize_descriptions(model, "ENTITY", descriptions, args)  # type: ignore
+    finally:
+        set_llm_budget(None)
+    assert model.max_in_flight == 2
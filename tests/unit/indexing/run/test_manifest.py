@@ -0,0 +1,224 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.run.manifest import (
+    PipelineManifest,
+    find_resumable_workflows,
+    hash_config,
+)
+from graphrag.index.run.run_pipeline import _run_pipeline, run_pipeline
+from graphrag.index.run.utils import create_run_context
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowFunctionOutput, WorkflowTables
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+
+def _copy(source: str, target: str, calls: list[str] | None = None):
+    """Return a workflow copying `source` to `target`, adding a column."""
+
+    async def run(_config, context):
+        if calls is not None:
+            calls.append(target)
+        table = await load_table_from_storage(source, context.output_storage)
+        table[target] = len(table.columns)
+        await write_table_to_storage(table, target, context.output_storage)
+        return WorkflowFunctionOutput(result=None)
+
+    return run
+
+
+def _chain_pipeline(calls: list[str] | None = None) -> Pipeline:
+    # each workflow name picks the config sections it is fingerprinted with
+    return Pipeline(
+        [
+            ("create_base_text_units", _copy("documents", "text_units", calls)),
+            ("create_communities", _copy("text_units", "communities", calls)),
+            ("create_community_reports", _copy("communities", "reports", calls)),
+        ],
+        tables={
+            "create_base_text_units": WorkflowTables(
+                frozenset(["documents"]), frozenset(["text_units"])
+            ),
+            "create_communities": WorkflowTables(
+                frozenset(["text_units"]), frozenset(["communities"])
+            ),
+            "create_community_reports": WorkflowTables(
+                frozenset(["communities"]), frozenset(["reports"])
+            ),
+        },
+    )
+
+
+def _config(**kwargs):
+    return create_graphrag_config({"models": DEFAULT_MODEL_CONFIG, **kwargs})
+
+
+async def _run(pipeline: Pipeline, config, storage: MemoryPipelineStorage):
+    context = create_run_context(output_storage=storage)
+    manifest = PipelineManifest(storage)
+    results = [
+        result async for result in _run_pipeline(pipeline, config, context, manifest)
+    ]
+    return results, await PipelineManifest.load(storage)
+
+
+async def _storage_with_documents() -> MemoryPipelineStorage:
+    storage = MemoryPipelineStorage()
+    await write_table_to_storage(
+        pd.DataFrame({"id": ["1", "2"], "text": ["a", "b"]}), "documents", storage
+    )
+    return storage
+
+
+async def test_manifest_records_completed_workflows():
+    storage = await _storage_with_documents()
+    config = _config()
+    _, manifest = await _run(_chain_pipeline(), config, storage)
+
+    assert list(manifest.checkpoints) == [
+        "create_base_text_units",
+        "create_communities",
+        "create_community_reports",
+    ]
+    base = manifest.checkpoints["create_base_text_units"]
+    communities = manifest.checkpoints["create_communities"]
+    assert base.config == hash_config(config, "create_base_text_units")
+    assert set(base.inputs) == {"documents"}
+    assert communities.inputs["text_units"] == base.outputs["text_units"]
+
+
+async def test_resume_restarts_at_the_first_changed_workflow():
+    storage = await _storage_with_documents()
+    config = _config()
+    _, manifest = await _run(_chain_pipeline(), config, storage)
+
+    assert await find_resumable_workflows(
+        _chain_pipeline(), config, manifest, MemoryPipelineStorage()
+    ) == ["create_base_text_units", "create_communities", "create_community_reports"]
+
+    # the community reports config is only read by the last workflow
+    changed = _config(community_reports={"max_length": 1234})
+    assert await find_resumable_workflows(
+        _chain_pipeline(), changed, manifest, MemoryPipelineStorage()
+    ) == ["create_base_text_units", "create_communities"]
+
+    # a changed clustering config invalidates the communities and everything after
+    changed = _config(cluster_graph={"max_cluster_size": 3})
+    assert await find_resumable_workflows(
+        _chain_pipeline(), changed, manifest, MemoryPipelineStorage()
+    ) == ["create_base_text_units"]
+
+    # new input documents invalidate everything
+    await write_table_to_storage(
+        pd.DataFrame({"id": ["1"], "text": ["c"]}), "documents", storage
+    )
+    assert (
+        await find_resumable_workflows(
+            _chain_pipeline(), config, manifest, MemoryPipelineStorage()
+        )
+        == []
+    )
+
+
+async def test_resume_requires_the_stored_tables_of_skipped_workflows():
+    storage = await _storage_with_documents()
+    config = _config()
+    pipeline = Pipeline(
+        [
+            ("create_base_text_units", _copy("documents", "text_units")),
+            ("create_final_text_units", _copy("text_units", "text_units")),
+        ],
+        tables={
+            "create_base_text_units": WorkflowTables(
+                frozenset(["documents"]), frozenset(["text_units"])
+            ),
+            "create_final_text_units": WorkflowTables(
+                frozenset(["text_units"]), frozenset(["text_units"])
+            ),
+        },
+    )
+    _, manifest = await _run(pipeline, config, storage)
+    resumable = await find_resumable_workflows(pipeline, config, manifest, storage)
+    assert resumable == pipeline.names()
+
+    # without its rewrite, the stored text units are not the first workflow's output
+    del manifest.checkpoints["create_final_text_units"]
+    assert await find_resumable_workflows(pipeline, config, manifest, storage) == []
+
+
+async def test_workflows_without_tables_are_not_skipped():
+    storage = await _storage_with_documents()
+    config = _config()
+    pipeline = _chain_pipeline()
+    del pipeline.tables["create_communities"]
+    _, manifest = await _run(pipeline, config, storage)
+
+    assert "create_communities" not in manifest.checkpoints
+    assert await find_resumable_workflows(
+        pipeline, config, manifest, MemoryPipelineStorage()
+    ) == ["create_base_text_units"]
+
+
+async def test_run_pipeline_resume(tmp_path):
+    config = _config(
+        root_dir=str(tmp_path),
+        output={"type": "file", "base_dir": str(tmp_path / "output")},
+        cache={"type": "none"},
+        write_manifest=True,
+    )
+    calls: list[str] = []
+
+    async def failing(_config, _context):  # noqa: RUF029
+        msg = "reports failed"
+        raise RuntimeError(msg)
+
+    pipeline = _chain_pipeline(calls)
+    pipeline.workflows[2] = ("create_community_reports", failing)
+    documents = pd.DataFrame({"id": ["1"], "text": ["a"]})
+    results = [
+        result
+        async for result in run_pipeline(
+            pipeline, config, NoopWorkflowCallbacks(), input_documents=documents
+        )
+    ]
+    assert results[-1].errors is not None
+    assert calls == ["text_units", "communities"]
+
+    calls.clear()
+    results = [
+        result
+        async for result in run_pipeline(
+            _chain_pipeline(calls),
+            config,
+            NoopWorkflowCallbacks(),
+            input_documents=documents,
+            resume=True,
+        )
+    ]
+    assert [result.workflow for result in results] == ["create_community_reports"]
+    assert calls == ["reports"]
+
+
+async def test_run_pipeline_writes_no_manifest_by_default(tmp_path):
+    config = _config(
+        root_dir=str(tmp_path),
+        output={"type": "file", "base_dir": str(tmp_path / "output")},
+        cache={"type": "none"},
+    )
+    calls: list[str] = []
+    documents = pd.DataFrame({"id": ["1"], "text": ["a"]})
+    async for _ in run_pipeline(
+        _chain_pipeline(calls),
+        config,
+        NoopWorkflowCallbacks(),
+        input_documents=documents,
+    ):
+        pass
+    assert calls == ["text_units", "communities", "reports"]
+    assert (tmp_path / "output" / "communities.parquet").exists()
+    assert not (tmp_path / "output" / "manifest.json").exists()
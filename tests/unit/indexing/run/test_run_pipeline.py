@@ -0,0 +1,226 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pytest
+
+import graphrag.index.workflows  # noqa: F401 - registers the built-in workflows
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.enums import IndexingMethod
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.run.utils import create_run_context
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowFunctionOutput, WorkflowTables
+from graphrag.index.utils.llm_budget import llm_request_slot
+from graphrag.index.workflows.factory import PipelineFactory
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+
+class RecordingCallbacks(NoopWorkflowCallbacks):
+    def __init__(self):
+        self.events: list[tuple[str, str]] = []
+
+    def workflow_start(self, name: str, instance: object) -> None:
+        self.events.append(("start", name))
+
+    def workflow_end(self, name: str, instance: object) -> None:
+        self.events.append(("end", name))
+
+
+def _tables(reads: list[str], writes: list[str]) -> WorkflowTables:
+    return WorkflowTables(reads=frozenset(reads), writes=frozenset(writes))
+
+
+def _workflow(delay: float = 0, stop: bool = False, error: bool = False):
+    async def run(_config, _context):
+        await asyncio.sleep(delay)
+        if error:
+            msg = "workflow failed"
+            raise RuntimeError(msg)
+        return WorkflowFunctionOutput(result=None, stop=stop)
+
+    return run
+
+
+def _config(**kwargs):
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    for key, value in kwargs.items():
+        setattr(config, key, value)
+    return config
+
+
+async def _collect(pipeline: Pipeline, config, callbacks=None):
+    context = create_run_context(callbacks=callbacks)
+    results = [
+        result
+        async for result in _run_pipeline(
+            pipeline=pipeline, config=config, context=context
+        )
+    ]
+    return results, context
+
+
+def test_standard_pipeline_dependencies():
+    config = _config()
+    dependencies = PipelineFactory.create_pipeline(
+        config, IndexingMethod.Standard
+    ).dependencies()
+
+    assert dependencies["load_input_documents"] == set()
+    assert dependencies["create_final_documents"] == {
+        "load_input_documents",
+        "create_base_text_units",
+    }
+    assert dependencies["extract_graph"] == {"create_base_text_units"}
+    # claim extraction overlaps with graph extraction and finalization
+    assert dependencies["extract_covariates"] == {"create_base_text_units"}
+    assert dependencies["create_final_text_units"] == {
+        "create_base_text_units",
+        "create_final_documents",
+        "extract_graph",
+        "finalize_graph",
+        "extract_covariates",
+    }
+    assert dependencies["create_community_reports"] == {
+        "finalize_graph",
+        "extract_covariates",
+        "create_communities",
+    }
+    assert dependencies["generate_text_embeddings"] == {
+        "create_final_documents",
+        "finalize_graph",
+        "create_final_text_units",
+        "create_community_reports",
+    }
+    # the lexical index runs alongside the reports and embeddings
+    assert dependencies["create_bm25_index"] == {
+        "finalize_graph",
+        "create_final_text_units",
+    }
+
+
+def test_undeclared_workflows_keep_their_place():
+    pipeline = Pipeline(
+        [("a", _workflow()), ("custom", _workflow()), ("b", _workflow())],
+        tables={"a": _tables([], ["x"]), "b": _tables([], ["y"])},
+    )
+    assert pipeline.dependencies() == {"a": set(), "custom": {"a"}, "b": {"custom"}}
+
+
+def test_readers_finish_before_a_table_is_rewritten():
+    pipeline = Pipeline(
+        [("write", _workflow()), ("read", _workflow()), ("rewrite", _workflow())],
+        tables={
+            "write": _tables([], ["x"]),
+            "read": _tables(["x"], []),
+            "rewrite": _tables([], ["x"]),
+        },
+    )
+    assert pipeline.dependencies()["rewrite"] == {"write", "read"}
+
+
+async def test_independent_workflows_run_concurrently():
+    pipeline = Pipeline(
+        [
+            ("source", _workflow()),
+            ("slow", _workflow(0.1)),
+            ("fast", _workflow(0.01)),
+            ("sink", _workflow()),
+        ],
+        tables={
+            "source": _tables([], ["x"]),
+            "slow": _tables(["x"], ["y"]),
+            "fast": _tables(["x"], ["z"]),
+            "sink": _tables(["y", "z"], []),
+        },
+    )
+    callbacks = RecordingCallbacks()
+    results, context = await _collect(
+        pipeline, _config(concurrent_workflows=4), callbacks
+    )
+
+    assert [result.workflow for result in results] == ["source", "fast", "slow", "sink"]
+    assert all(result.errors is None for result in results)
+    assert callbacks.events == [
+        ("start", "source"),
+        ("end", "source"),
+        ("start", "slow"),
+        ("start", "fast"),
+        ("end", "fast"),
+        ("end", "slow"),
+        ("start", "sink"),
+        ("end", "sink"),
+    ]
+    assert set(context.stats.workflows) == {"source", "slow", "fast", "sink"}
+    assert context.stats.workflows["slow"]["overall"] >= 0.1
+
+
+async def test_concurrent_workflows_setting():
+    pipeline = Pipeline(
+        [("slow", _workflow(0.05)), ("fast", _workflow())],
+        tables={"slow": _tables([], ["x"]), "fast": _tables([], ["y"])},
+    )
+    results, _ = await _collect(pipeline, _config())
+    assert [result.workflow for result in results] == ["slow", "fast"]
+    results, _ = await _collect(pipeline, _config(concurrent_workflows=2))
+    assert [result.workflow for result in results] == ["fast", "slow"]
+
+
+async def test_stop_starts_no_further_workflows():
+    pipeline = Pipeline(
+        [("stop", _workflow(stop=True)), ("next", _workflow())],
+        tables={"stop": _tables([], ["x"]), "next": _tables(["x"], [])},
+    )
+    results, _ = await _collect(pipeline, _config())
+    assert [result.workflow for result in results] == ["stop"]
+
+
+async def test_errors_cancel_running_workflows():
+    cancelled = asyncio.Event()
+
+    async def long_running(_config, _context):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    pipeline = Pipeline(
+        [("failing", _workflow(0.01, error=True)), ("long", long_running)],
+        tables={"failing": _tables([], ["x"]), "long": _tables([], ["y"])},
+    )
+    results, _ = await _collect(pipeline, _config(concurrent_workflows=2))
+
+    assert len(results) == 1
+    assert results[0].workflow == "failing"
+    assert results[0].errors is not None
+    assert str(results[0].errors[0]) == "workflow failed"
+    assert cancelled.is_set()
+
+
+@pytest.mark.parametrize(("budget", "expected"), [(1, 1), (3, 3)])
+async def test_workflows_share_the_llm_budget(budget: int, expected: int):
+    in_flight = 0
+    peak = 0
+
+    async def llm_workflow(_config, _context):
+        async def request():
+            nonlocal in_flight, peak
+            async with llm_request_slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[request() for _ in range(3)])
+        return WorkflowFunctionOutput(result=None)
+
+    pipeline = Pipeline(
+        [("a", llm_workflow), ("b", llm_workflow)],
+        tables={"a": _tables([], ["x"]), "b": _tables([], ["y"])},
+    )
+    await _collect(
+        pipeline, _config(concurrent_workflows=2, concurrent_llm_requests=budget)
+    )
+    assert peak == expected
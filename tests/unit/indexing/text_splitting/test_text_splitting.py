@@ -11,6 +11,7 @@ from graphrag.index.text_splitting.text_splitting import (
     NoopTextSplitter,
     TokenChunkerOptions,
     TokenTextSplitter,
+    split_grouped_texts_on_tokens,
     split_multiple_texts_on_tokens,
     split_single_text_on_tokens,
 )
@@ -129,6 +130,69 @@ def test_split_multiple_texts_on_tokens():
     mock_tick.assert_called()
 
 
+def test_split_multiple_texts_on_tokens_spans_documents():
+    texts = ["abcdefg", "", "hij", "klmnopqrstu"]
+
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = TokenChunkerOptions(
+        chunk_overlap=2,
+        tokens_per_chunk=6,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+    )
+
+    result = split_multiple_texts_on_tokens(texts, tokenizer, tick=MagicMock())
+
+    assert [(c.text_chunk, c.source_doc_indices, c.n_tokens) for c in result] == [
+        ("abcdef", [0], 6),
+        ("efghij", [0, 2], 6),
+        ("ijklmn", [2, 3], 6),
+        ("mnopqr", [3], 6),
+        ("qrstu", [3], 5),
+    ]
+
+
+def test_split_grouped_texts_on_tokens_matches_single_groups():
+    groups = [
+        ["This is a test text, meaning to be taken seriously."],
+        [],
+        ["Second group", "", "with three texts of different length."],
+        [""],
+        ["short"],
+        ["The last group is a single text that is longer than the chunk size."],
+    ]
+    sizes = [8, 8, 5, 8, 20, 7]
+    enc = tiktoken.get_encoding("cl100k_base")
+
+    result = list(
+        split_grouped_texts_on_tokens(
+            groups,
+            tokens_per_chunk=sizes,
+            chunk_overlap=2,
+            encode_batch=enc.encode_batch,
+            decode_batch=enc.decode_batch,
+            batch_size=2,
+        )
+    )
+
+    expected = [
+        (group_idx, chunk)
+        for group_idx, (group, size) in enumerate(zip(groups, sizes, strict=True))
+        for chunk in split_multiple_texts_on_tokens(
+            group,
+            TokenChunkerOptions(
+                chunk_overlap=2,
+                tokens_per_chunk=size,
+                decode=enc.decode,
+                encode=enc.encode,
+            ),
+            tick=None,  # type: ignore
+        )
+    ]
+    assert {group_idx for group_idx, _ in result} == {0, 2, 4, 5}
+    assert result == expected
+
+
 def test_split_single_text_on_tokens_no_overlap():
     text = "This is a test text, meaning to be taken seriously by this test only."
     enc = tiktoken.get_encoding("cl100k_base")
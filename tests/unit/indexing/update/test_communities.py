@@ -0,0 +1,212 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.data_model.schemas import COMMUNITY_REPORTS_FINAL_COLUMNS
+from graphrag.index.update.communities import _merge_regenerated_community_reports
+from graphrag.index.workflows.create_communities import create_communities
+from graphrag.index.workflows.update_communities import (
+    incremental_update_communities,
+)
+
+
+def _graph(edges: list[tuple[str, str]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    relationships = pd.DataFrame({
+        "id": [f"r-{source}-{target}" for source, target in edges],
+        "source": [source for source, _ in edges],
+        "target": [target for _, target in edges],
+        "weight": 1.0,
+        "text_unit_ids": [[f"t-{source}"] for source, _ in edges],
+    })
+    titles = sorted({title for edge in edges for title in edge})
+    entities = pd.DataFrame({"id": [f"e-{title}" for title in titles], "title": titles})
+    return entities, relationships
+
+
+def _clique(prefix: str, size: int) -> list[tuple[str, str]]:
+    return [
+        (f"{prefix}{i}", f"{prefix}{j}")
+        for i in range(size)
+        for j in range(i + 1, size)
+    ]
+
+
+def _members(communities: pd.DataFrame) -> dict[int, set[str]]:
+    return {
+        community: {entity_id.removeprefix("e-") for entity_id in entity_ids}
+        for community, entity_ids in zip(
+            communities["community"], communities["entity_ids"], strict=True
+        )
+    }
+
+
+OLD_EDGES = [*_clique("A", 5), *_clique("B", 5), *_clique("C", 5), ("A0", "B0")]
+
+
+def test_incremental_update_reclusters_only_touched_communities():
+    entities, relationships = _graph(OLD_EDGES)
+    old_communities = create_communities(
+        entities, relationships, max_cluster_size=10, use_lcc=True, seed=0xDEADBEEF
+    )
+    old_members = _members(old_communities)
+    # the C clique lies outside the largest connected component
+    assert sorted(map(sorted, old_members.values())) == [
+        [f"A{i}" for i in range(5)],
+        [f"B{i}" for i in range(5)],
+    ]
+
+    # a new entity joins the A clique and links the C clique into the graph
+    delta_entities, delta_relationships = _graph([
+        ("A1", "A5"),
+        ("A2", "A5"),
+        ("C0", "A5"),
+    ])
+    merged_entities, merged_relationships = _graph([
+        *OLD_EDGES,
+        ("A1", "A5"),
+        ("A2", "A5"),
+        ("C0", "A5"),
+    ])
+    merged, changed = incremental_update_communities(
+        old_communities.copy(),
+        merged_entities,
+        merged_relationships,
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=10,
+        use_lcc=True,
+        seed=0xDEADBEEF,
+    )
+
+    members = _members(merged)
+    a_community = next(c for c, m in old_members.items() if "A0" in m)
+    b_community = next(c for c, m in old_members.items() if "B0" in m)
+    # the untouched B community keeps its row, the A community keeps its number
+    pd.testing.assert_series_equal(
+        merged.set_index("community").loc[b_community],
+        old_communities.set_index("community").loc[b_community],
+    )
+    assert "A5" in members[a_community]
+    assert b_community not in changed
+    assert a_community in changed
+    # the C clique was outside the largest component before and is clustered now
+    c_community = next(c for c, m in members.items() if "C1" in m)
+    assert c_community > old_communities["community"].max()
+    assert c_community in changed
+    assert set().union(*members.values()) == set(merged_entities["title"])
+
+
+def test_incremental_update_without_touched_communities():
+    entities, relationships = _graph(OLD_EDGES)
+    old_communities = create_communities(
+        entities, relationships, max_cluster_size=10, use_lcc=True, seed=0xDEADBEEF
+    )
+    # an entity re-mentioned without any new relationships changes nothing
+    merged, changed = incremental_update_communities(
+        old_communities.copy(),
+        entities,
+        relationships,
+        pd.DataFrame({"id": ["x"], "title": ["UNKNOWN"]}),
+        relationships.iloc[:0],
+        max_cluster_size=10,
+        use_lcc=True,
+        seed=0xDEADBEEF,
+    )
+    assert changed == []
+    pd.testing.assert_frame_equal(merged, old_communities, check_dtype=False)
+
+
+def _move_member(communities: pd.DataFrame, title: str, community: int) -> pd.DataFrame:
+    communities = communities.copy()
+    communities["entity_ids"] = [
+        [entity_id for entity_id in entity_ids if entity_id != f"e-{title}"]
+        + ([f"e-{title}"] if row_community == community else [])
+        for row_community, entity_ids in zip(
+            communities["community"], communities["entity_ids"], strict=True
+        )
+    ]
+    return communities
+
+
+def test_incremental_update_keeps_members_left_out_of_the_region():
+    # X belongs to the A community but only links into the untouched B community
+    old_edges = [*OLD_EDGES, ("X", "B0"), ("X", "B1")]
+    entities, relationships = _graph(old_edges)
+    created = create_communities(
+        entities, relationships, max_cluster_size=10, use_lcc=True, seed=0xDEADBEEF
+    )
+    a_community = next(c for c, m in _members(created).items() if "A0" in m)
+    old_communities = _move_member(created, "X", a_community)
+
+    delta_entities, delta_relationships = _graph([("A1", "A5")])
+    merged_entities, merged_relationships = _graph([*old_edges, ("A1", "A5")])
+    merged, _ = incremental_update_communities(
+        old_communities.copy(),
+        merged_entities,
+        merged_relationships,
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=10,
+        use_lcc=True,
+        seed=0xDEADBEEF,
+    )
+    assert "X" in _members(merged)[a_community]
+
+
+def test_incremental_update_keeps_members_outside_the_largest_component():
+    entities, relationships = _graph(OLD_EDGES)
+    old_communities = create_communities(
+        entities, relationships, max_cluster_size=10, use_lcc=True, seed=0xDEADBEEF
+    )
+    old_members = _members(old_communities)
+
+    # a new, larger component takes over as the largest connected component
+    new_edges = [("A1", "A5"), *_clique("D", 12)]
+    delta_entities, delta_relationships = _graph(new_edges)
+    merged_entities, merged_relationships = _graph([*OLD_EDGES, *new_edges])
+    merged, _ = incremental_update_communities(
+        old_communities.copy(),
+        merged_entities,
+        merged_relationships,
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=10,
+        use_lcc=True,
+        seed=0xDEADBEEF,
+    )
+
+    # the touched A community keeps its members although it left the component
+    members = _members(merged)
+    for community, titles in old_members.items():
+        assert titles <= members[community]
+
+
+def _reports(communities: list[int], summary: str) -> pd.DataFrame:
+    reports = pd.DataFrame(
+        dict.fromkeys(COMMUNITY_REPORTS_FINAL_COLUMNS),
+        index=range(len(communities)),
+    )
+    reports["community"] = communities
+    reports["summary"] = summary
+    return reports
+
+
+def test_merge_regenerated_community_reports():
+    old_reports = _reports([0, 1, 2], "old")
+    regenerated = _reports([1, 3], "new")
+    merged_communities = pd.DataFrame({
+        "community": [0, 1, 3],
+        "parent": [-1, -1, 1],
+        "children": [[], [3], []],
+        "size": [4, 6, 2],
+        "period": ["2024-01-01", "2024-02-01", "2024-02-01"],
+    })
+
+    merged = _merge_regenerated_community_reports(
+        old_reports, regenerated, merged_communities
+    )
+    # the report of the removed community 2 is dropped
+    assert merged["community"].tolist() == [0, 1, 3]
+    assert merged["summary"].tolist() == ["old", "new", "new"]
+    assert merged.loc[0, "size"] == 4
+    assert list(merged.columns) == COMMUNITY_REPORTS_FINAL_COLUMNS
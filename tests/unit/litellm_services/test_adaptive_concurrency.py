@@ -0,0 +1,219 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test the adaptive concurrency limiter and its LiteLLM feedback wrapper."""
+
+import asyncio
+
+import httpx
+import litellm
+import pandas as pd
+import pytest
+
+from graphrag.config.enums import AsyncType, ModelType
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.llm_budget import request_limiter
+from graphrag.language_model.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from graphrag.language_model.manager import ModelManager
+from graphrag.language_model.providers.litellm.request_wrappers.with_concurrency_feedback import (
+    retry_after,
+    with_concurrency_feedback,
+)
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class MetricsCallbacks:
+    def __init__(self):
+        self.reports: list[tuple[str, dict[str, float]]] = []
+
+    def metrics(self, name: str, values: dict[str, float]) -> None:
+        self.reports.append((name, values))
+
+
+def _rate_limit_error(headers: dict[str, str]) -> litellm.RateLimitError:
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "https://example.com")
+    )
+    return litellm.RateLimitError(
+        "throttled", llm_provider="openai", model="gpt-4o", response=response
+    )
+
+
+def test_additive_increase_multiplicative_decrease():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(
+        "model", initial_limit=4, max_limit=6, clock=clock
+    )
+
+    # one more request per round of `limit` responses with a stable latency
+    for _ in range(4):
+        limiter.record_success(1.0)
+    assert limiter.limit == 5
+    for _ in range(5):
+        limiter.record_success(1.0)
+    assert limiter.limit == 6
+    for _ in range(20):
+        limiter.record_success(1.0)
+    assert limiter.limit == 6
+
+    # the throttled requests of one round trip back off once
+    clock.now = 10.0
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.limit == 3
+    clock.now = 11.0
+    limiter.record_throttle()
+    assert limiter.limit == 1
+    clock.now = 12.0
+    limiter.record_throttle()
+    assert limiter.limit == 1
+
+
+def test_rising_latency_holds_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(
+        "model", initial_limit=2, max_limit=10, clock=FakeClock()
+    )
+    for _ in range(10):
+        limiter.record_success(1.0)
+    limit = limiter.limit
+    for _ in range(10):
+        limiter.record_success(10.0)
+    assert limiter.limit == limit
+
+
+async def test_slots_follow_the_limit():
+    limiter = AdaptiveConcurrencyLimiter("model", initial_limit=2, max_limit=2)
+    running = 0
+    peak = 0
+
+    async def request(row: pd.Series) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return row["value"]
+
+    for async_type in (AsyncType.AsyncIO, AsyncType.Threaded):
+        result = await derive_from_rows(
+            pd.DataFrame({"value": range(8)}),
+            request,
+            async_type=async_type,
+            num_threads=8,
+            limiter=limiter,
+        )
+        assert result == list(range(8))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_cancelled_waiters_give_back_their_slot():
+    limiter = AdaptiveConcurrencyLimiter("model", initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    assert limiter.in_flight == 0
+
+    async with limiter:
+        assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
+
+
+def test_retry_after_headers():
+    assert retry_after(_rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(_rate_limit_error({"retry-after": "7"})) == 7.0
+    assert (
+        retry_after(_rate_limit_error({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+        == 0.0
+    )
+    assert retry_after(_rate_limit_error({})) is None
+    assert retry_after(ValueError("no response")) is None
+
+
+async def test_feedback_wrapper_reports_to_the_limiter():
+    clock = FakeClock()
+    callbacks = MetricsCallbacks()
+    limiter = AdaptiveConcurrencyLimiter(
+        "model", initial_limit=4, max_limit=8, callbacks=callbacks, clock=clock
+    )
+    errors = [_rate_limit_error({"retry-after": "30"}), ValueError("bad request")]
+
+    def request(**kwargs):
+        if errors:
+            raise errors.pop(0)
+        return "response"
+
+    async def arequest(**kwargs):  # noqa: RUF029
+        return request(**kwargs)
+
+    sync_fn, async_fn = with_concurrency_feedback(
+        sync_fn=request, async_fn=arequest, limiter=limiter
+    )
+    with pytest.raises(litellm.RateLimitError):
+        sync_fn()
+    assert limiter.limit == 2
+    assert limiter.pause_remaining() == 30.0
+
+    # other errors do not count as throttling
+    clock.now = 30.0
+    with pytest.raises(ValueError, match="bad request"):
+        await async_fn()
+    assert limiter.limit == 2
+    assert await async_fn() == "response"
+
+    name, values = callbacks.reports[-1]
+    assert name == "concurrency:model"
+    assert values["in_flight"] == 0
+    assert values["throttled"] == 1
+    assert values["throughput"] == pytest.approx(1 / 30)
+
+
+def test_request_limiter_shares_the_model_limiter():
+    llm = LanguageModelConfig(
+        type=ModelType.Chat,
+        model_provider="openai",
+        model="gpt-4o",
+        api_key="key",
+        concurrent_requests=3,
+        adaptive_concurrency=True,
+    ).model_dump()
+    limiters = ModelManager().concurrency_limiters
+    try:
+        limiter = request_limiter(llm, num_threads=3)
+        assert isinstance(limiter, AdaptiveConcurrencyLimiter)
+        assert limiter.limit == 3
+        assert limiter.name == "gpt-4o"
+        # every operation using the model shares its limiter
+        for name in ["extract_graph", "summarize_descriptions"]:
+            model = ModelManager().get_or_create_chat_model(
+                name, ModelType.Chat, config=LanguageModelConfig(**llm)
+            )
+            assert model.concurrency_limiter is limiter  # type: ignore
+        assert request_limiter(llm, num_threads=3) is limiter
+        # another endpoint has a quota of its own
+        other = {**llm, "api_base": "https://other.example.com"}
+        assert request_limiter(other, num_threads=3) is not limiter
+    finally:
+        ModelManager().remove_chat("extract_graph")
+        ModelManager().remove_chat("summarize_descriptions")
+        limiters.clear()
+
+    static = request_limiter({**llm, "adaptive_concurrency": False}, 3)
+    assert isinstance(static, asyncio.Semaphore)
+
+    with pytest.raises(ValueError, match="adaptive_concurrency is not supported"):
+        LanguageModelConfig(**{**llm, "type": ModelType.OpenAIChat})
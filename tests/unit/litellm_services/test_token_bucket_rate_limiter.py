@@ -0,0 +1,184 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test LiteLLM Token Bucket Rate Limiter."""
+
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from graphrag.language_model.providers.litellm.request_wrappers.with_rate_limiter import (
+    _used_tokens,
+    with_rate_limiter,
+)
+from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limiter_factory import (
+    RateLimiterFactory,
+)
+from graphrag.language_model.providers.litellm.services.rate_limiter.token_bucket_rate_limiter import (
+    TokenBucketRateLimiter,
+)
+
+rate_limiter_factory = RateLimiterFactory()
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limiter_validation():
+    rate_limiter = rate_limiter_factory.create(strategy="token_bucket", rpm=60)
+    assert isinstance(rate_limiter, TokenBucketRateLimiter)
+
+    with pytest.raises(ValueError, match=r"Both TPM and RPM cannot be None"):
+        rate_limiter_factory.create(strategy="token_bucket")
+    with pytest.raises(ValueError, match=r"RPM and TPM must be either None"):
+        rate_limiter_factory.create(strategy="token_bucket", tpm=0)
+    with pytest.raises(ValueError, match=r"Period in seconds must be a positive"):
+        rate_limiter_factory.create(strategy="token_bucket", rpm=1, period_in_seconds=0)
+
+
+def test_rpm_bursts_then_refills():
+    clock = FakeClock()
+    rate_limiter = TokenBucketRateLimiter(rpm=40, period_in_seconds=1, clock=clock)
+
+    # a burst of a tenth of the limit, then the rest spread over the period
+    delays = [rate_limiter.reserve(0) for _ in range(6)]
+    assert delays == pytest.approx([0, 0, 0, 0, 1 / 36, 2 / 36])
+    clock.now = 1.0
+    # however long the bucket refilled, it only holds the burst
+    delays = [rate_limiter.reserve(0) for _ in range(5)]
+    assert delays == pytest.approx([0, 0, 0, 0, 1 / 36])
+
+
+def test_no_window_exceeds_the_limit():
+    clock = FakeClock()
+    rng = random.Random(0)
+    rate_limiter = TokenBucketRateLimiter(
+        rpm=50, tpm=1000, period_in_seconds=1, clock=clock
+    )
+
+    sends = []
+    for _ in range(500):
+        # idle spells let the buckets fill up before bursts of requests
+        clock.now += rng.choice([0, 0, 0, 0.01, 2])
+        token_count = rng.randint(1, 300)
+        sends.append((clock.now + rate_limiter.reserve(token_count), token_count))
+
+    sends.sort()
+    for start, _ in sends:
+        window = [tokens for time, tokens in sends if start <= time < start + 1]
+        assert len(window) <= 50
+        assert sum(window) <= 1000 + 1e-6
+
+
+def test_tpm_serves_waiters_in_arrival_order():
+    clock = FakeClock()
+    rate_limiter = TokenBucketRateLimiter(tpm=100, period_in_seconds=1, clock=clock)
+
+    assert rate_limiter.reserve(10) == 0
+    # a request larger than the bucket waits until the refill covers it, not forever
+    assert rate_limiter.reserve(180) == pytest.approx(2.0)
+    # and a small request behind it waits until the large one and its excess over
+    # the burst of 10 are paid off
+    assert rate_limiter.reserve(9) == pytest.approx((180 + 170 + 9) / 90)
+
+
+def test_reconcile_corrects_the_estimate():
+    clock = FakeClock()
+    rate_limiter = TokenBucketRateLimiter(tpm=100, period_in_seconds=1, clock=clock)
+
+    rate_limiter.reserve(10)
+    rate_limiter.reconcile(token_count=10, actual_token_count=4)
+    assert rate_limiter.reserve(6) == 0
+
+    rate_limiter.reconcile(token_count=6, actual_token_count=15)
+    assert rate_limiter.reserve(9) == pytest.approx(0.2)
+
+
+async def test_async_waiters_do_not_block_the_event_loop():
+    rate_limiter = TokenBucketRateLimiter(rpm=10, period_in_seconds=1)
+    ticks = 0
+    done = False
+
+    async def ticker():
+        nonlocal ticks
+        while not done:
+            ticks += 1
+            await asyncio.sleep(0.05)
+
+    async def request(index: int) -> int:
+        async with rate_limiter.aacquire(token_count=0):
+            return index
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(request(index) for index in range(4)))
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+
+    assert results == [0, 1, 2, 3]
+    assert elapsed >= 0.3
+    assert ticks >= 5
+
+
+async def test_cancelled_waiter_gives_back_its_budget():
+    clock = FakeClock()
+    rate_limiter = TokenBucketRateLimiter(rpm=10, period_in_seconds=60, clock=clock)
+    assert rate_limiter.reserve(0) == 0
+
+    async def request():
+        async with rate_limiter.aacquire(token_count=0):
+            pass
+
+    task = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # the next request waits as if the cancelled one had never come
+    assert rate_limiter.reserve(0) == pytest.approx(60 / 9)
+
+
+def test_request_wrappers_reconcile_usage():
+    model_config = SimpleNamespace(
+        rate_limit_strategy="token_bucket",
+        max_completion_tokens=None,
+        max_tokens=1000,
+        model="gpt-4o",
+    )
+    response = SimpleNamespace(usage=SimpleNamespace(total_tokens=10))
+
+    async def async_fn(**kwargs):  # noqa: RUF029
+        return response
+
+    completion, acompletion = with_rate_limiter(
+        sync_fn=lambda **kwargs: response,
+        async_fn=async_fn,
+        model_config=model_config,  # type: ignore
+        tpm=20000,
+    )
+    # the estimates include the max tokens, without giving back what the responses
+    # did not use the third request would wait seconds
+    for _ in range(10):
+        assert completion(input="text") is response
+        assert asyncio.run(acompletion(input="text")) is response
+
+
+def test_zero_usage_is_not_reconciled():
+    def response(total_tokens):
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=total_tokens))
+
+    assert _used_tokens(response(12)) == 12
+    assert _used_tokens({"usage": {"total_tokens": 0}}) is None
+    assert _used_tokens(response(0)) is None
+    assert _used_tokens(response(None)) is None
@@ -3,12 +3,14 @@
 
 from typing import Any
 
+from graphrag.bm25.index import BM25Index
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.types import TextEmbedder
 from graphrag.language_model.manager import ModelManager
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
+    amap_query_to_entities,
     map_query_to_entities,
 )
 from graphrag.vector_stores.base import (
@@ -188,3 +190,67 @@ def test_map_query_to_entities():
             rank=3,
         ),
     ]
+
+
+async def test_amap_query_to_entities():
+    entities = [
+        Entity(id="id1", short_id="sid1", title="t1", rank=2),
+        Entity(id="id2", short_id="sid2", title="t22", rank=4),
+    ]
+    vectorstore = MockBaseVectorStore([
+        VectorStoreDocument(id=entity.id, text=entity.title, vector=None)
+        for entity in reversed(entities)
+    ])
+    text_embedder = ModelManager().get_or_create_embedding_model(
+        model_type="mock_embedding", name="mock"
+    )
+
+    # the async path embeds the query and runs the vector search off the event loop
+    assert await amap_query_to_entities(
+        query="t1",
+        text_embedding_vectorstore=vectorstore,
+        text_embedder=text_embedder,
+        all_entities_dict={entity.id: entity for entity in entities},
+        k=1,
+        oversample_scaler=1,
+    ) == [entities[1]]
+
+    assert await amap_query_to_entities(
+        query="",
+        text_embedding_vectorstore=vectorstore,
+        text_embedder=text_embedder,
+        all_entities_dict={entity.id: entity for entity in entities},
+        include_entity_names=["t1"],
+        k=1,
+    ) == [entities[0], entities[1]]
+
+
+def test_map_query_to_entities_fuses_lexical_matches():
+    entities = [
+        Entity(id="id1", short_id="sid1", title="BCBS 239", rank=1),
+        Entity(id="id2", short_id="sid2", title="Meldewesen", rank=2),
+        Entity(id="id3", short_id="sid3", title="Aufsicht", rank=3),
+    ]
+    lexical_index = BM25Index.from_texts(
+        [entity.id for entity in entities], [entity.title for entity in entities]
+    )
+    for key in (EntityVectorStoreKey.ID, EntityVectorStoreKey.TITLE):
+        # the vector store only returns the first entity the query is close to
+        vectorstore = MockBaseVectorStore([
+            VectorStoreDocument(id=getattr(entity, key), text=entity.title, vector=None)
+            for entity in entities[1:]
+        ])
+        matched = map_query_to_entities(
+            query="Meldung nach BCBS 239",
+            text_embedding_vectorstore=vectorstore,
+            text_embedder=ModelManager().get_or_create_embedding_model(
+                model_type="mock_embedding", name="mock"
+            ),
+            all_entities_dict={entity.id: entity for entity in entities},
+            embedding_vectorstore_key=key,
+            k=1,
+            oversample_scaler=2,
+            lexical_index=lexical_index,
+        )
+        # the keyword match joins the semantic ones, ahead of the second vector hit
+        assert [entity.id for entity in matched] == ["id2", "id1"]
@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.context_builder.local_context import build_relationship_context
+
+EDGES = [("A", "B"), ("A", "X"), ("A", "Y"), ("B", "X"), ("C", "Y")]
+
+
+def _entity(title: str) -> Entity:
+    return Entity(id=title, short_id=title, title=title)
+
+
+def _relationships() -> list[Relationship]:
+    return [
+        Relationship(
+            id=f"{source}-{target}",
+            short_id=str(i),
+            source=source,
+            target=target,
+            description=f"{source} knows {target}",
+            rank=i,
+        )
+        for i, (source, target) in enumerate(EDGES)
+    ]
+
+
+def _context(
+    titles: list[str], relationships: list[Relationship]
+) -> tuple[str, pd.DataFrame]:
+    return build_relationship_context(
+        selected_entities=[_entity(title) for title in titles],
+        relationships=relationships,
+        top_k_relationships=1,
+    )
+
+
+def test_relationship_context_leaves_shared_relationships_unchanged():
+    # relationships shared across queries, as a long-lived query session keeps them
+    shared = _relationships()
+    _context(["X"], shared)
+    text, records = _context(["A", "B"], shared)
+
+    fresh_text, fresh_records = _context(["A", "B"], _relationships())
+    assert text == fresh_text
+    pd.testing.assert_frame_equal(records, fresh_records)
+    assert all(relationship.attributes is None for relationship in shared)
@@ -0,0 +1,159 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import random
+
+import pandas as pd
+
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.context_builder.entity_extraction import (
+    find_nearest_neighbors_by_entity_rank,
+)
+from graphrag.query.context_builder.local_context import (
+    build_covariates_context,
+    build_relationship_context,
+    get_candidate_context,
+)
+from graphrag.query.input.retrieval.community_reports import (
+    get_candidate_communities,
+)
+from graphrag.query.input.retrieval.index import RetrievalIndex
+from graphrag.query.input.retrieval.text_units import get_candidate_text_units
+
+
+def _knowledge_model(seed: int = 0):
+    rng = random.Random(seed)
+    titles = [f"entity{i}" for i in range(40)]
+    text_units = [
+        TextUnit(id=f"unit{i}", short_id=str(i), text=f"text {i}") for i in range(30)
+    ]
+    reports = [
+        CommunityReport(
+            id=f"report{i}",
+            short_id=str(i),
+            title=f"report {i}",
+            community_id=str(i),
+            summary="",
+            full_content=f"content {i}",
+        )
+        for i in range(10)
+    ]
+    entities = [
+        Entity(
+            id=f"id-{title}",
+            short_id=str(i),
+            title=title,
+            rank=rng.randint(0, 5),
+            text_unit_ids=rng.sample([unit.id for unit in text_units], 3),
+            community_ids=rng.sample([report.id for report in reports], 2),
+        )
+        for i, title in enumerate(titles)
+    ]
+    relationships = [
+        Relationship(
+            id=f"rel{i}",
+            short_id=str(i),
+            source=rng.choice(titles),
+            target=rng.choice(titles),
+            weight=rng.random(),
+            rank=rng.randint(0, 3),
+        )
+        for i in range(200)
+    ]
+    covariates = [
+        Covariate(
+            id=f"claim{i}",
+            short_id=str(i),
+            subject_id=rng.choice(titles),
+            attributes={"status": rng.choice(["TRUE", "FALSE"])},
+        )
+        for i in range(60)
+    ]
+    return entities, relationships, covariates, text_units, reports
+
+
+def test_lookups_follow_the_collection_order():
+    entities, relationships, covariates, text_units, reports = _knowledge_model()
+    index = RetrievalIndex(entities, relationships, covariates, text_units, reports)
+
+    titles = {"entity1", "entity7", "missing"}
+    assert index.relationships_of(titles) == [
+        rel for rel in relationships if rel.source in titles or rel.target in titles
+    ]
+    assert index.covariates_of(titles) == [
+        cov for cov in covariates if cov.subject_id in titles
+    ]
+    assert index.entities_titled(titles) == [
+        entity for entity in entities if entity.title in titles
+    ]
+    assert index.text_units_with_ids(["unit9", "unit2", "unit9"]) == [
+        text_units[2],
+        text_units[9],
+    ]
+    assert index.community_reports_with_ids(["report3"]) == [reports[3]]
+    assert RetrievalIndex().relationships_of(titles) == []
+
+
+def test_context_builders_match_a_linear_scan():
+    entities, relationships, covariates, text_units, reports = _knowledge_model()
+    index = RetrievalIndex(
+        entities, relationships, text_units=text_units, community_reports=reports
+    )
+    covariate_index = RetrievalIndex(covariates=covariates)
+    rng = random.Random(1)
+
+    for _ in range(20):
+        selected = rng.sample(entities, rng.randint(1, 8))
+        for ranking_attribute in ("rank", "weight"):
+            pd.testing.assert_frame_equal(
+                build_relationship_context(
+                    selected,
+                    relationships,
+                    top_k_relationships=3,
+                    relationship_ranking_attribute=ranking_attribute,
+                )[1],
+                build_relationship_context(
+                    selected,
+                    relationships,
+                    top_k_relationships=3,
+                    relationship_ranking_attribute=ranking_attribute,
+                    index=index,
+                )[1],
+            )
+        assert (
+            build_covariates_context(selected, covariates)[0]
+            == build_covariates_context(selected, covariates, index=covariate_index)[0]
+        )
+
+        linear = get_candidate_context(
+            selected, entities, relationships, {"claims": covariates}
+        )
+        indexed = get_candidate_context(
+            selected,
+            entities,
+            relationships,
+            {"claims": covariates},
+            index=index,
+            covariate_indexes={"claims": covariate_index},
+        )
+        assert linear.keys() == indexed.keys()
+        for key in linear:
+            pd.testing.assert_frame_equal(linear[key], indexed[key])
+
+        pd.testing.assert_frame_equal(
+            get_candidate_text_units(selected, text_units),
+            get_candidate_text_units(selected, text_units, index=index),
+        )
+        pd.testing.assert_frame_equal(
+            get_candidate_communities(selected, reports),
+            get_candidate_communities(selected, reports, index=index),
+        )
+        assert find_nearest_neighbors_by_entity_rank(
+            selected[0].title, entities, relationships, k=5
+        ) == find_nearest_neighbors_by_entity_rank(
+            selected[0].title, entities, relationships, k=5, index=index
+        )
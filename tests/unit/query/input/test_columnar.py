@@ -0,0 +1,110 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from dataclasses import fields
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graphrag.query.indexer_adapters import (
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_text_units,
+)
+from graphrag.query.input.columnar import EntityTable
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
+
+DATA_DIR = Path(__file__).parents[3] / "verbs" / "data"
+
+
+def _read(name: str) -> pd.DataFrame:
+    return pd.read_parquet(DATA_DIR / f"{name}.parquet")
+
+
+def _assert_same_rows(rows, table):
+    assert len(rows) == len(table)
+    for row, view in zip(rows, table, strict=True):
+        assert isinstance(view, type(row))
+        for field in fields(row):
+            assert getattr(view, field.name) == getattr(row, field.name), field.name
+
+
+def test_tables_match_the_dataclass_lists():
+    entities, communities = _read("entities"), _read("communities")
+    _assert_same_rows(
+        read_indexer_entities(entities, communities, 1),
+        read_indexer_entities(entities, communities, 1, columnar=True),
+    )
+    relationships = _read("relationships")
+    _assert_same_rows(
+        read_indexer_relationships(relationships),
+        read_indexer_relationships(relationships, columnar=True),
+    )
+    text_units = _read("text_units")
+    _assert_same_rows(
+        read_indexer_text_units(text_units),
+        read_indexer_text_units(text_units, columnar=True),
+    )
+
+
+def test_row_views():
+    table = EntityTable.from_dataframe(
+        pd.DataFrame({
+            "id": ["a", "b"],
+            "title": ["A", "B"],
+            "degree": [3, None],
+            "description_embedding": [[0.5, 1.0], [0.25, 0.0]],
+        }),
+        short_id_col=None,
+        type_col=None,
+        description_col=None,
+        attributes_cols=["degree"],
+    )
+    first, last = table[0], table[-1]
+    assert first.short_id == "0"
+    assert first.rank == 3
+    assert last.rank is None
+    assert last.description_embedding == [0.25, 0.0]
+    assert [entity.title for entity in table[:1]] == ["A"]
+
+    # every access builds fresh attributes, changes do not reach the table
+    assert first.attributes == {"degree": 3}
+    first.attributes["links"] = 2  # type: ignore
+    assert table[0].attributes == {"degree": 3}
+
+    with pytest.raises(AttributeError):
+        first.title = "C"  # type: ignore
+    with pytest.raises(AttributeError):
+        first.attributes = {}  # type: ignore
+    with pytest.raises(IndexError):
+        table[2]
+    assert table[0] == first
+
+
+def test_local_context_from_tables():
+    entities, communities = _read("entities"), _read("communities")
+    relationships, text_units = _read("relationships"), _read("text_units")
+
+    def local_context(columnar: bool) -> tuple[str, str]:
+        context = LocalSearchMixedContext(
+            entities=read_indexer_entities(
+                entities, communities, None, columnar=columnar
+            ),
+            entity_text_embeddings=None,  # type: ignore
+            text_embedder=None,  # type: ignore
+            text_units=read_indexer_text_units(text_units, columnar=columnar),
+            relationships=read_indexer_relationships(relationships, columnar=columnar),
+        )
+        selected = list(context.entities.values())[:5]
+        local_text, _ = context._build_local_context(  # noqa: SLF001
+            selected, max_context_tokens=4000
+        )
+        sources_text, _ = context._build_text_unit_context(  # noqa: SLF001
+            selected, max_context_tokens=4000
+        )
+        return local_text, sources_text
+
+    assert local_context(columnar=True) == local_context(columnar=False)
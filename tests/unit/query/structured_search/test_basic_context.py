@@ -0,0 +1,56 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.bm25.index import BM25Index
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.structured_search.basic_search.basic_context import (
+    BasicSearchContext,
+)
+from graphrag.vector_stores.base import VectorStoreDocument, VectorStoreSearchResult
+from tests.unit.query.context_builder.test_entity_extraction import (
+    MockBaseVectorStore,
+)
+
+TEXT_UNITS = [
+    TextUnit(id="a", short_id="1", text="Die Aufsicht prüft das Meldewesen."),
+    TextUnit(id="b", short_id="2", text="Risikodaten nach BCBS 239 aggregieren."),
+    TextUnit(id="c", short_id="3", text="Kapitalanforderungen der Banken."),
+]
+
+
+def _context(lexical: bool) -> BasicSearchContext:
+    return BasicSearchContext(
+        text_embedder=None,  # type: ignore
+        text_unit_embeddings=MockBaseVectorStore([]),
+        text_units=TEXT_UNITS,
+        lexical_index=BM25Index.from_texts(
+            [unit.id for unit in TEXT_UNITS], [unit.text for unit in TEXT_UNITS]
+        )
+        if lexical
+        else None,
+    )
+
+
+def _hits(*ids: str) -> list[VectorStoreSearchResult]:
+    return [
+        VectorStoreSearchResult(
+            document=VectorStoreDocument(id=id, text=f"vector {id}", vector=None),
+            score=1.0,
+        )
+        for id in ids
+    ]
+
+
+def test_vector_results_are_fused_with_lexical_matches():
+    query = "BCBS 239 Meldewesen"
+    fused = _context(lexical=True)._fuse_lexical_results(  # noqa: SLF001
+        query, _hits("a", "c"), k=2
+    )
+    # "a" is found by both searches, "b" only by its keywords, "c" drops out
+    assert [result.document.id for result in fused] == ["a", "b"]
+    assert fused[0].document.text == "vector a"
+    assert fused[1].document.text == TEXT_UNITS[1].text
+
+    assert _context(lexical=False)._fuse_lexical_results(  # noqa: SLF001
+        query, _hits("a", "c"), k=2
+    ) == _hits("a", "c")
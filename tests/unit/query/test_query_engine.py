@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.api.query_engine import QueryEngine
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.workflows.create_bm25_index import create_bm25_index
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import write_table_to_storage
+from tests.verbs.util import DEFAULT_MODEL_CONFIG, load_test_table
+
+TABLES = ["entities", "communities", "community_reports", "text_units", "relationships"]
+
+
+async def _create_engine(
+    tmp_path, refresh_interval: float = 0
+) -> tuple[QueryEngine, dict[str, str]]:
+    storage = MemoryPipelineStorage()
+    for name in TABLES:
+        await write_table_to_storage(load_test_table(name), name, storage)
+
+    fingerprints = dict.fromkeys(storage.keys(), "1")
+
+    async def get_fingerprint(key: str) -> str | None:  # noqa: RUF029
+        return fingerprints.get(key)
+
+    storage.get_fingerprint = get_fingerprint  # type: ignore
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "root_dir": str(tmp_path),
+    })
+    return QueryEngine(
+        config, storage=storage, refresh_interval=refresh_interval
+    ), fingerprints
+
+
+async def test_query_engine_keeps_objects_warm(tmp_path):
+    engine, _ = await _create_engine(tmp_path)
+    await engine.load()
+
+    entities = await engine._entities(2)  # noqa: SLF001
+    text_units = await engine._text_units()  # noqa: SLF001
+    assert len(entities) > 0
+    assert len(text_units) > 0
+
+    assert await engine.refresh() is False
+    assert await engine._entities(2) is entities  # noqa: SLF001
+    assert await engine._text_units() is text_units  # noqa: SLF001
+
+
+async def test_query_engine_keeps_retrieval_index_warm(tmp_path):
+    engine, fingerprints = await _create_engine(tmp_path)
+    await engine.load()
+
+    index = await engine._retrieval_index(2)  # noqa: SLF001
+    assert index.entities == list(await engine._entities(2))  # noqa: SLF001
+    assert await engine._retrieval_index(2) is index  # noqa: SLF001
+    covariate_indexes = await engine._covariate_indexes()  # noqa: SLF001
+    assert await engine._covariate_indexes() is covariate_indexes  # noqa: SLF001
+
+    fingerprints["relationships.parquet"] = "2"
+    await engine.refresh()
+    assert await engine._retrieval_index(2) is not index  # noqa: SLF001
+
+
+async def test_query_engine_reloads_changed_outputs(tmp_path):
+    engine, fingerprints = await _create_engine(tmp_path)
+    await engine.load()
+    entities = await engine._entities(2)  # noqa: SLF001
+
+    fingerprints["entities.parquet"] = "2"
+
+    assert await engine.refresh() is True
+    assert await engine._entities(2) is not entities  # noqa: SLF001
+    assert await engine.refresh() is False
+
+
+async def test_query_engine_checks_outputs_once_per_interval(tmp_path):
+    engine, fingerprints = await _create_engine(tmp_path, refresh_interval=3600)
+    await engine.load()
+    entities = await engine._entities(2)  # noqa: SLF001
+
+    fingerprints["entities.parquet"] = "2"
+
+    assert await engine.refresh() is False
+    assert await engine._entities(2) is entities  # noqa: SLF001
+    assert await engine.refresh(force=True) is True
+    assert await engine._entities(2) is not entities  # noqa: SLF001
+
+
+async def test_query_engine_missing_optional_table(tmp_path):
+    engine, _ = await _create_engine(tmp_path)
+    await engine.load()
+
+    assert await engine._table("covariates") is None  # noqa: SLF001
+
+
+async def test_query_engine_lexical_index(tmp_path):
+    engine, fingerprints = await _create_engine(tmp_path)
+    assert await engine.lexical_index() is None
+
+    postings, documents = create_bm25_index(
+        load_test_table("text_units"), load_test_table("entities")
+    )
+    await write_table_to_storage(postings, "bm25_postings", engine._storage)  # noqa: SLF001
+    await write_table_to_storage(documents, "bm25_documents", engine._storage)  # noqa: SLF001
+    fingerprints["bm25_postings.parquet"] = fingerprints["bm25_documents.parquet"] = "1"
+
+    # the new outputs are picked up on the next lookup
+    text_units = await engine.lexical_index()
+    entities = await engine.lexical_index("entities")
+    assert text_units is not None
+    assert entities is not None
+    assert len(text_units) == len(load_test_table("text_units"))
+    assert len(entities) == len(load_test_table("entities"))
+    assert await engine.lexical_index() is text_units
+
+    text_unit = load_test_table("text_units").iloc[3]
+    hits = await engine.keyword_search(text_unit["text"], k=3)
+    assert hits is not None
+    assert list(hits.columns) == ["score", "id", "human_readable_id", "text"]
+    assert hits["id"].iloc[0] == text_unit["id"]
+    assert hits["score"].is_monotonic_decreasing
@@ -0,0 +1,22 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pytest
+
+from graphrag.utils.rank_fusion import reciprocal_rank_fusion
+
+
+def test_keys_found_by_both_rankings_rise_to_the_top():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d", "a"]])
+    assert [key for key, _ in fused] == ["a", "c", "b", "d"]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 63)
+
+
+def test_ties_keep_first_seen_order_and_duplicates_count_once():
+    assert [
+        key for key, _ in reciprocal_rank_fusion([["x", "x", "y"], ["y", "x"]])
+    ] == [
+        "x",
+        "y",
+    ]
+    assert reciprocal_rank_fusion([[], []]) == []
@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+import pytest
+
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+COMMUNITIES = pd.DataFrame({
+    "community": [0, 1, 2, 3],
+    "level": [0, 0, 1, 2],
+    "title": ["a", "b", "c", "d"],
+    "size": [10, 20, 30, 40],
+})
+
+
+@pytest.fixture(params=["file", "memory"])
+def storage(request, tmp_path):
+    if request.param == "file":
+        return FilePipelineStorage(base_dir=str(tmp_path))
+    return MemoryPipelineStorage()
+
+
+async def test_load_full_table(storage):
+    await write_table_to_storage(COMMUNITIES, "communities", storage)
+    pd.testing.assert_frame_equal(
+        await load_table_from_storage("communities", storage), COMMUNITIES
+    )
+
+
+async def test_load_projected_and_filtered_table(storage):
+    await write_table_to_storage(COMMUNITIES, "communities", storage)
+    table = await load_table_from_storage(
+        "communities",
+        storage,
+        # columns and predicates missing from the table are skipped
+        columns=["community", "title", "missing"],
+        filters=[("level", "<=", 1), ("missing", "==", 0)],
+    )
+    pd.testing.assert_frame_equal(
+        table.reset_index(drop=True),
+        COMMUNITIES.loc[COMMUNITIES["level"] <= 1, ["community", "title"]],
+    )
+
+
+async def test_local_path(tmp_path):
+    storage = FilePipelineStorage(base_dir=str(tmp_path))
+    assert storage.local_path("communities.parquet") == tmp_path / "communities.parquet"
+    assert MemoryPipelineStorage().local_path("communities.parquet") is None
+
+    with pytest.raises(ValueError, match="Could not find"):
+        await load_table_from_storage("communities", storage)
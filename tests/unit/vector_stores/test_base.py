@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from typing import Any
+
+import numpy as np
+
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.data_model.types import TextEmbedder
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    LazyVectorStoreDocument,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+    top_k_by_cosine_similarity,
+)
+
+
+class BruteForceVectorStore(BaseVectorStore):
+    """A vector store without native batching, ranking documents with numpy."""
+
+    def __init__(self, documents: list[VectorStoreDocument]) -> None:
+        super().__init__(
+            vector_store_schema_config=VectorStoreSchemaConfig(index_name="mock")
+        )
+        self.documents = documents
+        self.searches = 0
+
+    def connect(self, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        raise NotImplementedError
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        self.searches += 1
+        indices, scores = top_k_by_cosine_similarity(
+            np.asarray([query_embedding]),
+            np.asarray([document.vector for document in self.documents]),
+            k,
+        )
+        return [
+            VectorStoreSearchResult(document=self.documents[i], score=float(score))
+            for i, score in zip(indices[0], scores[0], strict=True)
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        raise NotImplementedError
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        raise NotImplementedError
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        raise NotImplementedError
+
+
+DOCUMENTS = [
+    VectorStoreDocument(id="x", text="x", vector=[1.0, 0.0]),
+    VectorStoreDocument(id="y", text="y", vector=[0.0, 1.0]),
+    VectorStoreDocument(id="xy", text="xy", vector=[1.0, 1.0]),
+]
+
+
+def test_top_k_by_cosine_similarity():
+    indices, scores = top_k_by_cosine_similarity(
+        np.array([[1.0, 0.1], [0.0, 0.0]]),
+        np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]]),
+        k=2,
+    )
+    assert indices.tolist() == [[0, 2], [0, 1]]
+    assert np.allclose(scores[0], [1 / np.sqrt(1.01), 1.1 / np.sqrt(2.02)])
+    # a zero query scores 0 against everything and keeps the document order
+    assert scores[1].tolist() == [0.0, 0.0]
+
+
+def test_similarity_search_batch_fallback():
+    store = BruteForceVectorStore(DOCUMENTS)
+    results = store.similarity_search_batch(np.array([[1.0, 0.0], [0.1, 1.0]]), k=2)
+    assert [[r.document.id for r in hits] for hits in results] == [
+        ["x", "xy"],
+        ["y", "xy"],
+    ]
+    assert store.searches == 2
+
+
+async def test_asimilarity_search_batch_by_text_embeds_once():
+    store = BruteForceVectorStore(DOCUMENTS)
+    calls = []
+
+    async def embed_batch(texts: list[str]) -> list[list[float]]:  # noqa: RUF029
+        calls.append(texts)
+        return [[1.0, 0.0] if text == "x" else [0.0, 1.0] for text in texts]
+
+    results = await store.asimilarity_search_batch_by_text(
+        ["x", "y", "x"], embed_batch, k=1
+    )
+    assert calls == [["x", "y", "x"]]
+    assert [[r.document.id for r in hits] for hits in results] == [["x"], ["y"], ["x"]]
+    assert await store.asimilarity_search_batch_by_text([], embed_batch) == []
+
+
+def test_lazy_document_attributes():
+    document = LazyVectorStoreDocument(
+        id="1", text="text", vector=None, raw_attributes='{"title": "Doc"}'
+    )
+    assert document._attributes is None  # noqa: SLF001
+    assert document.attributes == {"title": "Doc"}
+    assert LazyVectorStoreDocument("2", None, None, None).attributes == {}
@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.bm25.index import load_bm25_index
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.workflows.create_bm25_index import (
+    run_workflow,
+)
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+
+from .util import (
+    DEFAULT_MODEL_CONFIG,
+    create_test_context,
+    load_test_table,
+)
+
+
+async def test_create_bm25_index():
+    context = await create_test_context(
+        storage=["text_units", "entities"],
+    )
+
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+
+    await run_workflow(config, context)
+
+    documents = await load_table_from_storage("bm25_documents", context.output_storage)
+    text_units = load_test_table("text_units")
+    entities = load_test_table("entities")
+    assert (documents["corpus"] == "text_units").sum() == len(text_units)
+    assert (documents["corpus"] == "entities").sum() == len(entities)
+
+    # every entity and text unit is the best match for its own text
+    entity_index = await load_bm25_index("entities", context.output_storage)
+    text_unit_index = await load_bm25_index("text_units", context.output_storage)
+    assert entity_index is not None
+    assert text_unit_index is not None
+    for entity in entities.itertuples():
+        query = f"{entity.title} {entity.description}"
+        assert entity_index.search(query, k=1)[0][0] == entity.id
+    for text_unit in text_units.itertuples():
+        assert text_unit_index.search(text_unit.text, k=1)[0][0] == text_unit.id
+
+
+async def test_create_bm25_index_disabled_removes_stale_index():
+    context = await create_test_context(
+        storage=["text_units", "entities"],
+    )
+
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    await run_workflow(config, context)
+    assert await storage_has_table("bm25_postings", context.output_storage)
+
+    config.bm25_index.enabled = False
+    await run_workflow(config, context)
+    assert not await storage_has_table("bm25_postings", context.output_storage)
+    assert not await storage_has_table("bm25_documents", context.output_storage)
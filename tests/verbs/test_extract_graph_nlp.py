@@ -33,3 +33,24 @@ async def test_extract_graph_nlp():
     assert len(nodes_actual.columns) == 5
     assert len(edges_actual) == 29445
     assert len(edges_actual.columns) == 5
+
+
+async def test_extract_graph_nlp_process_pool():
+    context = await create_test_context(
+        storage=["text_units"],
+    )
+
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "extract_graph_nlp": {"async_mode": "process", "concurrent_requests": 2},
+    })
+
+    await run_workflow(config, context)
+
+    nodes_actual = await load_table_from_storage("entities", context.output_storage)
+    edges_actual = await load_table_from_storage(
+        "relationships", context.output_storage
+    )
+
+    assert len(nodes_actual) == 1148
+    assert len(edges_actual) == 29445